@@ -0,0 +1,69 @@
+"""
+Measures the dependency graph algorithms over a random model.
+
+Usage: python -m benchmarks.bench_analysis [relationship count]
+"""
+import random
+import sys
+import time
+
+from benchmarks.fixtures import BenchElement
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+
+DEFAULT_COUNT = 10 ** 6
+# the closure is quadratic in the number of elements
+MAX_CLOSURE_ELEMENTS = 10 ** 4
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:>24}: {time.perf_counter() - start:7.3f}s")
+    return result
+
+
+def main(count: int):
+    generator = random.Random(1)
+    model = Model()
+    elements = [BenchElement(f"Element {i}") for i in range(count // 10)]
+    for element in elements:
+        model.add_element(element)
+    for _ in range(count):
+        # mostly forward edges, with a few backward ones creating cycles
+        source, destination = generator.sample(range(len(elements)), 2)
+        if source > destination and generator.random() < 0.99:
+            source, destination = destination, source
+        model.add_relationship(Relationship(
+            elements[source], elements[destination], "Uses", None,
+            InteractionStyle.SYNCHRONOUS))
+
+    graph = model.get_dependency_graph()
+    print(f"{len(elements)} elements, {count} relationships")
+    timed("reachable_from (build)",
+          lambda: graph.reachable_from(elements[0]))
+    timed("reachable_from (cached)",
+          lambda: graph.reachable_from(elements[0]))
+    components = timed("strongly connected",
+                       graph.strongly_connected_components)
+    print(f"{'components':>24}: {len(components)}")
+    cycles = timed("cycles", graph.cycles)
+    print(f"{'cycles':>24}: {len(cycles)}")
+    layers = timed("layers", graph.layers)
+    print(f"{'layers':>24}: {len(layers)}")
+    timed("shortest_path", lambda: graph.shortest_path(elements[-1],
+                                                        elements[0]))
+    timed("reaches (search)", lambda: graph.reaches(elements[-1],
+                                                     elements[0]))
+    if len(elements) <= MAX_CLOSURE_ELEMENTS:
+        timed("transitive_closure", graph.transitive_closure)
+        timed("reaches (closure)", lambda: graph.reaches(elements[-1],
+                                                          elements[0]))
+    else:
+        print(f"{'transitive_closure':>24}: skipped, more than "
+              f"{MAX_CLOSURE_ELEMENTS} elements")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
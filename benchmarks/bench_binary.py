@@ -0,0 +1,81 @@
+"""
+Compares opening a binary workspace and looking up a few elements with
+loading the same workspace from JSON.
+
+Usage: python -m benchmarks.bench_binary [element count]
+"""
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.fixtures import BenchElement
+from structurizr_py.core.io.binary_workspace import BinaryWorkspace
+from structurizr_py.core.io.binary_writer import BinaryWriter
+from structurizr_py.core.io.json_reader import JsonReader
+from structurizr_py.core.io.json_writer import JsonWriter
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.tags import Tags
+
+DEFAULT_COUNT = 200000
+LOOKUPS = 100
+
+
+def create_element(fields, parent):
+    return BenchElement(fields["name"])
+
+
+def main(count: int):
+    generator = random.Random(1)
+    model = Model()
+    elements = [BenchElement(f"Element {i}") for i in range(count)]
+    for number, element in enumerate(elements):
+        element.identity = str(number)
+        element.description = "An element " * 10
+        model.add_element(element)
+    for number in range(count):
+        relationship = Relationship(elements[number],
+                                    generator.choice(elements), "Uses",
+                                    "HTTPS", InteractionStyle.SYNCHRONOUS)
+        relationship.identity = f"r{number}"
+        model.add_relationship(relationship)
+
+    handle, path = tempfile.mkstemp(suffix=".szrb")
+    try:
+        start = time.perf_counter()
+        with os.fdopen(handle, "wb") as file:
+            BinaryWriter().write(model, file)
+        print(f"{'write binary':>24}: {time.perf_counter() - start:7.3f}s "
+              f"({os.path.getsize(path) / 2 ** 20:.1f} MiB)")
+
+        identities = [str(generator.randrange(count))
+                      for _ in range(LOOKUPS)]
+        start = time.perf_counter()
+        with BinaryWorkspace(path) as workspace:
+            opened = time.perf_counter()
+            workspace.register_element_type(Tags.SOFTWARE_SYSTEM,
+                                            create_element)
+            for identity in identities:
+                workspace.get_relationships(workspace.get_element(identity))
+            end = time.perf_counter()
+        print(f"{'open binary':>24}: {opened - start:7.3f}s")
+        print(f"{f'{LOOKUPS} lookups':>24}: {end - opened:7.3f}s")
+    finally:
+        os.remove(path)
+
+    stream = io.StringIO()
+    JsonWriter().write(model, stream)
+    stream.seek(0)
+    reader = JsonReader()
+    reader.register_element_type(Tags.SOFTWARE_SYSTEM, create_element)
+    start = time.perf_counter()
+    reader.read(stream)
+    print(f"{'load json':>24}: {time.perf_counter() - start:7.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
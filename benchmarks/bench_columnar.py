@@ -0,0 +1,74 @@
+"""
+Compares analytics over the columnar relationship store with scans over
+Relationship objects.
+
+Usage: python -m benchmarks.bench_columnar [relationship count]
+"""
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+from benchmarks.fixtures import BenchElement
+from structurizr_py.core.model.columnar_relationship_store import \
+    ColumnarRelationshipStore
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.relationship import Relationship
+
+DEFAULT_COUNT = 10 ** 6
+TECHNOLOGIES = ["HTTPS", "gRPC", "Kafka", "JDBC", None]
+STYLES = [InteractionStyle.SYNCHRONOUS, InteractionStyle.ASYNCHRONOUS]
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:>32}: {time.perf_counter() - start:7.3f}s")
+    return result
+
+
+def main(count: int):
+    generator = random.Random(1)
+    elements = [BenchElement(f"Element {i}") for i in range(count // 10)]
+    rows = [(generator.choice(elements), generator.choice(elements), "Uses",
+             generator.choice(TECHNOLOGIES), generator.choice(STYLES))
+            for _ in range(count)]
+
+    tracemalloc.start()
+    relationships = [Relationship(*row) for row in rows]
+    objects_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    store = ColumnarRelationshipStore()
+    for element in elements:
+        store.index_of(element)
+    for row in rows:
+        store.add(*row)
+    columns_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{count} relationships")
+    print(f"{'bytes/relationship (objects)':>32}: "
+          f"{objects_memory / count:7.1f}")
+    print(f"{'bytes/relationship (columns)':>32}: "
+          f"{columns_memory / count:7.1f}")
+
+    timed("out degrees (objects)",
+          lambda: Counter(id(r.source) for r in relationships))
+    timed("out degrees (columns)", store.out_degrees)
+    timed("filter technology (objects)",
+          lambda: [r for r in relationships if r.technology == "Kafka"])
+    timed("filter technology (columns)",
+          lambda: store.filter_by_technology("Kafka"))
+    timed("filter async (objects)",
+          lambda: [r for r in relationships
+                   if r.interaction_style == InteractionStyle.ASYNCHRONOUS])
+    timed("filter async (columns)",
+          lambda: store.filter_by_interaction_style(
+              InteractionStyle.ASYNCHRONOUS))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
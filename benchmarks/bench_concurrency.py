@@ -0,0 +1,76 @@
+"""
+Measures a thread-safe model under contention: writer threads adding
+elements and relationships while reader threads take snapshots.
+
+Usage: python -m benchmarks.bench_concurrency [items per writer]
+"""
+import sys
+import threading
+import time
+
+from benchmarks.fixtures import BenchElement
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+
+DEFAULT_COUNT = 20000
+
+
+def write(model: Model, thread: int, count: int):
+    previous = None
+    for i in range(count):
+        element = BenchElement(f"Element {thread}.{i}")
+        model.add_element(element)
+        if previous is not None:
+            model.add_relationship(Relationship(
+                previous, element, "Uses", None,
+                InteractionStyle.SYNCHRONOUS))
+        previous = element
+
+
+def read(model: Model, done: threading.Event, latencies: list):
+    while not done.is_set():
+        start = time.perf_counter()
+        snapshot = model.snapshot()
+        latencies.append(time.perf_counter() - start)
+        sum(1 for _ in snapshot.iter_relationships())
+
+
+def run(writers: int, readers: int, count: int, thread_safe: bool):
+    model = Model(thread_safe=thread_safe)
+    done = threading.Event()
+    latencies = []
+    writer_threads = [threading.Thread(target=write,
+                                       args=(model, thread, count))
+                      for thread in range(writers)]
+    reader_threads = [threading.Thread(target=read,
+                                       args=(model, done, latencies))
+                      for _ in range(readers)]
+
+    start = time.perf_counter()
+    for thread in writer_threads + reader_threads:
+        thread.start()
+    for thread in writer_threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    done.set()
+    for thread in reader_threads:
+        thread.join()
+
+    items = writers * (2 * count - 1)
+    worst = max(latencies) * 1000 if latencies else 0
+    print(f"{writers} writers, {readers} readers "
+          f"({'thread-safe' if thread_safe else 'unlocked'}): "
+          f"{seconds:6.2f}s, {items / seconds:8.0f} items/s, "
+          f"{len(latencies)} snapshots, worst {worst:.2f}ms")
+
+
+def main(count: int):
+    run(1, 0, count, False)
+    run(1, 0, count, True)
+    for writers, readers in ((4, 0), (4, 2), (8, 4)):
+        run(writers, readers, count, True)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
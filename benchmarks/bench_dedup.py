@@ -0,0 +1,73 @@
+"""
+Measures relationship deduplication through content keys: rejecting
+duplicates in Model.add_relationship, keeping the content index up to date
+while elements are removed and added again, and deduplicating with a set.
+
+Usage: python -m benchmarks.bench_dedup [relationship count]
+"""
+import random
+import sys
+import time
+
+from benchmarks.fixtures import BenchElement
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+
+DEFAULT_COUNT = 10 ** 6
+INTERLEAVED_ROUNDS = 10 ** 4
+
+
+def create_relationships(elements, count: int, seed: int):
+    generator = random.Random(seed)
+    return [Relationship(generator.choice(elements),
+                         generator.choice(elements), "Uses",
+                         generator.choice(["HTTPS", "gRPC", None]),
+                         InteractionStyle.SYNCHRONOUS)
+            for _ in range(count)]
+
+
+def main(count: int):
+    model = Model()
+    elements = [BenchElement(f"Element {i}") for i in range(count // 10)]
+    for element in elements:
+        model.add_element(element)
+
+    first = create_relationships(elements, count, 1)
+    second = create_relationships(elements, count, 1)
+
+    start = time.perf_counter()
+    added = sum(model.add_relationship(r) for r in first)
+    seconds = time.perf_counter() - start
+    print(f"add {count} relationships: {seconds:6.2f}s "
+          f"({count / seconds:9.0f}/s, {added} added)")
+
+    start = time.perf_counter()
+    merged = sum(model.add_relationship(r) for r in second)
+    seconds = time.perf_counter() - start
+    print(f"merge {count} duplicates:  {seconds:6.2f}s "
+          f"({count / seconds:9.0f}/s, {merged} added)")
+
+    # neither removing a leaf element nor adding it again invalidates the
+    # content index, which add_relationship would otherwise rebuild
+    rounds = min(len(elements), INTERLEAVED_ROUNDS)
+    start = time.perf_counter()
+    for i in range(rounds):
+        element = elements[i]
+        element.model = None
+        element.model = model
+        model.add_relationship(Relationship(element, elements[-1 - i],
+                                            "Calls", None,
+                                            InteractionStyle.SYNCHRONOUS))
+    seconds = time.perf_counter() - start
+    print(f"remove/add {rounds} elements: {seconds:6.2f}s "
+          f"({rounds / seconds:9.0f}/s)")
+
+    start = time.perf_counter()
+    unique = len(set(first + second))
+    seconds = time.perf_counter() - start
+    print(f"set() of {2 * count}:      {seconds:6.2f}s ({unique} unique)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
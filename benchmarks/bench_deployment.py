@@ -0,0 +1,55 @@
+"""
+Measures building a large deployment model, deriving the relationships
+between its container instances and counting the connections between their
+replicas.
+
+Usage: python -m benchmarks.bench_deployment [node count]
+"""
+import sys
+import time
+
+from benchmarks.fixtures import BenchElement
+from structurizr_py.core.model.deployment_node import DeploymentNode
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+
+DEFAULT_COUNT = 10 ** 4
+CONTAINERS = 20
+REPLICAS = 50
+
+
+def main(count: int):
+    model = Model()
+    containers = [BenchElement(f"container{i}") for i in range(CONTAINERS)]
+    for container in containers:
+        container.model = model
+    for i, container in enumerate(containers[:-1]):
+        container.add_relationship(
+            Relationship(container, containers[i + 1], "Uses", None,
+                         InteractionStyle.SYNCHRONOUS))
+
+    start = time.perf_counter()
+    root = DeploymentNode("Data centre", environment="Live")
+    root.model = model
+    for i in range(count):
+        node = root.add_deployment_node(f"node{i}", instances=REPLICAS)
+        node.add(containers[i % CONTAINERS])
+    seconds = time.perf_counter() - start
+    print(f"{count} nodes with {REPLICAS} instances: {seconds:6.2f}s "
+          f"({len(model.elements)} elements)")
+
+    relationships = model.get_instance_relationships()
+    start = time.perf_counter()
+    connections = relationships.count_replica_connections()
+    seconds = time.perf_counter() - start
+    print(f"count replica connections: {seconds:6.2f}s ({connections})")
+
+    start = time.perf_counter()
+    derived = sum(1 for _ in relationships)
+    seconds = time.perf_counter() - start
+    print(f"derive instance relationships: {seconds:6.2f}s ({derived})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
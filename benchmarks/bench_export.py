@@ -0,0 +1,65 @@
+"""
+Measures exporting diagrams: one large diagram with a cold and a warm
+fragment cache, and many small views in this process and in a process pool.
+
+Usage: python -m benchmarks.bench_export [element count] [view count]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.generators import generate_model
+from structurizr_py.export.dot_exporter import DotExporter
+from structurizr_py.export.export_views import ExportView, export_views
+from structurizr_py.export.mermaid_exporter import MermaidExporter
+from structurizr_py.export.plant_uml_exporter import PlantUmlExporter
+
+DEFAULT_COUNT = 10 ** 5
+DEFAULT_VIEWS = 200
+VIEW_SIZE = 500
+
+
+class NullStream:
+    """A text stream discarding what is written, counting the characters."""
+
+    def __init__(self):
+        self.length = 0
+
+    def write(self, text: str) -> int:
+        self.length += len(text)
+        return len(text)
+
+
+def main(count: int, view_count: int):
+    model = generate_model(count)
+    elements = list(model.iter_elements())
+
+    for exporter in (PlantUmlExporter(), MermaidExporter(), DotExporter()):
+        name = type(exporter).__name__
+        for label in ("cold", "warm"):
+            stream = NullStream()
+            start = time.perf_counter()
+            exporter.export(model, stream)
+            seconds = time.perf_counter() - start
+            print(f"{name:17} {label} cache: {seconds:6.2f}s "
+                  f"({stream.length / 1e6:.1f}M characters)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        views = [ExportView(os.path.join(directory, f"view{i}.puml"),
+                            elements[(i * VIEW_SIZE) % count:]
+                            [:VIEW_SIZE])
+                 for i in range(view_count)]
+        for workers in (1, None):
+            start = time.perf_counter()
+            export_views(PlantUmlExporter(), model, views,
+                         max_workers=workers)
+            seconds = time.perf_counter() - start
+            print(f"{view_count} views, "
+                  f"{workers or os.cpu_count()} process(es): "
+                  f"{seconds:6.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT,
+         int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_VIEWS)
@@ -0,0 +1,56 @@
+"""
+Measures building a C4 element hierarchy of software systems, containers and
+components, computing the canonical names of all its elements after a
+rename and looking components up by name.
+
+Usage: python -m benchmarks.bench_hierarchy [component count]
+"""
+import sys
+import time
+
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.software_system import SoftwareSystem
+
+DEFAULT_COUNT = 10 ** 5
+CONTAINERS = 10
+COMPONENTS = 100
+
+
+def main(count: int):
+    model = Model()
+    systems = []
+    start = time.perf_counter()
+    for i in range(max(1, count // (CONTAINERS * COMPONENTS))):
+        system = SoftwareSystem(f"system{i}")
+        model.add_element(system)
+        systems.append(system)
+        for j in range(CONTAINERS):
+            container = system.add_container(f"container{j}")
+            for k in range(COMPONENTS):
+                container.add_component(f"component{k}")
+    seconds = time.perf_counter() - start
+    print(f"build: {seconds:6.2f}s ({len(model.elements)} elements)")
+
+    # renaming invalidates every cached canonical name
+    systems[0].name = "renamed"
+    for label in ("after a rename", "cached"):
+        start = time.perf_counter()
+        for element in model.iter_elements():
+            element.get_canonical_name()
+        seconds = time.perf_counter() - start
+        print(f"canonical names, {label}: {seconds:6.2f}s")
+
+    start = time.perf_counter()
+    found = 0
+    for system in systems:
+        for j in range(CONTAINERS):
+            container = system.get_container_with_name(f"container{j}")
+            for k in range(COMPONENTS):
+                if container.get_component_with_name(f"component{k}"):
+                    found += 1
+    seconds = time.perf_counter() - start
+    print(f"look up components by name: {seconds:6.2f}s ({found})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
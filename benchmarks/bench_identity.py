@@ -0,0 +1,55 @@
+"""
+Measures adding elements and relationships with each identity strategy,
+looking items up by identity and resolving relationships which refer to
+their elements by identity only.
+
+Usage: python -m benchmarks.bench_identity [element count]
+"""
+import sys
+import time
+
+from benchmarks.generators import generate_elements, generate_relationships
+from structurizr_py.core.model.identity_strategy import \
+    ContentHashIdentityStrategy, SequentialIdentityStrategy
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+
+DEFAULT_COUNT = 10 ** 5
+
+
+def main(count: int):
+    for strategy in (SequentialIdentityStrategy(),
+                     ContentHashIdentityStrategy()):
+        model = Model(identity_strategy=strategy)
+        elements = generate_elements(count)
+        start = time.perf_counter()
+        for element in elements:
+            model.add_element(element)
+        for relationship in generate_relationships(elements):
+            model.add_relationship(relationship)
+        seconds = time.perf_counter() - start
+        print(f"{type(strategy).__name__:27} add: {seconds:6.2f}s")
+
+    identities = [element.identity for element in elements]
+    start = time.perf_counter()
+    for identity in identities:
+        model.get_element(identity)
+    seconds = time.perf_counter() - start
+    print(f"get {count} elements by identity: {seconds:6.2f}s")
+
+    unresolved = []
+    for i, identity in enumerate(identities):
+        relationship = Relationship(None, None, "Refers to", None,
+                                    InteractionStyle.SYNCHRONOUS)
+        relationship.source_identity = identity
+        relationship.destination_identity = identities[(i + 7) % count]
+        unresolved.append(relationship)
+    start = time.perf_counter()
+    model.resolve_relationships(unresolved)
+    seconds = time.perf_counter() - start
+    print(f"resolve {count} relationships: {seconds:6.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,91 @@
+"""
+Measures the incremental maintenance of implied relationships in deep
+element hierarchies, against recomputing them after every change.
+
+Usage: python -m benchmarks.bench_implied [depth] [relationship count]
+"""
+import random
+import sys
+import time
+
+from structurizr_py.core.model.default_implied_relationships_strategy import \
+    DefaultImpliedRelationshipsStrategy
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+
+DEFAULT_DEPTH = 8
+DEFAULT_COUNT = 20000
+FAN_OUT = 3
+
+
+class NestedElement(Element):
+
+    __slots__ = ("parent",)
+
+    def __init__(self, name: str, parent):
+        super().__init__()
+        self.name = name
+        self.parent = parent
+
+    def get_parent(self):
+        return self.parent
+
+    def get_required_tags(self):
+        return set()
+
+
+def build_hierarchy(model: Model, depth: int) -> list:
+    level = [None]
+    for depth_index in range(depth):
+        level = [NestedElement(f"{depth_index}.{i}", parent)
+                 for i, parent in enumerate(
+                     parent for parent in level for _ in range(FAN_OUT))]
+        for element in level:
+            model.add_element(element)
+
+    return level
+
+
+def main(depth: int, count: int):
+    generator = random.Random(1)
+    model = Model()
+    leaves = build_hierarchy(model, depth)
+    model.implied_relationships_strategy = \
+        DefaultImpliedRelationshipsStrategy()
+    relationships = [Relationship(generator.choice(leaves),
+                                  generator.choice(leaves), "Uses", None,
+                                  InteractionStyle.SYNCHRONOUS)
+                     for _ in range(count)]
+    print(f"depth {depth}, {len(leaves)} leaves, {count} relationships")
+
+    start = time.perf_counter()
+    for relationship in relationships:
+        model.add_relationship(relationship)
+    seconds = time.perf_counter() - start
+    implied = sum(1 for _ in model.iter_implied_relationships())
+    print(f"{'incremental add':>20}: {seconds:7.3f}s "
+          f"({count / seconds:8.0f}/s, {implied} implied)")
+
+    removed = relationships[:count // 10]
+    start = time.perf_counter()
+    for relationship in removed:
+        model.remove_relationship(relationship)
+    seconds = time.perf_counter() - start
+    print(f"{'incremental remove':>20}: {seconds:7.3f}s "
+          f"({len(removed) / seconds:8.0f}/s)")
+
+    # a full recomputation, as needed after every change without the
+    # incremental index
+    start = time.perf_counter()
+    model.implied_relationships_strategy = \
+        DefaultImpliedRelationshipsStrategy()
+    sum(1 for _ in model.iter_implied_relationships())
+    seconds = time.perf_counter() - start
+    print(f"{'full recompute':>20}: {seconds:7.3f}s per change")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DEPTH,
+         int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_COUNT)
@@ -0,0 +1,41 @@
+"""
+Measures the cost of instrumentation: building and writing a model with
+the instrumentation never enabled, enabled, and enabled then disabled
+again.
+
+Usage: python -m benchmarks.bench_instrumentation [element count]
+"""
+import io
+import sys
+import time
+
+from benchmarks.generators import generate_model
+from structurizr_py.core.io.json_writer import JsonWriter
+from structurizr_py.core.util.instrumentation import DEFAULT_INSTRUMENTATION
+
+DEFAULT_COUNT = 10 ** 5
+
+
+def build(count: int) -> float:
+    start = time.perf_counter()
+    model = generate_model(count)
+    set(model.relationships)
+    JsonWriter().write(model, io.StringIO())
+    return time.perf_counter() - start
+
+
+def main(count: int):
+    print(f"never enabled:  {build(count):6.2f}s")
+
+    with DEFAULT_INSTRUMENTATION.profile() as metrics:
+        print(f"enabled:        {build(count):6.2f}s")
+    print(f"disabled again: {build(count):6.2f}s")
+
+    for name, values in metrics.items():
+        if values["calls"]:
+            print(f"  {name:36} {values['calls']:9} calls "
+                  f"{values['seconds']:6.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,81 @@
+"""
+Measures the throughput of writing and reading JSON workspaces.
+
+Usage: python -m benchmarks.bench_json [element count ...]
+"""
+import io
+import sys
+import time
+
+from benchmarks.fixtures import BenchElement
+from structurizr_py.core.io.json_format import JsonFormat
+from structurizr_py.core.io.json_reader import JsonReader
+from structurizr_py.core.io.json_writer import JsonWriter
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.tags import Tags
+
+DEFAULT_COUNTS = (10 ** 4, 10 ** 5)
+
+
+def build_model(count: int) -> Model:
+    """
+    Builds a model of count elements, each related to the next one.
+
+    :param count: the number of elements
+    :return: a Model
+    """
+    model = Model()
+    elements = []
+    for i in range(count):
+        element = BenchElement(f"Element {i}")
+        element.identity = str(i + 1)
+        element.description = "A benchmark element"
+        element.add_tags({Tags.ELEMENT, Tags.SOFTWARE_SYSTEM})
+        model.add_element(element)
+        elements.append(element)
+
+    for i in range(count):
+        relationship = Relationship(elements[i], elements[(i + 1) % count],
+                                    "Uses", "HTTPS",
+                                    InteractionStyle.SYNCHRONOUS)
+        relationship.identity = str(count + i + 1)
+        model.add_relationship(relationship)
+
+    return model
+
+
+def main(counts):
+    readers = {}
+    for fast in (False, True):
+        readers[fast] = JsonReader(use_fast_backend=fast)
+        readers[fast].register_element_type(
+            Tags.SOFTWARE_SYSTEM,
+            lambda fields, parent: BenchElement(fields["name"]))
+
+    backends = [False, True] if JsonFormat.has_fast_backend() else [False]
+    print(f"{'elements':>10} {'backend':>8} {'MB':>8} "
+          f"{'write MB/s':>11} {'read MB/s':>10}")
+    for count in counts:
+        model = build_model(count)
+        for fast in backends:
+            stream = io.StringIO()
+            start = time.perf_counter()
+            JsonWriter(use_fast_backend=fast).write(model, stream)
+            write_time = time.perf_counter() - start
+
+            document = stream.getvalue()
+            megabytes = len(document.encode("utf-8")) / 1e6
+
+            start = time.perf_counter()
+            readers[fast].read(io.StringIO(document))
+            read_time = time.perf_counter() - start
+
+            print(f"{count:>10} {'orjson' if fast else 'json':>8} "
+                  f"{megabytes:>8.1f} {megabytes / write_time:>11.1f} "
+                  f"{megabytes / read_time:>10.1f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_COUNTS)
@@ -0,0 +1,53 @@
+"""
+Measures the memory footprint of model items.
+
+Usage: python -m benchmarks.bench_memory [count ...]
+"""
+import gc
+import sys
+import tracemalloc
+
+from benchmarks.fixtures import BenchElement
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.relationship import Relationship
+
+DEFAULT_COUNTS = (10 ** 5, 10 ** 6)
+
+
+def measure(factory, count: int) -> float:
+    """
+    Gets the number of bytes allocated per item when creating count items.
+
+    :param factory: a callable creating the i-th item
+    :param count: the number of items to create
+    :return: bytes per item, as a float
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # the list holding the items is not part of their footprint
+    per_item = (after - before - sys.getsizeof(items)) / count
+    del items
+    return per_item
+
+
+def main(counts):
+    source = BenchElement("Source")
+    destination = BenchElement("Destination")
+
+    print(f"{'items':>10} {'bytes/element':>14} {'bytes/relationship':>19}")
+    for count in counts:
+        # names are shared so that only the items themselves are measured
+        element = measure(lambda i: BenchElement("Element"), count)
+        relationship = measure(
+            lambda i: Relationship(source, destination, "Uses", None,
+                                   InteractionStyle.SYNCHRONOUS), count)
+        print(f"{count:>10} {element:>14.1f} {relationship:>19.1f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_COUNTS)
@@ -0,0 +1,55 @@
+"""
+Measures finding elements by property value through the model's property
+store, against scanning every element's properties.
+
+Usage: python -m benchmarks.bench_properties [element count]
+"""
+import random
+import sys
+import time
+
+from benchmarks.fixtures import BenchElement
+from structurizr_py.core.model.model import Model
+
+DEFAULT_COUNT = 10 ** 6
+TEAMS = [f"team-{i}" for i in range(100)]
+LOOKUPS = 100
+
+
+def main(count: int):
+    generator = random.Random(1)
+    model = Model()
+
+    start = time.perf_counter()
+    for i in range(count):
+        element = BenchElement(f"Element {i}")
+        element.add_property("team", generator.choice(TEAMS))
+        if i % 10 == 0:
+            element.add_property("owner", f"owner-{i % 1000}")
+        element.model = model
+    seconds = time.perf_counter() - start
+    print(f"add {count} elements with properties: {seconds:6.2f}s")
+
+    elements = model.elements
+    start = time.perf_counter()
+    scanned = sum(len([e for e in elements
+                       if e.properties.get("team") == team])
+                  for team in TEAMS[:LOOKUPS])
+    seconds = time.perf_counter() - start
+    print(f"scan for {LOOKUPS} values:   {seconds:8.4f}s ({scanned} found)")
+
+    store = model.property_store
+    start = time.perf_counter()
+    found = sum(len(list(store.find("team", team)))
+                for team in TEAMS[:LOOKUPS])
+    seconds = time.perf_counter() - start
+    print(f"index for {LOOKUPS} values:  {seconds:8.4f}s ({found} found)")
+
+    start = time.perf_counter()
+    owners = sum(1 for _ in store.iter_property("owner"))
+    seconds = time.perf_counter() - start
+    print(f"iterate one property:  {seconds:8.4f}s ({owners} items)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,138 @@
+"""
+Measures model queries planned over indexes against the equivalent list
+comprehensions over every element.
+
+Usage: python -m benchmarks.bench_query [element count]
+"""
+import random
+import sys
+import time
+
+from benchmarks.fixtures import BenchElement
+from structurizr_py.core.model.code_element import CodeElement
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.tags import Tags
+
+DEFAULT_COUNT = 10 ** 5
+SYSTEMS = 100
+TEAMS = [f"team-{i}" for i in range(50)]
+
+
+class BenchComponent(Element):
+    """A nested element with code elements."""
+
+    __slots__ = ("__parent", "__code_elements")
+
+    def __init__(self, name: str, parent: Element):
+        self.__parent = parent
+        self.__code_elements = []
+        super().__init__()
+        self.name = name
+
+    @property
+    def code_elements(self):
+        return self.__code_elements
+
+    def add_code_element(self, code_element: CodeElement):
+        self.__code_elements.append(code_element)
+        if self.model is not None:
+            self.model._code_element_added(self, code_element)
+
+    def get_parent(self):
+        return self.__parent
+
+    def get_required_tags(self):
+        return {Tags.ELEMENT, Tags.COMPONENT}
+
+
+def create_model(count: int) -> Model:
+    generator = random.Random(1)
+    model = Model()
+    systems = [BenchElement(f"System {i}") for i in range(SYSTEMS)]
+    for system in systems:
+        system.model = model
+
+    for i in range(count):
+        component = BenchComponent(f"Component {i}",
+                                   generator.choice(systems))
+        component.add_tags({Tags.COMPONENT})
+        if i % 7 == 0:
+            component.add_tags({"Database Access"})
+        component.add_property("team", generator.choice(TEAMS))
+        component.add_code_element(CodeElement(
+            f"pkg{i % 200}.module{i % 13}.Class{i}"))
+        component.model = model
+        destination = generator.choice(systems)
+        component.add_relationship(Relationship(
+            component, destination, "Uses", None,
+            generator.choice([InteractionStyle.SYNCHRONOUS,
+                              InteractionStyle.ASYNCHRONOUS])))
+
+    return model
+
+
+def measure(label: str, function, repeat: int = 5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        found = function()
+    seconds = (time.perf_counter() - start) / repeat
+    print(f"{label:44} {seconds * 1000:9.2f}ms ({found} found)")
+
+
+def main(count: int):
+    start = time.perf_counter()
+    model = create_model(count)
+    print(f"create {count} components: "
+          f"{time.perf_counter() - start:6.2f}s")
+
+    elements = list(model.iter_elements())
+    target = next(e for e in elements if e.name == "System 0")
+
+    def has_code_in(element, package):
+        return any(c.get_package() == package or
+                   c.get_package().startswith(package + ".")
+                   for c in getattr(element, "code_elements", ()))
+
+    def relates_to(element, destination, style):
+        return any(r.destination is destination and
+                   r.interaction_style == style
+                   for r in model.get_efferent_relationships(element))
+
+    queries = [
+        ("tag + property",
+         lambda: len([e for e in elements
+                      if "Database Access" in e.get_tags_as_set() and
+                      e.properties.get("team") == "team-1"]),
+         model.query_elements().tagged("Database Access")
+         .with_property("team", "team-1")),
+        ("tag + package",
+         lambda: len([e for e in elements
+                      if "Database Access" in e.get_tags_as_set() and
+                      has_code_in(e, "pkg7")]),
+         model.query_elements().tagged("Database Access")
+         .with_code_in_package("pkg7")),
+        ("canonical name prefix",
+         lambda: len([e for e in elements
+                      if e.get_canonical_name().startswith("/System 5/")]),
+         model.query_elements().with_canonical_name_prefix("/System 5/")),
+        ("tag + async relationship to",
+         lambda: len([e for e in elements
+                      if Tags.COMPONENT in e.get_tags_as_set() and
+                      relates_to(e, target, InteractionStyle.ASYNCHRONOUS)]),
+         model.query_elements().tagged(Tags.COMPONENT)
+         .with_relationship_to(target, InteractionStyle.ASYNCHRONOUS)),
+    ]
+
+    for label, comprehension, query in queries:
+        measure(f"{label} (comprehension)", comprehension)
+        # the first run includes building the indexes created lazily
+        measure(f"{label} (first query)", query.count, repeat=1)
+        measure(f"{label} (query)", query.count)
+        print(f"  plan: {query.explain()}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
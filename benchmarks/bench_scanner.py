@@ -0,0 +1,71 @@
+"""
+Measures how many files per second the source scanner processes, for a cold
+scan, an unchanged re-scan and a re-scan after 1% of the files changed.
+
+Usage: python -m benchmarks.bench_scanner [file count] [processes]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from structurizr_py.core.scanner.python_source_scanner import \
+    PythonSourceScanner
+
+DEFAULT_COUNT = 5000
+
+MODULE = '''
+class Service{i}:
+    """A generated service."""
+
+    def __init__(self):
+        self._state = {{}}
+
+    def handle(self, request):
+        return self._process(request)
+
+    def _process(self, request):
+        return request
+
+
+def factory_{i}():
+    return Service{i}()
+'''
+
+
+def generate(root: str, count: int):
+    for i in range(count):
+        directory = os.path.join(root, f"package_{i // 100}")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"module_{i}.py"), "w") as file:
+            file.write(MODULE.format(i=i))
+
+
+def timed_scan(scanner: PythonSourceScanner, root: str, label: str,
+               count: int):
+    start = time.perf_counter()
+    code_elements = scanner.scan(root)
+    seconds = time.perf_counter() - start
+    print(f"{label:>14}: {seconds:7.3f}s {count / seconds:10.0f} files/s "
+          f"({scanner.parsed_files} parsed, {len(code_elements)} elements)")
+
+
+def main(count: int, processes: int or None):
+    with tempfile.TemporaryDirectory() as root:
+        generate(root, count)
+        scanner = PythonSourceScanner(processes=processes)
+        print(f"{count} files, {processes or os.cpu_count()} processes")
+
+        timed_scan(scanner, root, "cold", count)
+        timed_scan(scanner, root, "unchanged", count)
+
+        for i in range(0, count, 100):
+            path = os.path.join(root, f"package_{i // 100}", f"module_{i}.py")
+            with open(path, "a") as file:
+                file.write("\n\ndef added():\n    pass\n")
+        timed_scan(scanner, root, "1% changed", count)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT,
+         int(sys.argv[2]) if len(sys.argv) > 2 else None)
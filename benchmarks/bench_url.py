@@ -0,0 +1,54 @@
+"""
+Compares URL validation with the previous, uncached implementation.
+
+Usage: python -m benchmarks.bench_url [validations]
+"""
+import sys
+import time
+from urllib.parse import urlparse
+
+from structurizr_py.core.util.url import Url
+
+DEFAULT_COUNT = 10 ** 6
+
+"""A small set of repository base URLs, as reused across a typical model"""
+URLS = [f"https://github.com/example/repo-{i}/blob/main/src/module.py"
+        for i in range(50)] + \
+       [f"ssh://git@git.example.com/repo-{i}.git" for i in range(10)] + \
+       ["not a url"]
+
+
+def uncached_is_url(url: str) -> bool:
+    """The implementation of Url.is_url before caching was added."""
+    parsed = urlparse(url)
+    return True if len(parsed.scheme) > 0 and len(parsed.netloc) > 0\
+        else False
+
+
+def timed(function, urls) -> float:
+    start = time.perf_counter()
+    for url in urls:
+        function(url)
+    return time.perf_counter() - start
+
+
+def main(count: int):
+    urls = [URLS[i % len(URLS)] for i in range(count)]
+    Url.clear_cache()
+
+    uncached = timed(uncached_is_url, urls)
+    cached = timed(Url.is_url, urls)
+    start = time.perf_counter()
+    Url.validate_many(urls)
+    batch = time.perf_counter() - start
+
+    print(f"{count} validations of {len(URLS)} distinct URLs")
+    for label, seconds in (("uncached urlparse", uncached),
+                           ("Url.is_url", cached),
+                           ("Url.validate_many", batch)):
+        print(f"{label:>18}: {seconds:7.3f}s "
+              f"{count / seconds / 1e6:6.2f}M/s {uncached / seconds:6.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
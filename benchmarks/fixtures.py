@@ -0,0 +1,21 @@
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.tags import Tags
+
+
+class BenchElement(Element):
+    """
+    A minimal concrete, top-level element used by the benchmarks. It is
+    written to workspaces as a software system.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, name: str):
+        super().__init__()
+        self.name = name
+
+    def get_parent(self):
+        return None
+
+    def get_required_tags(self):
+        return {Tags.ELEMENT, Tags.SOFTWARE_SYSTEM}
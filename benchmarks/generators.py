@@ -0,0 +1,118 @@
+"""
+Reproducible synthetic models for the benchmarks. Every generator is
+deterministic for a given size and seed, so results from different runs and
+machines measure the same work.
+"""
+import random
+from typing import List
+
+from benchmarks.fixtures import BenchElement
+from structurizr_py.core.model.code_element import CodeElement
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.tags import Tags
+
+TAGS = [f"Tag {i}" for i in range(16)]
+TECHNOLOGIES = ["HTTPS", "gRPC", "JDBC", "AMQP", None]
+
+
+def generate_elements(count: int, seed: int = 0) -> List[BenchElement]:
+    """
+    Generates elements with a description and one or two tags each. They are
+    not added to any model.
+
+    :param count: the number of elements
+    :param seed: the seed of the random generator
+    :return: a List of BenchElement objects
+    """
+    generator = random.Random(seed)
+    elements = []
+    for i in range(count):
+        element = BenchElement(f"Element {i}")
+        element.description = f"Description of element {i}"
+        element.add_tags({Tags.ELEMENT, Tags.SOFTWARE_SYSTEM,
+                          generator.choice(TAGS)})
+        elements.append(element)
+
+    return elements
+
+
+def generate_relationships(elements: List[BenchElement],
+                           per_element: int = 2,
+                           seed: int = 0) -> List[Relationship]:
+    """
+    Generates relationships from every element to per_element others, all
+    with distinct content, so that none of them is rejected as a duplicate.
+
+    :param elements: the elements to relate
+    :param per_element: the number of relationships from each element
+    :param seed: the seed of the random generator
+    :return: a List of Relationship objects
+    """
+    generator = random.Random(seed)
+    count = len(elements)
+    relationships = []
+    for i, source in enumerate(elements):
+        for k in range(per_element):
+            destination = elements[(i + generator.randrange(1, count))
+                                   % count] if count > 1 else source
+            relationships.append(Relationship(
+                source, destination, f"Uses {k}",
+                generator.choice(TECHNOLOGIES),
+                generator.choice([InteractionStyle.SYNCHRONOUS,
+                                  InteractionStyle.ASYNCHRONOUS])))
+
+    return relationships
+
+
+def generate_model(count: int, per_element: int = 2, seed: int = 0) -> Model:
+    """
+    Generates a model of count elements, each with per_element outgoing
+    relationships. Every item has a sequential identity, elements first.
+
+    :param count: the number of elements
+    :param per_element: the number of relationships from each element
+    :param seed: the seed of the random generator
+    :return: a Model
+    """
+    model = Model()
+    elements = generate_elements(count, seed)
+    for element in elements:
+        model.add_element(element)
+
+    for relationship in generate_relationships(elements, per_element, seed):
+        model.add_relationship(relationship)
+
+    return model
+
+
+def generate_code_elements(count: int) -> List[CodeElement]:
+    """
+    Generates code elements spread over a tree of packages.
+
+    :param count: the number of code elements
+    :return: a List of CodeElement objects
+    """
+    return [CodeElement(f"pkg{i % 97}.module{i % 13}.Class{i}")
+            for i in range(count)]
+
+
+def generate_urls(count: int, seed: int = 0) -> List[str]:
+    """
+    Generates distinct URLs, roughly one in ten of which is invalid.
+
+    :param count: the number of URLs
+    :param seed: the seed of the random generator
+    :return: a List of str
+    """
+    generator = random.Random(seed)
+    urls = []
+    for i in range(count):
+        if generator.random() < 0.1:
+            urls.append(f"not a url {i}")
+        else:
+            urls.append(f"https://host{i % 1000}.example.com/path/{i}"
+                        f"?query={generator.randrange(10 ** 6)}")
+
+    return urls
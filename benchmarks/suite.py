@@ -0,0 +1,310 @@
+"""
+Runs the benchmark suite of the core model over synthetic models of
+increasing size, stores the results as JSON and compares them with a
+baseline, failing when a case got slower than the allowed threshold.
+
+Usage:
+    python -m benchmarks.suite [--sizes 1000,10000,100000,1000000]
+                               [--cases element,json] [--repeat 5]
+                               [--output results.json]
+                               [--baseline baseline.json] [--threshold 0.1]
+
+Record a baseline before upgrading (--output baseline.json), then run the
+suite against it (--baseline baseline.json); the exit status is 1 if any
+case regressed. Each case is prepared afresh for every repetition and only
+the work itself is timed, with the garbage collector disabled; the fastest
+repetition is kept.
+"""
+import argparse
+import gc
+import io
+import json
+import platform
+import sys
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.fixtures import BenchElement
+from benchmarks.generators import TAGS, generate_code_elements, \
+    generate_elements, generate_model, generate_relationships, generate_urls
+from structurizr_py.core.io.json_reader import JsonReader
+from structurizr_py.core.io.json_writer import JsonWriter
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.tags import Tags
+from structurizr_py.core.util.url import Url
+
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.10
+
+"""Differences below this many seconds are treated as noise"""
+MIN_DIFFERENCE = 0.001
+
+
+def case_create_elements(size: int) -> Callable[[], int]:
+    names = [f"Element {i}" for i in range(size)]
+    return lambda: len([BenchElement(name) for name in names])
+
+
+def case_add_elements(size: int) -> Callable[[], int]:
+    model = Model()
+    elements = generate_elements(size)
+
+    def run():
+        for element in elements:
+            model.add_element(element)
+        return size
+
+    return run
+
+
+def case_add_relationships(size: int) -> Callable[[], int]:
+    model = Model()
+    elements = generate_elements(size)
+    for element in elements:
+        model.add_element(element)
+    relationships = generate_relationships(elements)
+
+    def run():
+        return sum(model.add_relationship(r) for r in relationships)
+
+    return run
+
+
+def case_add_tags(size: int) -> Callable[[], int]:
+    elements = [BenchElement(f"Element {i}") for i in range(size)]
+    tags = [{TAGS[i % len(TAGS)], TAGS[(i + 1) % len(TAGS)]}
+            for i in range(size)]
+
+    def run():
+        for element, element_tags in zip(elements, tags):
+            element.add_tags(element_tags)
+        return size
+
+    return run
+
+
+def case_read_tags(size: int) -> Callable[[], int]:
+    elements = generate_elements(size)
+
+    def run():
+        for element in elements:
+            element.tags = {Tags.ELEMENT, TAGS[0]}
+            element.get_tags_as_set()
+        return sum(len(element.tags) > 0 for element in elements)
+
+    return run
+
+
+def case_has_afferent_relationships(size: int) -> Callable[[], int]:
+    model = generate_model(size)
+    elements = list(model.iter_elements())
+    return lambda: sum(e.has_afferent_relationships() for e in elements)
+
+
+def case_element_hashing(size: int) -> Callable[[], int]:
+    elements = generate_elements(size)
+    others = generate_elements(size)
+
+    def run():
+        unique = set(elements)
+        return len(unique) + sum(e in unique for e in others) + \
+            sum(a == b for a, b in zip(elements, others))
+
+    return run
+
+
+def case_relationship_hashing(size: int) -> Callable[[], int]:
+    elements = generate_elements(size)
+    relationships = generate_relationships(elements, per_element=1)
+    others = generate_relationships(elements, per_element=1)
+
+    def run():
+        unique = set(relationships)
+        return len(unique) + sum(r in unique for r in others) + \
+            sum(a == b for a, b in zip(relationships, others))
+
+    return run
+
+
+def case_code_element_hashing(size: int) -> Callable[[], int]:
+    code_elements = generate_code_elements(size)
+    others = generate_code_elements(size)
+
+    def run():
+        unique = set(code_elements)
+        return len(unique) + sum(c in unique for c in others)
+
+    return run
+
+
+def case_validate_urls(size: int) -> Callable[[], int]:
+    urls = generate_urls(size)
+    Url.clear_cache()
+    return lambda: sum(Url.is_url(url) for url in urls)
+
+
+def case_write_json(size: int) -> Callable[[], int]:
+    model = generate_model(size)
+    writer = JsonWriter()
+
+    def run():
+        stream = io.StringIO()
+        writer.write(model, stream)
+        return len(stream.getvalue())
+
+    return run
+
+
+def case_read_json(size: int) -> Callable[[], int]:
+    stream = io.StringIO()
+    JsonWriter().write(generate_model(size), stream)
+    document = stream.getvalue()
+    reader = JsonReader()
+    reader.register_element_type(
+        Tags.SOFTWARE_SYSTEM,
+        lambda fields, parent: BenchElement(fields["name"]))
+
+    return lambda: len(reader.read(io.StringIO(document)).elements)
+
+
+"""The cases of the suite, by name: each prepares its work for a size and
+returns a callable doing it"""
+CASES: Dict[str, Callable[[int], Callable[[], int]]] = {
+    "element.create": case_create_elements,
+    "element.add": case_add_elements,
+    "relationship.add": case_add_relationships,
+    "tags.add": case_add_tags,
+    "tags.read": case_read_tags,
+    "model.has_afferent_relationships": case_has_afferent_relationships,
+    "element.hash_eq": case_element_hashing,
+    "relationship.hash_eq": case_relationship_hashing,
+    "code_element.hash_eq": case_code_element_hashing,
+    "url.validate": case_validate_urls,
+    "json.write": case_write_json,
+    "json.read": case_read_json,
+}
+
+
+def measure(prepare: Callable[[int], Callable[[], int]], size: int,
+            repeat: int) -> float:
+    """
+    Measures one case at one size.
+
+    :param prepare: the function preparing the case
+    :param size: the size of the synthetic model
+    :param repeat: the number of repetitions
+    :return: the fastest time, in seconds
+    """
+    best = None
+    for _ in range(repeat):
+        run = prepare(size)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            seconds = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = seconds if best is None else min(best, seconds)
+
+    return best
+
+
+def run_suite(sizes: List[int], cases: List[str], repeat: int) -> dict:
+    """
+    Runs the selected cases at every size.
+
+    :param sizes: the sizes of the synthetic models
+    :param cases: the names of the cases to run
+    :param repeat: the number of repetitions of each case
+    :return: the results, as a JSON compatible dict
+    """
+    results = {}
+    for name in cases:
+        for size in sizes:
+            seconds = measure(CASES[name], size, repeat)
+            results[f"{name}/{size}"] = {
+                "seconds": seconds, "size": size,
+                "ns_per_item": seconds / size * 1e9}
+            print(f"{name:34} {size:>9} {seconds:10.4f}s "
+                  f"{seconds / size * 1e9:10.0f}ns/item", flush=True)
+
+    return {"python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": repeat,
+            "results": results}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """
+    Compares results with a baseline.
+
+    :param results: the results of run_suite
+    :param baseline: earlier results of run_suite
+    :param threshold: the allowed slowdown, e.g. 0.1 for 10%
+    :return: a List of the regressed cases, as "name/size" str
+    """
+    regressions = []
+    print(f"\n{'case':44} {'baseline':>10} {'current':>10} {'change':>8}")
+    for key, result in results["results"].items():
+        before = baseline.get("results", {}).get(key)
+        if before is None:
+            continue
+
+        old, new = before["seconds"], result["seconds"]
+        change = new / old - 1 if old else 0.0
+        regressed = change > threshold and new - old > MIN_DIFFERENCE
+        if regressed:
+            regressions.append(key)
+        print(f"{key:44} {old:10.4f} {new:10.4f} {change:+8.1%}"
+              f"{'  REGRESSION' if regressed else ''}")
+
+    return regressions
+
+
+def main(arguments: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Benchmarks the core model.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma separated model sizes")
+    parser.add_argument("--cases", default="",
+                        help="comma separated case names or prefixes "
+                             "(default: all)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", help="file to store the results in")
+    parser.add_argument("--baseline", help="results to compare with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown, e.g. 0.1 for 10%%")
+    options = parser.parse_args(arguments)
+
+    sizes = [int(size) for size in options.sizes.split(",") if size]
+    prefixes = [prefix for prefix in options.cases.split(",") if prefix]
+    cases = [name for name in CASES
+             if not prefixes or any(name.startswith(p) for p in prefixes)]
+    if not cases:
+        parser.error(f"no case matches {options.cases}")
+
+    results = run_suite(sizes, cases, options.repeat)
+    if options.output:
+        with open(options.output, "w") as stream:
+            json.dump(results, stream, indent=2)
+
+    if options.baseline:
+        with open(options.baseline) as stream:
+            baseline = json.load(stream)
+        regressions = compare(results, baseline, options.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above "
+                  f"{options.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
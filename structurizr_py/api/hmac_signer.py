@@ -0,0 +1,69 @@
+import base64
+import hashlib
+import hmac
+from typing import Dict
+
+
+class HmacSigner:
+    """
+    Signs requests to the Structurizr API with the API key and secret of a
+    workspace.
+
+    The signature is the HMAC-SHA256 (with the API secret) of the request
+    method, path, MD5 digest of the content, content type and nonce, one per
+    line. It is sent Base64 encoded in the X-Authorization header, after the
+    API key.
+    """
+
+    def __init__(self, api_key: str, api_secret: str):
+        if api_key is None or api_key.strip() == "":
+            raise ValueError("The API key must not be null or empty.")
+        if api_secret is None or api_secret.strip() == "":
+            raise ValueError("The API secret must not be null or empty.")
+
+        self.__api_key = api_key
+        self.__api_secret = api_secret.encode("utf-8")
+
+    @property
+    def api_key(self) -> str:
+        return self.__api_key
+
+    def signature(self, method: str, path: str, content_md5: str,
+                  content_type: str, nonce: str) -> str:
+        """
+        Computes the signature of a request.
+
+        :param method: the HTTP method, e.g. "PUT"
+        :param path: the path of the request, e.g. "/workspace/1234"
+        :param content_md5: the hex MD5 digest of the content
+        :param content_type: the content type, or an empty str
+        :param nonce: the nonce, as a str
+        :return: the hex HMAC digest, as a str
+        """
+        content = f"{method}\n{path}\n{content_md5}\n{content_type}\n" \
+                  f"{nonce}\n"
+        return hmac.new(self.__api_secret, content.encode("utf-8"),
+                        hashlib.sha256).hexdigest()
+
+    def headers(self, method: str, path: str, content_md5: str,
+                content_type: str, nonce: str) -> Dict[str, str]:
+        """
+        Gets the authentication headers of a request.
+
+        :param method: the HTTP method, e.g. "PUT"
+        :param path: the path of the request, e.g. "/workspace/1234"
+        :param content_md5: the hex MD5 digest of the content
+        :param content_type: the content type, or an empty str
+        :param nonce: the nonce, as a str
+        :return: a Dict of header name to value
+        """
+        signature = self.signature(method, path, content_md5, content_type,
+                                   nonce)
+        return {"X-Authorization":
+                f"{self.__api_key}:{_base64(signature)}",
+                "Nonce": nonce,
+                "Content-MD5": _base64(content_md5)}
+
+
+def _base64(value: str) -> str:
+    return base64.b64encode(value.encode("utf-8")).decode("ascii")
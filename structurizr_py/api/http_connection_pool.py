@@ -0,0 +1,251 @@
+from __future__ import annotations
+import asyncio
+import ssl
+from typing import AsyncIterator, Callable, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from structurizr_py.api.structurizr_client_error import \
+    StructurizrClientError
+
+_Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class HttpResponse:
+    """A response read by an HttpConnectionPool."""
+
+    __slots__ = ("status", "reason", "headers", "body")
+
+    def __init__(self, status: int, reason: str, headers: Dict[str, str],
+                 body: bytes):
+        """
+        :param status: the HTTP status
+        :param reason: the reason phrase
+        :param headers: the headers, with lower case names
+        :param body: the body, as sent (i.e. not decompressed)
+        """
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+
+class HttpConnectionPool:
+    """
+    A minimal HTTP/1.1 client for asyncio, keeping connections to one server
+    alive and reusing them across requests.
+
+    At most max_connections requests are in flight at once; further
+    requests wait for a connection. Request bodies can be streamed from an
+    async iterator, optionally announced with "Expect: 100-continue" so that
+    the server can reject a request (e.g. a failed precondition) before the
+    body is sent.
+    """
+
+    """Seconds to wait for "100 Continue" before sending the body anyway"""
+    CONTINUE_TIMEOUT = 1.0
+
+    def __init__(self, url: str, max_connections: int = 8,
+                 timeout: float = 60.0, ssl_context: ssl.SSLContext = None):
+        """
+        :param url: the base URL of the server, e.g. "https://example.com/api"
+        :param max_connections: the maximum number of open connections
+        :param timeout: the timeout of each request, in seconds
+        :param ssl_context: the SSL context of https connections, defaults to
+                            the system's default context
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"{url} is not a valid http(s) URL.")
+
+        self.__host = parts.hostname
+        self.__port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.__host_header = parts.netloc
+        self.__base_path = parts.path.rstrip("/")
+        self.__ssl = (ssl_context or ssl.create_default_context()) \
+            if parts.scheme == "https" else None
+        self.__timeout = timeout
+        self.__semaphore = asyncio.Semaphore(max_connections)
+        self.__idle: List[_Connection] = []
+        self.__connections_opened = 0
+
+    @property
+    def base_path(self) -> str:
+        """
+        Gets the path of the base URL, without a trailing slash.
+
+        :return: the path, as a str
+        """
+        return self.__base_path
+
+    @property
+    def connections_opened(self) -> int:
+        """
+        Gets the number of connections opened so far.
+
+        :return: the number of connections, as an int
+        """
+        return self.__connections_opened
+
+    async def request(self, method: str, path: str, headers: Dict[str, str],
+                      body: Callable[[], AsyncIterator[bytes]] = None,
+                      expect_continue: bool = False) -> HttpResponse:
+        """
+        Sends a request and reads its response. A request failing on a
+        reused keep-alive connection (which the server may have closed) is
+        retried once on a new connection.
+
+        :param method: the HTTP method
+        :param path: the path, relative to the base URL
+        :param headers: the request headers; Content-Length must be set if
+                        there is a body
+        :param body: a function returning an async iterator over the chunks
+                     of the body, None for no body
+        :param expect_continue: whether to wait for "100 Continue" before
+                                sending the body
+        :return: an HttpResponse object
+        """
+        async with self.__semaphore:
+            try:
+                return await asyncio.wait_for(
+                    self.__request(method, self.__base_path + path, headers,
+                                   body, expect_continue), self.__timeout)
+            except asyncio.TimeoutError:
+                raise StructurizrClientError(
+                    f"{method} {path} timed out after {self.__timeout}s")
+            except OSError as error:
+                raise StructurizrClientError(f"{method} {path} failed: "
+                                             f"{error}") from error
+
+    async def close(self):
+        """
+        Closes all idle connections.
+
+        :return: None
+        """
+        idle, self.__idle = self.__idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def __request(self, method: str, path: str,
+                        headers: Dict[str, str], body, expect_continue: bool) \
+            -> HttpResponse:
+        while True:
+            connection, reused = await self.__acquire()
+            try:
+                response, reusable = await self.__exchange(
+                    connection, method, path, headers, body, expect_continue)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                connection[1].close()
+                if reused:
+                    continue
+                raise ConnectionError("The connection was closed by the "
+                                      "server")
+            except BaseException:
+                connection[1].close()
+                raise
+
+            if reusable:
+                self.__idle.append(connection)
+            else:
+                connection[1].close()
+
+            return response
+
+    async def __acquire(self) -> Tuple[_Connection, bool]:
+        while self.__idle:
+            connection = self.__idle.pop()
+            if not connection[0].at_eof():
+                return connection, True
+            connection[1].close()
+
+        connection = await asyncio.open_connection(self.__host, self.__port,
+                                                   ssl=self.__ssl)
+        self.__connections_opened += 1
+        return connection, False
+
+    async def __exchange(self, connection: _Connection, method: str,
+                         path: str, headers: Dict[str, str], body,
+                         expect_continue: bool) -> Tuple[HttpResponse, bool]:
+        reader, writer = connection
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.__host_header}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        if body is not None and expect_continue:
+            lines.append("Expect: 100-continue")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+        if body is not None:
+            if expect_continue:
+                await writer.drain()
+                try:
+                    head = await asyncio.wait_for(
+                        self.__read_head(reader), self.CONTINUE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    head = None
+                if head is not None and head[0] != 100:
+                    # rejected before the body was sent, the server can't
+                    # tell whether a body will follow, so don't reuse
+                    return await self.__read_response(reader, method,
+                                                      head), False
+
+            async for chunk in body():
+                writer.write(chunk)
+                await writer.drain()
+        await writer.drain()
+
+        head = await self.__read_head(reader)
+        while 100 <= head[0] < 200:
+            head = await self.__read_head(reader)
+
+        response = await self.__read_response(reader, method, head)
+        reusable = response.headers.get("connection", "").lower() != \
+            "close" and not reader.at_eof()
+        return response, reusable
+
+    @staticmethod
+    async def __read_head(reader: asyncio.StreamReader) \
+            -> Tuple[int, str, Dict[str, str]]:
+        status_line = await reader.readuntil(b"\r\n")
+        parts = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise ConnectionError(f"Invalid HTTP status line {parts}")
+
+        headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        return int(parts[1]), parts[2] if len(parts) > 2 else "", headers
+
+    @staticmethod
+    async def __read_response(reader: asyncio.StreamReader, method: str,
+                              head: Tuple[int, str, Dict[str, str]]) \
+            -> HttpResponse:
+        status, reason, headers = head
+        if method == "HEAD" or status in (204, 304):
+            body = b""
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0],
+                           16)
+                if size == 0:
+                    while await reader.readuntil(b"\r\n") != b"\r\n":
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+
+        return HttpResponse(status, reason, headers, body)
@@ -0,0 +1,304 @@
+from __future__ import annotations
+import asyncio
+import hashlib
+import io
+import tempfile
+import time
+import zlib
+from typing import AsyncIterator, Dict, TYPE_CHECKING
+
+from structurizr_py.api.hmac_signer import HmacSigner
+from structurizr_py.api.http_connection_pool import HttpConnectionPool, \
+    HttpResponse
+from structurizr_py.api.structurizr_client_error import \
+    StructurizrClientError
+from structurizr_py.core.io.json_reader import JsonReader
+from structurizr_py.core.io.json_writer import JsonWriter
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.model import Model
+
+_CONTENT_TYPE = "application/json; charset=UTF-8"
+_USER_AGENT = "structurizr-py/0.1.0"
+
+
+class StructurizrClient:
+    """
+    An asyncio client for the Structurizr API, getting and putting
+    workspaces.
+
+    Requests are signed with the workspace's API key and secret (see
+    HmacSigner) and sent over a pool of keep-alive connections, so many
+    workspaces can be pushed concurrently (see put_workspaces). Uploads are
+    serialized in a worker thread into a gzip-compressed temporary file and
+    streamed from there.
+
+    The client remembers the ETag (the MD5 digest of the serialized,
+    uncompressed workspace) and Last-Modified date of each workspace it got
+    or put. put_workspace always serializes the workspace to compute that
+    digest, but an unchanged workspace isn't sent: the request is skipped
+    when the digest is the remembered ETag, and otherwise sent with
+    "If-None-Match" and "Expect: 100-continue", so a server already holding
+    the same workspace rejects it before the body is sent. get_workspace
+    sends "If-None-Match"/"If-Modified-Since" and returns None when the
+    workspace hasn't changed.
+    """
+
+    DEFAULT_URL = "https://api.structurizr.com"
+    """Size above which serialized workspaces are spooled to disk"""
+    SPOOL_SIZE = 1 << 23
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, api_key: str, api_secret: str,
+                 url: str = DEFAULT_URL, max_connections: int = 8,
+                 timeout: float = 60.0, use_gzip: bool = True,
+                 reader: JsonReader = None, writer: JsonWriter = None):
+        """
+        :param api_key: the API key of the workspace(s)
+        :param api_secret: the API secret of the workspace(s)
+        :param url: the base URL of the Structurizr API
+        :param max_connections: the maximum number of concurrent requests
+        :param timeout: the timeout of each request, in seconds
+        :param use_gzip: whether to compress uploads and accept compressed
+                         downloads
+        :param reader: the JsonReader used to read workspaces, with the
+                       element types registered
+        :param writer: the JsonWriter used to write workspaces
+        """
+        self.__signer = HmacSigner(api_key, api_secret)
+        self.__pool = HttpConnectionPool(url, max_connections, timeout)
+        self.__max_connections = max_connections
+        self.__use_gzip = use_gzip
+        self.__reader = reader or JsonReader()
+        self.__writer = writer or JsonWriter()
+        self.__etags: Dict[int, str] = {}
+        self.__last_modified: Dict[int, str] = {}
+        self.__last_nonce = 0
+
+    @property
+    def connections_opened(self) -> int:
+        """
+        Gets the number of connections opened so far.
+
+        :return: the number of connections, as an int
+        """
+        return self.__pool.connections_opened
+
+    def get_etag(self, workspace_id: int) -> str or None:
+        """
+        Gets the ETag of a workspace as last got or put by this client.
+
+        :param workspace_id: the ID of the workspace
+        :return: the ETag, as a str, or None if it is unknown
+        """
+        return self.__etags.get(workspace_id)
+
+    async def get_workspace(self, workspace_id: int, model: Model = None) \
+            -> Model or None:
+        """
+        Gets a workspace, unless it hasn't changed since this client last got
+        or put it.
+
+        :param workspace_id: the ID of the workspace
+        :param model: the Model to read into, a new one is created if None
+        :return: the Model, or None if the workspace hasn't changed
+        """
+        path = self.__path(workspace_id)
+        headers = self.__signed_headers("GET", path, hashlib.md5().hexdigest(),
+                                        "")
+        if self.__use_gzip:
+            headers["Accept-Encoding"] = "gzip"
+        if workspace_id in self.__etags:
+            headers["If-None-Match"] = self.__etags[workspace_id]
+        elif workspace_id in self.__last_modified:
+            headers["If-Modified-Since"] = self.__last_modified[workspace_id]
+
+        response = await self.__pool.request("GET", path, headers)
+        if response.status == 304:
+            return None
+        self.__check(response, "GET", workspace_id)
+
+        body = response.body
+        if response.headers.get("content-encoding", "").lower() == "gzip":
+            body = zlib.decompress(body, wbits=31)
+
+        loop = asyncio.get_running_loop()
+        model = await loop.run_in_executor(
+            None, self.__reader.read,
+            io.TextIOWrapper(io.BytesIO(body), encoding="utf-8"), model)
+        self.__remember(workspace_id, response,
+                        '"' + hashlib.md5(body).hexdigest() + '"')
+
+        return model
+
+    async def put_workspace(self, workspace_id: int, model: Model,
+                            name: str = None, description: str = None) -> bool:
+        """
+        Puts a workspace, unless the same workspace was last got or put by
+        this client, or is already held by the server. The workspace is
+        serialized either way, to compare its digest with the ETag. The
+        Content-MD5 header is the digest of the uncompressed JSON, which is
+        what the request is signed with, even when the body is gzip-encoded.
+
+        :param workspace_id: the ID of the workspace
+        :param model: the Model to put
+        :param name: the name of the workspace
+        :param description: the description of the workspace
+        :return: True if the workspace was sent, False if it was unchanged
+        """
+        loop = asyncio.get_running_loop()
+        payload = await loop.run_in_executor(
+            None, self.__serialize, model, name, description)
+        try:
+            etag = '"' + payload.digest + '"'
+            if self.__etags.get(workspace_id) == etag:
+                return False
+
+            path = self.__path(workspace_id)
+            headers = self.__signed_headers("PUT", path, payload.digest,
+                                            _CONTENT_TYPE)
+            headers["Content-Type"] = _CONTENT_TYPE
+            headers["Content-Length"] = str(payload.size)
+            headers["If-None-Match"] = etag
+            if self.__use_gzip:
+                headers["Content-Encoding"] = "gzip"
+
+            response = await self.__pool.request(
+                "PUT", path, headers, payload.chunks, expect_continue=True)
+            if response.status in (304, 412):
+                self.__etags[workspace_id] = etag
+                return False
+            self.__check(response, "PUT", workspace_id)
+            self.__remember(workspace_id, response, etag)
+
+            return True
+        finally:
+            payload.close()
+
+    async def put_workspaces(self, workspaces: Dict[int, Model]) \
+            -> Dict[int, bool]:
+        """
+        Puts many workspaces concurrently, over the client's connection pool.
+
+        :param workspaces: a Dict of workspace ID to Model
+        :return: a Dict of workspace ID to whether the workspace was sent
+        :raises StructurizrClientError: for the first workspace which failed,
+                                        after all of them were attempted
+        """
+        # bounds the number of workspaces serialized ahead of the requests
+        semaphore = asyncio.Semaphore(self.__max_connections)
+
+        async def put(workspace_id: int, model: Model) -> bool:
+            async with semaphore:
+                return await self.put_workspace(workspace_id, model)
+
+        results = await asyncio.gather(
+            *(put(workspace_id, model)
+              for workspace_id, model in workspaces.items()),
+            return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return dict(zip(workspaces, results))
+
+    async def close(self):
+        """
+        Closes the client's connections.
+
+        :return: None
+        """
+        await self.__pool.close()
+
+    async def __aenter__(self) -> StructurizrClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def __path(self, workspace_id: int) -> str:
+        if workspace_id is None or int(workspace_id) <= 0:
+            raise ValueError("The workspace ID must be a positive integer.")
+
+        return f"/workspace/{int(workspace_id)}"
+
+    def __signed_headers(self, method: str, path: str, content_md5: str,
+                         content_type: str) -> Dict[str, str]:
+        # nonces must increase, even for requests made in the same ms
+        nonce = max(int(time.time() * 1000), self.__last_nonce + 1)
+        self.__last_nonce = nonce
+
+        headers = self.__signer.headers(method, self.__pool.base_path + path,
+                                        content_md5, content_type, str(nonce))
+        headers["User-Agent"] = _USER_AGENT
+        return headers
+
+    def __remember(self, workspace_id: int, response: HttpResponse,
+                   etag: str):
+        self.__etags[workspace_id] = response.headers.get("etag", etag)
+        if "last-modified" in response.headers:
+            self.__last_modified[workspace_id] = \
+                response.headers["last-modified"]
+
+    @staticmethod
+    def __check(response: HttpResponse, method: str, workspace_id: int):
+        if 200 <= response.status < 300:
+            return
+
+        message = response.body.decode("utf-8", "replace").strip() \
+            or response.reason
+        raise StructurizrClientError(
+            f"{method} workspace {workspace_id} failed with "
+            f"{response.status}: {message}", response.status)
+
+    def __serialize(self, model: Model, name: str, description: str) \
+            -> _Payload:
+        payload = _Payload(self.SPOOL_SIZE, self.CHUNK_SIZE, self.__use_gzip)
+        try:
+            self.__writer.write(model, payload, name, description)
+            payload.finish()
+        except BaseException:
+            payload.close()
+            raise
+
+        return payload
+
+
+class _Payload:
+    """
+    A serialized workspace: written as text, digested with MD5 (before
+    compression) and optionally gzip-compressed as it is written, and spooled
+    to a temporary file once it gets large.
+    """
+
+    def __init__(self, spool_size: int, chunk_size: int, compress: bool):
+        self.__file = tempfile.SpooledTemporaryFile(max_size=spool_size)
+        self.__md5 = hashlib.md5()
+        self.__compressor = zlib.compressobj(wbits=31) if compress else None
+        self.__chunk_size = chunk_size
+        self.digest = None
+        self.size = 0
+
+    def write(self, text: str):
+        data = text.encode("utf-8")
+        self.__md5.update(data)
+        if self.__compressor is not None:
+            data = self.__compressor.compress(data)
+        self.__file.write(data)
+
+    def finish(self):
+        if self.__compressor is not None:
+            self.__file.write(self.__compressor.flush())
+        self.digest = self.__md5.hexdigest()
+        self.size = self.__file.tell()
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        self.__file.seek(0)
+        while True:
+            chunk = self.__file.read(self.__chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self):
+        self.__file.close()
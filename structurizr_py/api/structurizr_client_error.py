@@ -0,0 +1,12 @@
+class StructurizrClientError(Exception):
+    """
+    Raised when the Structurizr API rejects a request or can't be reached.
+    """
+
+    def __init__(self, message: str, status: int = None):
+        """
+        :param message: a description of the error
+        :param status: the HTTP status of the response, if there was one
+        """
+        super().__init__(message)
+        self.status = status
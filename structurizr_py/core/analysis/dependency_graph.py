@@ -0,0 +1,388 @@
+from __future__ import annotations
+from collections import deque
+from typing import Dict, FrozenSet, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.element import Element
+    from structurizr_py.core.model.model import Model
+
+
+class DependencyGraph:
+    """
+    Answers dependency questions about a model, treating each relationship
+    as an edge from its source to its destination: what an element depends
+    on (directly or transitively), which elements are cyclically dependent,
+    how elements stack up in layers, and the shortest dependency path between
+    two elements.
+
+    Elements are numbered and the adjacency is held as lists of integers, so
+    the algorithms run over plain lists rather than model objects. All of
+    them are iterative, and therefore not bound by the recursion limit.
+    Results are cached, and discarded as soon as the model's version
+    changes.
+    """
+
+    def __init__(self, model: Model):
+        self.__model = model
+        self.__version = -1
+        self.__clear()
+
+    @property
+    def model(self) -> Model:
+        return self.__model
+
+    def reachable_from(self, element: Element) -> FrozenSet[Element]:
+        """
+        Gets the elements which the specified element depends on, directly or
+        transitively. The element itself is only included if it is part of a
+        cycle.
+
+        :param element: an Element object
+        :return: a FrozenSet of Element objects
+        """
+        self.__refresh()
+        node = self.__node_of(element)
+        if node is None:
+            return frozenset()
+
+        reachable = self.__reachable.get(node)
+        if reachable is None:
+            reachable = self.__reachable[node] = frozenset(
+                self.__elements[reached] for reached in self.__search(node))
+
+        return reachable
+
+    def reaches(self, source: Element, destination: Element) -> bool:
+        """
+        Determines whether the source element depends on the destination
+        element, directly or transitively. This uses the transitive closure
+        if it has already been computed, and otherwise a depth-first search
+        from the source which stops as soon as it reaches the destination.
+
+        :param source: the source Element
+        :param destination: the destination Element
+        :return: True if there is a dependency path, False otherwise
+        """
+        self.__refresh()
+        source_node = self.__node_of(source)
+        destination_node = self.__node_of(destination)
+        if source_node is None or destination_node is None:
+            return False
+
+        if self.__closure_bits is not None:
+            components = self.__components()[1]
+            return bool(self.__closure_bits[components[source_node]] >>
+                        components[destination_node] & 1)
+
+        return self.__search_for(source_node, destination_node)
+
+    def transitive_closure(self) -> Dict[Element, FrozenSet[Element]]:
+        """
+        Gets, for every element, the elements it depends on directly or
+        transitively (as reachable_from). The closure is computed once per
+        strongly connected component, as a bitset over components, in
+        reverse topological order. The result is quadratic in the number of
+        elements in the worst case; prefer reachable_from for single elements.
+
+        :return: a Dict of Element to FrozenSet of Element objects
+        """
+        self.__refresh()
+        members, components = self.__components()
+        closure = self.__closure()
+
+        reachable_by_component = []
+        for bits in closure:
+            reachable_by_component.append(frozenset(
+                self.__elements[member]
+                for component, bit in enumerate(reversed(bin(bits)))
+                if bit == "1" for member in members[component]))
+
+        return {element: reachable_by_component[components[node]]
+                for node, element in enumerate(self.__elements)}
+
+    def strongly_connected_components(self) -> List[List[Element]]:
+        """
+        Gets the strongly connected components of the graph, using an
+        iterative version of Tarjan's algorithm. Components are listed in
+        reverse topological order: every component comes after the
+        components it depends on.
+
+        :return: a List of Lists of Element objects
+        """
+        self.__refresh()
+        return [[self.__elements[node] for node in component]
+                for component in self.__components()[0]]
+
+    def cycles(self) -> List[List[Element]]:
+        """
+        Gets the groups of cyclically dependent elements: the strongly
+        connected components with more than one element, and elements which
+        depend on themselves.
+
+        :return: a List of Lists of Element objects
+        """
+        self.__refresh()
+        successors = self.__successors
+        return [[self.__elements[node] for node in component]
+                for component in self.__components()[0]
+                if len(component) > 1 or component[0] in
+                successors[component[0]]]
+
+    def has_cycles(self) -> bool:
+        """
+        Determines whether any elements are cyclically dependent.
+
+        :return: True if there is at least one cycle, False otherwise
+        """
+        return bool(self.cycles())
+
+    def layers(self) -> List[List[Element]]:
+        """
+        Arranges the elements in layers, so that every element only depends
+        on elements in lower layers. Layer 0 holds the elements without
+        dependencies. Cyclically dependent elements share a layer.
+
+        :return: a List of layers, each a List of Element objects
+        """
+        self.__refresh()
+        if self.__layers is None:
+            members, components = self.__components()
+            successors = self.__successors
+            depths = [0] * len(members)
+            # components are in reverse topological order, so the depths of
+            # all dependencies are known when a component is reached
+            for component, component_members in enumerate(members):
+                depth = 0
+                for node in component_members:
+                    for successor in successors[node]:
+                        other = components[successor]
+                        if other != component and depths[other] >= depth:
+                            depth = depths[other] + 1
+                depths[component] = depth
+
+            layers: List[List[int]] = [[] for _ in
+                                       range(max(depths, default=-1) + 1)]
+            for node in range(len(self.__elements)):
+                layers[depths[components[node]]].append(node)
+            self.__layers = layers
+
+        return [[self.__elements[node] for node in layer]
+                for layer in self.__layers]
+
+    def shortest_path(self, source: Element, destination: Element) \
+            -> List[Element] or None:
+        """
+        Finds a shortest dependency path (fewest relationships) from the
+        source element to the destination element, with a breadth-first
+        search.
+
+        :param source: the source Element
+        :param destination: the destination Element
+        :return: a List of Element objects from source to destination, or
+                 None if the source doesn't depend on the destination
+        """
+        self.__refresh()
+        source_node = self.__node_of(source)
+        destination_node = self.__node_of(destination)
+        if source_node is None or destination_node is None:
+            return None
+
+        key = (source_node, destination_node)
+        if key not in self.__paths:
+            self.__paths[key] = self.__breadth_first(source_node,
+                                                     destination_node)
+
+        path = self.__paths[key]
+        return [self.__elements[node] for node in path] \
+            if path is not None else None
+
+    def __refresh(self):
+        if self.__version != self.__model.version:
+            self.__clear()
+            self.__build()
+            self.__version = self.__model.version
+
+    def __clear(self):
+        self.__elements: List[Element] = []
+        self.__nodes: Dict[int, int] = {}
+        self.__successors: List[List[int]] = []
+        self.__scc: Tuple[List[List[int]], List[int]] or None = None
+        self.__closure_bits: List[int] or None = None
+        self.__layers: List[List[int]] or None = None
+        self.__reachable: Dict[int, FrozenSet[Element]] = {}
+        self.__paths: Dict[Tuple[int, int], List[int] or None] = {}
+
+    def __build(self):
+        elements = self.__elements
+        nodes = self.__nodes
+        successors = self.__successors
+        for element in self.__model.iter_elements():
+            nodes[id(element)] = len(elements)
+            elements.append(element)
+            successors.append([])
+
+        for relationship in self.__model.iter_relationships():
+            source = self.__add_node(relationship.source)
+            destination = self.__add_node(relationship.destination)
+            if source is not None and destination is not None:
+                successors[source].append(destination)
+
+    def __add_node(self, element: Element) -> int or None:
+        if element is None:
+            return None
+
+        node = self.__nodes.get(id(element))
+        if node is None:
+            # an endpoint that hasn't been added to the model itself
+            node = self.__nodes[id(element)] = len(self.__elements)
+            self.__elements.append(element)
+            self.__successors.append([])
+
+        return node
+
+    def __node_of(self, element: Element) -> int or None:
+        return self.__nodes.get(id(element))
+
+    def __search(self, start: int) -> List[int]:
+        successors = self.__successors
+        seen = bytearray(len(successors))
+        reached = []
+        pending = list(successors[start])
+        while pending:
+            node = pending.pop()
+            if not seen[node]:
+                seen[node] = 1
+                reached.append(node)
+                pending.extend(successors[node])
+
+        return reached
+
+    def __search_for(self, start: int, target: int) -> bool:
+        successors = self.__successors
+        seen = bytearray(len(successors))
+        pending = list(successors[start])
+        while pending:
+            node = pending.pop()
+            if node == target:
+                return True
+            if not seen[node]:
+                seen[node] = 1
+                pending.extend(successors[node])
+
+        return False
+
+    def __breadth_first(self, source: int, destination: int) \
+            -> List[int] or None:
+        successors = self.__successors
+        parents = {source: None}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for successor in successors[node]:
+                if successor == destination:
+                    path = [destination, node]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    path.reverse()
+                    return path
+                if successor not in parents:
+                    parents[successor] = node
+                    queue.append(successor)
+
+        return None
+
+    def __components(self) -> Tuple[List[List[int]], List[int]]:
+        """
+        Gets the strongly connected components, as (members of each
+        component, component of each node).
+        """
+        if self.__scc is None:
+            self.__scc = _tarjan(self.__successors)
+
+        return self.__scc
+
+    def __closure(self) -> List[int]:
+        """
+        Gets, for each component, the bitset of the components it reaches.
+        """
+        if self.__closure_bits is None:
+            members, components = self.__components()
+            successors = self.__successors
+            closure = [0] * len(members)
+            for component, component_members in enumerate(members):
+                bits = 0
+                cyclic = len(component_members) > 1
+                for node in component_members:
+                    for successor in successors[node]:
+                        other = components[successor]
+                        if other == component:
+                            cyclic = True
+                        else:
+                            bits |= closure[other] | (1 << other)
+                if cyclic:
+                    bits |= 1 << component
+                closure[component] = bits
+            self.__closure_bits = closure
+
+        return self.__closure_bits
+
+
+def _tarjan(successors: List[List[int]]) -> Tuple[List[List[int]], List[int]]:
+    """
+    Finds the strongly connected components of a graph with Tarjan's
+    algorithm, using an explicit stack instead of recursion. Components are
+    emitted in reverse topological order.
+
+    :param successors: the successors of each node
+    :return: (members of each component, component of each node)
+    """
+    count = len(successors)
+    index = [-1] * count
+    low = [0] * count
+    on_stack = bytearray(count)
+    component_of = [-1] * count
+    stack = []
+    components = []
+    counter = 0
+
+    for root in range(count):
+        if index[root] != -1:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(successors[root]))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if index[child] == -1:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = 1
+                    work.append((child, iter(successors[child])))
+                    break
+                if on_stack[child] and index[child] < low[node]:
+                    low[node] = index[child]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+
+                if low[node] == index[node]:
+                    component = len(components)
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component_of[member] = component
+                        members.append(member)
+                        if member == node:
+                            break
+                    components.append(members)
+
+    return components, component_of
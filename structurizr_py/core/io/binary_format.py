@@ -0,0 +1,49 @@
+import struct
+
+
+class BinaryFormat:
+    """
+    Layout of the binary workspace format, designed to be memory-mapped and
+    read lazily.
+
+    A file starts with a fixed size header, followed by the records (the
+    compact JSON fields of each element, relationship and code element), the
+    keys of the indexes (UTF-8) and fixed width tables:
+
+    - elements: record offset and length, parent element, and the ranges of
+      its relationships and code elements
+    - relationships (grouped by source element): record offset and length,
+      source and destination elements
+    - code elements (grouped by element): record offset and length
+    - identity index, sorted by key: key offset and length, item kind,
+      element or relationship number
+    - canonical name index, sorted by key: as the identity index
+
+    Elements and relationships are referred to by their number (their
+    position in their table), and the indexes are binary searched in place,
+    so looking up one item only touches a handful of pages.
+    """
+
+    MAGIC = b"SZRB"
+    VERSION = 1
+
+    """magic, version, flags, then the element, relationship, code element,
+    identity and canonical name counts and table offsets"""
+    HEADER = struct.Struct("<4sHH5Q5Q")
+    """record offset, record length, parent number (-1 for none), first
+    relationship, relationship count, first code element, code element
+    count"""
+    ELEMENT = struct.Struct("<QIiIIII")
+    """record offset, record length, source number, destination number"""
+    RELATIONSHIP = struct.Struct("<QIII")
+    """record offset, record length"""
+    CODE_ELEMENT = struct.Struct("<QI")
+    """key offset, key length, item kind, item number"""
+    KEY = struct.Struct("<QIBI")
+
+    """Item kinds in the indexes"""
+    ELEMENT_KIND = 0
+    RELATIONSHIP_KIND = 1
+
+    """The name of the field holding the kind of an element in its record"""
+    KIND_FIELD = "kind"
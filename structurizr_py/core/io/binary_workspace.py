@@ -0,0 +1,307 @@
+from __future__ import annotations
+import mmap
+from typing import Callable, Dict, List, Tuple, TYPE_CHECKING
+
+from structurizr_py.core.io.binary_format import BinaryFormat
+from structurizr_py.core.io.json_format import JsonFormat
+from structurizr_py.core.io.json_reader import DEFAULT_ELEMENT_FACTORIES, \
+    JsonReader
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.tags import Tags
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.code_element import CodeElement
+    from structurizr_py.core.model.element import Element
+
+
+class BinaryWorkspace:
+    """
+    Opens a workspace written by BinaryWriter, memory-mapping the file and
+    creating elements, relationships and code elements only when they are
+    first accessed.
+
+    Opening a workspace only reads its header. Lookups by identity or
+    canonical name binary search the offset indexes in place, and each item
+    is decoded from its own record, so only the pages holding the indexes
+    and the items actually used are read from disk. Created items are added
+    to the workspace's model (an element's ancestors are created with it),
+    and returned again on later lookups.
+    """
+
+    def __init__(self, path: str, model: Model = None,
+                 use_fast_backend: bool = True):
+        """
+        :param path: the path of the workspace file
+        :param model: the Model to create items in, a new one if None
+        :param use_fast_backend: whether to decode records with orjson when
+                                 it is installed
+        """
+        with open(path, "rb") as file:
+            self.__data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = BinaryFormat.HEADER.unpack_from(self.__data, 0) \
+            if len(self.__data) >= BinaryFormat.HEADER.size else None
+        if header is None or header[0] != BinaryFormat.MAGIC:
+            self.__data.close()
+            raise ValueError(f"{path} is not a binary workspace")
+        if header[1] != BinaryFormat.VERSION:
+            self.__data.close()
+            raise ValueError(f"{path} has unsupported version {header[1]}")
+
+        self.__element_count, self.__relationship_count, _, \
+            self.__identity_count, self.__name_count = header[3:8]
+        self.__element_table, self.__relationship_table, \
+            self.__code_element_table, self.__identity_index, \
+            self.__name_index = header[8:13]
+
+        self.__decode = JsonFormat.get_decoder(use_fast_backend)
+        self.__factories = dict(DEFAULT_ELEMENT_FACTORIES)
+        self.__factories[Tags.CONTAINER_INSTANCE] = \
+            self.__create_container_instance
+        self.__model = model if model is not None else Model()
+        self.__elements: Dict[int, Element] = {}
+        self.__numbers: Dict[int, int] = {}
+        self.__relationships: Dict[int, Relationship] = {}
+        self.__code_elements: Dict[int, List[CodeElement]] = {}
+
+    def register_element_type(self, kind: str,
+                              factory: Callable[[dict, Element], Element]):
+        """
+        Registers the function used to create elements of the specified kind
+        (see JsonReader.register_element_type).
+
+        :param kind: the tag of the element type, e.g. Tags.CONTAINER
+        :param factory: a function taking the fields of the element and its
+                        parent Element (or None), returning a new Element
+        :return: None
+        """
+        self.__factories[kind] = factory
+
+    @property
+    def model(self) -> Model:
+        """
+        Gets the model holding the items created so far.
+
+        :return: a Model object
+        """
+        return self.__model
+
+    @property
+    def element_count(self) -> int:
+        return self.__element_count
+
+    @property
+    def relationship_count(self) -> int:
+        return self.__relationship_count
+
+    def get_element(self, identity: str) -> Element or None:
+        """
+        Gets the element with the specified identity, creating it (and its
+        ancestors) on first access.
+
+        :param identity: the identity of the element
+        :return: an Element object, or None if there is no such element
+        """
+        found = self.__find(self.__identity_index, self.__identity_count,
+                            identity)
+        if found is None or found[0] != BinaryFormat.ELEMENT_KIND:
+            return None
+
+        return self.__element(found[1])
+
+    def get_element_by_canonical_name(self, canonical_name: str) \
+            -> Element or None:
+        """
+        Gets the element with the specified canonical name (e.g.
+        "/System/Container"), creating it on first access.
+
+        :param canonical_name: the canonical name, as a str
+        :return: an Element object, or None if there is no such element
+        """
+        found = self.__find(self.__name_index, self.__name_count,
+                            canonical_name)
+        return self.__element(found[1]) if found is not None else None
+
+    def get_relationship(self, identity: str) -> Relationship or None:
+        """
+        Gets the relationship with the specified identity, creating it (and
+        its source and destination) on first access.
+
+        :param identity: the identity of the relationship
+        :return: a Relationship object, or None if there is no such
+                 relationship
+        """
+        found = self.__find(self.__identity_index, self.__identity_count,
+                            identity)
+        if found is None or found[0] != BinaryFormat.RELATIONSHIP_KIND:
+            return None
+
+        return self.__relationship(found[1])
+
+    def get_relationships(self, element: Element) -> List[Relationship]:
+        """
+        Gets the efferent (outgoing) relationships of an element created by
+        this workspace, creating them on first access.
+
+        :param element: an Element object
+        :return: a List of Relationship objects
+        """
+        number = self.__numbers.get(id(element))
+        if number is None:
+            return []
+
+        _, _, _, first, count, _, _ = self.__element_entry(number)
+        return [self.__relationship(index)
+                for index in range(first, first + count)]
+
+    def get_code_elements(self, element: Element) -> List[CodeElement]:
+        """
+        Gets the code elements of an element created by this workspace,
+        creating them on first access. They are also added to the element if
+        it supports code elements.
+
+        :param element: an Element object
+        :return: a List of CodeElement objects
+        """
+        number = self.__numbers.get(id(element))
+        if number is None:
+            return []
+
+        code_elements = self.__code_elements.get(number)
+        if code_elements is None:
+            _, _, _, _, _, first, count = self.__element_entry(number)
+            code_elements = self.__code_elements[number] = []
+            for index in range(first, first + count):
+                offset, length = BinaryFormat.CODE_ELEMENT.unpack_from(
+                    self.__data, self.__code_element_table +
+                    index * BinaryFormat.CODE_ELEMENT.size)
+                code_element = JsonReader._create_code_element(
+                    self.__record(offset, length))
+                code_elements.append(code_element)
+                if hasattr(element, "add_code_element"):
+                    element.add_code_element(code_element)
+
+        return code_elements
+
+    def load_all(self) -> Model:
+        """
+        Creates every element, relationship and code element of the
+        workspace.
+
+        :return: the Model
+        """
+        for number in range(self.__element_count):
+            element = self.__element(number)
+            self.get_relationships(element)
+            self.get_code_elements(element)
+
+        return self.__model
+
+    def close(self):
+        """
+        Unmaps the workspace file. Items created so far remain usable.
+
+        :return: None
+        """
+        self.__data.close()
+
+    def __enter__(self) -> BinaryWorkspace:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __find(self, index: int, count: int, key: str) \
+            -> Tuple[int, int] or None:
+        """
+        Binary searches an index for a key, returning (kind, number).
+        """
+        data = self.__data
+        key = key.encode("utf-8")
+        size = BinaryFormat.KEY.size
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            offset, length, kind, number = BinaryFormat.KEY.unpack_from(
+                data, index + middle * size)
+            candidate = data[offset:offset + length]
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return kind, number
+
+        return None
+
+    def __element_entry(self, number: int) -> tuple:
+        return BinaryFormat.ELEMENT.unpack_from(
+            self.__data,
+            self.__element_table + number * BinaryFormat.ELEMENT.size)
+
+    def __record(self, offset: int, length: int) -> dict:
+        return self.__decode(self.__data[offset:offset + length])
+
+    def __element(self, number: int) -> Element:
+        element = self.__elements.get(number)
+        if element is not None:
+            return element
+
+        # create the missing ancestors first, from the top
+        pending = []
+        while number >= 0 and number not in self.__elements:
+            entry = self.__element_entry(number)
+            pending.append((number, entry))
+            number = entry[2]
+
+        for number, entry in reversed(pending):
+            fields = self.__record(entry[0], entry[1])
+            kind = fields.pop(BinaryFormat.KIND_FIELD)
+            factory = self.__factories.get(kind)
+            if factory is None:
+                raise ValueError(f"No element type is registered for {kind}")
+
+            element = factory(fields, self.__elements.get(entry[2]))
+            JsonReader._set_element_fields(element, fields)
+            self.__model.add_element(element)
+            self.__elements[number] = element
+            self.__numbers[id(element)] = number
+
+        return element
+
+    def __create_container_instance(self, fields: dict,
+                                    parent: Element) -> Element:
+        # the container is created on demand, like any other element
+        identity = fields.get("containerId")
+        container = self.get_element(identity) \
+            if identity is not None else None
+        if container is None:
+            raise ValueError(f"The container {fields.get('containerId')} of "
+                             f"the container instance {fields.get('id')} "
+                             f"doesn't exist")
+
+        return parent.add(container)
+
+    def __relationship(self, number: int) -> Relationship:
+        relationship = self.__relationships.get(number)
+        if relationship is not None:
+            return relationship
+
+        offset, length, source, destination = \
+            BinaryFormat.RELATIONSHIP.unpack_from(
+                self.__data, self.__relationship_table +
+                number * BinaryFormat.RELATIONSHIP.size)
+        fields = self.__record(offset, length)
+        relationship = Relationship(
+            self.__element(source), self.__element(destination),
+            fields.get("description"), fields.get("technology"),
+            fields.get("interactionStyle", InteractionStyle.SYNCHRONOUS))
+        JsonReader._set_item_fields(relationship, fields)
+        if not self.__model.add_relationship(relationship):
+            raise ValueError(f"The relationship {relationship.identity} "
+                             f"duplicates another relationship")
+        self.__relationships[number] = relationship
+
+        return relationship
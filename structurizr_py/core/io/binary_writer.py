@@ -0,0 +1,162 @@
+from __future__ import annotations
+from typing import BinaryIO, Callable, Dict, List, Tuple, TYPE_CHECKING
+
+from structurizr_py.core.io.binary_format import BinaryFormat
+from structurizr_py.core.io.json_format import JsonFormat
+from structurizr_py.core.io.json_writer import JsonWriter, _IdentityAssigner
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.element import Element
+    from structurizr_py.core.model.model import Model
+
+
+class BinaryWriter:
+    """
+    Writes a model in the binary workspace format (see BinaryFormat), for
+    lazy loading with BinaryWorkspace.
+
+    Records are streamed to the output as they are encoded; only the fixed
+    width tables and index keys are kept in memory until the end. Items
+    without an identity are given one for the duration of the write, as with
+    JsonWriter.
+    """
+
+    def __init__(self, use_fast_backend: bool = True):
+        self.__json = JsonWriter(use_fast_backend)
+        self.__encode = JsonFormat.get_encoder(use_fast_backend)
+        self.__stream = None
+        self.__position = 0
+
+    def register_element_fields(self, kind: str,
+                                fields: Callable[[Element], dict]):
+        """
+        Registers a function returning the type specific fields of elements of
+        the specified kind (see JsonWriter.register_element_fields).
+
+        :param kind: the tag of the element type, e.g. Tags.CONTAINER
+        :param fields: a function taking an Element and returning a dict
+        :return: None
+        """
+        self.__json.register_element_fields(kind, fields)
+
+    def write(self, model: Model, stream: BinaryIO):
+        """
+        Writes the model to the specified stream.
+
+        :param model: the Model to write
+        :param stream: a writable, seekable binary stream
+        :return: None
+        """
+        identities = _IdentityAssigner(model)
+        elements = list(model.iter_elements())
+        numbers: Dict[int, int] = {id(element): number
+                                   for number, element in enumerate(elements)}
+
+        start = stream.tell()
+        stream.write(bytes(BinaryFormat.HEADER.size))
+        self.__stream = stream
+        self.__position = BinaryFormat.HEADER.size
+
+        element_table: List[bytes] = []
+        relationship_table: List[bytes] = []
+        code_element_table: List[bytes] = []
+        identity_keys: List[Tuple[bytes, int, int]] = []
+        name_keys: List[Tuple[bytes, int, int]] = []
+
+        for number, element in enumerate(elements):
+            fields = self.__json._element_fields(element, identities)
+            fields[BinaryFormat.KIND_FIELD] = JsonFormat.kind_of(element)
+            offset, length = self.__write_record(fields)
+
+            relationships = element.model.get_efferent_relationships(element) \
+                if element.model is not None else element.relationships
+            first_relationship = len(relationship_table)
+            for relationship in relationships:
+                relationship_table.append(BinaryFormat.RELATIONSHIP.pack(
+                    *self.__write_record(self.__json._relationship_fields(
+                        relationship, identities)),
+                    number, self.__number_of(relationship.destination,
+                                             numbers)))
+                identity_keys.append((
+                    identities.of(relationship).encode("utf-8"),
+                    BinaryFormat.RELATIONSHIP_KIND,
+                    len(relationship_table) - 1))
+
+            first_code_element = len(code_element_table)
+            for code_element in getattr(element, "code_elements", None) or ():
+                code_element_table.append(BinaryFormat.CODE_ELEMENT.pack(
+                    *self.__write_record(
+                        self.__json._code_element_fields(code_element))))
+
+            parent = element.get_parent()
+            element_table.append(BinaryFormat.ELEMENT.pack(
+                offset, length,
+                self.__number_of(parent, numbers) if parent is not None
+                else -1,
+                first_relationship,
+                len(relationship_table) - first_relationship,
+                first_code_element,
+                len(code_element_table) - first_code_element))
+            identity_keys.append((identities.of(element).encode("utf-8"),
+                                  BinaryFormat.ELEMENT_KIND, number))
+            name_keys.append((element.get_canonical_name().encode("utf-8"),
+                              BinaryFormat.ELEMENT_KIND, number))
+
+        identity_index = self.__write_keys(identity_keys, True)
+        name_index = self.__write_keys(name_keys, False)
+
+        offsets = []
+        for table in (element_table, relationship_table, code_element_table,
+                      identity_index, name_index):
+            offsets.append(self.__position)
+            self.__write(b"".join(table))
+
+        end = stream.tell()
+        stream.seek(start)
+        stream.write(BinaryFormat.HEADER.pack(
+            BinaryFormat.MAGIC, BinaryFormat.VERSION, 0,
+            len(element_table), len(relationship_table),
+            len(code_element_table), len(identity_index), len(name_index),
+            *offsets))
+        stream.seek(end)
+        self.__stream = None
+
+    def __write(self, data: bytes):
+        self.__stream.write(data)
+        self.__position += len(data)
+
+    def __write_record(self, fields: dict) -> Tuple[int, int]:
+        record = self.__encode(fields).encode("utf-8")
+        offset = self.__position
+        self.__write(record)
+
+        return offset, len(record)
+
+    def __write_keys(self, keys: List[Tuple[bytes, int, int]],
+                     unique: bool) -> List[bytes]:
+        """
+        Writes the keys of an index, sorted, returning the index entries.
+        Duplicate keys are an error if the keys must be unique, otherwise
+        only the first item with a key is indexed.
+        """
+        keys.sort(key=lambda entry: entry[0])
+        entries = []
+        for index, (key, kind, number) in enumerate(keys):
+            if index and keys[index - 1][0] == key:
+                if unique:
+                    raise ValueError(f"{key.decode('utf-8')} is not unique "
+                                     f"in the model")
+                continue
+            entries.append(BinaryFormat.KEY.pack(self.__position, len(key),
+                                                 kind, number))
+            self.__write(key)
+
+        return entries
+
+    @staticmethod
+    def __number_of(element: Element, numbers: Dict[int, int]) -> int:
+        number = numbers.get(id(element))
+        if number is None:
+            raise ValueError(f"{element} is not part of the model")
+
+        return number
@@ -0,0 +1,96 @@
+from __future__ import annotations
+import json
+from typing import Callable, TYPE_CHECKING
+
+from structurizr_py.core.model.tags import Tags
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.element import Element
+
+
+class JsonFormat:
+    """
+    Names used by the Structurizr JSON workspace format, and the JSON backend
+    used to encode it.
+
+    Elements are identified by the tag of their type (e.g. Tags.PERSON),
+    which is mapped to the collection they are stored in.
+    """
+
+    MODEL = "model"
+    RELATIONSHIPS = "relationships"
+    CODE_ELEMENTS = "code"
+
+    """Collections of elements which have no parent"""
+    TOP_LEVEL_COLLECTIONS = {
+        Tags.PERSON: "people",
+        Tags.SOFTWARE_SYSTEM: "softwareSystems",
+        Tags.DEPLOYMENT_NODE: "deploymentNodes",
+    }
+
+    """Collections of elements nested inside their parent element"""
+    CHILD_COLLECTIONS = {
+        Tags.CONTAINER: "containers",
+        Tags.COMPONENT: "components",
+        Tags.DEPLOYMENT_NODE: "children",
+        Tags.CONTAINER_INSTANCE: "containerInstances",
+    }
+
+    @staticmethod
+    def kind_of(element: Element) -> str:
+        """
+        Gets the kind of the specified element, i.e. the tag of its type.
+
+        :param element: an Element object
+        :return: the kind, as a str
+        """
+        for tag in element.get_required_tags():
+            if tag in JsonFormat.TOP_LEVEL_COLLECTIONS or \
+                    tag in JsonFormat.CHILD_COLLECTIONS:
+                return tag
+
+        raise ValueError(f"{element} can't be written to a workspace, as it "
+                         f"has no known element type tag.")
+
+    @staticmethod
+    def has_fast_backend() -> bool:
+        """
+        Determines whether the optional fast JSON backend (orjson) is
+        installed.
+
+        :return: True if it is installed, False otherwise
+        """
+        return orjson is not None
+
+    @staticmethod
+    def get_encoder(use_fast_backend: bool = True) -> Callable[[object], str]:
+        """
+        Gets a function encoding a value as compact JSON.
+
+        :param use_fast_backend: whether to use orjson when it is installed
+        :return: a function taking a value and returning a str
+        """
+        if use_fast_backend and orjson is not None:
+            return lambda value: orjson.dumps(value).decode("utf-8")
+
+        return json.JSONEncoder(ensure_ascii=False,
+                                separators=(",", ":")).encode
+
+    @staticmethod
+    def get_decoder(use_fast_backend: bool = True) \
+            -> Callable[[bytes], object]:
+        """
+        Gets a function decoding a UTF-8 encoded JSON document.
+
+        :param use_fast_backend: whether to use orjson when it is installed
+        :return: a function taking bytes and returning the decoded value
+        """
+        if use_fast_backend and orjson is not None:
+            return orjson.loads
+
+        return json.loads
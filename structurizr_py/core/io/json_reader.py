@@ -0,0 +1,577 @@
+from __future__ import annotations
+import json
+import re
+from typing import Callable, Dict, Iterator, List, TextIO, Tuple, \
+    TYPE_CHECKING
+
+from structurizr_py.core.io.json_format import JsonFormat
+from structurizr_py.core.model.code_element import CodeElement
+from structurizr_py.core.model.deployment_node import DeploymentNode
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.person import Person
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.software_system import SoftwareSystem
+from structurizr_py.core.model.tags import Tags
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.element import Element
+    from structurizr_py.core.model.model_item import ModelItem
+
+
+def _adder(parent: Element, method: str, kind: str,
+           fields: dict) -> Callable:
+    """Gets the method of the parent adding a child of the given kind."""
+    add = getattr(parent, method, None)
+    if add is None:
+        raise ValueError(f"The {kind} {fields.get('name')} can't be nested "
+                         f"in {parent}")
+
+    return add
+
+
+def _create_container(fields: dict, parent: Element) -> Element:
+    add = _adder(parent, "add_container", Tags.CONTAINER, fields)
+    return add(fields.get("name"), technology=fields.get("technology"))
+
+
+def _create_component(fields: dict, parent: Element) -> Element:
+    add = _adder(parent, "add_component", Tags.COMPONENT, fields)
+    return add(fields.get("name"), technology=fields.get("technology"))
+
+
+def _create_deployment_node(fields: dict, parent: Element) -> Element:
+    if parent is not None:
+        add = _adder(parent, "add_deployment_node", Tags.DEPLOYMENT_NODE,
+                     fields)
+        return add(fields.get("name"), technology=fields.get("technology"),
+                   instances=fields.get("instances", 1))
+
+    return DeploymentNode(
+        fields.get("name"),
+        environment=fields.get("environment",
+                               DeploymentNode.DEFAULT_ENVIRONMENT),
+        technology=fields.get("technology"),
+        instances=fields.get("instances", 1))
+
+
+def _create_container_instance(fields: dict, parent: Element) -> Element:
+    add = _adder(parent, "add", Tags.CONTAINER_INSTANCE, fields)
+    container = parent.model.get_element(fields.get("containerId")) \
+        if parent.model is not None else None
+    if container is None:
+        raise ValueError(f"The container {fields.get('containerId')} of the "
+                         f"container instance {fields.get('id')} doesn't "
+                         f"exist")
+
+    return add(container)
+
+
+"""
+Functions creating an element of a given kind from its JSON fields and its
+parent element (None for top-level elements), by kind
+"""
+DEFAULT_ELEMENT_FACTORIES: Dict[str, Callable[[dict, Element], Element]] = {
+    Tags.PERSON: lambda fields, parent: Person(),
+    Tags.SOFTWARE_SYSTEM: lambda fields, parent: SoftwareSystem(),
+    Tags.CONTAINER: _create_container,
+    Tags.COMPONENT: _create_component,
+    Tags.DEPLOYMENT_NODE: _create_deployment_node,
+    Tags.CONTAINER_INSTANCE: _create_container_instance,
+}
+
+_CHILD_KINDS = {collection: kind for kind, collection in
+                JsonFormat.CHILD_COLLECTIONS.items()}
+
+"""
+The fields an element must have been read with before it is created, by
+kind: those read by its factory. Elements whose nested items come first are
+read as a whole before being created.
+"""
+_ID_AND_NAME = frozenset({"id", "name"})
+_CREATION_FIELDS = {
+    Tags.CONTAINER: _ID_AND_NAME | {"technology"},
+    Tags.COMPONENT: _ID_AND_NAME | {"technology"},
+    Tags.DEPLOYMENT_NODE: _ID_AND_NAME | {"environment", "technology",
+                                          "instances"},
+    Tags.CONTAINER_INSTANCE: _ID_AND_NAME | {"containerId"},
+}
+_TOP_LEVEL_KINDS = {collection: kind for kind, collection in
+                    JsonFormat.TOP_LEVEL_COLLECTIONS.items()}
+
+
+def _is_nested(key: str) -> bool:
+    return key in _CHILD_KINDS or key == JsonFormat.RELATIONSHIPS or \
+        key == JsonFormat.CODE_ELEMENTS
+
+
+class JsonReader:
+    """
+    Reads a model from a Structurizr JSON workspace.
+
+    The workspace is parsed incrementally: only the fields of the element
+    currently being read are decoded at once, and elements, relationships and
+    code elements are created as soon as they have been read. Elements are
+    looked up in the identity index of the model, and relationships referring
+    to elements which haven't been read yet are resolved in one pass once the
+    whole model has been read (see Model.resolve_relationships).
+
+    Keys may come in any order. An element whose nested items come before
+    the fields it is created with (its id, name and type specific fields) is
+    read as a whole before it is created, and deployment nodes which come
+    before the software systems whose containers they deploy are read after
+    them. Malformed nesting (e.g. nested items without an id, or components
+    in a software system) raises a ValueError.
+
+    With the optional fast backend (orjson), the whole document is decoded at
+    once instead, which is faster but holds the decoded document in memory;
+    the elements are then created from it in the same order.
+    """
+
+    """Event emitted when the fields of an element have been read"""
+    ELEMENT = "element"
+    """Event emitted when an element (including its children) has been read"""
+    ELEMENT_END = "element_end"
+    """Event emitted for each relationship"""
+    RELATIONSHIP = "relationship"
+    """Event emitted for each code element"""
+    CODE_ELEMENT = "code_element"
+
+    def __init__(self, use_fast_backend: bool = False):
+        """
+        :param use_fast_backend: whether to decode the whole document with
+                                 orjson when it is installed, rather than
+                                 incrementally
+        """
+        self.__use_fast_backend = use_fast_backend
+        self.__factories = dict(DEFAULT_ELEMENT_FACTORIES)
+
+    def register_element_type(self, kind: str,
+                              factory: Callable[[dict, Element], Element]):
+        """
+        Registers the function used to create elements of the specified kind.
+        The reader sets the identity, name, description, URL, tags and
+        properties of the created element itself.
+
+        :param kind: the tag of the element type, e.g. Tags.CONTAINER
+        :param factory: a function taking the JSON fields of the element and
+                        its parent Element (or None), returning a new Element
+        :return: None
+        """
+        self.__factories[kind] = factory
+
+    def read(self, stream: TextIO, model: Model = None) -> Model:
+        """
+        Reads a model from the specified text stream.
+
+        :param stream: a readable text stream
+        :param model: the Model to read into, a new one is created if None
+        :return: the Model
+        :raises ValueError: if the workspace is invalid, e.g. if a
+                            relationship duplicates another one
+        """
+        if model is None:
+            model = Model()
+
+        unresolved: List[Relationship] = []
+
+        for event in self.iter_events(stream, self.__use_fast_backend):
+            event_type = event[0]
+            if event_type == self.ELEMENT:
+                _, kind, fields, parent_identity = event
+                factory = self.__factories.get(kind)
+                if factory is None:
+                    raise ValueError(
+                        f"No element type is registered for {kind}")
+
+                parent = model.get_element(parent_identity) \
+                    if parent_identity is not None else None
+                element = factory(fields, parent)
+                self._set_element_fields(element, fields)
+                model.add_element(element)
+
+            elif event_type == self.ELEMENT_END:
+                _, kind, identity, late_fields = event
+                if late_fields:
+                    self._set_element_fields(model.get_element(identity),
+                                             late_fields)
+
+            elif event_type == self.RELATIONSHIP:
+                _, fields, source_identity = event
+                relationship = self.__create_relationship(
+                    fields, fields.get("sourceId", source_identity), model)
+                if relationship.source is None or \
+                        relationship.destination is None:
+                    unresolved.append(relationship)
+                elif not model.add_relationship(relationship):
+                    raise self.__duplicate_error(model, relationship)
+
+            elif event_type == self.CODE_ELEMENT:
+                _, fields, element_identity = event
+                element = model.get_element(element_identity)
+                add_code_element = getattr(element, "add_code_element", None)
+                if add_code_element is None:
+                    raise ValueError(f"The element {element_identity} can't "
+                                     f"have code elements")
+                add_code_element(self._create_code_element(fields))
+
+        model.resolve_relationships(unresolved)
+        for relationship in unresolved:
+            if relationship.model is not model:
+                raise self.__duplicate_error(model, relationship)
+
+        return model
+
+    @staticmethod
+    def iter_events(stream: TextIO,
+                    use_fast_backend: bool = False) -> Iterator[Tuple]:
+        """
+        Parses a workspace incrementally, yielding an event for each element,
+        relationship and code element in document order:
+
+        - (ELEMENT, kind, fields, parent identity or None)
+        - (ELEMENT_END, kind, identity, fields read after the element's
+          children or None)
+        - (RELATIONSHIP, fields, source identity)
+        - (CODE_ELEMENT, fields, element identity)
+
+        :param stream: a readable text stream
+        :param use_fast_backend: whether to decode the whole document with
+                                 orjson when it is installed
+        :return: an Iterator over event tuples
+        """
+        if use_fast_backend and JsonFormat.has_fast_backend():
+            tokens = _DecodedTokens(
+                JsonFormat.get_decoder()(stream.read().encode("utf-8")))
+        else:
+            tokens = _JsonTokenizer(stream)
+        for key in tokens.object_keys():
+            if key != JsonFormat.MODEL:
+                tokens.value()
+                continue
+
+            read = set()
+            deferred = []
+            for collection in tokens.object_keys():
+                kind = _TOP_LEVEL_KINDS.get(collection)
+                if kind is None:
+                    tokens.value()
+                    continue
+
+                if kind == Tags.DEPLOYMENT_NODE and \
+                        Tags.SOFTWARE_SYSTEM not in read:
+                    # container instances refer to the containers of
+                    # software systems, which must be read first
+                    deferred.append((kind, _DecodedTokens(tokens.value())))
+                    continue
+
+                read.add(kind)
+                for _ in tokens.array_items():
+                    yield from JsonReader.__iter_element_events(
+                        tokens, kind, None)
+
+            for kind, decoded in deferred:
+                for _ in decoded.array_items():
+                    yield from JsonReader.__iter_element_events(
+                        decoded, kind, None)
+
+    @staticmethod
+    def __iter_element_events(tokens: _JsonTokenizer, kind: str,
+                              parent_identity: str or None) -> Iterator[Tuple]:
+        fields = {}
+        late_fields = None
+        identity = None
+        started = False
+
+        keys = tokens.object_keys()
+        for key in keys:
+            if not _is_nested(key):
+                if started:
+                    if late_fields is None:
+                        late_fields = {}
+                    late_fields[key] = tokens.value()
+                else:
+                    fields[key] = tokens.value()
+                continue
+
+            if not started:
+                if not _CREATION_FIELDS.get(kind, _ID_AND_NAME) <= \
+                        fields.keys():
+                    # the element can't be created before the fields which
+                    # follow its nested items, so the rest of it is read
+                    nested = {key: tokens.value()}
+                    for other in keys:
+                        if _is_nested(other):
+                            nested[other] = tokens.value()
+                        else:
+                            fields[other] = tokens.value()
+                    yield from JsonReader.__iter_read_element_events(
+                        kind, fields, parent_identity, nested)
+                    return
+
+                identity = fields["id"]
+                started = True
+                yield JsonReader.ELEMENT, kind, fields, parent_identity
+
+            yield from JsonReader.__iter_nested_events(tokens, key, identity)
+
+        if not started:
+            identity = fields.get("id")
+            yield JsonReader.ELEMENT, kind, fields, parent_identity
+
+        yield JsonReader.ELEMENT_END, kind, identity, late_fields
+
+    @staticmethod
+    def __iter_read_element_events(kind: str, fields: dict,
+                                   parent_identity: str or None,
+                                   nested: Dict[str, object]) \
+            -> Iterator[Tuple]:
+        identity = fields.get("id")
+        if identity is None:
+            raise ValueError(f"The {kind} {fields.get('name')} has nested "
+                             f"items but no id")
+
+        yield JsonReader.ELEMENT, kind, fields, parent_identity
+        for key, value in nested.items():
+            yield from JsonReader.__iter_nested_events(
+                _DecodedTokens(value), key, identity)
+        yield JsonReader.ELEMENT_END, kind, identity, None
+
+    @staticmethod
+    def __iter_nested_events(tokens: _JsonTokenizer, key: str,
+                             identity: str) -> Iterator[Tuple]:
+        if key == JsonFormat.RELATIONSHIPS:
+            for _ in tokens.array_items():
+                yield JsonReader.RELATIONSHIP, tokens.value(), identity
+        elif key == JsonFormat.CODE_ELEMENTS:
+            for _ in tokens.array_items():
+                yield JsonReader.CODE_ELEMENT, tokens.value(), identity
+        else:
+            for _ in tokens.array_items():
+                yield from JsonReader.__iter_element_events(
+                    tokens, _CHILD_KINDS[key], identity)
+
+    @staticmethod
+    def _set_item_fields(item: ModelItem, fields: dict):
+        """Sets the identity, tags and properties of an item."""
+        if "id" in fields:
+            item.identity = fields["id"]
+        if fields.get("tags"):
+            item.add_tags(fields["tags"].split(","))
+        if fields.get("properties"):
+            for name, value in fields["properties"].items():
+                item.add_property(name, value)
+
+    @staticmethod
+    def _set_element_fields(element: Element, fields: dict):
+        """Sets the item fields, name, description and URL of an element."""
+        JsonReader._set_item_fields(element, fields)
+        if "name" in fields:
+            element.name = fields["name"]
+        if "description" in fields:
+            element.description = fields["description"]
+        if "url" in fields:
+            element.url = fields["url"]
+
+    @staticmethod
+    def __duplicate_error(model: Model,
+                          relationship: Relationship) -> ValueError:
+        existing = model.get_equivalent_relationship(relationship)
+        return ValueError(
+            f"The relationship {relationship.identity} duplicates the "
+            f"relationship {existing.identity if existing else '?'}")
+
+    @staticmethod
+    def __create_relationship(fields: dict, source_identity: str,
+                              model: Model) -> Relationship:
+        destination_identity = fields.get("destinationId")
+        relationship = Relationship(
+            model.get_element(source_identity),
+            model.get_element(destination_identity),
+            fields.get("description"), fields.get("technology"),
+            fields.get("interactionStyle", InteractionStyle.SYNCHRONOUS))
+        relationship.source_identity = source_identity
+        relationship.destination_identity = destination_identity
+        JsonReader._set_item_fields(relationship, fields)
+
+        return relationship
+
+    @staticmethod
+    def _create_code_element(fields: dict) -> CodeElement:
+        """Creates a code element from its JSON fields."""
+        code_element = CodeElement(fields["type"])
+        if "role" in fields:
+            code_element.role = fields["role"]
+        if "name" in fields:
+            code_element.name = fields["name"]
+        if "description" in fields:
+            code_element.description = fields["description"]
+        if "url" in fields:
+            code_element.url = fields["url"]
+        if "language" in fields:
+            code_element.language = fields["language"]
+        if "category" in fields:
+            code_element.category = fields["category"]
+        if "visibility" in fields:
+            code_element.visibility = fields["visibility"]
+        if "size" in fields:
+            code_element.size = fields["size"]
+
+        return code_element
+
+
+class _JsonTokenizer:
+    """
+    Walks a JSON document read from a text stream in chunks. Objects and
+    arrays can be entered one key or item at a time, and values are decoded
+    with the C accelerated scanner of the json module.
+    """
+
+    CHUNK_SIZE = 1 << 16
+
+    __WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self, stream: TextIO):
+        self.__stream = stream
+        self.__buffer = ""
+        self.__position = 0
+        self.__eof = False
+        self.__decoder = json.JSONDecoder()
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and gets the next character without consuming it.
+
+        :return: the character, or an empty str at the end of the stream
+        """
+        while True:
+            self.__position = self.__WHITESPACE.match(
+                self.__buffer, self.__position).end()
+            if self.__position < len(self.__buffer):
+                return self.__buffer[self.__position]
+            if not self.__fill(self.CHUNK_SIZE):
+                return ""
+
+    def expect(self, character: str):
+        """
+        Consumes the specified structural character.
+
+        :param character: the expected character
+        :return: None
+        """
+        found = self.peek()
+        if found != character:
+            raise ValueError(f"Expected '{character}' but found "
+                             f"'{found or 'end of input'}' in workspace JSON")
+        self.__position += 1
+
+    def value(self) -> object:
+        """
+        Decodes the next value, reading more of the stream as required.
+
+        :return: the decoded value
+        """
+        self.peek()
+        size = self.CHUNK_SIZE
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer,
+                                                       self.__position)
+                # a number at the end of the buffer might continue
+                if end < len(self.__buffer) or self.__eof:
+                    self.__position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.__eof:
+                    raise
+
+            self.__fill(size)
+            size *= 2
+
+    def object_keys(self) -> Iterator[str]:
+        """
+        Enters the next object, yielding its keys. The value of each key must
+        be consumed before advancing the iterator.
+
+        :return: an Iterator over keys
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.__position += 1
+            return
+
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+
+            if self.peek() == ",":
+                self.__position += 1
+            else:
+                self.expect("}")
+                return
+
+    def array_items(self) -> Iterator[None]:
+        """
+        Enters the next array, yielding once for each item. The item must be
+        consumed before advancing the iterator.
+
+        :return: an Iterator
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.__position += 1
+            return
+
+        while True:
+            yield
+
+            if self.peek() == ",":
+                self.__position += 1
+            else:
+                self.expect("]")
+                return
+
+    def __fill(self, size: int) -> bool:
+        if self.__eof:
+            return False
+
+        chunk = self.__stream.read(size)
+        if not chunk:
+            self.__eof = True
+            return False
+
+        self.__buffer = self.__buffer[self.__position:] + chunk
+        self.__position = 0
+        return True
+
+
+class _DecodedTokens:
+    """
+    Walks a JSON document which has already been decoded, in the same way
+    as _JsonTokenizer walks a stream.
+    """
+
+    def __init__(self, document: object):
+        self.__pending = [document]
+
+    def value(self) -> object:
+        return self.__pending.pop()
+
+    def object_keys(self) -> Iterator[str]:
+        value = self.__pending.pop()
+        if not isinstance(value, dict):
+            raise ValueError("Expected '{' in workspace JSON")
+
+        for key, item in value.items():
+            self.__pending.append(item)
+            yield key
+
+    def array_items(self) -> Iterator[None]:
+        value = self.__pending.pop()
+        if not isinstance(value, list):
+            raise ValueError("Expected '[' in workspace JSON")
+
+        for item in value:
+            self.__pending.append(item)
+            yield
@@ -0,0 +1,257 @@
+from __future__ import annotations
+from typing import Callable, Dict, List, TextIO, TYPE_CHECKING
+
+from structurizr_py.core.io.json_format import JsonFormat
+from structurizr_py.core.model.tags import Tags
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.code_element import CodeElement
+    from structurizr_py.core.model.element import Element
+    from structurizr_py.core.model.model import Model
+    from structurizr_py.core.model.model_item import ModelItem
+    from structurizr_py.core.model.relationship import Relationship
+
+"""Functions returning the type specific JSON fields of an element, by kind"""
+DEFAULT_ELEMENT_FIELDS: Dict[str, Callable[[Element], dict]] = {}
+
+
+def _technology_fields(element: Element) -> dict:
+    technology = getattr(element, "technology", None)
+    return {"technology": technology} if technology is not None else {}
+
+
+def _deployment_node_fields(element: Element) -> dict:
+    fields = _technology_fields(element)
+    fields["environment"] = element.environment
+    fields["instances"] = element.instances
+    return fields
+
+
+def _container_instance_fields(element: Element) -> dict:
+    # containers are given an identity when added to the model
+    return {"containerId": element.container.identity,
+            "environment": element.environment}
+
+
+DEFAULT_ELEMENT_FIELDS[Tags.CONTAINER] = _technology_fields
+DEFAULT_ELEMENT_FIELDS[Tags.COMPONENT] = _technology_fields
+DEFAULT_ELEMENT_FIELDS[Tags.DEPLOYMENT_NODE] = _deployment_node_fields
+DEFAULT_ELEMENT_FIELDS[Tags.CONTAINER_INSTANCE] = _container_instance_fields
+
+
+class JsonWriter:
+    """
+    Writes a model as a Structurizr JSON workspace.
+
+    The workspace is streamed to the output one element, relationship and
+    code element at a time, so the JSON document never exists in memory as a
+    whole. Relationships are nested in their source element and refer to
+    their destination by identity. Items without an identity are given one
+    for the duration of the write.
+    """
+
+    def __init__(self, use_fast_backend: bool = True):
+        self.__encode = JsonFormat.get_encoder(use_fast_backend)
+        self.__element_fields = dict(DEFAULT_ELEMENT_FIELDS)
+
+    def register_element_fields(self, kind: str,
+                                fields: Callable[[Element], dict]):
+        """
+        Registers a function returning the type specific fields of elements of
+        the specified kind (e.g. the technology of a container).
+
+        :param kind: the tag of the element type, e.g. Tags.CONTAINER
+        :param fields: a function taking an Element and returning a dict
+        :return: None
+        """
+        self.__element_fields[kind] = fields
+
+    def write(self, model: Model, stream: TextIO, name: str = None,
+              description: str = None):
+        """
+        Writes the model to the specified text stream.
+
+        :param model: the Model to write
+        :param stream: a writable text stream
+        :param name: the name of the workspace
+        :param description: the description of the workspace
+        :return: None
+        """
+        identities = _IdentityAssigner(model)
+        top_level: Dict[str, List[Element]] = {}
+        children: Dict[int, List[Element]] = {}
+        for element in model.iter_elements():
+            parent = element.get_parent()
+            if parent is None:
+                top_level.setdefault(JsonFormat.kind_of(element), []) \
+                    .append(element)
+            else:
+                children.setdefault(id(parent), []).append(element)
+
+        workspace = {}
+        if name is not None:
+            workspace["name"] = name
+        if description is not None:
+            workspace["description"] = description
+
+        write = stream.write
+        write(self.__encode(workspace)[:-1])
+        write(',"' if workspace else '"')
+        write(JsonFormat.MODEL + '":{')
+
+        first = True
+        for kind, collection in JsonFormat.TOP_LEVEL_COLLECTIONS.items():
+            elements = top_level.get(kind)
+            if elements:
+                write('"' if first else ',"')
+                write(collection + '":')
+                self.__write_elements(elements, stream, children, identities)
+                first = False
+
+        write("}}")
+
+    def __write_elements(self, elements: List[Element], stream: TextIO,
+                         children: Dict[int, List[Element]],
+                         identities: _IdentityAssigner):
+        write = stream.write
+        separator = "["
+        for element in elements:
+            write(separator)
+            self.__write_element(element, stream, children, identities)
+            separator = ","
+        write("]")
+
+    def __write_element(self, element: Element, stream: TextIO,
+                        children: Dict[int, List[Element]],
+                        identities: _IdentityAssigner):
+        fields = self._element_fields(element, identities)
+
+        write = stream.write
+        write(self.__encode(fields)[:-1])
+
+        relationships = element.model.get_efferent_relationships(element) \
+            if element.model is not None else element.relationships
+        if relationships:
+            write(',"' + JsonFormat.RELATIONSHIPS + '":[')
+            write(",".join(
+                self.__encode(self._relationship_fields(r, identities))
+                for r in relationships))
+            write("]")
+
+        nested: Dict[str, List[Element]] = {}
+        for child in children.get(id(element), ()):
+            nested.setdefault(
+                JsonFormat.CHILD_COLLECTIONS[JsonFormat.kind_of(child)], []) \
+                .append(child)
+        for collection, elements in nested.items():
+            write(',"' + collection + '":')
+            self.__write_elements(elements, stream, children, identities)
+
+        code_elements = getattr(element, "code_elements", None)
+        if code_elements:
+            write(',"' + JsonFormat.CODE_ELEMENTS + '":[')
+            write(",".join(self.__encode(self._code_element_fields(c))
+                           for c in code_elements))
+            write("]")
+
+        write("}")
+
+    def _element_fields(self, element: Element,
+                        identities: _IdentityAssigner) -> dict:
+        """Gets the fields of an element, without its nested items."""
+        fields = self._item_fields(element, identities)
+        if element.name is not None:
+            fields["name"] = element.name
+        if element.description is not None:
+            fields["description"] = element.description
+        if element.url is not None:
+            fields["url"] = element.url
+
+        type_fields = self.__element_fields.get(JsonFormat.kind_of(element))
+        if type_fields is not None:
+            fields.update(type_fields(element))
+
+        return fields
+
+    @staticmethod
+    def _relationship_fields(relationship: Relationship,
+                             identities: _IdentityAssigner) -> dict:
+        """Gets the fields of a relationship."""
+        fields = JsonWriter._item_fields(relationship, identities)
+        fields["sourceId"] = identities.of(relationship.source)
+        fields["destinationId"] = identities.of(relationship.destination)
+        if relationship.description is not None:
+            fields["description"] = relationship.description
+        if relationship.technology is not None:
+            fields["technology"] = relationship.technology
+        if relationship.interaction_style is not None:
+            fields["interactionStyle"] = relationship.interaction_style
+
+        return fields
+
+    @staticmethod
+    def _item_fields(item: ModelItem, identities: _IdentityAssigner) -> dict:
+        """Gets the identity, tags and properties of an item."""
+        fields = {"id": identities.of(item)}
+        if item.tags:
+            fields["tags"] = item.tags
+        if item.properties:
+            fields["properties"] = dict(item.properties)
+
+        return fields
+
+    @staticmethod
+    def _code_element_fields(code_element: CodeElement) -> dict:
+        """Gets the fields of a code element."""
+        fields = {"role": code_element.role, "name": code_element.name,
+                  "type": code_element.type}
+        if code_element.description is not None:
+            fields["description"] = code_element.description
+        if code_element.url is not None:
+            fields["url"] = code_element.url
+        if code_element.language is not None:
+            fields["language"] = code_element.language
+        if code_element.category is not None:
+            fields["category"] = code_element.category
+        if code_element.visibility is not None:
+            fields["visibility"] = code_element.visibility
+        fields["size"] = code_element.size
+
+        return fields
+
+
+class _IdentityAssigner:
+    """
+    Hands out the identities of model items, generating unused ones for items
+    which don't have an identity yet. Models give identities to the items
+    added to them, so the identities in use are only collected once one has
+    to be generated.
+    """
+
+    def __init__(self, model: Model):
+        self.__model = model
+        self.__used = None
+        self.__generated: Dict[int, str] = {}
+        self.__next = 1
+
+    def of(self, item: ModelItem) -> str or None:
+        if item is None:
+            return None
+        if item.identity:
+            return item.identity
+
+        identity = self.__generated.get(id(item))
+        if identity is None:
+            if self.__used is None:
+                self.__used = {
+                    other.identity for others in (
+                        self.__model.iter_elements(),
+                        self.__model.iter_relationships())
+                    for other in others if other.identity}
+            while str(self.__next) in self.__used:
+                self.__next += 1
+            identity = str(self.__next)
+            self.__next += 1
+            self.__generated[id(item)] = identity
+
+        return identity
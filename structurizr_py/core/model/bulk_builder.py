@@ -0,0 +1,194 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Tuple, Type, TYPE_CHECKING
+
+from structurizr_py.core.model.bulk_validation_error import \
+    BulkValidationError
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.util.url import Url
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.model import Model
+
+_INTERACTION_STYLES = {InteractionStyle.SYNCHRONOUS,
+                       InteractionStyle.ASYNCHRONOUS}
+
+
+class BulkBuilder:
+    """
+    Stages elements and relationships for a model from plain tuples or
+    dicts, without running the per-property validation of the setters.
+
+    Nothing is added to the model until commit() is called, which validates
+    all staged rows in a single pass (each distinct URL is only validated
+    once), raises a BulkValidationError listing every failure, and otherwise
+    adds the items to the model one at a time, which gives those without an
+    identity one (see Model.identity_strategy), holding the lock of a
+    thread-safe model while doing so. If the model rejects an element (e.g.
+    a duplicate top-level name), the items added so far are removed again.
+    """
+
+    def __init__(self, model: Model):
+        self.__model = model
+        self.__elements: List[Tuple[Element, str, str, str]] = []
+        self.__relationships: List[Relationship] = []
+
+    def add_elements(self, element_type: Type[Element],
+                     rows: Iterable[tuple or dict]) -> List[Element]:
+        """
+        Stages elements of the specified type. Each row is either a tuple of
+        (name[, description[, url]]) or a dict with a "name" and optionally
+        "description", "url", "tags" and "properties".
+
+        :param element_type: an Element subclass with a no-argument constructor
+        :param rows: an iterable of tuples or dicts
+        :return: the List of staged (not yet validated) Element objects
+        """
+        staged = []
+        for row in rows:
+            element = element_type()
+            if isinstance(row, dict):
+                name = row.get("name")
+                description = row.get("description")
+                url = row.get("url")
+                if row.get("tags"):
+                    element.add_tags(row["tags"])
+                for key, value in (row.get("properties") or {}).items():
+                    element.add_property(key, value)
+            else:
+                name = row[0]
+                description = row[1] if len(row) > 1 else None
+                url = row[2] if len(row) > 2 else None
+
+            self.__elements.append((element, name, description, url))
+            staged.append(element)
+
+        return staged
+
+    def add_relationships(self, rows: Iterable[tuple or dict]) \
+            -> List[Relationship]:
+        """
+        Stages relationships. Each row is either a tuple of
+        (source, destination[, description[, technology[, interaction
+        style]]]) or a dict with those keys (interaction_style for the latter)
+        and optionally "tags" and "properties". Source and destination may be
+        elements staged in this builder.
+
+        :param rows: an iterable of tuples or dicts
+        :return: the List of staged (not yet validated) Relationship objects
+        """
+        staged = []
+        for row in rows:
+            if isinstance(row, dict):
+                relationship = Relationship(
+                    row.get("source"), row.get("destination"),
+                    row.get("description"), row.get("technology"),
+                    row.get("interaction_style",
+                            InteractionStyle.SYNCHRONOUS))
+                if row.get("tags"):
+                    relationship.add_tags(row["tags"])
+                for key, value in (row.get("properties") or {}).items():
+                    relationship.add_property(key, value)
+            else:
+                relationship = Relationship(
+                    row[0], row[1],
+                    row[2] if len(row) > 2 else None,
+                    row[3] if len(row) > 3 else None,
+                    row[4] if len(row) > 4 else InteractionStyle.SYNCHRONOUS)
+
+            self.__relationships.append(relationship)
+            staged.append(relationship)
+
+        return staged
+
+    def commit(self):
+        """
+        Validates all staged rows and adds them to the model. If validation
+        or adding an item fails, nothing is added and the builder keeps its
+        staged rows. Relationships duplicating one in the model (or one
+        staged before them) are not added, as by Model.add_relationship.
+
+        :return: None
+        :raises BulkValidationError: listing every invalid row
+        :raises ValueError: if the model rejects an element
+        """
+        errors = self.__validate()
+        if errors:
+            raise BulkValidationError(errors)
+
+        model = self.__model
+        added_elements = []
+        added_relationships = []
+        with model.locked():
+            try:
+                for element, name, description, url in self.__elements:
+                    element._set_fields_unchecked(
+                        name, description,
+                        url if url and url.strip() else None)
+                    model.add_element(element)
+                    added_elements.append(element)
+
+                for relationship in self.__relationships:
+                    if model.add_relationship(relationship):
+                        added_relationships.append(relationship)
+            except BaseException:
+                for relationship in reversed(added_relationships):
+                    model.remove_relationship(relationship)
+                for element in reversed(added_elements):
+                    element.model = None
+                raise
+
+        self.__elements = []
+        self.__relationships = []
+
+    def __validate(self) -> List[Tuple[str, int, str]]:
+        errors = []
+
+        distinct = {url for _, _, _, url in self.__elements
+                    if url is not None and url.strip()}
+        urls: Dict[str, bool] = dict(zip(distinct,
+                                         Url.validate_many(distinct)))
+
+        for index, (_, name, _, url) in enumerate(self.__elements):
+            if name is None or name.strip() == "":
+                errors.append(("element", index, "The name of an element "
+                                                 "must not be null or empty"))
+            if urls.get(url) is False:
+                errors.append(("element", index, f"{url} is not a valid URL."))
+
+        staged = {id(element) for element, _, _, _ in self.__elements}
+        for index, relationship in enumerate(self.__relationships):
+            for end in (relationship.source, relationship.destination):
+                if not isinstance(end, Element):
+                    errors.append(("relationship", index,
+                                   "The source and destination of a "
+                                   "relationship must be elements"))
+                    break
+                if id(end) not in staged and end.model is not self.__model:
+                    errors.append(("relationship", index,
+                                   f"{end} is not part of the model"))
+                    break
+            if relationship.interaction_style not in _INTERACTION_STYLES:
+                errors.append(("relationship", index,
+                               f"{relationship.interaction_style} is not a "
+                               f"valid interaction style"))
+
+        identities = set()
+        for kind, items in (
+                ("element", [element for element, _, _, _ in self.__elements]),
+                ("relationship", self.__relationships)):
+            for index, item in enumerate(items):
+                identity = item.identity
+                if not identity:
+                    continue
+                existing = self.__model.get_element(identity)
+                if existing is None:
+                    existing = self.__model.get_relationship(identity)
+                if identity in identities or \
+                        (existing is not None and existing is not item):
+                    errors.append((kind, index, f"The identity '{identity}' "
+                                                f"is already used"))
+                identities.add(identity)
+
+        return errors
@@ -0,0 +1,22 @@
+from typing import List, Tuple
+
+
+class BulkValidationError(ValueError):
+    """
+    Raised when rows added through a bulk builder fail validation. It carries
+    every failure rather than only the first one.
+    """
+
+    def __init__(self, errors: List[Tuple[str, int, str]]):
+        """
+        :param errors: a List of (kind, row index, message) tuples, where kind
+                       is "element" or "relationship"
+        """
+        self.errors = errors
+
+        lines = [f"{kind} {index}: {message}"
+                 for kind, index, message in errors[:10]]
+        if len(errors) > 10:
+            lines.append(f"... and {len(errors) - 10} more")
+        super().__init__(f"{len(errors)} bulk validation error(s):\n" +
+                         "\n".join(lines))
@@ -10,40 +10,37 @@ class CodeElement:
     design of a component.
     """
 
-    """The role of the code element ... Primary or Supporting"""
-    __role: CodeElementRole = CodeElementRole.SUPPORTING
-
-    """
-    The name of the code element ... typically the simple class/interface name
-    """
-    __name: str = None
-
-    """The fully qualified type of the code element"""
-    __type: str = None
-
-    """A short description of the code element"""
-    __description: str = None
-
-    """A URL, e.g. a reference to the code element in source code control"""
-    __url: str = None
-
-    """The programming language used to create the code element"""
-    __language: str = "Python"
-
-    """The category of code element, e.g. class, interface, etc"""
-    __category: str = None
-
-    """The visibility of the code element, e.g. public, package, private"""
-    __visibility: str = None
-
-    """The size of the code element, e.g. the number of lines"""
-    __size: int = 0
+    __slots__ = ("__role", "__name", "__type", "__package", "__description",
+                 "__url", "__language", "__category", "__visibility", "__size")
 
     def __init__(self, fully_qualified_type_name: str):
         if fully_qualified_type_name is None \
                 or len(fully_qualified_type_name.strip()) == 0:
             raise ValueError("A fully qualified name must be provided")
 
+        # the role of the code element ... Primary or Supporting
+        self.__role: CodeElementRole = CodeElementRole.SUPPORTING
+        # the name of the code element ... typically the simple
+        # class/interface name
+        self.__name: str = None
+        # the fully qualified type of the code element
+        self.__type: str = None
+        # the package of the type, computed when the type is set
+        self.__package: str = None
+        # a short description of the code element
+        self.__description: str = None
+        # a URL, e.g. a reference to the code element in source code
+        # control
+        self.__url: str = None
+        # the programming language used to create the code element
+        self.__language: str = "Python"
+        # the category of code element, e.g. class, interface, etc
+        self.__category: str = None
+        # the visibility of the code element, e.g. public, package, private
+        self.__visibility: str = None
+        # the size of the code element, e.g. the number of lines
+        self.__size: int = 0
+
         dot = fully_qualified_type_name.rfind(".")
         if dot > -1:
             self.name = fully_qualified_type_name[dot + 1:]
@@ -76,6 +73,9 @@ class CodeElement:
     def type(self, new_type: str):
         self.__type = new_type
 
+        dot = new_type.rfind(".") if new_type is not None else -1
+        self.__package = new_type[:dot] if dot > -1 else ""
+
     @property
     def description(self) -> str:
         return self.__description
@@ -133,9 +133,9 @@ class CodeElement:
         Gets the package of this component (i.e. the package of the primary
         code element)
 
-        :return: the package name, as a str
+        :return: the package name, as a str (empty for the default package)
         """
-        return self.type[:self.type.rfind(".")]
+        return self.__package
 
     def __eq__(self, other: CodeElement) -> bool:
         if self is other:
@@ -0,0 +1,130 @@
+from typing import Dict, Iterator
+
+from structurizr_py.core.model.code_element import CodeElement
+from structurizr_py.core.model.code_element_role import CodeElementRole
+
+
+class _PackageNode:
+    """A node of the package trie, holding the code elements of one package."""
+
+    __slots__ = ("children", "code_elements")
+
+    def __init__(self):
+        self.children: Dict[str, _PackageNode] = {}
+        self.code_elements: Dict[str, CodeElement] = {}
+
+
+class CodeElementIndex:
+    """
+    Indexes code elements by fully qualified type and by package.
+
+    Packages are stored in a trie keyed on package segments, so finding the
+    code elements of a package and all of its subpackages only visits that
+    part of the tree. Code elements are indexed by the type they have when
+    they are added; re-add them after changing their type.
+    """
+
+    def __init__(self):
+        self.__root = _PackageNode()
+        self.__by_type: Dict[str, CodeElement] = {}
+
+    def add(self, code_element: CodeElement) -> bool:
+        """
+        Adds a code element to the index.
+
+        :param code_element: a CodeElement object
+        :return: True if it was added, False if a code element with the same
+                 type is already indexed
+        """
+        if code_element.type in self.__by_type:
+            return False
+
+        node = self.__root
+        for segment in self.__segments(code_element.get_package()):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _PackageNode()
+            node = child
+
+        node.code_elements[code_element.type] = code_element
+        self.__by_type[code_element.type] = code_element
+
+        return True
+
+    def remove(self, code_element: CodeElement) -> bool:
+        """
+        Removes a code element from the index, pruning packages which become
+        empty.
+
+        :param code_element: a CodeElement object
+        :return: True if it was removed, False if it wasn't indexed
+        """
+        if self.__by_type.get(code_element.type) is not code_element:
+            return False
+
+        del self.__by_type[code_element.type]
+
+        path = [self.__root]
+        segments = self.__segments(code_element.get_package())
+        for segment in segments:
+            path.append(path[-1].children[segment])
+        del path[-1].code_elements[code_element.type]
+
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node.children or node.code_elements:
+                break
+            del path[depth - 1].children[segments[depth - 1]]
+
+        return True
+
+    def get(self, fully_qualified_type: str) -> CodeElement or None:
+        """
+        Gets the code element with the specified fully qualified type.
+
+        :param fully_qualified_type: the type, as a str
+        :return: a CodeElement object, or None if there is no such element
+        """
+        return self.__by_type.get(fully_qualified_type)
+
+    def find_in_package(self, package: str, include_subpackages: bool = True,
+                        role: CodeElementRole = None) \
+            -> Iterator[CodeElement]:
+        """
+        Finds the code elements living in the specified package.
+
+        :param package: the package name, e.g. "structurizr.component" (an
+                        empty str is the default package)
+        :param include_subpackages: whether to include code elements in
+                                    subpackages of the package
+        :param role: only include code elements with this role, if specified
+        :return: an Iterator over CodeElement objects
+        """
+        node = self.__root
+        for segment in self.__segments(package):
+            node = node.children.get(segment)
+            if node is None:
+                return
+
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            for code_element in node.code_elements.values():
+                if role is None or code_element.role == role:
+                    yield code_element
+
+            if include_subpackages:
+                pending.extend(node.children.values())
+
+    def __contains__(self, code_element: CodeElement) -> bool:
+        return self.__by_type.get(code_element.type) is code_element
+
+    def __len__(self) -> int:
+        return len(self.__by_type)
+
+    def __iter__(self) -> Iterator[CodeElement]:
+        return iter(self.__by_type.values())
+
+    @staticmethod
+    def __segments(package: str) -> list:
+        return package.split(".") if package else []
@@ -0,0 +1,358 @@
+from __future__ import annotations
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List, Sequence, TYPE_CHECKING
+
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.tag_registry import DEFAULT_TAG_REGISTRY
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.element import Element
+    from structurizr_py.core.model.model import Model
+
+"""Codes of the interaction styles in the interaction style column"""
+_STYLE_CODES = {InteractionStyle.SYNCHRONOUS: 0,
+                InteractionStyle.ASYNCHRONOUS: 1}
+_STYLES = [InteractionStyle.SYNCHRONOUS, InteractionStyle.ASYNCHRONOUS]
+
+"""The code of a missing (None) description or technology"""
+_NONE = -1
+
+
+class ColumnarRelationshipStore:
+    """
+    Stores relationships column by column, for analytics over very large
+    models: integer source and destination element indices, interned
+    description and technology codes, interaction style codes and tag
+    bitmasks, each in an array.
+
+    Degree counts and filters run over whole columns (with NumPy when it is
+    installed, otherwise with the C implemented iteration of the standard
+    library) without creating an object per relationship, and return plain
+    lists of counts or relationship indices either way. Relationships can
+    be read back through lightweight RelationshipView objects, or
+    materialized as Relationship objects, on demand.
+    """
+
+    def __init__(self):
+        self.__elements: List[Element] = []
+        self.__element_indices: Dict[int, int] = {}
+        self.__strings: List[str] = []
+        self.__string_codes: Dict[str, int] = {}
+
+        self.__sources = array("l")
+        self.__destinations = array("l")
+        self.__descriptions = array("l")
+        self.__technologies = array("l")
+        self.__styles = array("b")
+        self.__tag_masks: Sequence[int] = array("Q")
+        self.__identities: List[str] = []
+
+    @staticmethod
+    def from_model(model: Model) -> ColumnarRelationshipStore:
+        """
+        Creates a store holding all relationships of a model.
+
+        :param model: a Model object
+        :return: a ColumnarRelationshipStore object
+        """
+        store = ColumnarRelationshipStore()
+        for element in model.iter_elements():
+            store.index_of(element)
+        for relationship in model.iter_relationships():
+            store.add_relationship(relationship)
+
+        return store
+
+    @property
+    def elements(self) -> List[Element]:
+        """
+        Gets the elements referenced by the store, by element index.
+
+        :return: a List of Element objects
+        """
+        return self.__elements
+
+    def index_of(self, element: Element) -> int:
+        """
+        Gets the index of an element, registering it if required.
+
+        :param element: an Element object
+        :return: the index, as an int
+        """
+        index = self.__element_indices.get(id(element))
+        if index is None:
+            index = self.__element_indices[id(element)] = len(self.__elements)
+            self.__elements.append(element)
+
+        return index
+
+    def add(self, source: Element, destination: Element,
+            description: str = None, technology: str = None,
+            interaction_style: str = InteractionStyle.SYNCHRONOUS,
+            tags: Iterable[str] = (), identity: str = "") -> int:
+        """
+        Adds a relationship without creating a Relationship object.
+
+        :param source: the source Element
+        :param destination: the destination Element
+        :param description: the description
+        :param technology: the technology
+        :param interaction_style: an InteractionStyle value
+        :param tags: the tags (strings)
+        :param identity: the identity
+        :return: the index of the relationship, as an int
+        """
+        return self.__append(self.index_of(source), self.index_of(destination),
+                             description, technology, interaction_style,
+                             DEFAULT_TAG_REGISTRY.mask(tags), identity)
+
+    def add_relationship(self, relationship: Relationship) -> int:
+        """
+        Adds the columns of an existing Relationship.
+
+        :param relationship: a Relationship object
+        :return: the index of the relationship, as an int
+        """
+        return self.__append(self.index_of(relationship.source),
+                             self.index_of(relationship.destination),
+                             relationship.description, relationship.technology,
+                             relationship.interaction_style,
+                             relationship.tag_mask, relationship.identity)
+
+    def get(self, index: int) -> RelationshipView:
+        """
+        Gets a lightweight view of the relationship at the specified index.
+
+        :param index: the index of the relationship
+        :return: a RelationshipView object
+        """
+        if not 0 <= index < len(self.__sources):
+            raise IndexError(f"No relationship at index {index}")
+
+        return RelationshipView(self, index)
+
+    def materialize(self, index: int) -> Relationship:
+        """
+        Creates a Relationship object from the relationship at the specified
+        index. It is not added to any model.
+
+        :param index: the index of the relationship
+        :return: a Relationship object
+        """
+        return self.get(index).to_relationship()
+
+    def out_degrees(self) -> List[int]:
+        """
+        Counts the outgoing relationships of every element.
+
+        :return: a List of counts, by element index
+        """
+        return self.__count(self.__sources)
+
+    def in_degrees(self) -> List[int]:
+        """
+        Counts the incoming relationships of every element.
+
+        :return: a List of counts, by element index
+        """
+        return self.__count(self.__destinations)
+
+    def filter_by_technology(self, technology: str) -> List[int]:
+        """
+        Finds the relationships with the specified technology.
+
+        :param technology: the technology, or None
+        :return: a List of relationship indices, in order
+        """
+        if technology is not None and technology not in self.__string_codes:
+            return []
+
+        return self.__select(self.__technologies,
+                             self.__intern(technology))
+
+    def filter_by_interaction_style(self, interaction_style: str) \
+            -> List[int]:
+        """
+        Finds the relationships with the specified interaction style.
+
+        :param interaction_style: an InteractionStyle value
+        :return: a List of relationship indices, in order
+        """
+        return self.__select(self.__styles,
+                             _STYLE_CODES.get(interaction_style, -1))
+
+    def filter_by_tag(self, tag: str) -> List[int]:
+        """
+        Finds the relationships with the specified tag.
+
+        :param tag: the tag, as a str
+        :return: a List of relationship indices, in order
+        """
+        bit = DEFAULT_TAG_REGISTRY.find(tag)
+        if not bit:
+            return []
+        if numpy is not None and isinstance(self.__tag_masks, array):
+            return numpy.flatnonzero(
+                _to_numpy(self.__tag_masks) & numpy.uint64(bit)).tolist()
+
+        return list(compress(range(len(self.__tag_masks)),
+                             map(bit.__and__, self.__tag_masks)))
+
+    def __len__(self) -> int:
+        return len(self.__sources)
+
+    def __iter__(self) -> Iterator[RelationshipView]:
+        return (RelationshipView(self, index)
+                for index in range(len(self.__sources)))
+
+    def _row(self, index: int) -> tuple:
+        """
+        Gets the decoded columns of one relationship: (source, destination,
+        description, technology, interaction style, tag mask, identity).
+        """
+        description = self.__descriptions[index]
+        technology = self.__technologies[index]
+        return (self.__elements[self.__sources[index]],
+                self.__elements[self.__destinations[index]],
+                self.__strings[description] if description != _NONE else None,
+                self.__strings[technology] if technology != _NONE else None,
+                _STYLES[self.__styles[index]], self.__tag_masks[index],
+                self.__identities[index])
+
+    def __append(self, source: int, destination: int, description: str,
+                 technology: str, interaction_style: str, tag_mask: int,
+                 identity: str) -> int:
+        style = _STYLE_CODES.get(interaction_style)
+        if style is None:
+            raise ValueError(
+                f"{interaction_style} is not a valid interaction style")
+
+        try:
+            self.__tag_masks.append(tag_mask)
+        except OverflowError:
+            # more than 64 distinct tags, fall back to Python ints
+            self.__tag_masks = list(self.__tag_masks)
+            self.__tag_masks.append(tag_mask)
+
+        self.__sources.append(source)
+        self.__destinations.append(destination)
+        self.__descriptions.append(self.__intern(description))
+        self.__technologies.append(self.__intern(technology))
+        self.__styles.append(style)
+        self.__identities.append(identity)
+
+        return len(self.__sources) - 1
+
+    def __intern(self, value: str or None) -> int:
+        if value is None:
+            return _NONE
+
+        code = self.__string_codes.get(value)
+        if code is None:
+            code = self.__string_codes[value] = len(self.__strings)
+            self.__strings.append(value)
+
+        return code
+
+    def __count(self, column: array) -> List[int]:
+        if numpy is not None:
+            return numpy.bincount(_to_numpy(column),
+                                  minlength=len(self.__elements)).tolist()
+
+        counts = [0] * len(self.__elements)
+        for index, count in Counter(column).items():
+            counts[index] = count
+
+        return counts
+
+    @staticmethod
+    def __select(column: array, code: int) -> List[int]:
+        if numpy is not None:
+            return numpy.flatnonzero(_to_numpy(column) == code).tolist()
+
+        return list(compress(range(len(column)), map(code.__eq__, column)))
+
+
+def _to_numpy(column: array):
+    """Wraps an array column in a NumPy array without copying it."""
+    kind = "u" if column.typecode.isupper() else "i"
+    return numpy.frombuffer(column, dtype=f"{kind}{column.itemsize}")
+
+
+class RelationshipView:
+    """
+    A read-only view of one relationship in a ColumnarRelationshipStore. Its
+    columns are decoded on first access and then kept, as the store only
+    ever appends relationships.
+    """
+
+    __slots__ = ("__store", "__index", "__row")
+
+    def __init__(self, store: ColumnarRelationshipStore, index: int):
+        self.__store = store
+        self.__index = index
+        self.__row = None
+
+    @property
+    def index(self) -> int:
+        return self.__index
+
+    @property
+    def source(self) -> Element:
+        return self.__get_row()[0]
+
+    @property
+    def destination(self) -> Element:
+        return self.__get_row()[1]
+
+    @property
+    def description(self) -> str:
+        return self.__get_row()[2]
+
+    @property
+    def technology(self) -> str:
+        return self.__get_row()[3]
+
+    @property
+    def interaction_style(self) -> str:
+        return self.__get_row()[4]
+
+    @property
+    def tags(self) -> str:
+        return DEFAULT_TAG_REGISTRY.csv(self.__get_row()[5])
+
+    @property
+    def identity(self) -> str:
+        return self.__get_row()[6]
+
+    def to_relationship(self) -> Relationship:
+        """
+        Creates a Relationship object with the values of this view.
+
+        :return: a Relationship object, not added to any model
+        """
+        source, destination, description, technology, style, tag_mask, \
+            identity = self.__get_row()
+        relationship = Relationship(source, destination, description,
+                                    technology, style)
+        relationship.tags = DEFAULT_TAG_REGISTRY.names(tag_mask)
+        relationship.identity = identity
+
+        return relationship
+
+    def __get_row(self) -> tuple:
+        if self.__row is None:
+            self.__row = self.__store._row(self.__index)
+
+        return self.__row
+
+    def __repr__(self) -> str:
+        return f"RelationshipView({self.__index})"
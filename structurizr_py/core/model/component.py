@@ -0,0 +1,87 @@
+from __future__ import annotations
+from typing import List, Set, TYPE_CHECKING
+
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.tags import Tags
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.code_element import CodeElement
+    from structurizr_py.core.model.container import Container
+
+
+class Component(Element):
+    """
+    Represents a component in the C4 model, i.e. a grouping of related code
+    elements within a container. Components are created with
+    Container.add_component.
+    """
+
+    __slots__ = ("__parent", "__technology", "__code_elements")
+
+    def __init__(self, name: str, parent: Container, description: str = None,
+                 technology: str = None):
+        """
+        :param name: the name of the component
+        :param parent: the Container the component belongs to
+        :param description: the description
+        :param technology: the technology
+        """
+        super().__init__()
+        self.__parent = parent
+        self.__technology = technology
+        self.__code_elements: List[CodeElement] = []
+        self.name = name
+        self.description = description
+        self.add_tags(self.get_required_tags())
+
+    @Element.name.setter
+    def name(self, name: str):
+        old = self.name
+        if old is None or name == old:
+            Element.name.fset(self, name)
+            return
+
+        if self.__parent.get_component_with_name(name) is not None:
+            raise ValueError(f"A component named '{name}' already exists in "
+                             f"'{self.__parent.name}'")
+
+        Element.name.fset(self, name)
+        self.__parent._component_renamed(self, old)
+
+    @property
+    def technology(self) -> str:
+        return self.__technology
+
+    @technology.setter
+    def technology(self, technology: str):
+        self.__technology = technology
+
+    def get_parent(self) -> Container:
+        return self.__parent
+
+    def get_required_tags(self) -> Set[str]:
+        return {Tags.ELEMENT, Tags.COMPONENT}
+
+    @property
+    def code_elements(self) -> List[CodeElement]:
+        """
+        Gets the code elements that make up this component.
+
+        :return: a List of CodeElement objects
+        """
+        return list(self.__code_elements)
+
+    def add_code_element(self, code_element: CodeElement):
+        """
+        Adds a code element to this component, indexing it in the model (see
+        Model.get_elements_with_code_in_package).
+
+        :param code_element: a CodeElement object
+        :return: None
+        """
+        if code_element is None:
+            raise ValueError("A code element must be provided")
+
+        self.__code_elements.append(code_element)
+        if self.model is not None:
+            self.model._code_element_added(self, code_element)
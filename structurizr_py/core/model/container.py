@@ -0,0 +1,117 @@
+from __future__ import annotations
+from typing import Dict, List, Set, TYPE_CHECKING
+
+from structurizr_py.core.model.component import Component
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.tags import Tags
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.model import Model
+    from structurizr_py.core.model.software_system import SoftwareSystem
+
+
+class Container(Element):
+    """
+    Represents a container in the C4 model, i.e. an application or data
+    store within a software system. Containers are created with
+    SoftwareSystem.add_container.
+
+    Components are kept in a dict keyed by name, like the containers of a
+    software system (see SoftwareSystem).
+    """
+
+    __slots__ = ("__parent", "__technology", "__components")
+
+    def __init__(self, name: str, parent: SoftwareSystem,
+                 description: str = None, technology: str = None):
+        """
+        :param name: the name of the container
+        :param parent: the SoftwareSystem the container belongs to
+        :param description: the description
+        :param technology: the technology, e.g. "Django"
+        """
+        super().__init__()
+        self.__parent = parent
+        self.__technology = technology
+        self.__components: Dict[str, Component] = {}
+        self.name = name
+        self.description = description
+        self.add_tags(self.get_required_tags())
+
+    @Element.model.setter
+    def model(self, model: Model):
+        Element.model.fset(self, model)
+        for component in self.__components.values():
+            component.model = model
+
+    @Element.name.setter
+    def name(self, name: str):
+        old = self.name
+        if old is None or name == old:
+            Element.name.fset(self, name)
+            return
+
+        if self.__parent.get_container_with_name(name) is not None:
+            raise ValueError(f"A container named '{name}' already exists in "
+                             f"'{self.__parent.name}'")
+
+        Element.name.fset(self, name)
+        self.__parent._container_renamed(self, old)
+
+    @property
+    def technology(self) -> str:
+        return self.__technology
+
+    @technology.setter
+    def technology(self, technology: str):
+        self.__technology = technology
+
+    def get_parent(self) -> SoftwareSystem:
+        return self.__parent
+
+    def get_required_tags(self) -> Set[str]:
+        return {Tags.ELEMENT, Tags.CONTAINER}
+
+    @property
+    def components(self) -> List[Component]:
+        """
+        Gets the components of this container.
+
+        :return: a List of Component objects
+        """
+        return list(self.__components.values())
+
+    def add_component(self, name: str, description: str = None,
+                      technology: str = None) -> Component:
+        """
+        Adds a component, in the model of this container.
+
+        :param name: the name of the component, unique within this container
+        :param description: the description
+        :param technology: the technology
+        :return: the new Component
+        """
+        if name in self.__components:
+            raise ValueError(f"A component named '{name}' already exists in "
+                             f"'{self.name}'")
+
+        component = Component(name, self, description, technology)
+        self.__components[name] = component
+        component.model = self.model
+
+        return component
+
+    def get_component_with_name(self, name: str) -> Component or None:
+        """
+        Gets the component with the specified name.
+
+        :param name: the name of the component
+        :return: a Component object, or None if there is no such component
+        """
+        return self.__components.get(name)
+
+    def _component_renamed(self, component: Component, old_name: str):
+        """Called by a component of this container once renamed."""
+        if self.__components.get(old_name) is component:
+            del self.__components[old_name]
+            self.__components[component.name] = component
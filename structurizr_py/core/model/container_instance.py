@@ -0,0 +1,90 @@
+from __future__ import annotations
+from typing import List, Set, TYPE_CHECKING
+
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.tags import Tags
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.deployment_node import DeploymentNode
+    from structurizr_py.core.model.relationship import Relationship
+
+
+class ContainerInstance(Element):
+    """
+    Represents the deployment of a container on a deployment node.
+
+    It is named after its container when it is created. One
+    ContainerInstance stands for all replicas of the container on the
+    node (see replicas) rather than for a single running copy. Its
+    relationships aren't copied from the container: they are derived from
+    the container's relationships when asked for (see
+    get_derived_relationships).
+    """
+
+    __slots__ = ("__container", "__parent")
+
+    def __init__(self, container: Element, parent: DeploymentNode):
+        """
+        :param container: the container Element which is deployed
+        :param parent: the DeploymentNode the container is deployed on
+        """
+        if container is None:
+            raise ValueError("A container must be specified")
+
+        super().__init__()
+        self.__container = container
+        self.__parent = parent
+        self.name = container.name
+        self.add_tags(self.get_required_tags())
+
+    @property
+    def container(self) -> Element:
+        return self.__container
+
+    @property
+    def technology(self) -> str or None:
+        return getattr(self.__container, "technology", None)
+
+    @property
+    def environment(self) -> str:
+        return self.__parent.environment
+
+    @property
+    def replicas(self) -> int:
+        """
+        Gets the number of running copies of the container this instance
+        represents, i.e. the total number of instances of its node.
+
+        :return: the number of replicas, as an int
+        """
+        return self.__parent.get_total_instances()
+
+    def get_parent(self) -> DeploymentNode:
+        return self.__parent
+
+    def get_required_tags(self) -> Set[str]:
+        return {Tags.ELEMENT, Tags.CONTAINER_INSTANCE}
+
+    def compute_canonical_name(self) -> str:
+        """
+        Builds the canonical name of this instance from the canonical names
+        of its node and its container, e.g.
+        "/Deployment/Live/EC2/Shop/Web".
+
+        :return: the canonical name, as a str
+        """
+        return self.__parent.get_canonical_name() + \
+            self.__container.get_canonical_name()
+
+    def get_derived_relationships(self) -> List[Relationship]:
+        """
+        Gets the relationships from this instance to the instances of other
+        containers in the same deployment environment, derived from the
+        relationships of its container. They are not part of the model.
+
+        :return: a List of Relationship objects
+        """
+        if self.model is None:
+            return []
+
+        return self.model.get_instance_relationships().get_efferent(self)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+from typing import Iterator, Tuple, TYPE_CHECKING
+
+from structurizr_py.core.model.implied_relationships_strategy import \
+    ImpliedRelationshipsStrategy
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.element import Element
+    from structurizr_py.core.model.relationship import Relationship
+
+
+class DefaultImpliedRelationshipsStrategy(ImpliedRelationshipsStrategy):
+    """
+    Implies a relationship between every ancestor (or self) of the source
+    and every ancestor (or self) of the destination, except between an
+    element and one of its own ancestors or descendants. For example, a
+    relationship from component A1 (in container A) to component B1 (in
+    container B) implies the relationships A1 -> B, A -> B1 and A -> B.
+    """
+
+    def get_implied_pairs(self, relationship: Relationship) \
+            -> Iterator[Tuple[Element, Element]]:
+        source = relationship.source
+        destination = relationship.destination
+        if source is None or destination is None:
+            return
+
+        sources = self.get_ancestors(source)
+        destinations = self.get_ancestors(destination)
+        source_ids = {id(element) for element in sources}
+        destination_ids = {id(element) for element in destinations}
+
+        for implied_source in sources:
+            if id(implied_source) in destination_ids:
+                # contains the destination
+                break
+            for implied_destination in destinations:
+                if id(implied_destination) in source_ids:
+                    break
+                if implied_source is not source or \
+                        implied_destination is not destination:
+                    yield implied_source, implied_destination
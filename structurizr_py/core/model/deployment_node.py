@@ -0,0 +1,225 @@
+from __future__ import annotations
+from typing import Dict, List, Set, TYPE_CHECKING
+
+from structurizr_py.core.model.container_instance import ContainerInstance
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.tags import Tags
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.model import Model
+
+
+class DeploymentNode(Element):
+    """
+    Represents a deployment node, e.g. a physical server, a virtual machine,
+    a Docker container or an execution environment, which runs a number of
+    identical instances.
+
+    Replication is represented by counts rather than by copies: a node with
+    instances=10 is one object, and so is each container instance deployed
+    on it, however many replicas the node and its ancestors multiply it into
+    (see get_total_instances). Child nodes are kept in a dict keyed by name,
+    so looking them up and checking the uniqueness of a new (or renamed)
+    child's name don't scan the siblings. Children and container instances
+    follow the node into and out of models.
+    """
+
+    DEFAULT_ENVIRONMENT = "Default"
+
+    __slots__ = ("__parent", "__environment", "__technology", "__instances",
+                 "__children", "__container_instances")
+
+    def __init__(self, name: str, parent: DeploymentNode = None,
+                 environment: str = DEFAULT_ENVIRONMENT,
+                 technology: str = None, instances: int = 1):
+        """
+        :param name: the name of the node
+        :param parent: the parent DeploymentNode, or None for a top-level
+                       node
+        :param environment: the deployment environment, e.g. "Live" (child
+                            nodes are in the environment of their parent)
+        :param technology: the technology, e.g. "Ubuntu 22.04"
+        :param instances: the number of instances of the node, at least 1
+        """
+        super().__init__()
+        self.__parent = parent
+        self.__environment = parent.environment if parent is not None \
+            else environment
+        self.__technology = technology
+        self.__instances = 1
+        self.__children: Dict[str, DeploymentNode] = {}
+        self.__container_instances: Dict[int, ContainerInstance] = {}
+        self.name = name
+        self.instances = instances
+        self.add_tags(self.get_required_tags())
+
+    @Element.model.setter
+    def model(self, model: Model):
+        Element.model.fset(self, model)
+        for child in self.__children.values():
+            child.model = model
+        for container_instance in self.__container_instances.values():
+            container_instance.model = model
+
+    @Element.name.setter
+    def name(self, name: str):
+        old = self.name
+        parent = self.__parent
+        renamed = parent is not None and old is not None and name != old
+        if renamed and name in parent.__children:
+            raise ValueError(f"A deployment node named '{name}' already "
+                             f"exists in '{parent.name}'")
+
+        Element.name.fset(self, name)
+        if renamed and parent.__children.get(old) is self:
+            del parent.__children[old]
+            parent.__children[name] = self
+
+    @property
+    def environment(self) -> str:
+        return self.__environment
+
+    @property
+    def technology(self) -> str:
+        return self.__technology
+
+    @technology.setter
+    def technology(self, technology: str):
+        self.__technology = technology
+
+    @property
+    def instances(self) -> int:
+        """
+        Gets the number of instances of this node within one instance of its
+        parent.
+
+        :return: the number of instances, as an int
+        """
+        return self.__instances
+
+    @instances.setter
+    def instances(self, instances: int):
+        if type(instances) is not int or instances < 1:
+            raise ValueError(
+                "The number of instances must be a positive integer")
+
+        self.__instances = instances
+
+    def get_total_instances(self) -> int:
+        """
+        Gets the number of instances of this node across the deployment,
+        i.e. its own instance count multiplied by those of its ancestors.
+
+        :return: the number of instances, as an int
+        """
+        total = self.__instances
+        parent = self.__parent
+        while parent is not None:
+            total *= parent.instances
+            parent = parent.get_parent()
+
+        return total
+
+    def get_parent(self) -> DeploymentNode or None:
+        return self.__parent
+
+    def get_required_tags(self) -> Set[str]:
+        return {Tags.ELEMENT, Tags.DEPLOYMENT_NODE}
+
+    def compute_canonical_name(self) -> str:
+        """
+        Builds the canonical name of this node, e.g.
+        "/Deployment/Live/Amazon Web Services/EC2".
+
+        :return: the canonical name, as a str
+        """
+        if self.__parent is not None:
+            return super().compute_canonical_name()
+
+        return self.CANONICAL_NAME_SEPARATOR + "Deployment" + \
+            self.CANONICAL_NAME_SEPARATOR + \
+            self.format_for_canonical_name(self.__environment) + \
+            super().compute_canonical_name()
+
+    @property
+    def children(self) -> List[DeploymentNode]:
+        """
+        Gets the child deployment nodes.
+
+        :return: a List of DeploymentNode objects
+        """
+        return list(self.__children.values())
+
+    def add_deployment_node(self, name: str, description: str = None,
+                            technology: str = None,
+                            instances: int = 1) -> DeploymentNode:
+        """
+        Adds a child deployment node, in the model of this node.
+
+        :param name: the name of the child, unique among the children
+        :param description: the description
+        :param technology: the technology
+        :param instances: the number of instances of the child within one
+                          instance of this node
+        :return: the new DeploymentNode
+        """
+        if name in self.__children:
+            raise ValueError(f"A deployment node named '{name}' already "
+                             f"exists in '{self.name}'")
+
+        child = DeploymentNode(name, self, technology=technology,
+                               instances=instances)
+        child.description = description
+        self.__children[name] = child
+        child.model = self.model
+
+        return child
+
+    def get_deployment_node_with_name(self, name: str) \
+            -> DeploymentNode or None:
+        """
+        Gets the child deployment node with the specified name.
+
+        :param name: the name of the child
+        :return: a DeploymentNode object, or None if there is no such child
+        """
+        return self.__children.get(name)
+
+    @property
+    def container_instances(self) -> List[ContainerInstance]:
+        """
+        Gets the container instances deployed on this node.
+
+        :return: a List of ContainerInstance objects
+        """
+        return list(self.__container_instances.values())
+
+    def add(self, container: Element) -> ContainerInstance:
+        """
+        Deploys a container on this node, in the model of this node. The
+        container instance has as many replicas as this node has instances
+        in total.
+
+        :param container: the container Element
+        :return: the new ContainerInstance
+        """
+        if id(container) in self.__container_instances:
+            raise ValueError(f"'{container.name}' is already deployed on "
+                             f"'{self.name}'")
+
+        container_instance = ContainerInstance(container, self)
+        self.__container_instances[id(container)] = container_instance
+        container_instance.model = self.model
+
+        return container_instance
+
+    def get_container_instance(self, container: Element) \
+            -> ContainerInstance or None:
+        """
+        Gets the instance of a container deployed on this node.
+
+        :param container: the container Element
+        :return: a ContainerInstance object, or None if the container isn't
+                 deployed on this node
+        """
+        return self.__container_instances.get(id(container))
@@ -1,25 +1,50 @@
 from __future__ import annotations
+import itertools
 from abc import ABC, abstractmethod
 from typing import Set, TYPE_CHECKING
 
-from structurizr_py.core.model.model import Model
 from structurizr_py.core.model.model_item import ModelItem
 from structurizr_py.core.util.url import Url
 
 if TYPE_CHECKING:
+    from structurizr_py.core.model.model import Model
     from structurizr_py.core.model.relationship import Relationship
 
+# every hierarchy version is drawn from this sequence, so that versions of
+# different models (or of elements without a model) are never equal
+_hierarchy_versions = itertools.count(1)
+
 
 class Element(ModelItem, ABC):
-    """This is the superclass for all model elements."""
+    """
+    This is the superclass for all model elements.
+
+    Canonical names are cached per element, against the hierarchy version of
+    the element's model (or the one shared by all elements without a model).
+    Renaming or re-parenting an element whose canonical name has been
+    computed drops its own cached name and, if it has descendants in its
+    model, bumps the version of that model, which invalidates the cached
+    canonical names in that model only (including those of its descendants,
+    which are expected to be in the same model).
+    """
 
     CANONICAL_NAME_SEPARATOR = "/"
 
-    __model: Model = None
-    __name: str = None
-    __description: str = None
-    __url: str = None
-    __relationships: Set[Relationship] = None
+    __slots__ = ("__model", "__name", "__description", "__url",
+                 "__relationships", "__canonical_name",
+                 "__canonical_name_version")
+
+    __detached_hierarchy_version: int = next(_hierarchy_versions)
+
+    def __init__(self):
+        super().__init__()
+        self.__model = None
+        self.__name = None
+        self.__description = None
+        self.__url = None
+        self.__relationships = None
+        self.__canonical_name = None
+        self.__canonical_name_version = -1
 
     @property
     def model(self) -> Model:
@@ -27,7 +52,60 @@ class Element(ModelItem, ABC):
 
     @model.setter
     def model(self, model: Model):
+        old = self.__model
+        if old is model:
+            return
+
+        removed = old._element_removed(self) if old is not None else []
         self.__model = model
+        # its parent may be renamed while it is out of the model
+        self.__canonical_name = None
+        self.__canonical_name_version = -1
+        if model is not None:
+            try:
+                model._element_added(self)
+            except ValueError:
+                self.__model = old
+                if old is not None:
+                    old._element_added(self)
+                    for relationship in removed:
+                        old.add_relationship(relationship)
+                raise
+
+        # efferent relationships move with the element, afferent ones with
+        # their source if it is a descendant being moved along, or are purged
+        relationships = self.__relationships or set()
+        for relationship in removed:
+            source = relationship.source
+            if source is self:
+                relationships.add(relationship)
+            elif source.__is_moving_to(model):
+                if source.__relationships is None:
+                    source.__relationships = set()
+                source.__relationships.add(relationship)
+
+        if model is not None:
+            for relationship in relationships:
+                model.add_relationship(relationship)
+            self.__relationships = None
+        elif relationships:
+            self.__relationships = relationships
+
+    def __is_moving_to(self, model: Model) -> bool:
+        """
+        Determines whether this element is about to follow one of its
+        ancestors, which has already been moved to the specified model.
+        """
+        parent = self.get_parent()
+        while parent is not None:
+            if parent.model is model:
+                return True
+            parent = parent.get_parent()
+
+        return False
+
+    def _get_model(self) -> Model or None:
+        return self.model
 
     @property
     def name(self) -> str:
@@ -39,7 +117,24 @@ class Element(ModelItem, ABC):
             raise ValueError(
                 "The name of an element must not be null or empty")
 
+        old = self.__name
+        model = self.__model
+        if model is None or old is None or name == old or \
+                self.get_parent() is not None:
+            self.__name = name
+            self._hierarchy_changed()
+            return
+
+        # top-level names are unique within a model
+        old_canonical_name = self.get_canonical_name()
         self.__name = name
+        self._hierarchy_changed()
+        try:
+            model._element_renamed(self, old_canonical_name)
+        except ValueError:
+            self.__name = old
+            self._hierarchy_changed()
+            raise
 
     @property
     def description(self) -> str:
@@ -62,13 +157,79 @@ class Element(ModelItem, ABC):
                 raise ValueError(
                     url + " is not a valid URL.")
 
-    @abstractmethod
     def get_canonical_name(self) -> str:
-        pass
+        """
+        Gets the canonical name of this element, e.g. "/System/Container".
+        The name is cached until this element or one of its ancestors is
+        renamed or moved.
+
+        :return: the canonical name, as a str
+        """
+        version = self.get_hierarchy_version()
+        if self.__canonical_name_version != version:
+            self.__canonical_name = self.compute_canonical_name()
+            self.__canonical_name_version = version
+
+        return self.__canonical_name
+
+    def compute_canonical_name(self) -> str:
+        """
+        Builds the canonical name of this element from the canonical name of
+        its parent and its own name.
+
+        :return: the canonical name, as a str
+        """
+        parent = self.get_parent()
+        prefix = parent.get_canonical_name() if parent is not None else ""
+
+        return prefix + self.CANONICAL_NAME_SEPARATOR + \
+            self.format_for_canonical_name(self.name or "")
+
+    def get_hierarchy_version(self) -> int:
+        """
+        Gets the version of the hierarchy this element is part of: that of
+        its model (see Model.hierarchy_version), or the one shared by all
+        elements without a model. Use it to invalidate values derived from
+        canonical names.
+
+        :return: the version, as an int
+        """
+        model = self.__model
+        return model.hierarchy_version if model is not None \
+            else Element.__detached_hierarchy_version
+
+    @staticmethod
+    def _new_hierarchy_version() -> int:
+        """Draws a hierarchy version which has never been used before."""
+        return next(_hierarchy_versions)
+
+    def _hierarchy_changed(self):
+        """
+        Invalidates cached canonical names. Subclasses must call this whenever
+        the parent of the element changes.
+        """
+        cached = self.__canonical_name is not None
+        if cached:
+            self.__canonical_name = None
+            self.__canonical_name_version = -1
+            # descendants without a model may have cached it too
+            Element.__detached_hierarchy_version = next(_hierarchy_versions)
+        if self.__model is not None:
+            self.__model._hierarchy_changed(self, cached)
 
     def format_for_canonical_name(self, name: str) -> str:
         return name.replace(self.CANONICAL_NAME_SEPARATOR, "")
 
+    def _set_fields_unchecked(self, name: str, description: str, url: str):
+        """
+        Sets the name, description and URL without validating them. Used by
+        the bulk builder, which validates all elements in one pass instead.
+        """
+        self.__name = name
+        self.__description = description
+        self.__url = url
+        self._hierarchy_changed()
+
     @abstractmethod
     def get_parent(self) -> Element or None:
         """
@@ -85,12 +246,22 @@ class Element(ModelItem, ABC):
         Gets the set of outgoing relationships.
         :return: a Set of Relationship objects, or am empty Set if none exist
         """
-        return self.__relationships or {}
+        if self.model is not None:
+            return set(self.model.get_efferent_relationships(self))
+
+        return self.__relationships or set()
 
     @relationships.setter
     def relationships(self, relationships: Set[Relationship]):
         if relationships is not None and type(relationships) is set:
-            self.__relationships = relationships
+            if self.model is not None:
+                for relationship in \
+                        self.model.get_efferent_relationships(self):
+                    self.model.remove_relationship(relationship)
+                for relationship in relationships:
+                    self.model.add_relationship(relationship)
+            else:
+                self.__relationships = relationships
 
     def has_afferent_relationships(self) -> bool:
         """
@@ -99,8 +270,7 @@ class Element(ModelItem, ABC):
         :return: true if this element has afferent relationships, false
                  otherwise
         """
-        return any(relation.destination == self for relation in
-                   self.model.relationships)
+        return self.model.has_afferent_relationships(self)
 
     def has_efferent_relationship_with(self, element) -> bool:
         """
@@ -125,8 +295,11 @@ class Element(ModelItem, ABC):
         if element is None:
             return None
 
+        if self.model is not None:
+            return self.model.get_relationship_between(self, element)
+
         for relation in self.relationships:
-            if relation.destination == self:
+            if relation.destination is element:
                 return relation
 
         return None
@@ -135,13 +308,19 @@ class Element(ModelItem, ABC):
         return True if relationship in self.relationships else False
 
     def add_relationship(self, relationship: Relationship):
-        self.relationships.add(relationship)
+        if self.model is not None:
+            self.model.add_relationship(relationship)
+            return
+
+        if self.__relationships is None:
+            self.__relationships = set()
+        self.__relationships.add(relationship)
 
     def __str__(self) -> str:
         return f"{{{self.identity} | {self.name} | {self.description}}}"
 
     def __hash__(self) -> int:
-        return hash(self.name) if self.name is not None else hash(super())
+        return hash(self.get_canonical_name())
 
     def __eq__(self, other: Element) -> bool:
         if self is other:
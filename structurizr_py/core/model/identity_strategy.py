@@ -0,0 +1,106 @@
+from __future__ import annotations
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Set, TYPE_CHECKING
+
+from structurizr_py.core.model.element import Element
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.model_item import ModelItem
+
+
+class IdentityStrategy(ABC):
+    """
+    Generates the identities of the items added to a model without one (see
+    Model.identity_strategy). Elements and relationships share one namespace.
+    """
+
+    @abstractmethod
+    def generate_identity(self, item: ModelItem) -> str:
+        """
+        Generates an identity for an item which doesn't have one.
+
+        :param item: the Element or Relationship being added to the model
+        :return: an identity not generated or found before, as a str
+        """
+        pass
+
+    @abstractmethod
+    def found(self, identity: str):
+        """
+        Called for each identity already set on an item added to the model
+        (e.g. when reading a workspace), so that it isn't generated again.
+
+        :param identity: the identity, as a str
+        :return: None
+        """
+        pass
+
+
+class SequentialIdentityStrategy(IdentityStrategy):
+    """
+    Generates sequential integer identities: "1", "2", "3", ... Numeric
+    identities which are found advance the sequence past them.
+    """
+
+    __slots__ = ("__next",)
+
+    def __init__(self, start: int = 1):
+        """
+        :param start: the first identity to generate
+        """
+        self.__next = start
+
+    def generate_identity(self, item: ModelItem) -> str:
+        identity = self.__next
+        self.__next += 1
+
+        return str(identity)
+
+    def found(self, identity: str):
+        if identity.isdigit():
+            self.__next = max(self.__next, int(identity) + 1)
+
+
+class ContentHashIdentityStrategy(IdentityStrategy):
+    """
+    Generates identities from a hash of the content of items: the canonical
+    name of elements and the content key of relationships (see
+    Relationship.get_content_key). The same model built twice gets the same
+    identities, whatever the order in which items were added. Items with the
+    same content get a numbered suffix, in the order in which they are added.
+    """
+
+    __slots__ = ("__length", "__used")
+
+    def __init__(self, length: int = 16):
+        """
+        :param length: the number of hex digits of the hash to keep, from 8
+                       to 40
+        """
+        if not 8 <= length <= 40:
+            raise ValueError("The length must be between 8 and 40")
+
+        self.__length = length
+        self.__used: Set[str] = set()
+
+    def generate_identity(self, item: ModelItem) -> str:
+        if isinstance(item, Element):
+            content = item.get_canonical_name()
+        else:
+            content = "\x1f".join(part if part is not None else ""
+                                  for part in item.get_content_key())
+        identity = hashlib.sha1(content.encode("utf-8")).hexdigest()[
+            :self.__length]
+
+        suffix = 1
+        unique = identity
+        while unique in self.__used:
+            suffix += 1
+            unique = f"{identity}-{suffix}"
+        self.__used.add(unique)
+
+        return unique
+
+    def found(self, identity: str):
+        self.__used.add(identity)
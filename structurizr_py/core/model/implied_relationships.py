@@ -0,0 +1,145 @@
+from __future__ import annotations
+from typing import Dict, Iterator, List, Tuple, TYPE_CHECKING
+
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.relationship import Relationship
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.implied_relationships_strategy import \
+        ImpliedRelationshipsStrategy
+    from structurizr_py.core.model.model import Model
+
+"""(id of the source, id of the destination, description) of an implied
+relationship"""
+_Key = Tuple[int, int, str]
+
+
+class ImpliedRelationships:
+    """
+    Maintains the implied relationships of a model, as decided by an
+    ImpliedRelationshipsStrategy.
+
+    Each implied relationship is reference counted by the explicit
+    relationships implying it, and the keys each explicit relationship
+    contributed are remembered, so adding or removing one relationship only
+    touches its own ancestor pairs. Implied relationships are Relationship
+    objects which are not part of the model, created when they are first
+    read; they take their technology and interaction style from the first
+    relationship implying them. Everything is recomputed once after an
+    element of the model is renamed or moved.
+    """
+
+    def __init__(self, model: Model, strategy: ImpliedRelationshipsStrategy):
+        self.__model = model
+        self.__strategy = strategy
+        # (source id, destination id) -> description -> [count, source,
+        # destination, description, technology, interaction style, implied
+        # relationship or None]
+        self.__implied: Dict[Tuple[int, int], Dict[str, list]] = {}
+        self.__contributions: Dict[int, List[_Key]] = {}
+        self.__count = 0
+        self.__version = -1
+
+    @property
+    def strategy(self) -> ImpliedRelationshipsStrategy:
+        return self.__strategy
+
+    def add(self, relationship: Relationship):
+        """
+        Adds the relationships implied by a relationship of the model.
+
+        :param relationship: a Relationship which has been added to the model
+        :return: None
+        """
+        if self.__version != self.__model.hierarchy_version:
+            # the model already contains the relationship
+            self.__rebuild()
+        else:
+            self.__add(relationship)
+
+    def remove(self, relationship: Relationship):
+        """
+        Removes the relationships which were only implied by a relationship
+        which is being removed from the model.
+
+        :param relationship: a Relationship object
+        :return: None
+        """
+        for key in self.__contributions.pop(id(relationship), ()):
+            pair = key[:2]
+            by_description = self.__implied[pair]
+            entry = by_description[key[2]]
+            entry[0] -= 1
+            if not entry[0]:
+                del by_description[key[2]]
+                self.__count -= 1
+                if not by_description:
+                    del self.__implied[pair]
+
+    def get_between(self, source: Element, destination: Element) \
+            -> List[Relationship]:
+        """
+        Gets the implied relationships from the source element to the
+        destination element.
+
+        :param source: the source Element
+        :param destination: the destination Element
+        :return: a List of Relationship objects (empty if there are none)
+        """
+        self.__refresh()
+        by_description = self.__implied.get((id(source), id(destination)))
+        return [self.__materialize(entry)
+                for entry in by_description.values()] \
+            if by_description else []
+
+    def __iter__(self) -> Iterator[Relationship]:
+        self.__refresh()
+        return (self.__materialize(entry)
+                for by_description in list(self.__implied.values())
+                for entry in list(by_description.values()))
+
+    def __len__(self) -> int:
+        self.__refresh()
+        return self.__count
+
+    def __refresh(self):
+        if self.__version != self.__model.hierarchy_version:
+            self.__rebuild()
+
+    def __rebuild(self):
+        self.__implied = {}
+        self.__contributions = {}
+        self.__count = 0
+        self.__version = self.__model.hierarchy_version
+        for relationship in self.__model.iter_relationships():
+            self.__add(relationship)
+
+    @staticmethod
+    def __materialize(entry: list) -> Relationship:
+        implied = entry[6]
+        if implied is None:
+            implied = entry[6] = Relationship(*entry[1:6])
+
+        return implied
+
+    def __add(self, relationship: Relationship):
+        description = relationship.description
+        technology = relationship.technology
+        interaction_style = relationship.interaction_style
+        keys = []
+        for source, destination in \
+                self.__strategy.get_implied_pairs(relationship):
+            by_description = self.__implied.setdefault(
+                (id(source), id(destination)), {})
+            entry = by_description.get(description)
+            if entry is None:
+                by_description[description] = [
+                    1, source, destination, description, technology,
+                    interaction_style, None]
+                self.__count += 1
+            else:
+                entry[0] += 1
+            keys.append((id(source), id(destination), description))
+
+        if keys:
+            self.__contributions[id(relationship)] = keys
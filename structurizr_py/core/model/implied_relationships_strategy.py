@@ -0,0 +1,44 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Iterable, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.element import Element
+    from structurizr_py.core.model.relationship import Relationship
+
+
+class ImpliedRelationshipsStrategy(ABC):
+    """
+    Decides which relationships are implied by a relationship between two
+    (possibly nested) elements. A strategy only looks at one relationship at
+    a time; the model keeps track of how many relationships imply each
+    implied relationship, so that they can be added and removed
+    incrementally.
+    """
+
+    @abstractmethod
+    def get_implied_pairs(self, relationship: Relationship) \
+            -> Iterable[Tuple[Element, Element]]:
+        """
+        Gets the (source, destination) pairs of the relationships implied by
+        the specified relationship.
+
+        :param relationship: a Relationship object
+        :return: an Iterable of (source Element, destination Element) tuples
+        """
+        pass
+
+    @staticmethod
+    def get_ancestors(element: Element) -> list:
+        """
+        Gets the element and its ancestors, starting with the element itself.
+
+        :param element: an Element object
+        :return: a List of Element objects
+        """
+        ancestors = []
+        while element is not None:
+            ancestors.append(element)
+            element = element.get_parent()
+
+        return ancestors
@@ -0,0 +1,125 @@
+from __future__ import annotations
+from typing import Dict, Iterator, List, Tuple, TYPE_CHECKING
+
+from structurizr_py.core.model.container_instance import ContainerInstance
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.tag_registry import DEFAULT_TAG_REGISTRY
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.element import Element
+    from structurizr_py.core.model.model import Model
+
+
+class InstanceRelationships:
+    """
+    The relationships between the container instances of a model, derived
+    from the relationships between their containers: when container A uses
+    container B, every instance of A uses every instance of B in the same
+    deployment environment.
+
+    Nothing is copied into the model. The instances of each container are
+    indexed when first needed, and the derived relationships of an instance
+    are only created when they are asked for; both are discarded when the
+    model changes (see Model.version). Counting the connections between the
+    individual replicas doesn't create any relationship at all.
+    """
+
+    def __init__(self, model: Model):
+        self.__model = model
+        self.__version = -1
+        self.__instances: Dict[int, List[ContainerInstance]] = {}
+        self.__derived: Dict[int, List[Relationship]] = {}
+
+    def get_instances_of(self, container: Element) \
+            -> List[ContainerInstance]:
+        """
+        Gets the instances of a container, across all deployment nodes.
+
+        :param container: the container Element
+        :return: a List of ContainerInstance objects
+        """
+        self.__refresh()
+        return list(self.__instances.get(id(container), ()))
+
+    def get_efferent(self, instance: ContainerInstance) -> List[Relationship]:
+        """
+        Gets the relationships derived from the relationships of the
+        container of an instance.
+
+        :param instance: a ContainerInstance object
+        :return: a List of Relationship objects, which are not part of the
+                 model
+        """
+        self.__refresh()
+        derived = self.__derived.get(id(instance))
+        if derived is None:
+            derived = self.__derived[id(instance)] = \
+                list(self.__derive(instance))
+
+        return list(derived)
+
+    def __iter__(self) -> Iterator[Relationship]:
+        self.__refresh()
+        for instances in list(self.__instances.values()):
+            for instance in instances:
+                yield from self.get_efferent(instance)
+
+    def count_replica_connections(self) -> int:
+        """
+        Counts the connections between individual replicas, i.e. the sum of
+        source replicas times destination replicas over all derived
+        relationships, without deriving them.
+
+        :return: the number of connections, as an int
+        """
+        self.__refresh()
+        # instance counts can change without changing the model's version
+        replicas: Dict[Tuple[int, str], int] = {}
+        for key, instances in self.__instances.items():
+            for instance in instances:
+                replicas_key = (key, instance.environment)
+                replicas[replicas_key] = \
+                    replicas.get(replicas_key, 0) + instance.replicas
+
+        model = self.__model
+        total = 0
+        for instances in self.__instances.values():
+            container = instances[0].container
+            relationships = model.get_efferent_relationships(container)
+            for instance in instances:
+                environment = instance.environment
+                total += instance.replicas * sum(
+                    replicas.get(
+                        (id(relationship.destination), environment), 0)
+                    for relationship in relationships)
+
+        return total
+
+    def __derive(self, instance: ContainerInstance) \
+            -> Iterator[Relationship]:
+        environment = instance.environment
+        for relationship in self.__model.get_efferent_relationships(
+                instance.container):
+            for destination in self.__instances.get(
+                    id(relationship.destination), ()):
+                if destination.environment == environment:
+                    derived = Relationship(
+                        instance, destination, relationship.description,
+                        relationship.technology,
+                        relationship.interaction_style)
+                    derived.tags = DEFAULT_TAG_REGISTRY.names(
+                        relationship.tag_mask)
+                    yield derived
+
+    def __refresh(self):
+        version = self.__model.version
+        if version == self.__version:
+            return
+
+        self.__instances = {}
+        self.__derived = {}
+        for element in self.__model.iter_elements():
+            if isinstance(element, ContainerInstance):
+                self.__instances.setdefault(id(element.container), []) \
+                    .append(element)
+        self.__version = version
@@ -1,6 +1,1193 @@
+from __future__ import annotations
+from bisect import bisect_left
+from contextlib import nullcontext
+from functools import partial
+from threading import RLock
+from typing import Callable, ContextManager, Dict, Iterable, Iterator, \
+    List, Mapping, Set, TextIO, Tuple, Type, TYPE_CHECKING
+
+from structurizr_py.core.model.code_element_index import CodeElementIndex
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.identity_strategy import IdentityStrategy, \
+    SequentialIdentityStrategy
+from structurizr_py.core.model.property_store import PropertyStore
+from structurizr_py.core.model.tag_index import TagIndex
+from structurizr_py.core.model.tag_registry import DEFAULT_TAG_REGISTRY, \
+    TagRegistry
+
+if TYPE_CHECKING:
+    from structurizr_py.core.analysis.dependency_graph import DependencyGraph
+    from structurizr_py.core.model.bulk_builder import BulkBuilder
+    from structurizr_py.core.model.code_element import CodeElement
+    from structurizr_py.core.model.columnar_relationship_store import \
+        ColumnarRelationshipStore
+    from structurizr_py.core.model.implied_relationships import \
+        ImpliedRelationships
+    from structurizr_py.core.model.implied_relationships_strategy import \
+        ImpliedRelationshipsStrategy
+    from structurizr_py.core.model.instance_relationships import \
+        InstanceRelationships
+    from structurizr_py.core.model.model_diff import ModelDiff
+    from structurizr_py.core.model.model_item import ModelItem
+    from structurizr_py.core.model.model_query import ElementQuery, \
+        RelationshipQuery
+    from structurizr_py.core.model.model_snapshot import ModelSnapshot
+    from structurizr_py.core.model.relationship import Relationship
+
+
 class Model:
     """
     Represents a software architecture model, into which all model elements
     are added.
+
+    The model owns the relationships between its elements and keeps adjacency
+    indexes over them (outgoing by source, incoming by destination and by
+    source/destination pair), so that relationship lookups for a single
+    element don't need to scan every relationship in the model. The indexes
+    are keyed by the id() of the elements, which stays valid for as long as
+    the relationships referencing them are part of the model.
+
+    Relationships are also indexed by their content key (see
+    Relationship.get_content_key), so that adding a relationship which
+    duplicates an existing one is rejected in constant time. That index is
+    rebuilt when an element of the model is renamed or moved.
+
+    Top-level elements (e.g. people and software systems) are indexed by
+    canonical name, so that adding or renaming one to the name of another is
+    rejected, as elements are compared by canonical name.
+
+    Items are indexed by identity too. Items added without an identity are
+    given one by the identity strategy of the model (see
+    identity_strategy), and relationships referring to elements by identity
+    only are resolved against that index (see resolve_relationships).
+
+    The code elements of the model's elements are indexed by package, the
+    elements and relationships by tag (see element_tag_index), and the
+    elements by canonical name (built when first queried), so that queries
+    (see query_elements) can start from the most selective index.
+
+    A thread-safe model serializes changes with a re-entrant lock, so that
+    many threads can add elements and relationships concurrently. Readers
+    iterate over snapshots (see snapshot), which never block and never see a
+    change half made.
     """
-    pass
+
+    """Removed items kept in the logs of a thread-safe model before they are
+    compacted"""
+    LOG_COMPACTION_THRESHOLD = 1024
+
+    def __init__(self, thread_safe: bool = False,
+                 identity_strategy: IdentityStrategy = None):
+        """
+        :param thread_safe: whether elements and relationships may be added
+                            and removed from several threads concurrently
+        :param identity_strategy: the strategy generating the identities of
+                                  items added without one, sequential
+                                  integers by default
+        """
+        self.__lock = RLock() if thread_safe else None
+        self.__snapshot: ModelSnapshot or None = None
+        self.__shared = False
+        # append-only logs of [item, version removed at] entries, from which
+        # the snapshots of a thread-safe model are read
+        self.__element_log: List[list] = []
+        self.__relationship_log: List[list] = []
+        self.__log_entries: Dict[int, list] or None = \
+            {} if thread_safe else None
+        self.__removed_entries = 0
+        self.__identity_strategy = identity_strategy \
+            if identity_strategy is not None else SequentialIdentityStrategy()
+        self.__items_by_identity: Dict[str, ModelItem] = {}
+        self.__version = 0
+        self.__property_store = PropertyStore()
+        self.__element_tag_index = TagIndex()
+        self.__relationship_tag_index = TagIndex()
+        self.__code_elements = CodeElementIndex()
+        self.__code_element_owners: Dict[str, Dict[int, Element]] = {}
+        self.__canonical_names: List[str] = []
+        self.__canonical_name_elements: List[Element] = []
+        self.__canonical_names_version = (-1, -1)
+        self.__elements: Dict[int, Element] = {}
+        self.__top_level_elements: Dict[str, Element] = {}
+        # the parents of the elements, and the number of their children in
+        # this model, by id
+        self.__parents: Dict[int, Element] = {}
+        self.__child_counts: Dict[int, int] = {}
+        self.__relationships: Dict[int, Relationship] = {}
+        self.__outgoing: Dict[int, Dict[int, Relationship]] = {}
+        self.__incoming: Dict[int, Dict[int, Relationship]] = {}
+        self.__pairs: Dict[Tuple[int, int], Dict[int, Relationship]] = {}
+        self.__hierarchy_version = Element._new_hierarchy_version()
+        self.__by_content: Dict[tuple, Relationship] = {}
+        self.__by_content_version = self.__hierarchy_version
+        self.__dependency_graph = None
+        self.__instance_relationships = None
+        self.__implied_relationships: ImpliedRelationships or None = None
+
+    @property
+    def tag_registry(self) -> TagRegistry:
+        """
+        Gets the registry used to intern the tags of the model's items. It is
+        shared by all models, so items can be moved between them.
+
+        :return: a TagRegistry object
+        """
+        return DEFAULT_TAG_REGISTRY
+
+    @property
+    def thread_safe(self) -> bool:
+        """
+        Determines whether this model may be changed from several threads.
+
+        :return: True if changes are serialized with a lock, False otherwise
+        """
+        return self.__lock is not None
+
+    def locked(self) -> ContextManager:
+        """
+        Holds the lock of a thread-safe model for a sequence of changes, so
+        that they are not interleaved with changes from other threads and
+        snapshots see all or none of them. Does nothing for other models.
+
+        :return: a context manager
+        """
+        return self.__lock if self.__lock is not None else nullcontext()
+
+    def snapshot(self) -> ModelSnapshot:
+        """
+        Takes a snapshot of the elements and relationships of the model, in
+        constant time. It is reused until the model changes.
+
+        A thread-safe model keeps append-only logs of its items, in which
+        removals are stamped with the model version, so its snapshots read a
+        prefix of the logs and writers never copy anything. Other models
+        share their collections with the latest snapshot and copy them before
+        the next change (copy-on-write).
+
+        :return: a ModelSnapshot object
+        """
+        with self.locked():
+            snapshot = self.__snapshot
+            if snapshot is None or snapshot.version != self.__version:
+                from structurizr_py.core.model.model_snapshot import \
+                    ModelSnapshot
+
+                if self.__log_entries is not None:
+                    snapshot = ModelSnapshot(
+                        self.__version,
+                        partial(_iter_log, self.__element_log,
+                                len(self.__element_log), self.__version),
+                        partial(_iter_log, self.__relationship_log,
+                                len(self.__relationship_log), self.__version))
+                else:
+                    snapshot = ModelSnapshot(self.__version,
+                                             self.__elements.values,
+                                             self.__relationships.values)
+                    self.__shared = True
+                self.__snapshot = snapshot
+
+        return snapshot
+
+    @property
+    def property_store(self) -> PropertyStore:
+        """
+        Gets the index of the properties of the elements and relationships in
+        this model.
+
+        :return: a PropertyStore object
+        """
+        return self.__property_store
+
+    @property
+    def hierarchy_version(self) -> int:
+        """
+        Gets the version of the hierarchy of this model's elements, which
+        changes whenever an element of this model which has descendants in
+        it is renamed, moved or removed after its canonical name has been
+        computed. Versions are never reused, not even by other models.
+
+        :return: the version, as an int
+        """
+        return self.__hierarchy_version
+
+    @property
+    def element_tag_index(self) -> TagIndex:
+        """
+        Gets the index of the tags of the elements in this model.
+
+        :return: a TagIndex object
+        """
+        return self.__element_tag_index
+
+    @property
+    def relationship_tag_index(self) -> TagIndex:
+        """
+        Gets the index of the tags of the relationships in this model.
+
+        :return: a TagIndex object
+        """
+        return self.__relationship_tag_index
+
+    @property
+    def identity_strategy(self) -> IdentityStrategy:
+        """
+        Gets the strategy generating the identities of the items added to
+        this model without one.
+
+        :return: an IdentityStrategy object
+        """
+        return self.__identity_strategy
+
+    @identity_strategy.setter
+    def identity_strategy(self, identity_strategy: IdentityStrategy):
+        if identity_strategy is None:
+            raise ValueError("An identity strategy must be provided")
+
+        with self.locked():
+            for identity in self.__items_by_identity:
+                identity_strategy.found(identity)
+            self.__identity_strategy = identity_strategy
+
+    @property
+    def version(self) -> int:
+        """
+        Gets the version of the model, which changes whenever an element or
+        relationship is added or removed, or a relationship is reconnected.
+        Results derived from the model's structure can be cached against it.
+
+        :return: the version, as an int
+        """
+        return self.__version
+
+    @property
+    def elements(self) -> Set[Element]:
+        """
+        Gets the set of all elements in the model.
+
+        :return: a Set of Element objects, or an empty Set if none exist
+        """
+        if self.__lock is not None:
+            return self.snapshot().elements
+
+        return set(self.__elements.values())
+
+    def iter_elements(self) -> Iterator[Element]:
+        """
+        Iterates over the elements of the model in the order in which they
+        were added, without copying them.
+
+        :return: an Iterator over Element objects
+        """
+        if self.__lock is not None:
+            return self.snapshot().iter_elements()
+
+        return iter(self.__elements.values())
+
+    def get_element(self, identity: str) -> Element or None:
+        """
+        Gets the element with the specified identity.
+
+        :param identity: the identity of the element
+        :return: an Element object, or None if there is no such element
+        """
+        item = self.__items_by_identity.get(identity)
+        return item if isinstance(item, Element) else None
+
+    def get_relationship(self, identity: str) -> Relationship or None:
+        """
+        Gets the relationship with the specified identity.
+
+        :param identity: the identity of the relationship
+        :return: a Relationship object, or None if there is no such
+                 relationship
+        """
+        item = self.__items_by_identity.get(identity)
+        return item if item is not None and not isinstance(item, Element) \
+            else None
+
+    def add_element(self, element: Element):
+        """
+        Adds an element to the model.
+
+        :param element: the Element to add
+        :return: None
+        """
+        if element is None:
+            raise ValueError("An element must be provided")
+
+        element.model = self
+
+    def bulk(self) -> BulkBuilder:
+        """
+        Creates a builder which stages elements and relationships and adds
+        them to this model, validated in a single pass, on commit().
+
+        :return: a BulkBuilder object
+        """
+        from structurizr_py.core.model.bulk_builder import BulkBuilder
+
+        return BulkBuilder(self)
+
+    def add_elements_bulk(self, element_type: Type[Element],
+                          rows: Iterable[tuple or dict]) -> List[Element]:
+        """
+        Adds many elements of the same type at once. Rows are validated in a
+        single pass before anything is added, and if adding one of the
+        elements fails, those added before it are removed again. See
+        BulkBuilder.add_elements for the row format.
+
+        :param element_type: an Element subclass with a no-argument constructor
+        :param rows: an iterable of tuples or dicts
+        :return: the List of added Element objects
+        :raises BulkValidationError: listing every invalid row
+        :raises ValueError: if an element can't be added, e.g. because of a
+                            duplicate top-level name
+        """
+        builder = self.bulk()
+        elements = builder.add_elements(element_type, rows)
+        builder.commit()
+
+        return elements
+
+    def add_relationships_bulk(self, rows: Iterable[tuple or dict]) \
+            -> List[Relationship]:
+        """
+        Adds many relationships at once. Rows are validated in a single pass
+        before anything is added. Relationships duplicating one in the model
+        (or an earlier row) are skipped, as by add_relationship. See
+        BulkBuilder.add_relationships for the row format.
+
+        :param rows: an iterable of tuples or dicts
+        :return: the List of added Relationship objects, without the skipped
+                 duplicates
+        :raises BulkValidationError: listing every invalid row
+        """
+        builder = self.bulk()
+        relationships = builder.add_relationships(rows)
+        builder.commit()
+
+        return [relationship for relationship in relationships
+                if relationship.model is self]
+
+    @property
+    def relationships(self) -> Set[Relationship]:
+        """
+        Gets the set of all relationships in the model.
+
+        :return: a Set of Relationship objects, or an empty Set if none exist
+        """
+        if self.__lock is not None:
+            return self.snapshot().relationships
+
+        return set(self.__relationships.values())
+
+    def iter_relationships(self) -> Iterator[Relationship]:
+        """
+        Iterates over the relationships of the model in the order in which
+        they were added, without copying them.
+
+        :return: an Iterator over Relationship objects
+        """
+        if self.__lock is not None:
+            return self.snapshot().iter_relationships()
+
+        return iter(self.__relationships.values())
+
+    def contains(self, relationship: Relationship) -> bool:
+        """
+        Determines whether the specified relationship is part of this model.
+
+        :param relationship: a Relationship object
+        :return: True if the relationship has been added to this model, False
+                 otherwise
+        """
+        return id(relationship) in self.__relationships
+
+    def add_relationship(self, relationship: Relationship) -> bool:
+        """
+        Adds a relationship to the model and indexes it by its source and
+        destination elements.
+
+        :param relationship: the Relationship to add
+        :return: True if the relationship was added, False if it, or a
+                 relationship with the same content key, is already part of
+                 the model
+        """
+        if relationship is None:
+            raise ValueError("A relationship must be provided")
+
+        if self.__lock is None:
+            return self.__add_relationship(relationship)
+        with self.__lock:
+            return self.__add_relationship(relationship)
+
+    def resolve_relationships(self, relationships: Iterable[Relationship]):
+        """
+        Resolves the sources and destinations which relationships only refer
+        to by identity (see Relationship.source_identity and
+        destination_identity), e.g. because they were read before the
+        elements they refer to, and adds the relationships to this model.
+        Every reference is resolved before anything is added.
+
+        :param relationships: an iterable of Relationship objects
+        :return: None
+        :raises ValueError: if a reference isn't the identity of an element of
+                            this model
+        """
+        resolved = []
+        for relationship in relationships:
+            source = relationship.source
+            if source is None:
+                source = self.get_element(relationship.source_identity)
+                if source is None:
+                    raise ValueError(
+                        f"The source of relationship {relationship.identity} "
+                        f"({relationship.source_identity}) does not exist")
+            destination = relationship.destination
+            if destination is None:
+                destination = self.get_element(
+                    relationship.destination_identity)
+                if destination is None:
+                    raise ValueError(
+                        f"The destination of relationship "
+                        f"{relationship.identity} "
+                        f"({relationship.destination_identity}) does not "
+                        f"exist")
+            resolved.append((relationship, source, destination))
+
+        with self.locked():
+            for relationship, source, destination in resolved:
+                if relationship.source is not source:
+                    relationship.source = source
+                if relationship.destination is not destination:
+                    relationship.destination = destination
+                self.add_relationship(relationship)
+
+    def remove_relationship(self, relationship: Relationship) -> bool:
+        """
+        Removes a relationship from the model.
+
+        :param relationship: the Relationship to remove
+        :return: True if the relationship was removed, False if it wasn't
+                 part of the model
+        """
+        if relationship is None:
+            return False
+
+        if self.__lock is None:
+            return self.__remove_relationship(relationship)
+        with self.__lock:
+            return self.__remove_relationship(relationship)
+
+    @property
+    def implied_relationships_strategy(self) \
+            -> ImpliedRelationshipsStrategy or None:
+        """
+        Gets the strategy deciding which relationships are implied by the
+        relationships of the model, e.g. between the parents of nested
+        elements.
+
+        :return: an ImpliedRelationshipsStrategy object, or None if implied
+                 relationships are disabled (the default)
+        """
+        return self.__implied_relationships.strategy \
+            if self.__implied_relationships is not None else None
+
+    @implied_relationships_strategy.setter
+    def implied_relationships_strategy(
+            self, strategy: ImpliedRelationshipsStrategy or None):
+        if strategy is None:
+            self.__implied_relationships = None
+            return
+
+        from structurizr_py.core.model.implied_relationships import \
+            ImpliedRelationships
+
+        self.__implied_relationships = ImpliedRelationships(self, strategy)
+
+    def iter_implied_relationships(self) -> Iterator[Relationship]:
+        """
+        Iterates over the relationships implied by the relationships of the
+        model. Implied relationships are maintained incrementally as
+        relationships are added and removed, and are not part of the model
+        themselves.
+
+        :return: an Iterator over Relationship objects
+        """
+        if self.__implied_relationships is None:
+            return iter(())
+
+        return iter(self.__implied_relationships)
+
+    def get_implied_relationships_between(self, source: Element,
+                                          destination: Element) \
+            -> List[Relationship]:
+        """
+        Gets the implied relationships from the source element to the
+        destination element.
+
+        :param source: the source Element
+        :param destination: the destination Element
+        :return: a List of Relationship objects (empty if there are none)
+        """
+        if self.__implied_relationships is None:
+            return []
+
+        return self.__implied_relationships.get_between(source, destination)
+
+    def to_columnar_relationships(self) -> ColumnarRelationshipStore:
+        """
+        Copies the relationships of this model into a columnar store, for
+        degree counts and filters over very large models.
+
+        :return: a ColumnarRelationshipStore object
+        """
+        from structurizr_py.core.model.columnar_relationship_store import \
+            ColumnarRelationshipStore
+
+        return ColumnarRelationshipStore.from_model(self)
+
+    def get_equivalent_relationship(self, relationship: Relationship) \
+            -> Relationship or None:
+        """
+        Gets the relationship in this model which has the same content key as
+        the specified relationship (which may belong to another model).
+
+        :param relationship: a Relationship object
+        :return: a Relationship object, or None if there is no such
+                 relationship
+        """
+        with self.locked():
+            if self.__by_content_version != self.__hierarchy_version:
+                self.__rebuild_content_index()
+
+            return self.__by_content.get(relationship.get_content_key())
+
+    def get_efferent_relationships(self, element: Element) \
+            -> List[Relationship]:
+        """
+        Gets the efferent (outgoing) relationships of the specified element.
+
+        :param element: an Element object
+        :return: a List of Relationship objects (empty if there are none)
+        """
+        outgoing = self.__outgoing.get(id(element))
+        return list(outgoing.values()) if outgoing else []
+
+    def get_afferent_relationships(self, element: Element) \
+            -> List[Relationship]:
+        """
+        Gets the afferent (incoming) relationships of the specified element.
+
+        :param element: an Element object
+        :return: a List of Relationship objects (empty if there are none)
+        """
+        incoming = self.__incoming.get(id(element))
+        return list(incoming.values()) if incoming else []
+
+    def has_afferent_relationships(self, element: Element) -> bool:
+        """
+        Determines whether the specified element has afferent (incoming)
+        relationships.
+
+        :param element: an Element object
+        :return: True if there is at least one incoming relationship, False
+                 otherwise
+        """
+        return id(element) in self.__incoming
+
+    def get_relationship_between(self, source: Element,
+                                 destination: Element) -> Relationship or None:
+        """
+        Gets the first relationship from the source element to the destination
+        element.
+
+        :param source: the source Element
+        :param destination: the destination Element
+        :return: a Relationship object, or None if there is no such
+                 relationship
+        """
+        between = self.__pairs.get((id(source), id(destination)))
+        if not between:
+            return None
+
+        return next(iter(between.values()))
+
+    def get_items_with_tag(self, tag: str) -> Iterator[ModelItem]:
+        """
+        Gets all elements and relationships in the model which have the
+        specified tag, by looking them up in the tag indexes.
+
+        :param tag: the tag, as a str
+        :return: an Iterator over ModelItem objects
+        """
+        yield from self.__element_tag_index.find(tag)
+        yield from self.__relationship_tag_index.find(tag)
+
+    def get_items_with_property(self, name: str,
+                                value: str) -> Iterator[ModelItem]:
+        """
+        Gets all elements and relationships in the model which have the
+        specified property value, by looking them up in the property store.
+
+        :param name: the name of the property
+        :param value: the value of the property
+        :return: an Iterator over ModelItem objects
+        """
+        return self.__property_store.find(name, value)
+
+    def get_elements_with_code_in_package(
+            self, package: str, include_subpackages: bool = True) \
+            -> Iterator[Element]:
+        """
+        Gets the elements which have code elements in the specified package.
+
+        :param package: the package name, e.g. "structurizr.component"
+        :param include_subpackages: whether to include code elements in
+                                    subpackages of the package
+        :return: an Iterator over Element objects, each returned once
+        """
+        seen = set()
+        for code_element in list(self.__code_elements.find_in_package(
+                package, include_subpackages)):
+            for key, element in list(self.__code_element_owners.get(
+                    code_element.type, {}).items()):
+                if key not in seen:
+                    seen.add(key)
+                    yield element
+
+    def get_elements_with_canonical_name_prefix(self, prefix: str) \
+            -> List[Element]:
+        """
+        Gets the elements whose canonical name starts with the specified
+        prefix, e.g. "/System/" for everything nested in System, through a
+        sorted index of canonical names which is rebuilt after the model or
+        its hierarchy has changed.
+
+        :param prefix: the canonical name prefix
+        :return: a List of Element objects, sorted by canonical name
+        """
+        with self.locked():
+            version = (self.__version, self.__hierarchy_version)
+            if self.__canonical_names_version != version:
+                ordered = sorted(
+                    ((element.get_canonical_name(), element)
+                     for element in self.__elements.values()),
+                    key=lambda entry: entry[0])
+                self.__canonical_names = [name for name, _ in ordered]
+                self.__canonical_name_elements = \
+                    [element for _, element in ordered]
+                self.__canonical_names_version = version
+
+            names = self.__canonical_names
+            start = bisect_left(names, prefix)
+            end = bisect_left(names, prefix + "\U0010ffff", start)
+
+            return self.__canonical_name_elements[start:end]
+
+    def query_elements(self) -> ElementQuery:
+        """
+        Starts a query over the elements of this model.
+
+        :return: an ElementQuery matching every element
+        """
+        from structurizr_py.core.model.model_query import ElementQuery
+        return ElementQuery(self)
+
+    def query_relationships(self) -> RelationshipQuery:
+        """
+        Starts a query over the relationships of this model.
+
+        :return: a RelationshipQuery matching every relationship
+        """
+        from structurizr_py.core.model.model_query import RelationshipQuery
+        return RelationshipQuery(self)
+
+    def get_dependency_graph(self) -> DependencyGraph:
+        """
+        Gets the dependency graph of this model, for reachability, cycle,
+        layering and path queries. Its results are cached until the model
+        changes.
+
+        :return: a DependencyGraph object
+        """
+        if self.__dependency_graph is None:
+            from structurizr_py.core.analysis.dependency_graph import \
+                DependencyGraph
+
+            self.__dependency_graph = DependencyGraph(self)
+
+        return self.__dependency_graph
+
+    def get_instance_relationships(self) -> InstanceRelationships:
+        """
+        Gets the relationships between the container instances of this model,
+        which are derived from the relationships between their containers
+        when asked for, instead of being added to the model.
+
+        :return: an InstanceRelationships object
+        """
+        if self.__instance_relationships is None:
+            from structurizr_py.core.model.instance_relationships import \
+                InstanceRelationships
+
+            self.__instance_relationships = InstanceRelationships(self)
+
+        return self.__instance_relationships
+
+    def diff(self, other: Model) -> ModelDiff:
+        """
+        Computes the elements and relationships which were added, removed or
+        modified going from this model to the other model.
+
+        :param other: the newer Model
+        :return: a ModelDiff object
+        """
+        from structurizr_py.core.model.model_diff import ModelDiff
+
+        return ModelDiff.between(self, other)
+
+    def diff_snapshot(self, stream: TextIO) -> ModelDiff:
+        """
+        Computes the elements and relationships which were added, removed or
+        modified going from a serialized JSON workspace to this model. The
+        snapshot is streamed rather than loaded.
+
+        :param stream: a readable text stream with the older model
+        :return: a ModelDiff object
+        """
+        from structurizr_py.core.model.model_diff import ModelDiff
+
+        return ModelDiff.from_snapshot(stream, self)
+
+    def _element_added(self, element: Element):
+        """Called by an element when its model is set to this model."""
+        with self.locked():
+            top_level_name = None
+            if id(element) not in self.__elements:
+                top_level_name = self.__check_top_level_name(element)
+                self.__index_identity(element)
+            self.__copy_shared()
+            if id(element) not in self.__elements:
+                if top_level_name is not None:
+                    self.__top_level_elements[top_level_name] = element
+                self.__record_parent(element, element.get_parent())
+                self.__property_store._item_added(element)
+                self.__element_tag_index._item_added(element)
+                for code_element in getattr(element, "code_elements", None) \
+                        or ():
+                    self._code_element_added(element, code_element)
+            self.__elements[id(element)] = element
+            self.__version += 1
+            if self.__log_entries is not None:
+                self.__log_added(self.__element_log, element)
+
+    def _element_removed(self, element: Element) -> List[Relationship]:
+        """
+        Called by an element when it is moved out of this model, removing the
+        relationships from and to it along with it.
+
+        :return: the List of removed Relationship objects
+        """
+        with self.locked():
+            self.__copy_shared()
+            removed = []
+            if self.__elements.pop(id(element), None) is not None:
+                removed = self.get_efferent_relationships(element) + [
+                    relationship for relationship
+                    in self.get_afferent_relationships(element)
+                    if relationship.source is not element]
+                for relationship in removed:
+                    self.__remove_relationship(relationship)
+                self.__unindex_identity(element)
+                name = element.get_canonical_name()
+                if self.__top_level_elements.get(name) is element:
+                    del self.__top_level_elements[name]
+                self.__record_parent(element, None)
+                if self.__child_counts.get(id(element)):
+                    # the names of its descendants cached against this model
+                    # must not be trusted if it changes while out of it
+                    self.__hierarchy_version = \
+                        Element._new_hierarchy_version()
+                self.__property_store._item_removed(element)
+                self.__element_tag_index._item_removed(element)
+                for code_element in getattr(element, "code_elements", None) \
+                        or ():
+                    self._code_element_removed(element, code_element)
+            self.__version += 1
+            if self.__log_entries is not None:
+                self.__log_removed(element)
+
+            return removed
+
+    def __record_parent(self, element: Element,
+                        parent: Element or None) -> bool:
+        """
+        Records the parent of an element of this model (None when it is
+        removed), returning whether it differs from the recorded one.
+        """
+        key = id(element)
+        recorded = self.__parents.get(key)
+        if recorded is parent:
+            return False
+
+        if recorded is not None:
+            del self.__parents[key]
+            count = self.__child_counts[id(recorded)] - 1
+            if count:
+                self.__child_counts[id(recorded)] = count
+            else:
+                del self.__child_counts[id(recorded)]
+        if parent is not None:
+            self.__parents[key] = parent
+            self.__child_counts[id(parent)] = \
+                self.__child_counts.get(id(parent), 0) + 1
+
+        return True
+
+    def _hierarchy_changed(self, element: Element, cached: bool):
+        """
+        Called by an element of this model when it is renamed or moved. If it
+        was moved, or its canonical name had been computed and it has
+        descendants in this model, the canonical names cached in this model
+        are invalidated; otherwise only its own relationships are reindexed
+        by content.
+
+        :param element: the renamed or moved Element
+        :param cached: whether its canonical name had been computed
+        :return: None
+        """
+        with self.locked():
+            if id(element) not in self.__elements:
+                return
+            moved = self.__record_parent(element, element.get_parent())
+            if moved or cached and self.__child_counts.get(id(element)):
+                self.__hierarchy_version = Element._new_hierarchy_version()
+                return
+            if not cached:
+                return
+
+            self.__canonical_names_version = (-1, -1)
+            if self.__by_content_version != self.__hierarchy_version:
+                return
+            relationships = list(
+                self.__outgoing.get(id(element), {}).values())
+            relationships += [
+                relationship for relationship
+                in self.__incoming.get(id(element), {}).values()
+                if relationship.source is not element]
+            for relationship in relationships:
+                key = relationship._cached_content_key()
+                if self.__by_content.get(key) is relationship:
+                    del self.__by_content[key]
+            for relationship in relationships:
+                self.__by_content.setdefault(relationship.get_content_key(),
+                                             relationship)
+
+    def _element_renamed(self, element: Element, old_canonical_name: str):
+        """
+        Called by a top-level element of this model when it is renamed.
+
+        :raises ValueError: if another top-level element has the new name
+        """
+        with self.locked():
+            if self.__top_level_elements.get(old_canonical_name) \
+                    is not element:
+                return
+
+            name = self.__check_top_level_name(element)
+            del self.__top_level_elements[old_canonical_name]
+            self.__top_level_elements[name] = element
+
+    def __check_top_level_name(self, element: Element) -> str or None:
+        if element.get_parent() is not None:
+            return None
+
+        name = element.get_canonical_name()
+        existing = self.__top_level_elements.get(name)
+        if existing is not None and existing is not element:
+            raise ValueError(f"An element named '{element.name}' already "
+                             f"exists in the model")
+
+        return name
+
+    def _code_element_added(self, element: Element,
+                            code_element: CodeElement):
+        """Called by an element of this model when it gets a code element."""
+        owners = self.__code_element_owners.setdefault(code_element.type, {})
+        owners[id(element)] = element
+        self.__code_elements.add(code_element)
+
+    def _code_element_removed(self, element: Element,
+                              code_element: CodeElement):
+        """Called by an element of this model when it loses a code element."""
+        owners = self.__code_element_owners.get(code_element.type)
+        if owners is None or owners.pop(id(element), None) is None:
+            return
+
+        if not owners:
+            del self.__code_element_owners[code_element.type]
+            indexed = self.__code_elements.get(code_element.type)
+            if indexed is not None:
+                self.__code_elements.remove(indexed)
+
+    def _relationship_changing(self, relationship: Relationship,
+                               change: Callable[[], None],
+                               undo: Callable[[], None]):
+        """
+        Called by a relationship to change its source, destination,
+        description, technology or interaction style, taking it out of the
+        indexes (and its implied relationships) for the duration of the
+        change. A thread-safe model stays locked until the
+        relationship has been put back.
+
+        :param relationship: the Relationship to change
+        :param change: a function making the change
+        :param undo: a function reverting the change
+        :return: None
+        :raises ValueError: if the change would make the relationship
+                            duplicate another one, in which case it is undone
+        """
+        with self.locked():
+            if id(relationship) not in self.__relationships:
+                change()
+                return
+
+            self.__unindex(relationship)
+            if self.__implied_relationships is not None:
+                self.__implied_relationships.remove(relationship)
+            try:
+                change()
+                existing = self.__by_content.get(
+                    relationship.get_content_key())
+                if existing is not None and existing is not relationship:
+                    undo()
+                    raise ValueError(
+                        f"The relationship {relationship.identity} would "
+                        f"duplicate the relationship {existing.identity}")
+            finally:
+                self.__index(relationship)
+                self.__version += 1
+                if self.__implied_relationships is not None:
+                    self.__implied_relationships.add(relationship)
+
+    def __add_relationship(self, relationship: Relationship) -> bool:
+        key = id(relationship)
+        if key in self.__relationships or \
+                self.get_equivalent_relationship(relationship) is not None:
+            return False
+
+        self.__index_identity(relationship)
+        self.__copy_shared()
+        self.__relationships[key] = relationship
+        relationship.model = self
+        self.__index(relationship)
+        self.__property_store._item_added(relationship)
+        self.__relationship_tag_index._item_added(relationship)
+        self.__version += 1
+        if self.__log_entries is not None:
+            self.__log_added(self.__relationship_log, relationship)
+        if self.__implied_relationships is not None:
+            self.__implied_relationships.add(relationship)
+
+        return True
+
+    def __remove_relationship(self, relationship: Relationship) -> bool:
+        if id(relationship) not in self.__relationships:
+            return False
+
+        self.__copy_shared()
+        del self.__relationships[id(relationship)]
+        self.__unindex(relationship)
+        self.__unindex_identity(relationship)
+        self.__property_store._item_removed(relationship)
+        self.__relationship_tag_index._item_removed(relationship)
+        relationship.model = None
+        self.__version += 1
+        if self.__log_entries is not None:
+            self.__log_removed(relationship)
+        if self.__implied_relationships is not None:
+            self.__implied_relationships.remove(relationship)
+
+        return True
+
+    def _tags_changed(self, item: ModelItem, old: int, new: int):
+        """
+        Called by an item of this model when its tags change, so that it can
+        be reindexed by tag.
+        """
+        with self.locked():
+            if id(item) in self.__elements:
+                self.__element_tag_index._mask_changed(item, old, new)
+            elif id(item) in self.__relationships:
+                self.__relationship_tag_index._mask_changed(item, old, new)
+
+    def _property_changed(self, item: ModelItem, name: str, old: str or None,
+                          new: str or None):
+        """
+        Called by an item of this model when one of its properties is set or
+        removed, so that it can be reindexed by property.
+
+        :param item: the ModelItem whose property changed
+        :param name: the name of the property
+        :param old: the previous value, or None if the property was added
+        :param new: the new value, or None if the property was removed
+        :return: None
+        """
+        with self.locked():
+            if id(item) in self.__elements or \
+                    id(item) in self.__relationships:
+                if old is not None:
+                    self.__property_store._property_removed(item, name, old)
+                if new is not None:
+                    self.__property_store._property_set(item, name, new)
+
+    def _properties_replaced(self, item: ModelItem, old: Mapping[str, str],
+                             new: Mapping[str, str]):
+        """
+        Called by an item of this model when all its properties are replaced,
+        so that it can be reindexed by property.
+        """
+        with self.locked():
+            if id(item) in self.__elements or \
+                    id(item) in self.__relationships:
+                self.__property_store._properties_replaced(item, old, new)
+
+    def _identity_changing(self, item: ModelItem, identity: str):
+        """
+        Called by an item of this model before its identity is changed, so
+        that it can be indexed by its new identity.
+        """
+        with self.locked():
+            if identity:
+                self.__check_identity(item, identity)
+            self.__unindex_identity(item)
+            if identity:
+                self.__identity_strategy.found(identity)
+                self.__items_by_identity[identity] = item
+
+    def __index_identity(self, item: ModelItem):
+        """
+        Indexes an item added to this model by its identity, generating one
+        if it has none.
+        """
+        identity = item.identity
+        if not identity:
+            identity = self.__identity_strategy.generate_identity(item)
+            self.__check_identity(item, identity)
+            # set while the item isn't part of a model, bypassing the index
+            item._set_identity_unchecked(identity)
+        else:
+            self.__check_identity(item, identity)
+            self.__identity_strategy.found(identity)
+        self.__items_by_identity[identity] = item
+
+    def __unindex_identity(self, item: ModelItem):
+        identity = item.identity
+        if identity and self.__items_by_identity.get(identity) is item:
+            del self.__items_by_identity[identity]
+
+    def __check_identity(self, item: ModelItem, identity: str):
+        existing = self.__items_by_identity.get(identity)
+        if existing is not None and existing is not item:
+            raise ValueError(
+                f"An item with the identity '{identity}' already exists in "
+                f"the model")
+
+    def __copy_shared(self):
+        """
+        Copies the collections shared with the latest snapshot before they
+        are changed.
+        """
+        if self.__shared:
+            self.__elements = dict(self.__elements)
+            self.__relationships = dict(self.__relationships)
+            self.__shared = False
+
+    def __log_added(self, log: List[list], item: ModelItem):
+        entry = [item, None]
+        log.append(entry)
+        self.__log_entries[id(item)] = entry
+
+    def __log_removed(self, item: ModelItem):
+        entry = self.__log_entries.pop(id(item), None)
+        if entry is None:
+            return
+
+        entry[1] = self.__version
+        self.__removed_entries += 1
+        if self.__removed_entries > self.LOG_COMPACTION_THRESHOLD and \
+                self.__removed_entries * 2 > len(self.__log_entries):
+            # new lists, so that existing snapshots keep reading the old ones
+            self.__element_log = [entry for entry in self.__element_log
+                                  if entry[1] is None]
+            self.__relationship_log = [
+                entry for entry in self.__relationship_log
+                if entry[1] is None]
+            self.__removed_entries = 0
+
+    def __rebuild_content_index(self):
+        self.__by_content = {}
+        for relationship in self.__relationships.values():
+            self.__by_content.setdefault(relationship.get_content_key(),
+                                         relationship)
+        self.__by_content_version = self.__hierarchy_version
+
+    def __index(self, relationship: Relationship):
+        key = id(relationship)
+        if self.__by_content_version != self.__hierarchy_version:
+            self.__rebuild_content_index()
+        self.__by_content.setdefault(relationship.get_content_key(),
+                                     relationship)
+
+        source = id(relationship.source) \
+            if relationship.source is not None else None
+        destination = id(relationship.destination) \
+            if relationship.destination is not None else None
+
+        if source is not None:
+            self.__outgoing.setdefault(source, {})[key] = relationship
+        if destination is not None:
+            self.__incoming.setdefault(destination, {})[key] = relationship
+        if source is not None and destination is not None:
+            self.__pairs.setdefault((source, destination), {})[key] = \
+                relationship
+
+    def __unindex(self, relationship: Relationship):
+        key = id(relationship)
+        if self.__by_content_version != self.__hierarchy_version:
+            self.__rebuild_content_index()
+        content_key = relationship.get_content_key()
+        if self.__by_content.get(content_key) is relationship:
+            del self.__by_content[content_key]
+
+        source = id(relationship.source) \
+            if relationship.source is not None else None
+        destination = id(relationship.destination) \
+            if relationship.destination is not None else None
+
+        if source is not None:
+            self.__discard(self.__outgoing, source, key)
+        if destination is not None:
+            self.__discard(self.__incoming, destination, key)
+        if source is not None and destination is not None:
+            self.__discard(self.__pairs, (source, destination), key)
+
+    @staticmethod
+    def __discard(index: dict, bucket_key, key: int):
+        bucket = index.get(bucket_key)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del index[bucket_key]
+
+
+def _iter_log(log: List[list], count: int, version: int) -> Iterator:
+    """
+    Iterates over the items of the first entries of a log which were not yet
+    removed at the specified model version.
+    """
+    for index in range(count):
+        item, removed = log[index]
+        if removed is None or removed > version:
+            yield item
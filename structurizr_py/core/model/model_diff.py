@@ -0,0 +1,300 @@
+from __future__ import annotations
+from typing import Dict, List, TextIO, Tuple, TYPE_CHECKING
+
+from structurizr_py.core.model.deployment_node import DeploymentNode
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.tags import Tags
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.model import Model
+    from structurizr_py.core.model.relationship import Relationship
+
+_ELEMENT_FIELDS = ("description", "url", "tags")
+_RELATIONSHIP_FIELDS = ("interaction_style", "tags")
+
+
+class ItemChange:
+    """
+    Describes an element or relationship which was added, removed or modified
+    between two versions of a model.
+    """
+
+    __slots__ = ("key", "old", "new", "changes")
+
+    def __init__(self, key: str or tuple, old: object, new: object,
+                 changes: Dict[str, Tuple[object, object]] = None):
+        """
+        :param key: the canonical name of an element, or the content key of
+                    a relationship (see Relationship.get_content_key)
+        :param old: the old item (a ModelItem, or the dict of its JSON fields
+                    when diffing against a snapshot), None if it was added
+        :param new: the new item, None if it was removed
+        :param changes: the modified fields, as field name to (old, new)
+                        value; properties are reported as "properties.<name>"
+                        and tags as frozensets
+        """
+        self.key = key
+        self.old = old
+        self.new = new
+        self.changes = changes or {}
+
+    def __repr__(self) -> str:
+        return f"ItemChange({self.key!r}, {self.changes!r})"
+
+
+class ModelDiff:
+    """
+    The differences between two versions of a model.
+
+    Elements are matched by canonical name, and relationships by their
+    content key (as in Relationship.__eq__), so changing the technology of a
+    relationship removes it and adds another. Items sharing a key are matched
+    in the order in which they appear in each model. The new model is indexed
+    once and the old one is streamed against the index, so diffing is linear
+    in the size of both models, and the old model can be read from a
+    serialized snapshot without loading it.
+    """
+
+    def __init__(self):
+        self.added_elements: List[ItemChange] = []
+        self.removed_elements: List[ItemChange] = []
+        self.modified_elements: List[ItemChange] = []
+        self.added_relationships: List[ItemChange] = []
+        self.removed_relationships: List[ItemChange] = []
+        self.modified_relationships: List[ItemChange] = []
+
+    def is_empty(self) -> bool:
+        """
+        Determines whether the two versions of the model are the same.
+
+        :return: True if nothing changed, False otherwise
+        """
+        return not (self.added_elements or self.removed_elements or
+                    self.modified_elements or self.added_relationships or
+                    self.removed_relationships or self.modified_relationships)
+
+    @staticmethod
+    def between(old: Model, new: Model) -> ModelDiff:
+        """
+        Computes the differences between two models.
+
+        :param old: the old Model
+        :param new: the new Model
+        :return: a ModelDiff object
+        """
+        builder = _DiffBuilder(new)
+        for element in old.iter_elements():
+            builder.old_element(element.get_canonical_name(), element,
+                                _element_state(element))
+        for relationship in old.iter_relationships():
+            builder.old_relationship(relationship.get_content_key(),
+                                     relationship,
+                                     _relationship_state(relationship))
+
+        return builder.finish()
+
+    @staticmethod
+    def from_snapshot(stream: TextIO, new: Model) -> ModelDiff:
+        """
+        Computes the differences between a model serialized as a JSON
+        workspace and a model in memory, streaming the serialized model.
+
+        :param stream: a readable text stream with the old model
+        :param new: the new Model
+        :return: a ModelDiff object
+        :raises ValueError: if a relationship refers to an element which
+                            isn't in the snapshot
+        """
+        from structurizr_py.core.io.json_reader import JsonReader
+
+        builder = _DiffBuilder(new)
+        canonical_names: Dict[str, str] = {}
+        open_elements: List[Tuple[str, dict]] = []
+        unresolved: List[Tuple[dict, str]] = []
+
+        for event in JsonReader.iter_events(stream):
+            event_type = event[0]
+            if event_type == JsonReader.ELEMENT:
+                _, kind, fields, parent_identity = event
+                canonical_name = _snapshot_canonical_name(
+                    kind, fields, parent_identity, canonical_names)
+                canonical_names[fields.get("id")] = canonical_name
+                open_elements.append((canonical_name, fields))
+
+            elif event_type == JsonReader.ELEMENT_END:
+                canonical_name, fields = open_elements.pop()
+                if event[3]:
+                    fields = dict(fields, **event[3])
+                builder.old_element(canonical_name, fields,
+                                    _snapshot_state(fields, _ELEMENT_FIELDS))
+
+            elif event_type == JsonReader.RELATIONSHIP:
+                _, fields, source_identity = event
+                source = _canonical_name_of(
+                    canonical_names, fields.get("sourceId", source_identity))
+                if fields.get("destinationId") in canonical_names:
+                    builder.old_relationship(
+                        _snapshot_key(fields, source, canonical_names),
+                        fields, _snapshot_state(fields, _RELATIONSHIP_FIELDS))
+                else:
+                    unresolved.append((fields, source))
+
+        for fields, source in unresolved:
+            builder.old_relationship(
+                _snapshot_key(fields, source, canonical_names), fields,
+                _snapshot_state(fields, _RELATIONSHIP_FIELDS))
+
+        return builder.finish()
+
+
+class _DiffBuilder:
+    """
+    Indexes the new model and compares old items against it. The indexes are
+    multimaps, as several items may share a key (e.g. top-level elements of
+    different types with the same name).
+    """
+
+    def __init__(self, new: Model):
+        self.__diff = ModelDiff()
+        self.__elements: Dict[str, List[Element]] = {}
+        for element in new.iter_elements():
+            self.__elements.setdefault(element.get_canonical_name(),
+                                       []).append(element)
+        self.__relationships: Dict[tuple, List[Relationship]] = {}
+        for relationship in new.iter_relationships():
+            self.__relationships.setdefault(relationship.get_content_key(),
+                                            []).append(relationship)
+
+    def old_element(self, key: str, item: object, state: dict):
+        element = _pop_first(self.__elements, key)
+        if element is None:
+            self.__diff.removed_elements.append(ItemChange(key, item, None))
+            return
+
+        changes = _compare(state, _element_state(element))
+        if changes:
+            self.__diff.modified_elements.append(
+                ItemChange(key, item, element, changes))
+
+    def old_relationship(self, key: tuple, item: object, state: dict):
+        relationship = _pop_first(self.__relationships, key)
+        if relationship is None:
+            self.__diff.removed_relationships.append(
+                ItemChange(key, item, None))
+            return
+
+        changes = _compare(state, _relationship_state(relationship))
+        if changes:
+            self.__diff.modified_relationships.append(
+                ItemChange(key, item, relationship, changes))
+
+    def finish(self) -> ModelDiff:
+        self.__diff.added_elements = [
+            ItemChange(key, None, element)
+            for key, elements in self.__elements.items()
+            for element in elements]
+        self.__diff.added_relationships = [
+            ItemChange(key, None, relationship)
+            for key, relationships in self.__relationships.items()
+            for relationship in relationships]
+
+        return self.__diff
+
+
+def _pop_first(index: Dict[object, list], key: object) -> object or None:
+    items = index.get(key)
+    if not items:
+        return None
+
+    item = items.pop(0)
+    if not items:
+        del index[key]
+
+    return item
+
+
+def _snapshot_canonical_name(kind: str, fields: dict,
+                             parent_identity: str or None,
+                             canonical_names: Dict[str, str]) -> str:
+    """
+    Builds the canonical name of a serialized element the same way as
+    Element.get_canonical_name, including the deployment specific names of
+    DeploymentNode and ContainerInstance.
+    """
+    separator = Element.CANONICAL_NAME_SEPARATOR
+    if kind == Tags.CONTAINER_INSTANCE:
+        return canonical_names[parent_identity] + _canonical_name_of(
+            canonical_names, fields.get("containerId"))
+
+    if parent_identity is not None:
+        prefix = canonical_names[parent_identity]
+    elif kind == Tags.DEPLOYMENT_NODE:
+        prefix = separator + "Deployment" + separator + fields.get(
+            "environment", DeploymentNode.DEFAULT_ENVIRONMENT).replace(
+            separator, "")
+    else:
+        prefix = ""
+
+    return prefix + separator + (fields.get("name") or "").replace(
+        separator, "")
+
+
+def _canonical_name_of(canonical_names: Dict[str, str],
+                       identity: str) -> str:
+    canonical_name = canonical_names.get(identity)
+    if canonical_name is None:
+        raise ValueError(f"The element {identity} referred to by another "
+                         f"item does not exist in the snapshot")
+
+    return canonical_name
+
+
+def _snapshot_key(fields: dict, source: str,
+                  canonical_names: Dict[str, str]) -> tuple:
+    return (source,
+            _canonical_name_of(canonical_names, fields.get("destinationId")),
+            fields.get("description"), fields.get("technology"))
+
+
+def _element_state(element: Element) -> dict:
+    return {"description": element.description, "url": element.url,
+            "tags": frozenset(element.get_tags_as_set()),
+            "properties": element.properties}
+
+
+def _relationship_state(relationship: Relationship) -> dict:
+    return {"interaction_style": relationship.interaction_style,
+            "tags": frozenset(relationship.get_tags_as_set()),
+            "properties": relationship.properties}
+
+
+def _snapshot_state(fields: dict, names: tuple) -> dict:
+    state = {name: fields.get(name) for name in names}
+    state["tags"] = frozenset(fields["tags"].split(",")) \
+        if fields.get("tags") else frozenset()
+    state["properties"] = fields.get("properties") or {}
+    if "interaction_style" in names:
+        state["interaction_style"] = fields.get("interactionStyle",
+                                                InteractionStyle.SYNCHRONOUS)
+
+    return state
+
+
+def _compare(old: dict, new: dict) -> Dict[str, Tuple[object, object]]:
+    changes = {}
+    for name, old_value in old.items():
+        if name == "properties":
+            continue
+        if old_value != new[name]:
+            changes[name] = (old_value, new[name])
+
+    old_properties = old["properties"]
+    new_properties = new["properties"]
+    if old_properties != new_properties:
+        for name in old_properties.keys() | new_properties.keys():
+            if old_properties.get(name) != new_properties.get(name):
+                changes["properties." + name] = (old_properties.get(name),
+                                                 new_properties.get(name))
+
+    return changes
@@ -1,13 +1,35 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Set, Dict
+from types import MappingProxyType
+from typing import Dict, Mapping, Set, TYPE_CHECKING
+
+from structurizr_py.core.model.property_store import PropertyStore
+from structurizr_py.core.model.tag_registry import DEFAULT_TAG_REGISTRY
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.model import Model
+
+_NO_PROPERTIES = MappingProxyType({})
 
 
 class ModelItem(ABC):
-    """The base class for model elements and relationships."""
+    """
+    The base class for model elements and relationships.
+
+    Items are slotted. Tags are interned in the shared TagRegistry and stored
+    as an integer bitmask, and the property dict is only allocated when the
+    first property is added. Property names are interned, and the properties
+    of items which are part of a model are indexed by the model's
+    PropertyStore, and their tags by the model's TagIndex objects.
+    """
+
+    __slots__ = ("__identity", "__tag_mask", "__tags_csv", "__properties")
 
-    __identity: str = ""
-    __tags: Set[str] = set()
-    __properties: Dict[str, str] = {}
+    def __init__(self):
+        self.__identity = ""
+        self.__tag_mask = 0
+        self.__tags_csv = ""
+        self.__properties = None
 
     @property
     def identity(self) -> str:
@@ -21,23 +43,38 @@ class ModelItem(ABC):
     @identity.setter
     def identity(self, identity: str):
         """
-        Sets the ID of this item in the model.
+        Sets the ID of this item in the model, which must be unique in the
+        model the item is part of.
 
         :param identity: ID to be set, as a str
         :return: None
         """
+        model = self._get_model()
+        if model is not None and identity != self.__identity:
+            model._identity_changing(self, identity)
+        self.__identity = identity
+
+    def _set_identity_unchecked(self, identity: str):
+        """
+        Sets the identity without updating the index of the model. Used by
+        the model itself, when it generates the identity of an item it adds.
+        """
         self.__identity = identity
 
     @property
     def tags(self) -> str:
         """
-        Gets the comma separated list of tags. Please note that the list is
-        unsorted.
+        Gets the comma separated list of tags, in the order in which the tags
+        were first registered. The list is cached until the tags change.
 
         :return: a comma separated list of tags,
                  or an empty string if there are no tags
         """
-        return ",".join(self.__tags)
+        csv = self.__tags_csv
+        if csv is None:
+            csv = self.__tags_csv = DEFAULT_TAG_REGISTRY.csv(self.__tag_mask)
+
+        return csv
 
     def get_tags_as_set(self) -> Set[str]:
         """
@@ -45,7 +82,7 @@ class ModelItem(ABC):
 
         :return: a set of tags (strings)
         """
-        return self.__tags
+        return set(DEFAULT_TAG_REGISTRY.names(self.__tag_mask))
 
     @tags.setter
     def tags(self, tags: Set[str]):
@@ -55,7 +92,16 @@ class ModelItem(ABC):
         :param tags: a set of tags (strings)
         :return: None
         """
-        self.__tags = tags
+        self.__set_tag_mask(DEFAULT_TAG_REGISTRY.mask(tags) if tags else 0)
+
+    @property
+    def tag_mask(self) -> int:
+        """
+        Gets the bitmask of the item's tags, as assigned by the TagRegistry.
+
+        :return: the bitmask, as an int
+        """
+        return self.__tag_mask
 
     def add_tags(self, tags: Set[str]):
         """
@@ -64,7 +110,23 @@ class ModelItem(ABC):
         :param tags: a set of tags (strings)
         :return: None
         """
-        self.__tags = self.__tags.union(tags)
+        if not tags:
+            return
+
+        mask = self.__tag_mask | DEFAULT_TAG_REGISTRY.mask(tags)
+        if mask != self.__tag_mask:
+            self.__set_tag_mask(mask)
+
+    def add_tag(self, tag: str):
+        """
+        Adds a single tag to the item.
+
+        :param tag: str
+        :return: None
+        """
+        bit = DEFAULT_TAG_REGISTRY.bit(tag)
+        if not self.__tag_mask & bit:
+            self.__set_tag_mask(self.__tag_mask | bit)
 
     @abstractmethod
     def get_required_tags(self) -> Set[str]:
@@ -82,7 +144,18 @@ class ModelItem(ABC):
         :param tag: str
         :return: None
         """
-        self.__tags.remove(tag)
+        bit = DEFAULT_TAG_REGISTRY.find(tag)
+        if self.__tag_mask & bit:
+            self.__set_tag_mask(self.__tag_mask ^ bit)
+
+    def __set_tag_mask(self, mask: int):
+        old = self.__tag_mask
+        self.__tag_mask = mask
+        self.__tags_csv = None
+
+        model = self._get_model()
+        if model is not None:
+            model._tags_changed(self, old, mask)
 
     def has_tag(self, tag: str) -> bool:
         """
@@ -91,17 +164,19 @@ class ModelItem(ABC):
         :param tag: str
         :return: True or False
         """
-        return tag in self.__tags
+        return self.__tag_mask & DEFAULT_TAG_REGISTRY.find(tag) != 0
 
     @property
-    def properties(self) -> Dict[str, str]:
+    def properties(self) -> Mapping[str, str]:
         """
         Gets the collection of name-value property pairs associated with this
-        element as a Dict.
+        element, as a read-only mapping (use add_property and remove_property
+        to change it, so that the model's index stays up to date).
 
-        :return: a Dict (str, str) (empty if there are no properties)
+        :return: a Mapping (str, str), empty if there are no properties
         """
-        return self.__properties
+        return MappingProxyType(self.__properties) \
+            if self.__properties is not None else _NO_PROPERTIES
 
     @properties.setter
     def properties(self, properties: Dict[str, str]):
@@ -111,14 +186,56 @@ class ModelItem(ABC):
         :param properties: a Dict (str, str)
         :return: None
         """
-        self.__properties = properties
+        old = self.properties
+        self.__properties = {PropertyStore.intern(name): value
+                             for name, value in properties.items()} \
+            if properties else None
+
+        model = self._get_model()
+        if model is not None:
+            model._properties_replaced(self, old, self.properties)
 
     def add_property(self, name: str, value: str):
         """
-        Adds a name-value property pair to this item.
+        Adds a name-value property pair to this item, replacing the value of
+        an existing property with the same name.
 
         :param name: the name of the property
         :param value: the value of the property
-        :return:
+        :return: None
         """
+        name = PropertyStore.intern(name)
+        if self.__properties is None:
+            self.__properties = {}
+        old = self.__properties.get(name)
         self.__properties[name] = value
+
+        model = self._get_model()
+        if model is not None:
+            model._property_changed(self, name, old, value)
+
+    def remove_property(self, name: str):
+        """
+        Removes a property from this item, if it exists.
+
+        :param name: the name of the property
+        :return: None
+        """
+        if not self.__properties or name not in self.__properties:
+            return
+
+        value = self.__properties.pop(name)
+        if not self.__properties:
+            self.__properties = None
+
+        model = self._get_model()
+        if model is not None:
+            model._property_changed(self, name, value, None)
+
+    def _get_model(self) -> Model or None:
+        """
+        Gets the model this item is part of, which indexes it by identity.
+
+        :return: a Model object, or None
+        """
+        return None
@@ -0,0 +1,553 @@
+from __future__ import annotations
+import functools
+import operator
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Iterator, List, Tuple, TYPE_CHECKING
+
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.tag_registry import DEFAULT_TAG_REGISTRY
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.model import Model
+    from structurizr_py.core.model.model_item import ModelItem
+    from structurizr_py.core.model.tag_index import TagIndex
+
+
+class _Criterion(ABC):
+    """
+    One predicate of a query. Criteria which are backed by an index of the
+    model can estimate how many items they match and produce them as
+    candidates; the others can only test items.
+    """
+
+    """The relative cost of testing an item, used to order the filters"""
+    cost = 0
+
+    @abstractmethod
+    def matches(self, item: ModelItem) -> bool:
+        pass
+
+    def estimate(self, model: Model) -> int or None:
+        """Gets the number of matching items, or None without an index."""
+        return None
+
+    def candidates(self, model: Model) -> Iterable[ModelItem]:
+        """Gets a superset of the matching items, from the index."""
+        return ()
+
+    @abstractmethod
+    def describe(self) -> str:
+        pass
+
+
+class _TagCriterion(_Criterion):
+
+    def __init__(self, tags: Tuple[str, ...],
+                 index: Callable[[Model], TagIndex]):
+        self.__tags = tags
+        self.__index = index
+        self.__mask = None
+
+    def matches(self, item: ModelItem) -> bool:
+        mask = self.__resolve()
+        return mask is not None and item.tag_mask & mask == mask
+
+    def estimate(self, model: Model) -> int or None:
+        if not self.__tags:
+            return None
+
+        index = self.__index(model)
+        return min(index.count(tag) for tag in self.__tags)
+
+    def candidates(self, model: Model) -> Iterable[ModelItem]:
+        index = self.__index(model)
+        return index.find(min(self.__tags, key=index.count))
+
+    def describe(self) -> str:
+        return f"tags {', '.join(self.__tags)}"
+
+    def __resolve(self) -> int or None:
+        # resolved when the query runs, as the tags may be registered after
+        # it was built; a tag can't be on any item before it is registered,
+        # and its bit never changes afterwards
+        mask = self.__mask
+        if mask is None:
+            bits = [DEFAULT_TAG_REGISTRY.find(tag) for tag in self.__tags]
+            if all(bits):
+                mask = self.__mask = functools.reduce(operator.or_, bits, 0)
+
+        return mask
+
+
+class _PropertyCriterion(_Criterion):
+    cost = 1
+
+    def __init__(self, name: str, value: str or None):
+        self.__name = name
+        self.__value = value
+
+    def matches(self, item: ModelItem) -> bool:
+        if self.__value is None:
+            return self.__name in item.properties
+
+        return item.properties.get(self.__name) == self.__value
+
+    def estimate(self, model: Model) -> int or None:
+        return model.property_store.count(self.__name, self.__value)
+
+    def candidates(self, model: Model) -> Iterable[ModelItem]:
+        store = model.property_store
+        if self.__value is None:
+            return (item for item, _ in store.iter_property(self.__name))
+
+        return store.find(self.__name, self.__value)
+
+    def describe(self) -> str:
+        if self.__value is None:
+            return f"property {self.__name}"
+
+        return f"property {self.__name}={self.__value}"
+
+
+class _CanonicalNamePrefixCriterion(_Criterion):
+    cost = 2
+
+    def __init__(self, prefix: str):
+        self.__prefix = prefix
+
+    def matches(self, element: Element) -> bool:
+        return element.get_canonical_name().startswith(self.__prefix)
+
+    def estimate(self, model: Model) -> int or None:
+        return len(model.get_elements_with_canonical_name_prefix(
+            self.__prefix))
+
+    def candidates(self, model: Model) -> Iterable[ModelItem]:
+        return model.get_elements_with_canonical_name_prefix(self.__prefix)
+
+    def describe(self) -> str:
+        return f"canonical name prefix {self.__prefix}"
+
+
+class _PackageCriterion(_Criterion):
+    cost = 3
+
+    def __init__(self, package: str, include_subpackages: bool):
+        self.__package = package
+        self.__include_subpackages = include_subpackages
+
+    def matches(self, element: Element) -> bool:
+        package = self.__package
+        for code_element in getattr(element, "code_elements", None) or ():
+            candidate = code_element.get_package()
+            if candidate == package or self.__include_subpackages and (
+                    not package or candidate.startswith(package + ".")):
+                return True
+
+        return False
+
+    def estimate(self, model: Model) -> int or None:
+        return sum(1 for _ in self.candidates(model))
+
+    def candidates(self, model: Model) -> Iterable[ModelItem]:
+        return model.get_elements_with_code_in_package(
+            self.__package, self.__include_subpackages)
+
+    def describe(self) -> str:
+        return f"code in package {self.__package}"
+
+
+class _RelatedCriterion(_Criterion):
+    """Matches the elements with a relationship to or from an element."""
+    cost = 3
+
+    def __init__(self, element: Element, outgoing: bool,
+                 interaction_style: str or None):
+        self.__element = element
+        self.__outgoing = outgoing
+        self.__interaction_style = interaction_style
+
+    def matches(self, element: Element) -> bool:
+        if element.model is None:
+            return False
+
+        if self.__outgoing:
+            relationships = element.model.get_efferent_relationships(element)
+        else:
+            relationships = element.model.get_afferent_relationships(element)
+        other = self.__element
+        style = self.__interaction_style
+        for relationship in relationships:
+            end = relationship.destination if self.__outgoing \
+                else relationship.source
+            if end is other and (
+                    style is None or relationship.interaction_style == style):
+                return True
+
+        return False
+
+    def estimate(self, model: Model) -> int or None:
+        style = self.__interaction_style
+        relationships = self.__relationships(model)
+        if style is None:
+            return len(relationships)
+
+        return sum(1 for relationship in relationships
+                   if relationship.interaction_style == style)
+
+    def candidates(self, model: Model) -> Iterable[ModelItem]:
+        style = self.__interaction_style
+        seen = set()
+        for relationship in self.__relationships(model):
+            if style is not None and relationship.interaction_style != style:
+                continue
+
+            end = relationship.source if self.__outgoing \
+                else relationship.destination
+            if id(end) not in seen:
+                seen.add(id(end))
+                yield end
+
+    def describe(self) -> str:
+        direction = "to" if self.__outgoing else "from"
+        style = f" ({self.__interaction_style})" \
+            if self.__interaction_style is not None else ""
+        return f"relationship {direction} {self.__element.name}{style}"
+
+    def __relationships(self, model: Model) -> List[Relationship]:
+        if self.__outgoing:
+            return model.get_afferent_relationships(self.__element)
+
+        return model.get_efferent_relationships(self.__element)
+
+
+class _EndpointCriterion(_Criterion):
+    """Matches the relationships with a given source or destination."""
+
+    def __init__(self, element: Element, source: bool):
+        self.__element = element
+        self.__source = source
+
+    def matches(self, relationship: Relationship) -> bool:
+        end = relationship.source if self.__source \
+            else relationship.destination
+        return end is self.__element
+
+    def estimate(self, model: Model) -> int or None:
+        return len(self.candidates(model))
+
+    def candidates(self, model: Model) -> List[Relationship]:
+        if self.__source:
+            return model.get_efferent_relationships(self.__element)
+
+        return model.get_afferent_relationships(self.__element)
+
+    def describe(self) -> str:
+        end = "source" if self.__source else "destination"
+        return f"{end} {self.__element.name}"
+
+
+class _AttributeCriterion(_Criterion):
+    """Compares one attribute of a relationship with a value."""
+
+    def __init__(self, attribute: str, value: str or None):
+        self.__attribute = attribute
+        self.__value = value
+
+    def matches(self, relationship: Relationship) -> bool:
+        return getattr(relationship, self.__attribute) == self.__value
+
+    def describe(self) -> str:
+        return f"{self.__attribute.replace('_', ' ')} {self.__value}"
+
+
+class _PredicateCriterion(_Criterion):
+    cost = 4
+
+    def __init__(self, predicate: Callable[[ModelItem], bool]):
+        self.__predicate = predicate
+
+    def matches(self, item: ModelItem) -> bool:
+        return bool(self.__predicate(item))
+
+    def describe(self) -> str:
+        return f"predicate {getattr(self.__predicate, '__name__', '?')}"
+
+
+class _Query(ABC):
+    """
+    The base class of the model queries: an immutable conjunction of
+    criteria, which is planned and run lazily each time it is iterated.
+
+    The planner asks every criterion backed by an index (tags, properties,
+    code element packages, canonical names, relationship adjacency) how many
+    items it matches, starts from the most selective one and tests the
+    remaining criteria on its candidates, cheapest first. Without any such
+    criterion, the query scans the model, testing every criterion.
+    """
+
+    """The type of the items the query returns"""
+    _item_type = None
+
+    def __init__(self, model: Model, criteria: Tuple[_Criterion, ...] = ()):
+        self.__model = model
+        self.__criteria = criteria
+
+    @property
+    def model(self) -> Model:
+        return self.__model
+
+    def tagged(self, *tags: str):
+        """
+        Restricts the query to items having all the specified tags.
+
+        :param tags: the tags, as str (e.g. Tags.COMPONENT)
+        :return: a new query
+        """
+        return self._with(_TagCriterion(tags, self._tag_index))
+
+    def with_property(self, name: str, value: str = None):
+        """
+        Restricts the query to items having the specified property.
+
+        :param name: the name of the property
+        :param value: the value of the property, or None for any value
+        :return: a new query
+        """
+        return self._with(_PropertyCriterion(name, value))
+
+    def where(self, predicate: Callable[[ModelItem], bool]):
+        """
+        Restricts the query to items for which a function returns True. The
+        function is called last, on the items matching every other criterion.
+
+        :param predicate: a function taking an item and returning a bool
+        :return: a new query
+        """
+        return self._with(_PredicateCriterion(predicate))
+
+    def count(self) -> int:
+        """
+        Counts the matching items.
+
+        :return: the number of items, as an int
+        """
+        return sum(1 for _ in self)
+
+    def first(self) -> ModelItem or None:
+        """
+        Gets the first matching item.
+
+        :return: a ModelItem object, or None if nothing matches
+        """
+        return next(iter(self), None)
+
+    def explain(self) -> str:
+        """
+        Describes how the query would currently be run: the index it starts
+        from (or a scan) and the filters applied to each candidate.
+
+        :return: a description of the plan, as a str
+        """
+        criterion, estimate, filters = self.__plan()
+        source = f"index {criterion.describe()} (~{estimate} items)" \
+            if criterion is not None else "scan"
+        if not filters:
+            return source
+
+        return source + ", filter " + ", ".join(f.describe() for f in filters)
+
+    def __iter__(self) -> Iterator:
+        return self.__run()
+
+    def _with(self, criterion: _Criterion):
+        return type(self)(self.__model, self.__criteria + (criterion,))
+
+    @abstractmethod
+    def _scan(self) -> Iterable[ModelItem]:
+        """Gets all items of the queried type in the model."""
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def _tag_index(model: Model) -> TagIndex:
+        """Gets the tag index of the queried type in the model."""
+        pass
+
+    def __plan(self) -> Tuple[_Criterion or None, int,
+                              List[_Criterion]]:
+        best = None
+        best_estimate = None
+        for criterion in self.__criteria:
+            estimate = criterion.estimate(self.__model)
+            if estimate is not None and (
+                    best_estimate is None or estimate < best_estimate):
+                best, best_estimate = criterion, estimate
+                if estimate == 0:
+                    break
+
+        filters = sorted((c for c in self.__criteria if c is not best),
+                         key=lambda c: c.cost)
+        return best, best_estimate, filters
+
+    def __run(self) -> Iterator:
+        criterion, estimate, filters = self.__plan()
+        if criterion is None:
+            source = self._scan()
+        elif estimate == 0:
+            return
+        else:
+            item_type = self._item_type
+            source = (item for item in criterion.candidates(self.__model)
+                      if isinstance(item, item_type))
+
+        tests = [f.matches for f in filters]
+        if not tests:
+            yield from source
+        elif len(tests) == 1:
+            yield from filter(tests[0], source)
+        else:
+            for item in source:
+                for test in tests:
+                    if not test(item):
+                        break
+                else:
+                    yield item
+
+
+class ElementQuery(_Query):
+    """
+    A lazy query over the elements of a model, e.g. the components tagged
+    "Database Access" with code in the "payments" package and asynchronous
+    relationships to the ledger:
+
+        model.query_elements().tagged(Tags.COMPONENT, "Database Access") \\
+            .with_code_in_package("payments") \\
+            .with_relationship_to(ledger, InteractionStyle.ASYNCHRONOUS)
+
+    Every method returns a new query; iterating a query yields the matching
+    elements one at a time.
+    """
+
+    _item_type = Element
+
+    def with_canonical_name_prefix(self, prefix: str) -> ElementQuery:
+        """
+        Restricts the query to elements whose canonical name starts with the
+        specified prefix, e.g. "/System/" for the elements nested in System.
+
+        :param prefix: the canonical name prefix
+        :return: a new query
+        """
+        return self._with(_CanonicalNamePrefixCriterion(prefix))
+
+    def with_code_in_package(self, package: str,
+                             include_subpackages: bool = True) \
+            -> ElementQuery:
+        """
+        Restricts the query to elements with code elements in the specified
+        package.
+
+        :param package: the package name, e.g. "structurizr.component"
+        :param include_subpackages: whether code elements in subpackages of
+                                    the package match too
+        :return: a new query
+        """
+        return self._with(_PackageCriterion(package, include_subpackages))
+
+    def with_relationship_to(self, element: Element,
+                             interaction_style: str = None) -> ElementQuery:
+        """
+        Restricts the query to elements with a relationship to the specified
+        element.
+
+        :param element: the destination Element
+        :param interaction_style: an InteractionStyle value the relationship
+                                  must have, or None for any
+        :return: a new query
+        """
+        return self._with(_RelatedCriterion(element, True, interaction_style))
+
+    def with_relationship_from(self, element: Element,
+                               interaction_style: str = None) \
+            -> ElementQuery:
+        """
+        Restricts the query to elements with a relationship from the
+        specified element.
+
+        :param element: the source Element
+        :param interaction_style: an InteractionStyle value the relationship
+                                  must have, or None for any
+        :return: a new query
+        """
+        return self._with(
+            _RelatedCriterion(element, False, interaction_style))
+
+    def _scan(self) -> Iterable[ModelItem]:
+        return self.model.iter_elements()
+
+    @staticmethod
+    def _tag_index(model: Model) -> TagIndex:
+        return model.element_tag_index
+
+
+class RelationshipQuery(_Query):
+    """
+    A lazy query over the relationships of a model, e.g. the asynchronous
+    relationships from a container:
+
+        model.query_relationships().with_source(container) \\
+            .with_interaction_style(InteractionStyle.ASYNCHRONOUS)
+
+    Every method returns a new query; iterating a query yields the matching
+    relationships one at a time.
+    """
+
+    _item_type = Relationship
+
+    def with_source(self, element: Element) -> RelationshipQuery:
+        """
+        Restricts the query to relationships from the specified element.
+
+        :param element: the source Element
+        :return: a new query
+        """
+        return self._with(_EndpointCriterion(element, True))
+
+    def with_destination(self, element: Element) -> RelationshipQuery:
+        """
+        Restricts the query to relationships to the specified element.
+
+        :param element: the destination Element
+        :return: a new query
+        """
+        return self._with(_EndpointCriterion(element, False))
+
+    def with_interaction_style(self, interaction_style: str) \
+            -> RelationshipQuery:
+        """
+        Restricts the query to relationships with the specified interaction
+        style.
+
+        :param interaction_style: an InteractionStyle value
+        :return: a new query
+        """
+        return self._with(
+            _AttributeCriterion("interaction_style", interaction_style))
+
+    def with_technology(self, technology: str) -> RelationshipQuery:
+        """
+        Restricts the query to relationships with the specified technology.
+
+        :param technology: the technology, or None
+        :return: a new query
+        """
+        return self._with(_AttributeCriterion("technology", technology))
+
+    def _scan(self) -> Iterable[ModelItem]:
+        return self.model.iter_relationships()
+
+    @staticmethod
+    def _tag_index(model: Model) -> TagIndex:
+        return model.relationship_tag_index
@@ -0,0 +1,122 @@
+from __future__ import annotations
+from typing import Callable, Dict, Iterator, List, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.element import Element
+    from structurizr_py.core.model.relationship import Relationship
+
+
+class ModelSnapshot:
+    """
+    The elements and relationships of a model at one version, unaffected by
+    elements and relationships added to or removed from the model later.
+
+    A snapshot doesn't copy the model's collections: it reads collections
+    which the model promises not to change in a way visible to the snapshot
+    (see Model.snapshot). Snapshots are therefore cheap to take, and reading
+    them never blocks writers. Only membership is captured: the items
+    themselves are the model's live objects.
+    """
+
+    def __init__(self, version: int,
+                 elements: Callable[[], Iterator[Element]],
+                 relationships: Callable[[], Iterator[Relationship]]):
+        """
+        :param version: the version of the model
+        :param elements: a function iterating over the elements of the model
+                         at that version
+        :param relationships: a function iterating over the relationships of
+                              the model at that version
+        """
+        self.__version = version
+        self.__elements = elements
+        self.__relationships = relationships
+        self.__members: Set[int] or None = None
+        self.__outgoing: Dict[int, List[Relationship]] or None = None
+        self.__incoming: Dict[int, List[Relationship]] or None = None
+
+    @property
+    def version(self) -> int:
+        """
+        Gets the version of the model this snapshot was taken at.
+
+        :return: the version, as an int
+        """
+        return self.__version
+
+    @property
+    def elements(self) -> Set[Element]:
+        return set(self.__elements())
+
+    @property
+    def relationships(self) -> Set[Relationship]:
+        return set(self.__relationships())
+
+    def iter_elements(self) -> Iterator[Element]:
+        return self.__elements()
+
+    def iter_relationships(self) -> Iterator[Relationship]:
+        return self.__relationships()
+
+    def contains(self, item: Element or Relationship) -> bool:
+        """
+        Determines whether the specified element or relationship was part of
+        the model when the snapshot was taken. The set of members is built on
+        first use.
+
+        :param item: an Element or Relationship object
+        :return: True if it was part of the model, False otherwise
+        """
+        members = self.__members
+        if members is None:
+            members = self.__members = {id(item) for item in self.__items()}
+
+        return id(item) in members
+
+    def get_efferent_relationships(self, element: Element) \
+            -> List[Relationship]:
+        """
+        Gets the efferent (outgoing) relationships of an element in this
+        snapshot. The adjacency of the snapshot is built on first use.
+
+        :param element: an Element object
+        :return: a List of Relationship objects (empty if there are none)
+        """
+        if self.__outgoing is None:
+            self.__build_adjacency()
+
+        return list(self.__outgoing.get(id(element), ()))
+
+    def get_afferent_relationships(self, element: Element) \
+            -> List[Relationship]:
+        """
+        Gets the afferent (incoming) relationships of an element in this
+        snapshot. The adjacency of the snapshot is built on first use.
+
+        :param element: an Element object
+        :return: a List of Relationship objects (empty if there are none)
+        """
+        if self.__outgoing is None:
+            self.__build_adjacency()
+
+        return list(self.__incoming.get(id(element), ()))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.__items())
+
+    def __items(self) -> Iterator[Element or Relationship]:
+        yield from self.__elements()
+        yield from self.__relationships()
+
+    def __build_adjacency(self):
+        outgoing: Dict[int, List[Relationship]] = {}
+        incoming: Dict[int, List[Relationship]] = {}
+        for relationship in self.__relationships():
+            outgoing.setdefault(id(relationship.source), []) \
+                .append(relationship)
+            incoming.setdefault(id(relationship.destination), []) \
+                .append(relationship)
+
+        # assigned last, so that concurrent readers never see a partial index
+        self.__incoming = incoming
+        self.__outgoing = outgoing
@@ -0,0 +1,31 @@
+from __future__ import annotations
+from typing import Set
+
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.tags import Tags
+
+
+class Person(Element):
+    """
+    Represents a person in the C4 model, i.e. a user of a software system.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, name: str = None, description: str = None):
+        """
+        :param name: the name of the person, which may be set later (e.g. by
+                     the bulk builder)
+        :param description: the description
+        """
+        super().__init__()
+        if name is not None:
+            self.name = name
+        self.description = description
+        self.add_tags(self.get_required_tags())
+
+    def get_parent(self) -> None:
+        return None
+
+    def get_required_tags(self) -> Set[str]:
+        return {Tags.ELEMENT, Tags.PERSON}
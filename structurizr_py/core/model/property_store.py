@@ -0,0 +1,127 @@
+from __future__ import annotations
+import sys
+from typing import Dict, Iterator, List, Mapping, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.model_item import ModelItem
+
+
+class PropertyStore:
+    """
+    Indexes the properties of the elements and relationships of a model,
+    from property name and value to the items having them.
+
+    Finding the items with a given property value is a dict lookup, and
+    iterating over one property across the model only visits the items
+    which have it. Property names are interned, so the many items sharing a
+    name share one str. Items keep their own property dicts, which are only
+    allocated when the first property is added; the store is kept up to date
+    by the items and the model as properties and items come and go.
+    """
+
+    def __init__(self):
+        self.__index: Dict[str, Dict[str, Dict[int, ModelItem]]] = {}
+
+    @staticmethod
+    def intern(name: str) -> str:
+        """
+        Interns a property name.
+
+        :param name: the name of a property
+        :return: the interned name
+        """
+        return sys.intern(name) if type(name) is str else name
+
+    def names(self) -> List[str]:
+        """
+        Gets the names of the properties used in the model.
+
+        :return: a List of property names
+        """
+        return list(self.__index)
+
+    def values(self, name: str) -> Dict[str, int]:
+        """
+        Gets the distinct values of a property, with the number of items
+        having each value.
+
+        :param name: the name of the property
+        :return: a Dict of value to number of items
+        """
+        return {value: len(items)
+                for value, items in self.__index.get(name, {}).items()}
+
+    def find(self, name: str, value: str) -> Iterator[ModelItem]:
+        """
+        Finds the items with the specified property value.
+
+        :param name: the name of the property
+        :param value: the value of the property
+        :return: an Iterator over ModelItem objects
+        """
+        items = self.__index.get(name, {}).get(value)
+        return iter(list(items.values())) if items else iter(())
+
+    def count(self, name: str, value: str = None) -> int:
+        """
+        Counts the items with the specified property, or property value.
+
+        :param name: the name of the property
+        :param value: the value of the property, None for any value
+        :return: the number of items, as an int
+        """
+        by_value = self.__index.get(name)
+        if not by_value:
+            return 0
+        if value is not None:
+            return len(by_value.get(value, ()))
+
+        return sum(len(items) for items in by_value.values())
+
+    def iter_property(self, name: str) -> Iterator[Tuple[ModelItem, str]]:
+        """
+        Iterates over the items having the specified property, grouped by
+        value.
+
+        :param name: the name of the property
+        :return: an Iterator over (ModelItem, value) tuples
+        """
+        for value, items in list(self.__index.get(name, {}).items()):
+            for item in list(items.values()):
+                yield item, value
+
+    def _item_added(self, item: ModelItem):
+        """Indexes the properties of an item added to the model."""
+        for name, value in item.properties.items():
+            self._property_set(item, name, value)
+
+    def _item_removed(self, item: ModelItem):
+        """Removes an item taken out of the model from the index."""
+        for name, value in item.properties.items():
+            self._property_removed(item, name, value)
+
+    def _properties_replaced(self, item: ModelItem,
+                             old: Mapping[str, str], new: Mapping[str, str]):
+        """Reindexes an item whose properties were replaced."""
+        for name, value in old.items():
+            self._property_removed(item, name, value)
+        for name, value in new.items():
+            self._property_set(item, name, value)
+
+    def _property_set(self, item: ModelItem, name: str, value: str):
+        """Indexes one property of an item."""
+        self.__index.setdefault(name, {}).setdefault(value, {})[id(item)] = \
+            item
+
+    def _property_removed(self, item: ModelItem, name: str, value: str):
+        """Removes one property of an item from the index."""
+        by_value = self.__index.get(name)
+        if by_value is None:
+            return
+
+        items = by_value.get(value)
+        if items is not None and items.pop(id(item), None) is not None and \
+                not items:
+            del by_value[value]
+            if not by_value:
+                del self.__index[name]
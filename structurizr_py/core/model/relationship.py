@@ -1,34 +1,58 @@
 from __future__ import annotations
 from typing import Set, TYPE_CHECKING
 
+from structurizr_py.core.model.element import Element
 from structurizr_py.core.model.interaction_style import InteractionStyle
 from structurizr_py.core.model.model_item import ModelItem
 from structurizr_py.core.model.tags import Tags
 
 if TYPE_CHECKING:
-    from structurizr_py.core.model.element import Element
+    from structurizr_py.core.model.model import Model
 
 
 class Relationship(ModelItem):
-    """A relationship between two elements."""
-
-    __source: Element = None
-    __source_identity: str = None
-    __destination: Element = None
-    __destination_identity: str = None
-    __description: str = None
-    __technology: str = None
-    __interaction_style: str = InteractionStyle.SYNCHRONOUS
+    """
+    A relationship between two elements.
+
+    Each relationship has a content key (see get_content_key), which is
+    computed once and recomputed only after its source, destination,
+    description or technology changed, or the canonical name of its source
+    or destination did (which is checked against the names cached by the
+    elements themselves).
+    Equality and hashing are based on it. A relationship of a model can't be
+    changed into a duplicate of another relationship of the model, as it
+    couldn't have been added as such: the change is undone and a ValueError
+    raised.
+    """
+
+    __slots__ = ("__model", "__source", "__source_identity", "__destination",
+                 "__destination_identity", "__description", "__technology",
+                 "__interaction_style", "__content_key")
 
     def __init__(self, source: Element, destination: Element, description: str,
                  technology: str, interaction_style: str):
-        super()
+        super().__init__()
 
+        self.__model = None
         self.__source = source
+        self.__source_identity = None
         self.__destination = destination
+        self.__destination_identity = None
         self.__description = description
         self.__technology = technology
         self.__interaction_style = interaction_style
+        self.__content_key = None
+
+    @property
+    def model(self) -> Model:
+        return self.__model
+
+    @model.setter
+    def model(self, model: Model):
+        self.__model = model
+
+    def _get_model(self) -> Model or None:
+        return self.model
 
     @property
     def source(self) -> Element:
@@ -36,7 +60,7 @@ class Relationship(ModelItem):
 
     @source.setter
     def source(self, source: Element):
-        self.__source = source
+        self.__change("source", source)
 
     @property
     def source_identity(self) -> str:
@@ -53,11 +77,12 @@ class Relationship(ModelItem):
 
     @destination.setter
     def destination(self, destination: Element):
-        self.__destination = destination
+        self.__change("destination", destination)
 
     @property
     def destination_identity(self) -> str:
-        return self.__destination.identity if self.__source is not None \
+        return self.__destination.identity \
+            if self.__destination is not None \
             else self.__destination_identity
 
     @destination_identity.setter
@@ -70,7 +95,7 @@ class Relationship(ModelItem):
 
     @description.setter
     def description(self, description: str):
-        self.__description = description
+        self.__change("description", description)
 
     @property
     def technology(self) -> str:
@@ -78,7 +103,7 @@ class Relationship(ModelItem):
 
     @technology.setter
     def technology(self, technology: str):
-        self.__technology = technology
+        self.__change("technology", technology)
 
     @property
     def interaction_style(self) -> str:
@@ -86,42 +111,72 @@ class Relationship(ModelItem):
 
     @interaction_style.setter
     def interaction_style(self, interaction_style: str):
-        self.__interaction_style = interaction_style
+        self.__change("interaction_style", interaction_style)
 
         if interaction_style == InteractionStyle.SYNCHRONOUS:
             self.remove_tag(Tags.ASYNCHRONOUS)
-            self.add_tags({Tags.SYNCHRONOUS})
+            self.add_tag(Tags.SYNCHRONOUS)
         else:
             self.remove_tag(Tags.SYNCHRONOUS)
-            self.add_tags({Tags.ASYNCHRONOUS})
+            self.add_tag(Tags.ASYNCHRONOUS)
+
+    def __change(self, field: str, value):
+        attribute = "_Relationship__" + field
+        old = getattr(self, attribute)
+
+        def assign(new):
+            setattr(self, attribute, new)
+            self.__content_key = None
+
+        if self.__model is None:
+            assign(value)
+        else:
+            self.__model._relationship_changing(
+                self, lambda: assign(value), lambda: assign(old))
 
     def get_required_tags(self) -> Set[str]:
         return {Tags.RELATIONSHIP}
 
+    def get_content_key(self) -> tuple:
+        """
+        Gets the key identifying the content of this relationship, which is
+        stable across models: (source canonical name, destination canonical
+        name, description, technology).
+
+        :return: the key, as a tuple
+        """
+        source = self.__source.get_canonical_name() \
+            if self.__source is not None else None
+        destination = self.__destination.get_canonical_name() \
+            if self.__destination is not None else None
+        key = self.__content_key
+        if key is None or key[0] is not source or key[1] is not destination:
+            key = self.__content_key = (source, destination,
+                                        self.__description, self.__technology)
+
+        return key
+
+    def _cached_content_key(self) -> tuple or None:
+        """
+        Gets the content key as it was last computed, i.e. the one a model
+        indexed this relationship by, even if the canonical name of its
+        source or destination has changed since.
+        """
+        return self.__content_key
+
     def __eq__(self, other: Relationship) -> bool:
         if self is other:
             return True
         if other is None or not isinstance(other, Relationship):
             return False
 
-        if self.description != other.description:
-            return False
-        if self.destination != other.destination:
-            return False
-        if self.source != other.source:
-            return False
-
-        return True
+        return self.get_content_key() == other.get_content_key()
 
     def __ne__(self, other: Relationship) -> bool:
         return not self.__eq__(other)
 
     def __hash__(self) -> int:
-        result = hash(self.source_identity)
-        result = 31 * result + hash(self.destination)
-        result = 31 * result + hash(self.description)
-
-        return result
+        return hash(self.get_content_key())
 
     def __str__(self) -> str:
         return str(self.source) + "---[" + self.description + "]--->" + \
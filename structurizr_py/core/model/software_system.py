@@ -0,0 +1,92 @@
+from __future__ import annotations
+from typing import Dict, List, Set, TYPE_CHECKING
+
+from structurizr_py.core.model.container import Container
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.tags import Tags
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.model import Model
+
+
+class SoftwareSystem(Element):
+    """
+    Represents a software system in the C4 model.
+
+    Containers are kept in a dict keyed by name, so looking them up and
+    checking the uniqueness of a new (or renamed) container's name don't scan
+    the siblings. Containers follow the software system into and out of
+    models.
+    """
+
+    __slots__ = ("__containers",)
+
+    def __init__(self, name: str = None, description: str = None):
+        """
+        :param name: the name of the software system, which may be set later
+                     (e.g. by the bulk builder)
+        :param description: the description
+        """
+        super().__init__()
+        self.__containers: Dict[str, Container] = {}
+        if name is not None:
+            self.name = name
+        self.description = description
+        self.add_tags(self.get_required_tags())
+
+    @Element.model.setter
+    def model(self, model: Model):
+        Element.model.fset(self, model)
+        for container in self.__containers.values():
+            container.model = model
+
+    def get_parent(self) -> None:
+        return None
+
+    def get_required_tags(self) -> Set[str]:
+        return {Tags.ELEMENT, Tags.SOFTWARE_SYSTEM}
+
+    @property
+    def containers(self) -> List[Container]:
+        """
+        Gets the containers of this software system.
+
+        :return: a List of Container objects
+        """
+        return list(self.__containers.values())
+
+    def add_container(self, name: str, description: str = None,
+                      technology: str = None) -> Container:
+        """
+        Adds a container, in the model of this software system.
+
+        :param name: the name of the container, unique within this software
+                     system
+        :param description: the description
+        :param technology: the technology, e.g. "Django"
+        :return: the new Container
+        """
+        if name in self.__containers:
+            raise ValueError(f"A container named '{name}' already exists in "
+                             f"'{self.name}'")
+
+        container = Container(name, self, description, technology)
+        self.__containers[name] = container
+        container.model = self.model
+
+        return container
+
+    def get_container_with_name(self, name: str) -> Container or None:
+        """
+        Gets the container with the specified name.
+
+        :param name: the name of the container
+        :return: a Container object, or None if there is no such container
+        """
+        return self.__containers.get(name)
+
+    def _container_renamed(self, container: Container, old_name: str):
+        """Called by a container of this software system once renamed."""
+        if self.__containers.get(old_name) is container:
+            del self.__containers[old_name]
+            self.__containers[container.name] = container
@@ -0,0 +1,67 @@
+from __future__ import annotations
+from typing import Dict, Iterator, TYPE_CHECKING
+
+from structurizr_py.core.model.tag_registry import DEFAULT_TAG_REGISTRY
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.model_item import ModelItem
+
+
+class TagIndex:
+    """
+    Indexes the items of a model by tag, from the bit of each tag (see
+    TagRegistry) to the items having it.
+
+    Finding the items with a tag is a dict lookup, and counting them doesn't
+    visit them. Tags are resolved when the index is queried, so a tag
+    registered after a query was built is still found. The index is kept up
+    to date by the items and the model as tags and items come and go.
+    """
+
+    def __init__(self):
+        self.__index: Dict[int, Dict[int, ModelItem]] = {}
+
+    def find(self, tag: str) -> Iterator[ModelItem]:
+        """
+        Finds the items with the specified tag.
+
+        :param tag: the tag, as a str
+        :return: an Iterator over ModelItem objects
+        """
+        items = self.__index.get(DEFAULT_TAG_REGISTRY.find(tag))
+        return iter(list(items.values())) if items else iter(())
+
+    def count(self, tag: str) -> int:
+        """
+        Counts the items with the specified tag.
+
+        :param tag: the tag, as a str
+        :return: the number of items, as an int
+        """
+        return len(self.__index.get(DEFAULT_TAG_REGISTRY.find(tag), ()))
+
+    def _item_added(self, item: ModelItem):
+        """Indexes the tags of an item added to the model."""
+        self._mask_changed(item, 0, item.tag_mask)
+
+    def _item_removed(self, item: ModelItem):
+        """Removes an item taken out of the model from the index."""
+        self._mask_changed(item, item.tag_mask, 0)
+
+    def _mask_changed(self, item: ModelItem, old: int, new: int):
+        """Reindexes an item whose tags changed from one mask to another."""
+        removed = old & ~new
+        while removed:
+            bit = removed & -removed
+            removed ^= bit
+            items = self.__index.get(bit)
+            if items is not None:
+                items.pop(id(item), None)
+                if not items:
+                    del self.__index[bit]
+
+        added = new & ~old
+        while added:
+            bit = added & -added
+            added ^= bit
+            self.__index.setdefault(bit, {})[id(item)] = item
@@ -0,0 +1,110 @@
+from threading import Lock
+from typing import Dict, Iterable, List
+
+from structurizr_py.core.model.tags import Tags
+
+
+class TagRegistry:
+    """
+    Interns tag names and assigns each of them a bit, so that the tags of a
+    model item can be stored as a single integer bitmask.
+
+    The default tags (see Tags) are registered first, so they always get the
+    lowest bits and come first in comma separated lists of tags. Registering
+    a new tag is serialized with a lock, so that threads creating items
+    concurrently never assign the same bit twice; known tags are looked up
+    without locking.
+    """
+
+    DEFAULT_TAGS = (Tags.ELEMENT, Tags.RELATIONSHIP, Tags.PERSON,
+                    Tags.SOFTWARE_SYSTEM, Tags.CONTAINER, Tags.COMPONENT,
+                    Tags.DEPLOYMENT_NODE, Tags.CONTAINER_INSTANCE,
+                    Tags.SYNCHRONOUS, Tags.ASYNCHRONOUS)
+
+    def __init__(self):
+        self.__bits: Dict[str, int] = {}
+        self.__names: List[str] = []
+        self.__csv: Dict[int, str] = {0: ""}
+        self.__lock = Lock()
+
+        for tag in self.DEFAULT_TAGS:
+            self.bit(tag)
+
+    def bit(self, tag: str) -> int:
+        """
+        Gets the bit of the specified tag, registering the tag if required.
+
+        :param tag: the tag, as a str
+        :return: an int with exactly one bit set
+        """
+        bit = self.__bits.get(tag)
+        if bit is None:
+            with self.__lock:
+                bit = self.__bits.get(tag)
+                if bit is None:
+                    bit = 1 << len(self.__names)
+                    self.__names.append(tag)
+                    self.__bits[tag] = bit
+
+        return bit
+
+    def find(self, tag: str) -> int:
+        """
+        Gets the bit of the specified tag without registering it.
+
+        :param tag: the tag, as a str
+        :return: an int with exactly one bit set, or 0 if the tag is unknown
+        """
+        return self.__bits.get(tag, 0)
+
+    def mask(self, tags: Iterable[str]) -> int:
+        """
+        Gets the bitmask representing the specified tags, registering any
+        tags which are not known yet.
+
+        :param tags: an iterable of tags (strings)
+        :return: the bitmask, as an int
+        """
+        mask = 0
+        for tag in tags:
+            mask |= self.bit(tag)
+
+        return mask
+
+    def names(self, mask: int) -> List[str]:
+        """
+        Gets the tags represented by the specified bitmask, in registration
+        order.
+
+        :param mask: a bitmask, as an int
+        :return: a List of tags (strings)
+        """
+        names = []
+        while mask:
+            lowest = mask & -mask
+            names.append(self.__names[lowest.bit_length() - 1])
+            mask ^= lowest
+
+        return names
+
+    def csv(self, mask: int) -> str:
+        """
+        Gets the comma separated list of tags represented by the specified
+        bitmask. The result is cached, so items sharing the same combination
+        of tags share the same string.
+
+        :param mask: a bitmask, as an int
+        :return: a comma separated list of tags
+        """
+        csv = self.__csv.get(mask)
+        if csv is None:
+            csv = self.__csv[mask] = ",".join(self.names(mask))
+
+        return csv
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+
+"""The registry shared by all models, so that items can move between them."""
+DEFAULT_TAG_REGISTRY = TagRegistry()
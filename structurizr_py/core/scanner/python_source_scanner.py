@@ -0,0 +1,241 @@
+import ast
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from structurizr_py.core.model.code_element import CodeElement
+
+"""(fully qualified type, category, visibility, size) of one code element"""
+Record = Tuple[str, str, str, int]
+
+
+def _visibility(name: str) -> str:
+    if name.startswith("__") and not name.endswith("__"):
+        return "private"
+    if name.startswith("_"):
+        return "package"
+    return "public"
+
+
+def _size(node: ast.AST) -> int:
+    first = min([node.lineno] +
+                [decorator.lineno for decorator in node.decorator_list])
+    return node.end_lineno - first + 1
+
+
+def parse_module(source: bytes, module: str) -> List[Record]:
+    """
+    Finds the classes, methods and functions defined in a module. Functions
+    nested inside functions are local and therefore skipped.
+
+    :param source: the source code of the module
+    :param module: the fully qualified name of the module
+    :return: a List of (type, category, visibility, size) tuples
+    """
+    records = []
+    pending = [(node, module, False) for node in
+               reversed(ast.parse(source).body)]
+    while pending:
+        node, prefix, in_class = pending.pop()
+        if isinstance(node, ast.ClassDef):
+            name = f"{prefix}.{node.name}"
+            records.append((name, "class", _visibility(node.name),
+                            _size(node)))
+            pending.extend((child, name, True)
+                           for child in reversed(node.body))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            records.append((f"{prefix}.{node.name}",
+                            "method" if in_class else "function",
+                            _visibility(node.name), _size(node)))
+
+    return records
+
+
+def _scan_file(task: Tuple[str, str, str]) \
+        -> Tuple[str, str, List[Record] or None, str or None]:
+    """
+    Hashes and parses one file in a worker process. The file isn't parsed if
+    its hash matches the cached hash.
+
+    :return: (path, hash, records or None if unchanged, error or None)
+    """
+    path, module, cached_hash = task
+    try:
+        with open(path, "rb") as file:
+            source = file.read()
+    except OSError as error:
+        return path, None, None, str(error)
+
+    digest = hashlib.sha256(source).hexdigest()
+    if digest == cached_hash:
+        return path, digest, None, None
+
+    try:
+        return path, digest, parse_module(source, module), None
+    except (SyntaxError, ValueError, RecursionError, MemoryError) as error:
+        # the parser raises RecursionError or MemoryError for sources nested
+        # too deeply
+        return path, digest, [], f"{type(error).__name__}: {error}"
+
+
+class PythonSourceScanner:
+    """
+    Scans a Python source tree and creates a CodeElement for each class,
+    method and function, with its size (number of lines, including
+    decorators), visibility (derived from leading underscores) and category.
+
+    Files are parsed with a process pool. Results are cached by file
+    modification time and content hash, so a re-scan only reads files whose
+    modification time changed, and only parses those whose content changed.
+    Parse errors are cached with the results, so files which still fail are
+    reported by every scan.
+    """
+
+    """Below this number of files to parse, files are parsed in-process"""
+    PARALLEL_THRESHOLD = 64
+
+    def __init__(self, processes: int = None):
+        """
+        :param processes: the number of worker processes, defaults to the
+                          number of CPUs; 1 disables the process pool
+        """
+        self.__processes = processes or os.cpu_count() or 1
+        self.__cache: Dict[str, list] = {}
+        self.__errors: Dict[str, str] = {}
+        self.__parsed_files = 0
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        """
+        Gets the files which couldn't be read or parsed by the last scan.
+
+        :return: a Dict of path to error message
+        """
+        return self.__errors
+
+    @property
+    def parsed_files(self) -> int:
+        """
+        Gets the number of files which were parsed by the last scan (i.e. not
+        served from the cache).
+
+        :return: the number of files, as an int
+        """
+        return self.__parsed_files
+
+    def scan(self, root: str) -> List[CodeElement]:
+        """
+        Scans all Python files below the specified directory. Module names
+        are derived from the paths relative to the directory.
+
+        :param root: the root directory of the source tree
+        :return: a List of CodeElement objects
+        """
+        files = self.__find_files(root)
+        self.__errors = {}
+
+        tasks = []
+        for path, module in files.items():
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError as error:
+                self.__errors[path] = str(error)
+                continue
+
+            cached = self.__cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                if cached[3] is not None:
+                    self.__errors[path] = cached[3]
+                continue
+            tasks.append((path, module, cached[1] if cached else None))
+            self.__cache.setdefault(path, [None, None, [], None])[0] = mtime
+
+        self.__parsed_files = 0
+        for path, digest, records, error in self.__run(tasks):
+            entry = self.__cache[path]
+            if error is not None:
+                self.__errors[path] = error
+                if digest is None:
+                    # unreadable, try again on the next scan
+                    entry[0] = None
+            elif records is None and entry[3] is not None:
+                # unchanged content, which still fails to parse
+                self.__errors[path] = entry[3]
+            entry[1] = digest
+            if records is not None:
+                entry[2] = records
+                entry[3] = error
+                self.__parsed_files += 1
+
+        for path in list(self.__cache):
+            if path not in files:
+                del self.__cache[path]
+
+        return [self.__create_code_element(record)
+                for path in files if path in self.__cache
+                for record in self.__cache[path][2]]
+
+    def load_cache(self, path: str):
+        """
+        Loads a cache previously saved with save_cache, if it exists.
+
+        :param path: the path of the cache file
+        :return: None
+        """
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                self.__cache = {source: [mtime, digest,
+                                         [tuple(r) for r in records],
+                                         error[0] if error else None]
+                                for source, (mtime, digest, records, *error)
+                                in json.load(file).items()}
+
+    def save_cache(self, path: str):
+        """
+        Saves the cache, so that another scanner can reuse it.
+
+        :param path: the path of the cache file
+        :return: None
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.__cache, file)
+
+    def __run(self, tasks: list):
+        if self.__processes == 1 or len(tasks) < self.PARALLEL_THRESHOLD:
+            return map(_scan_file, tasks)
+
+        with ProcessPoolExecutor(self.__processes) as executor:
+            chunk_size = max(1, len(tasks) // (self.__processes * 8))
+            return list(executor.map(_scan_file, tasks,
+                                     chunksize=chunk_size))
+
+    @staticmethod
+    def __find_files(root: str) -> Dict[str, str]:
+        files = {}
+        root = os.path.abspath(root)
+        for directory, directories, names in os.walk(root):
+            directories[:] = sorted(d for d in directories
+                                    if not d.startswith(".") and
+                                    d != "__pycache__")
+            relative = os.path.relpath(directory, root)
+            package = [] if relative == os.curdir else relative.split(os.sep)
+            for name in sorted(names):
+                if name.endswith(".py"):
+                    module = package if name == "__init__.py" \
+                        else package + [name[:-3]]
+                    files[os.path.join(directory, name)] = \
+                        ".".join(module) or "__init__"
+
+        return files
+
+    @staticmethod
+    def __create_code_element(record: Record) -> CodeElement:
+        fully_qualified_type, category, visibility, size = record
+        code_element = CodeElement(fully_qualified_type)
+        code_element.category = category
+        code_element.visibility = visibility
+        code_element.size = size
+
+        return code_element
@@ -0,0 +1,270 @@
+from __future__ import annotations
+import functools
+import importlib
+import inspect
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+"""The operations instrumented by default: name -> (module, class, method)"""
+DEFAULT_OPERATIONS: Dict[str, Tuple[str, str, str]] = {
+    "url.is_url": ("structurizr_py.core.util.url", "Url", "is_url"),
+    "model_item.add_tags": ("structurizr_py.core.model.model_item",
+                            "ModelItem", "add_tags"),
+    "model_item.remove_tag": ("structurizr_py.core.model.model_item",
+                              "ModelItem", "remove_tag"),
+    "element.has_afferent_relationships": (
+        "structurizr_py.core.model.element", "Element",
+        "has_afferent_relationships"),
+    "relationship.eq": ("structurizr_py.core.model.relationship",
+                        "Relationship", "__eq__"),
+    "relationship.hash": ("structurizr_py.core.model.relationship",
+                          "Relationship", "__hash__"),
+    "json.write": ("structurizr_py.core.io.json_writer", "JsonWriter",
+                   "write"),
+    "json.read": ("structurizr_py.core.io.json_reader", "JsonReader", "read"),
+    "binary.write": ("structurizr_py.core.io.binary_writer", "BinaryWriter",
+                     "write"),
+    "binary.load_all": ("structurizr_py.core.io.binary_workspace",
+                        "BinaryWorkspace", "load_all"),
+}
+
+
+class MetricsSink(ABC):
+    """
+    Receives the metrics of an Instrumentation (see Instrumentation.flush).
+    """
+
+    @abstractmethod
+    def write(self, metrics: Dict[str, Dict[str, float]]):
+        """
+        Writes metrics.
+
+        :param metrics: a dict of {operation: {"calls": int, "seconds":
+                        float}}, as returned by Instrumentation.snapshot
+        :return: None
+        """
+        pass
+
+
+class PrometheusTextFileSink(MetricsSink):
+    """
+    Writes metrics to a file in the Prometheus text exposition format, e.g.
+    for the textfile collector of the node exporter. The file is replaced
+    atomically, so the collector never reads a partial file.
+    """
+
+    def __init__(self, path: str, prefix: str = "structurizr"):
+        """
+        :param path: the path of the file, which should end with ".prom"
+        :param prefix: the prefix of the metric names
+        """
+        self.__path = path
+        self.__prefix = prefix
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def write(self, metrics: Dict[str, Dict[str, float]]):
+        prefix = self.__prefix
+        lines = [f"# HELP {prefix}_calls_total Calls of instrumented "
+                 f"operations.",
+                 f"# TYPE {prefix}_calls_total counter"]
+        lines.extend(f'{prefix}_calls_total{{operation="{name}"}} '
+                     f'{values["calls"]}'
+                     for name, values in sorted(metrics.items()))
+        lines.append(f"# HELP {prefix}_call_seconds_total Time spent in "
+                     f"instrumented operations.")
+        lines.append(f"# TYPE {prefix}_call_seconds_total counter")
+        lines.extend(f'{prefix}_call_seconds_total{{operation="{name}"}} '
+                     f'{values["seconds"]!r}'
+                     for name, values in sorted(metrics.items()))
+
+        directory = os.path.dirname(os.path.abspath(self.__path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory,
+                                                 suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as stream:
+                stream.write("\n".join(lines) + "\n")
+            os.replace(temporary, self.__path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+class Instrumentation:
+    """
+    Counts and times the calls of hot model operations (see
+    DEFAULT_OPERATIONS), such as URL validation, tag changes, relationship
+    hashing and (de)serialization.
+
+    Disabled instrumentation costs nothing: enabling it replaces the
+    instrumented methods of their classes with counting wrappers, and
+    disabling it puts the original methods back. As this changes classes,
+    only one Instrumentation can be enabled at a time. Counts and times
+    accumulate until reset, and nested calls of an operation are each
+    counted and timed.
+    """
+
+    __enabled: Instrumentation or None = None
+
+    def __init__(self):
+        self.__operations: Dict[str, Tuple[str, str, str]] = \
+            dict(DEFAULT_OPERATIONS)
+        self.__calls: Dict[str, int] = dict.fromkeys(self.__operations, 0)
+        self.__seconds: Dict[str, float] = \
+            dict.fromkeys(self.__operations, 0.0)
+        self.__originals: List[Tuple[type, str, object]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return Instrumentation.__enabled is self
+
+    def register(self, name: str, module: str, owner: str, method: str):
+        """
+        Registers another operation to instrument, e.g. a method of a custom
+        element type. Takes effect the next time the instrumentation is
+        enabled.
+
+        :param name: the name of the operation in the metrics
+        :param module: the name of the module defining the class
+        :param owner: the name of the class
+        :param method: the name of the method
+        :return: None
+        """
+        self.__operations[name] = (module, owner, method)
+        self.__calls.setdefault(name, 0)
+        self.__seconds.setdefault(name, 0.0)
+
+    def enable(self):
+        """
+        Starts counting and timing the instrumented operations.
+
+        :return: None
+        """
+        if self.enabled:
+            return
+        if Instrumentation.__enabled is not None:
+            raise ValueError("Another instrumentation is already enabled")
+
+        Instrumentation.__enabled = self
+        try:
+            for name, (module, owner, method) in self.__operations.items():
+                cls = getattr(importlib.import_module(module), owner)
+                wrapper = self.__wrap(name,
+                                      inspect.getattr_static(cls, method))
+                self.__originals.append((cls, method,
+                                         vars(cls).get(method)))
+                setattr(cls, method, wrapper)
+        except (ImportError, AttributeError):
+            self.disable()
+            raise
+
+    def disable(self):
+        """
+        Stops counting and timing, restoring the original methods. The
+        metrics are kept.
+
+        :return: None
+        """
+        if not self.enabled:
+            return
+
+        for cls, method, original in reversed(self.__originals):
+            if original is not None:
+                setattr(cls, method, original)
+            else:
+                delattr(cls, method)
+        self.__originals = []
+        Instrumentation.__enabled = None
+
+    def reset(self):
+        """
+        Sets all counts and times back to zero.
+
+        :return: None
+        """
+        for name in self.__calls:
+            self.__calls[name] = 0
+            self.__seconds[name] = 0.0
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Gets the metrics collected so far.
+
+        :return: a dict of {operation: {"calls": int, "seconds": float}}
+        """
+        return {name: {"calls": calls, "seconds": self.__seconds[name]}
+                for name, calls in self.__calls.items()}
+
+    def flush(self, sink: MetricsSink):
+        """
+        Writes the metrics collected so far to a sink.
+
+        :param sink: a MetricsSink object
+        :return: None
+        """
+        sink.write(self.snapshot())
+
+    @contextmanager
+    def profile(self, sink: MetricsSink = None) \
+            -> Iterator[Dict[str, Dict[str, float]]]:
+        """
+        Profiles a block of code, e.g. one model build, enabling the
+        instrumentation for its duration if it isn't enabled yet.
+
+            with DEFAULT_INSTRUMENTATION.profile() as metrics:
+                build_model()
+            print(metrics["url.is_url"]["calls"])
+
+        :param sink: a MetricsSink to write the metrics of the block to, or
+                     None
+        :return: a context manager giving a dict which is filled with the
+                 metrics of the block (see snapshot) when it exits
+        """
+        was_enabled = self.enabled
+        self.enable()
+        before = self.snapshot()
+        metrics: Dict[str, Dict[str, float]] = {}
+        try:
+            yield metrics
+        finally:
+            after = self.snapshot()
+            if not was_enabled:
+                self.disable()
+            for name, values in after.items():
+                previous = before.get(name, {"calls": 0, "seconds": 0.0})
+                metrics[name] = {
+                    "calls": values["calls"] - previous["calls"],
+                    "seconds": values["seconds"] - previous["seconds"]}
+            if sink is not None:
+                sink.write(metrics)
+
+    def __wrap(self, name: str, method) -> object:
+        if isinstance(method, (staticmethod, classmethod)):
+            return type(method)(self.__wrap_function(name, method.__func__))
+
+        return self.__wrap_function(name, method)
+
+    def __wrap_function(self, name: str, function: Callable) -> Callable:
+        calls = self.__calls
+        seconds = self.__seconds
+        clock = time.perf_counter
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                seconds[name] += clock() - start
+                calls[name] += 1
+
+        return wrapper
+
+
+DEFAULT_INSTRUMENTATION = Instrumentation()
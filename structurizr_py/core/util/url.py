@@ -1,5 +1,25 @@
+import re
+from functools import lru_cache
+from typing import Iterable, List
 from urllib.parse import urlparse
 
+"""
+Matches the common http(s)://host/... shape. Anything it matches has a scheme
+and a network location, so it is valid without a full parse.
+"""
+_HTTP_URL = re.compile(r"https?://[A-Za-z0-9._~%!$&'()*+,;=:@-]+(?:[/?#]|\Z)")
+
+
+"""The maximum number of URLs whose full parse result is cached"""
+_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_is_url(url: str) -> bool:
+    parsed = urlparse(url)
+    return True if len(parsed.scheme) > 0 and len(parsed.netloc) > 0\
+        else False
+
 
 class Url:
     """
@@ -9,11 +29,42 @@ class Url:
     @staticmethod
     def is_url(url: str) -> bool:
         """
-        Determines whether the supplied string is a valid URL.
+        Determines whether the supplied string is a valid URL. URLs of the
+        form http(s)://host/... are accepted without parsing them, and the
+        results of full parses are kept in a bounded LRU cache.
 
         :param url: str
         :return: True if the URL is valid, False otherwise
         """
-        parsed = urlparse(url)
-        return True if len(parsed.scheme) > 0 and len(parsed.netloc) > 0\
-            else False
+        if url is not None and _HTTP_URL.match(url) is not None:
+            return True
+
+        return _parse_is_url(url)
+
+    @staticmethod
+    def validate_many(urls: Iterable[str]) -> List[bool]:
+        """
+        Determines for each of the supplied strings whether it is a valid URL,
+        validating each distinct string only once.
+
+        :param urls: an iterable of str
+        :return: a List of bool, in the same order as the input
+        """
+        results = {}
+        validated = []
+        for url in urls:
+            result = results.get(url)
+            if result is None:
+                result = results[url] = Url.is_url(url)
+            validated.append(result)
+
+        return validated
+
+    @staticmethod
+    def clear_cache():
+        """
+        Clears the cache of full parse results.
+
+        :return: None
+        """
+        _parse_is_url.cache_clear()
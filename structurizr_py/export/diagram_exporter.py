@@ -0,0 +1,152 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Set, TextIO, TYPE_CHECKING
+
+from structurizr_py.export.export_graph import ExportEdge, ExportGraph, \
+    ExportNode
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.element import Element
+    from structurizr_py.core.model.model import Model
+
+
+class DiagramExporter(ABC):
+    """
+    The base class of the exporters writing a model as a diagram definition
+    (PlantUML, Mermaid or Graphviz DOT).
+
+    Diagrams are streamed to a text stream one fragment at a time. Elements
+    with children in the diagram are written as boundaries around them. The
+    fragment of every element and relationship is cached, keyed by the values
+    it is rendered from, so exporting the same elements to many diagrams only
+    renders each of them once, and an element is only rendered again after
+    it has changed. The cache is emptied when it grows beyond cache_size
+    fragments.
+    """
+
+    """The default maximum number of cached fragments"""
+    DEFAULT_CACHE_SIZE = 1000000
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        :param cache_size: the maximum number of cached fragments
+        """
+        self.__cache_size = cache_size
+        self.__fragments: Dict[tuple, str] = {}
+
+    def export(self, model: Model, stream: TextIO, title: str = None,
+               elements: Iterable[Element] = None):
+        """
+        Writes a diagram of a model to a text stream.
+
+        :param model: a Model object
+        :param stream: a writable text stream
+        :param title: the title of the diagram
+        :param elements: the elements to include, or None for all elements of
+                         the model
+        :return: None
+        """
+        self.write(ExportGraph.from_model(model, elements), stream, title)
+
+    def write(self, graph: ExportGraph, stream: TextIO, title: str = None):
+        """
+        Writes a diagram of an export graph to a text stream.
+
+        :param graph: an ExportGraph object
+        :param stream: a writable text stream
+        :param title: the title of the diagram
+        :return: None
+        """
+        fragments = self.__fragments
+        if len(fragments) > self.__cache_size:
+            fragments.clear()
+
+        write = stream.write
+        write(self._header(title))
+
+        groups: Set[str] = set()
+        # (node, depth, whether its children were written) entries
+        pending = [(node, 0, False)
+                   for node in reversed(graph.get_children(None))]
+        while pending:
+            node, depth, closing = pending.pop()
+            if closing:
+                write(self._group_footer(node, depth))
+                continue
+
+            children = graph.get_children(node.alias)
+            if not children:
+                key = (node, depth)
+                fragment = fragments.get(key)
+                if fragment is None:
+                    fragment = fragments[key] = self._node(node, depth)
+                write(fragment)
+                continue
+
+            groups.add(node.alias)
+            key = (node, depth, True)
+            fragment = fragments.get(key)
+            if fragment is None:
+                fragment = fragments[key] = self._group_header(node, depth)
+            write(fragment)
+            pending.append((node, depth, True))
+            pending.extend((child, depth + 1, False)
+                           for child in reversed(children))
+
+        for edge in graph.edges:
+            key = (edge, edge.source in groups, edge.destination in groups)
+            fragment = fragments.get(key)
+            if fragment is None:
+                fragment = fragments[key] = self._edge(edge, key[1], key[2])
+            write(fragment)
+
+        write(self._footer())
+
+    def clear_cache(self):
+        """
+        Discards all cached fragments.
+
+        :return: None
+        """
+        self.__fragments.clear()
+
+    @abstractmethod
+    def _header(self, title: str or None) -> str:
+        """Renders the start of a diagram."""
+        pass
+
+    @abstractmethod
+    def _footer(self) -> str:
+        """Renders the end of a diagram."""
+        pass
+
+    @abstractmethod
+    def _node(self, node: ExportNode, depth: int) -> str:
+        """Renders an element without children, nested depth levels deep."""
+        pass
+
+    @abstractmethod
+    def _group_header(self, node: ExportNode, depth: int) -> str:
+        """Renders the start of the boundary of an element with children."""
+        pass
+
+    @abstractmethod
+    def _group_footer(self, node: ExportNode, depth: int) -> str:
+        """Renders the end of the boundary of an element with children."""
+        pass
+
+    @abstractmethod
+    def _edge(self, edge: ExportEdge, source_is_group: bool,
+              destination_is_group: bool) -> str:
+        """Renders a relationship."""
+        pass
+
+    def __getstate__(self) -> dict:
+        # the cache isn't worth sending to the processes of export_views
+        state = self.__dict__.copy()
+        state["_DiagramExporter__fragments"] = {}
+        return state
+
+    @staticmethod
+    def _indent(depth: int) -> str:
+        return "  " * depth
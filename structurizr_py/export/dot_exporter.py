@@ -0,0 +1,73 @@
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.export.diagram_exporter import DiagramExporter
+from structurizr_py.export.export_graph import ExportEdge, ExportNode
+
+
+class DotExporter(DiagramExporter):
+    """
+    Exports models as Graphviz DOT digraphs, with elements with children as
+    clusters, and asynchronous relationships dashed.
+
+    Graphviz can't connect edges to clusters, so every cluster holds an
+    invisible anchor node named after its element, and the edges to and from
+    it are clipped at the boundary of the cluster (with compound=true).
+    """
+
+    def _header(self, title: str or None) -> str:
+        header = "digraph {\n" if title is None \
+            else f"digraph \"{_quote(title)}\" {{\n" \
+                 f"  label=\"{_quote(title)}\"\n  labelloc=t\n"
+
+        return header + "  compound=true\n" \
+                        "  node [shape=box, style=rounded]\n"
+
+    def _footer(self) -> str:
+        return "}\n"
+
+    def _node(self, node: ExportNode, depth: int) -> str:
+        return f"{self._indent(depth + 1)}{node.alias} " \
+               f"[label=\"{_label(node)}\"]\n"
+
+    def _group_header(self, node: ExportNode, depth: int) -> str:
+        indent = self._indent(depth + 1)
+        return f"{indent}subgraph cluster_{node.alias} {{\n" \
+               f"{indent}  label=\"{_label(node)}\"\n" \
+               f"{indent}  {node.alias} " \
+               f"[shape=point, style=invis, width=0, height=0]\n"
+
+    def _group_footer(self, node: ExportNode, depth: int) -> str:
+        return f"{self._indent(depth + 1)}}}\n"
+
+    def _edge(self, edge: ExportEdge, source_is_group: bool,
+              destination_is_group: bool) -> str:
+        label = _quote(edge.description or "")
+        if edge.technology:
+            label += f"\\n[{_quote(edge.technology)}]"
+
+        attributes = [f"label=\"{label}\""]
+        if edge.interaction_style == InteractionStyle.ASYNCHRONOUS:
+            attributes.append("style=dashed")
+        if source_is_group:
+            attributes.append(f"ltail=cluster_{edge.source}")
+        if destination_is_group:
+            attributes.append(f"lhead=cluster_{edge.destination}")
+
+        return f"  {edge.source} -> {edge.destination} " \
+               f"[{', '.join(attributes)}]\n"
+
+
+def _label(node: ExportNode) -> str:
+    label = f"{_quote(node.name or '')}\\n[{_quote(node.kind)}"
+    if node.technology:
+        label += f": {_quote(node.technology)}"
+    label += "]"
+    if node.description:
+        label += f"\\n\\n{_quote(node.description)}"
+
+    return label
+
+
+def _quote(text: str) -> str:
+    """Makes text safe to use in a double-quoted DOT string."""
+    return text.replace("\\", "\\\\").replace('"', '\\"') \
+        .replace("\r", "").replace("\n", "\\n")
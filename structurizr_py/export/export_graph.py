@@ -0,0 +1,165 @@
+from __future__ import annotations
+from functools import partial
+from typing import Dict, Iterable, List, NamedTuple, Set, TYPE_CHECKING
+
+from structurizr_py.core.io.json_format import JsonFormat
+from structurizr_py.core.model.tags import Tags
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.element import Element
+    from structurizr_py.core.model.model import Model
+
+
+class ExportNode(NamedTuple):
+    """
+    The values of an element which are rendered in diagrams. As a tuple of
+    strings it is cheap to pickle, and it doubles as the key of the element's
+    cached fragment: the fragment is rendered again whenever a value changes.
+    """
+    alias: str
+    parent: str or None
+    kind: str
+    name: str
+    description: str or None
+    technology: str or None
+    tags: str
+
+
+class ExportEdge(NamedTuple):
+    """The values of a relationship which are rendered in diagrams."""
+    source: str
+    destination: str
+    description: str or None
+    technology: str or None
+    interaction_style: str or None
+    tags: str
+
+
+class ExportGraph:
+    """
+    The elements and relationships of a model (or of a part of it), reduced
+    to the plain values which the diagram exporters render. Elements are
+    nested in their parent (see Element.get_parent) when the parent is part
+    of the graph, and at the top level otherwise.
+
+    Graphs only hold tuples of strings, so they can be sent to other
+    processes to render several views in parallel (see export_views).
+    """
+
+    def __init__(self, nodes: List[ExportNode], edges: List[ExportEdge]):
+        """
+        :param nodes: the nodes
+        :param edges: the edges between the nodes
+        """
+        self.__nodes = nodes
+        self.__edges = edges
+        self.__children: Dict[str or None, List[ExportNode]] or None = None
+
+    @staticmethod
+    def from_model(model: Model,
+                   elements: Iterable[Element] = None) -> ExportGraph:
+        """
+        Creates the graph of a model.
+
+        :param model: a Model object
+        :param elements: the elements to include, or None for all elements of
+                         the model
+        :return: an ExportGraph object
+        """
+        if elements is None:
+            elements = model.iter_elements()
+        elements = list(elements)
+        aliases = {id(element): ExportGraph.alias_of(element)
+                   for element in elements}
+
+        nodes = []
+        for element in elements:
+            parent = element.get_parent()
+            nodes.append(_new_node((
+                aliases[id(element)],
+                aliases.get(id(parent)) if parent is not None else None,
+                _kind_of(element), element.name, element.description,
+                getattr(element, "technology", None), element.tags)))
+
+        edges = []
+        for element in elements:
+            source = aliases[id(element)]
+            for relationship in model.get_efferent_relationships(element):
+                destination = aliases.get(id(relationship.destination))
+                if destination is not None:
+                    edges.append(_new_edge((
+                        source, destination, relationship.description,
+                        relationship.technology,
+                        relationship.interaction_style, relationship.tags)))
+
+        return ExportGraph(nodes, edges)
+
+    @staticmethod
+    def alias_of(element: Element) -> str:
+        """
+        Gets the alias of an element in diagrams: its identity, with every
+        character other than ASCII letters and digits escaped, so that the
+        aliases of distinct identities never collide.
+
+        :param element: an Element object
+        :return: the alias, as a str
+        """
+        identity = element.identity
+        if not identity:
+            return f"x{id(element)}"
+        if identity.isascii() and identity.isalnum():
+            return "e" + identity
+
+        return "e" + "".join(
+            c if c.isascii() and c.isalnum() else f"_{ord(c):x}_"
+            for c in identity)
+
+    @property
+    def nodes(self) -> List[ExportNode]:
+        return self.__nodes
+
+    @property
+    def edges(self) -> List[ExportEdge]:
+        return self.__edges
+
+    def get_children(self, alias: str or None) -> List[ExportNode]:
+        """
+        Gets the nodes nested in the specified node.
+
+        :param alias: the alias of a node, or None for the top level nodes
+        :return: a List of ExportNode objects
+        """
+        if self.__children is None:
+            known = {node.alias for node in self.__nodes}
+            self.__children = {}
+            for node in self.__nodes:
+                parent = node.parent if node.parent in known else None
+                self.__children.setdefault(parent, []).append(node)
+
+        return self.__children.get(alias, [])
+
+    def subset(self, aliases: Set[str]) -> ExportGraph:
+        """
+        Gets the part of this graph made of the specified nodes and the edges
+        between them.
+
+        :param aliases: the aliases of the nodes to keep
+        :return: an ExportGraph object
+        """
+        return ExportGraph(
+            [node for node in self.__nodes if node.alias in aliases],
+            [edge for edge in self.__edges
+             if edge.source in aliases and edge.destination in aliases])
+
+
+# create the tuples without the argument handling of their constructors
+_new_node = partial(tuple.__new__, ExportNode)
+_new_edge = partial(tuple.__new__, ExportEdge)
+
+
+def _kind_of(element: Element) -> str:
+    try:
+        return JsonFormat.kind_of(element)
+    except ValueError:
+        return Tags.ELEMENT
+
@@ -0,0 +1,109 @@
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import FrozenSet, Iterable, List, Tuple, TYPE_CHECKING
+
+from structurizr_py.export.export_graph import ExportGraph
+
+if TYPE_CHECKING:
+    from structurizr_py.core.model.element import Element
+    from structurizr_py.core.model.model import Model
+    from structurizr_py.export.diagram_exporter import DiagramExporter
+
+
+class ExportView:
+    """
+    A diagram to export: a file and the elements of the model shown in it.
+    """
+
+    def __init__(self, path: str, elements: Iterable[Element] = None,
+                 title: str = None):
+        """
+        :param path: the path of the file to write the diagram to
+        :param elements: the elements to show, or None for all elements of
+                         the model
+        :param title: the title of the diagram
+        """
+        self.__path = path
+        self.__elements = list(elements) if elements is not None else None
+        self.__title = title
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def elements(self) -> List[Element] or None:
+        return self.__elements
+
+    @property
+    def title(self) -> str:
+        return self.__title
+
+
+"""(path, aliases of the elements or None, title) of a view to export"""
+_Task = Tuple[str, FrozenSet[str] or None, str or None]
+
+"""The exporter and graph of a worker process of export_views"""
+_worker_state: Tuple[DiagramExporter, ExportGraph] or None = None
+
+
+def export_views(exporter: DiagramExporter, model: Model,
+                 views: Iterable[ExportView],
+                 max_workers: int = None) -> List[str]:
+    """
+    Exports many views of a model to files, in parallel in a pool of
+    processes.
+
+    The model is reduced to an ExportGraph once, which is sent to each
+    worker process when it starts; the views are then handed out in chunks,
+    and each worker renders them with its own copy of the exporter (and its
+    own fragment cache). With max_workers=1 the views are exported in this
+    process, reusing the cache of the exporter.
+
+    :param exporter: the DiagramExporter to use, e.g. a PlantUmlExporter
+    :param model: a Model object
+    :param views: the ExportView objects to export
+    :param max_workers: the number of processes, by default the number of
+                        processors
+    :return: the paths of the written files, in the order of the views
+    """
+    graph = ExportGraph.from_model(model)
+    tasks: List[_Task] = [
+        (view.path,
+         frozenset(ExportGraph.alias_of(element) for element in view.elements)
+         if view.elements is not None else None,
+         view.title)
+        for view in views]
+
+    if max_workers == 1 or len(tasks) < 2:
+        return [_export(exporter, graph, task) for task in tasks]
+
+    workers = max_workers or os.cpu_count() or 1
+    chunk_size = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(workers, initializer=_initialize_worker,
+                             initargs=(exporter, graph)) as executor:
+        return list(executor.map(_export_in_worker, tasks,
+                                 chunksize=chunk_size))
+
+
+def _initialize_worker(exporter: DiagramExporter, graph: ExportGraph):
+    global _worker_state
+    _worker_state = (exporter, graph)
+
+
+def _export_in_worker(task: _Task) -> str:
+    exporter, graph = _worker_state
+    return _export(exporter, graph, task)
+
+
+def _export(exporter: DiagramExporter, graph: ExportGraph,
+            task: _Task) -> str:
+    path, aliases, title = task
+    if aliases is not None:
+        graph = graph.subset(aliases)
+
+    with open(path, "w", encoding="utf-8", newline="\n") as stream:
+        exporter.write(graph, stream, title)
+
+    return path
@@ -0,0 +1,66 @@
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.export.diagram_exporter import DiagramExporter
+from structurizr_py.export.export_graph import ExportEdge, ExportNode
+
+
+class MermaidExporter(DiagramExporter):
+    """
+    Exports models as Mermaid flowcharts, with elements with children as
+    subgraphs, and asynchronous relationships dotted.
+    """
+
+    def __init__(self, direction: str = "TB",
+                 cache_size: int = DiagramExporter.DEFAULT_CACHE_SIZE):
+        """
+        :param direction: the direction of the flowchart, e.g. "TB" or "LR"
+        :param cache_size: the maximum number of cached fragments
+        """
+        super().__init__(cache_size)
+        self.__direction = direction
+
+    def _header(self, title: str or None) -> str:
+        flowchart = f"flowchart {self.__direction}\n"
+        if title is None:
+            return flowchart
+
+        return f"---\ntitle: {_quote(title)}\n---\n{flowchart}"
+
+    def _footer(self) -> str:
+        return ""
+
+    def _node(self, node: ExportNode, depth: int) -> str:
+        kind = _quote(node.kind)
+        if node.technology:
+            kind += f": {_quote(node.technology)}"
+        label = f"<b>{_quote(node.name or '')}</b><br>[{kind}]"
+        if node.description:
+            label += f"<br><br>{_quote(node.description)}"
+
+        return f"{self._indent(depth + 1)}{node.alias}[\"{label}\"]\n"
+
+    def _group_header(self, node: ExportNode, depth: int) -> str:
+        return f"{self._indent(depth + 1)}subgraph {node.alias}" \
+               f"[\"{_quote(node.name or '')}\"]\n"
+
+    def _group_footer(self, node: ExportNode, depth: int) -> str:
+        return f"{self._indent(depth + 1)}end\n"
+
+    def _edge(self, edge: ExportEdge, source_is_group: bool,
+              destination_is_group: bool) -> str:
+        arrow = "-.->" \
+            if edge.interaction_style == InteractionStyle.ASYNCHRONOUS \
+            else "-->"
+        label = _quote(edge.description or "")
+        if edge.technology:
+            label += f"<br>[{_quote(edge.technology)}]"
+        if not label:
+            return f"  {edge.source} {arrow} {edge.destination}\n"
+
+        return f"  {edge.source} {arrow}|\"{label}\"| {edge.destination}\n"
+
+
+def _quote(text: str) -> str:
+    """Makes text safe to use in a double-quoted Mermaid label."""
+    return text.replace("#", "#35;").replace('"', "#quot;") \
+        .replace("<", "#lt;").replace(">", "#gt;").replace("\r", "") \
+        .replace("\n", "<br>")
@@ -0,0 +1,57 @@
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.export.diagram_exporter import DiagramExporter
+from structurizr_py.export.export_graph import ExportEdge, ExportNode
+
+
+class PlantUmlExporter(DiagramExporter):
+    """
+    Exports models as PlantUML diagrams, with an element as a rectangle
+    stereotyped with its kind, and asynchronous relationships dotted.
+    """
+
+    def _header(self, title: str or None) -> str:
+        if title is None:
+            return "@startuml\n"
+
+        return f"@startuml\ntitle {_quote(title)}\n\n"
+
+    def _footer(self) -> str:
+        return "@enduml\n"
+
+    def _node(self, node: ExportNode, depth: int) -> str:
+        return self.__rectangle(node, depth, "\n")
+
+    def _group_header(self, node: ExportNode, depth: int) -> str:
+        return self.__rectangle(node, depth, " {\n")
+
+    def _group_footer(self, node: ExportNode, depth: int) -> str:
+        return self._indent(depth) + "}\n"
+
+    def _edge(self, edge: ExportEdge, source_is_group: bool,
+              destination_is_group: bool) -> str:
+        arrow = "..>" \
+            if edge.interaction_style == InteractionStyle.ASYNCHRONOUS \
+            else "-->"
+        label = _quote(edge.description or "")
+        if edge.technology:
+            label += f"\\n<size:8>[{_quote(edge.technology)}]</size>"
+
+        return f"{edge.source} {arrow} {edge.destination} : \"{label}\"\n"
+
+    @staticmethod
+    def __rectangle(node: ExportNode, depth: int, end: str) -> str:
+        kind = _quote(node.kind)
+        label = f"=={_quote(node.name or '')}\\n<size:10>[{kind}"
+        if node.technology:
+            label += f": {_quote(node.technology)}"
+        label += "]</size>"
+        if node.description:
+            label += f"\\n\\n{_quote(node.description)}"
+
+        return f"{DiagramExporter._indent(depth)}rectangle \"{label}\" " \
+               f"<<{kind}>> as {node.alias}{end}"
+
+
+def _quote(text: str) -> str:
+    """Makes text safe to use in a double-quoted PlantUML string."""
+    return text.replace('"', "'").replace("\r", "").replace("\n", "\\n")
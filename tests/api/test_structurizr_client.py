@@ -0,0 +1,205 @@
+import asyncio
+import hashlib
+import json
+import unittest
+import zlib
+from base64 import b64decode
+
+from structurizr_py.api.hmac_signer import HmacSigner
+from structurizr_py.api.structurizr_client import StructurizrClient
+from structurizr_py.api.structurizr_client_error import \
+    StructurizrClientError
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.software_system import SoftwareSystem
+
+API_KEY = "key"
+API_SECRET = "secret"
+
+
+class StandInServer:
+    """
+    A local stand-in for the Structurizr API, checking signatures and
+    honouring ETags and "Expect: 100-continue".
+    """
+
+    def __init__(self):
+        self.signer = HmacSigner(API_KEY, API_SECRET)
+        self.workspaces = {}
+        self.connections = 0
+        self.bodies_received = 0
+        self.server = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/api"
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode().split(" ")
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode().strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(":")
+                    headers[name.lower()] = value.strip()
+                await self.respond(method, path, headers, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, method, path, headers, reader, writer):
+        workspace_id = int(path.rsplit("/", 1)[1])
+        stored = self.workspaces.get(workspace_id)
+
+        if method == "PUT":
+            if stored is not None and \
+                    headers.get("if-none-match") == stored[1]:
+                # the body hasn't been sent yet, so close the connection
+                self.send(writer, 412, {"Connection": "close"}, b"")
+                raise ConnectionError()
+            writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            body = await reader.readexactly(int(headers["content-length"]))
+            self.bodies_received += 1
+            if headers.get("content-encoding") == "gzip":
+                body = zlib.decompress(body, wbits=31)
+            content_md5 = hashlib.md5(body).hexdigest()
+            content_type = headers.get("content-type", "")
+        else:
+            content_md5 = hashlib.md5(b"").hexdigest()
+            content_type = ""
+
+        if not self.authorized(method, path, headers, content_md5,
+                               content_type):
+            self.send(writer, 401, {}, b"Unauthorized")
+            return
+
+        if method == "PUT":
+            etag = '"' + content_md5 + '"'
+            self.workspaces[workspace_id] = (body, etag)
+            self.send(writer, 200, {"ETag": etag}, b"OK")
+        elif stored is None:
+            self.send(writer, 404, {}, b"Not found")
+        elif headers.get("if-none-match") == stored[1]:
+            self.send(writer, 304, {"ETag": stored[1]}, b"")
+        else:
+            self.send(writer, 200, {"ETag": stored[1],
+                                    "Content-Encoding": "gzip"},
+                      zlib.compress(stored[0], wbits=31))
+
+    def authorized(self, method, path, headers, content_md5, content_type):
+        api_key, _, signature = headers["x-authorization"].partition(":")
+        expected = self.signer.signature(method, path, content_md5,
+                                         content_type, headers["nonce"])
+        return api_key == API_KEY and \
+            b64decode(signature).decode() == expected and \
+            b64decode(headers["content-md5"]).decode() == content_md5
+
+    @staticmethod
+    def send(writer, status, headers, body):
+        lines = [f"HTTP/1.1 {status} Status",
+                 f"Content-Length: {len(body)}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+
+
+class TestStructurizrClient(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = StandInServer()
+        url = await self.server.start()
+        self.client = StructurizrClient(API_KEY, API_SECRET, url,
+                                        max_connections=4)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.stop()
+
+    @staticmethod
+    def model(*names) -> Model:
+        model = Model()
+        for name in names:
+            model.add_element(SoftwareSystem(name))
+        return model
+
+    async def test_put_and_get_workspace(self):
+        self.assertTrue(await self.client.put_workspace(
+            1, self.model("A", "B"), name="Workspace"))
+
+        stored = json.loads(self.server.workspaces[1][0])
+        self.assertEqual("Workspace", stored["name"])
+
+        other = StructurizrClient(API_KEY, API_SECRET,
+                                  await self.server_url())
+        try:
+            model = await other.get_workspace(1)
+            self.assertEqual({"A", "B"}, {e.name for e in model.elements})
+            self.assertEqual(self.server.workspaces[1][1],
+                             other.get_etag(1))
+            self.assertIsNone(await other.get_workspace(1))
+        finally:
+            await other.close()
+
+    async def test_unchanged_workspace_is_not_sent_again(self):
+        self.assertTrue(await self.client.put_workspace(1, self.model("A")))
+        self.assertFalse(await self.client.put_workspace(1, self.model("A")))
+        self.assertEqual(1, self.server.bodies_received)
+
+        self.assertTrue(await self.client.put_workspace(1, self.model("B")))
+        self.assertEqual(2, self.server.bodies_received)
+
+    async def test_server_rejects_unchanged_workspace_before_the_body(self):
+        await self.client.put_workspace(1, self.model("A"))
+
+        other = StructurizrClient(API_KEY, API_SECRET,
+                                  await self.server_url())
+        try:
+            self.assertFalse(await other.put_workspace(1, self.model("A")))
+        finally:
+            await other.close()
+        self.assertEqual(1, self.server.bodies_received)
+
+    async def test_put_workspaces_concurrently_over_the_pool(self):
+        workspaces = {workspace_id: self.model(f"System {workspace_id}")
+                      for workspace_id in range(1, 41)}
+        results = await self.client.put_workspaces(workspaces)
+
+        self.assertEqual({workspace_id: True for workspace_id in workspaces},
+                         results)
+        self.assertEqual(40, len(self.server.workspaces))
+        self.assertLessEqual(self.client.connections_opened, 4)
+
+    async def test_wrong_secret_is_rejected(self):
+        client = StructurizrClient(API_KEY, "wrong", await self.server_url())
+        try:
+            with self.assertRaises(StructurizrClientError) as context:
+                await client.put_workspace(1, self.model("A"))
+            self.assertEqual(401, context.exception.status)
+        finally:
+            await client.close()
+
+    async def test_missing_workspace(self):
+        with self.assertRaises(StructurizrClientError) as context:
+            await self.client.get_workspace(7)
+        self.assertEqual(404, context.exception.status)
+
+    def test_requires_api_key_and_secret(self):
+        with self.assertRaises(ValueError):
+            StructurizrClient("", API_SECRET)
+        with self.assertRaises(ValueError):
+            StructurizrClient(API_KEY, " ")
+
+    async def server_url(self) -> str:
+        host, port = self.server.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/api"
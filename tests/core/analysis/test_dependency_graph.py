@@ -0,0 +1,152 @@
+import unittest
+
+from structurizr_py.core.analysis.dependency_graph import DependencyGraph
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from tests.fixtures import SimpleElement
+
+
+class TestDependencyGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.elements = {}
+        for name in "ABCDE":
+            element = SimpleElement(name)
+            element.model = self.model
+            self.elements[name] = element
+        self.graph = self.model.get_dependency_graph()
+
+    def relate(self, *pairs):
+        relationships = []
+        for pair in pairs:
+            relationship = Relationship(
+                self.elements[pair[0]], self.elements[pair[1]], "Uses", None,
+                InteractionStyle.SYNCHRONOUS)
+            self.model.add_relationship(relationship)
+            relationships.append(relationship)
+        return relationships
+
+    def names(self, elements):
+        return sorted(element.name for element in elements)
+
+    def test_model_returns_the_same_graph(self):
+        self.assertIs(self.graph, self.model.get_dependency_graph())
+        self.assertIsInstance(self.graph, DependencyGraph)
+
+    def test_reachable_from(self):
+        self.relate("AB", "BC", "CD")
+        self.assertEqual(["B", "C", "D"],
+                         self.names(self.graph.reachable_from(
+                             self.elements["A"])))
+        self.assertEqual([], self.names(self.graph.reachable_from(
+            self.elements["D"])))
+        self.assertTrue(self.graph.reaches(self.elements["A"],
+                                           self.elements["D"]))
+        self.assertFalse(self.graph.reaches(self.elements["D"],
+                                            self.elements["A"]))
+
+    def test_element_reaches_itself_only_through_a_cycle(self):
+        self.relate("AB", "BA", "BC")
+        self.assertEqual(["A", "B", "C"], self.names(
+            self.graph.reachable_from(self.elements["A"])))
+        self.assertTrue(self.graph.reaches(self.elements["A"],
+                                           self.elements["A"]))
+        self.assertFalse(self.graph.reaches(self.elements["C"],
+                                            self.elements["C"]))
+
+    def test_reaches_with_and_without_the_closure(self):
+        self.relate("AB", "BC", "CB", "DE", "EE")
+        pairs = [(source, destination) for source in "ABCDE"
+                 for destination in "ABCDE"]
+        searched = [self.graph.reaches(self.elements[source],
+                                       self.elements[destination])
+                    for source, destination in pairs]
+        self.graph.transitive_closure()
+
+        self.assertEqual(searched,
+                         [self.graph.reaches(self.elements[source],
+                                             self.elements[destination])
+                          for source, destination in pairs])
+        self.assertEqual(8, sum(searched))
+
+    def test_transitive_closure_matches_reachable_from(self):
+        self.relate("AB", "BC", "CB", "DE", "EE")
+        closure = self.graph.transitive_closure()
+        for element in self.elements.values():
+            self.assertEqual(self.graph.reachable_from(element),
+                             closure[element])
+
+    def test_cycles(self):
+        self.relate("AB", "BC", "CA", "CD", "EE")
+        cycles = sorted(self.names(cycle) for cycle in self.graph.cycles())
+        self.assertEqual([["A", "B", "C"], ["E"]], cycles)
+        self.assertTrue(self.graph.has_cycles())
+
+    def test_components_come_after_their_dependencies(self):
+        self.relate("AB", "BC", "CB", "CD")
+        components = self.graph.strongly_connected_components()
+        position = {element.name: index
+                    for index, component in enumerate(components)
+                    for element in component}
+        self.assertEqual(position["B"], position["C"])
+        self.assertLess(position["D"], position["C"])
+        self.assertLess(position["C"], position["A"])
+
+    def test_layers(self):
+        self.relate("AB", "AC", "BD", "CD")
+        layers = [self.names(layer) for layer in self.graph.layers()]
+        self.assertEqual([["D", "E"], ["B", "C"], ["A"]], layers)
+
+    def test_cyclic_elements_share_a_layer(self):
+        self.relate("AB", "BA", "BC")
+        layers = [self.names(layer) for layer in self.graph.layers()]
+        self.assertEqual([["C", "D", "E"], ["A", "B"]], layers)
+
+    def test_shortest_path(self):
+        self.relate("AB", "BC", "CD", "AD")
+        self.assertEqual(["A", "D"], [element.name for element in
+                                      self.graph.shortest_path(
+                                          self.elements["A"],
+                                          self.elements["D"])])
+        self.assertEqual(["B", "C", "D"], [element.name for element in
+                                           self.graph.shortest_path(
+                                               self.elements["B"],
+                                               self.elements["D"])])
+        self.assertIsNone(self.graph.shortest_path(self.elements["D"],
+                                                   self.elements["A"]))
+
+    def test_shortest_path_around_a_cycle(self):
+        self.relate("AB", "BA")
+        self.assertEqual(["A", "B", "A"], [element.name for element in
+                                           self.graph.shortest_path(
+                                               self.elements["A"],
+                                               self.elements["A"])])
+
+    def test_results_are_refreshed_when_the_model_changes(self):
+        relationship, = self.relate("AB")
+        self.assertFalse(self.graph.has_cycles())
+        self.relate("BA")
+        self.assertTrue(self.graph.has_cycles())
+        self.model.remove_relationship(relationship)
+        self.assertFalse(self.graph.has_cycles())
+        self.assertEqual([], self.names(self.graph.reachable_from(
+            self.elements["A"])))
+
+    def test_deep_chain_does_not_hit_the_recursion_limit(self):
+        model = Model()
+        chain = [SimpleElement(str(i)) for i in range(20000)]
+        for element in chain:
+            model.add_element(element)
+        for source, destination in zip(chain, chain[1:]):
+            model.add_relationship(Relationship(
+                source, destination, "Uses", None,
+                InteractionStyle.SYNCHRONOUS))
+        model.add_relationship(Relationship(
+            chain[-1], chain[0], "Uses", None, InteractionStyle.SYNCHRONOUS))
+
+        graph = model.get_dependency_graph()
+        self.assertEqual([len(chain)], [len(cycle)
+                                        for cycle in graph.cycles()])
+        self.assertEqual(len(chain), len(graph.reachable_from(chain[0])))
@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+
+from structurizr_py.core.io.binary_workspace import BinaryWorkspace
+from structurizr_py.core.io.binary_writer import BinaryWriter
+from structurizr_py.core.model.code_element import CodeElement
+from structurizr_py.core.model.deployment_node import DeploymentNode
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.software_system import SoftwareSystem
+from structurizr_py.core.model.tags import Tags
+
+
+class TestBinaryWorkspace(unittest.TestCase):
+
+    def setUp(self):
+        model = Model()
+        self.system = SoftwareSystem("System")
+        self.system.identity = "1"
+        self.system.url = "https://example.com/system"
+        self.system.add_property("team", "payments")
+        other = SoftwareSystem("Other")
+        other.identity = "2"
+        module = self.system.add_container("Module")
+        module.identity = "3"
+        service = module.add_component("Service")
+        service.identity = "5"
+        service.add_code_element(CodeElement("app.module.Service"))
+        for element in (self.system, other):
+            model.add_element(element)
+
+        relationship = Relationship(module, other, "Uses", "HTTPS",
+                                    InteractionStyle.ASYNCHRONOUS)
+        relationship.identity = "4"
+        relationship.add_tags({Tags.RELATIONSHIP})
+        model.add_relationship(relationship)
+
+        handle, self.path = tempfile.mkstemp(suffix=".szrb")
+        with os.fdopen(handle, "wb") as file:
+            BinaryWriter().write(model, file)
+
+        self.workspace = BinaryWorkspace(self.path)
+
+    def tearDown(self):
+        self.workspace.close()
+        os.remove(self.path)
+
+    def test_opening_creates_nothing(self):
+        self.assertEqual(4, self.workspace.element_count)
+        self.assertEqual(1, self.workspace.relationship_count)
+        self.assertEqual(set(), self.workspace.model.elements)
+
+    def test_get_element_by_identity_creates_its_ancestors(self):
+        module = self.workspace.get_element("3")
+        self.assertEqual("Module", module.name)
+        self.assertEqual("System", module.get_parent().name)
+        self.assertEqual({"System", "Module"},
+                         {e.name for e in self.workspace.model.elements})
+        self.assertIs(module, self.workspace.get_element("3"))
+
+    def test_get_element_by_canonical_name(self):
+        system = self.workspace.get_element_by_canonical_name("/System")
+        self.assertEqual("https://example.com/system", system.url)
+        self.assertEqual({"team": "payments"}, system.properties)
+        self.assertEqual("Module", self.workspace
+                         .get_element_by_canonical_name("/System/Module").name)
+        self.assertIsNone(
+            self.workspace.get_element_by_canonical_name("/Missing"))
+
+    def test_unknown_identity(self):
+        self.assertIsNone(self.workspace.get_element("42"))
+        self.assertIsNone(self.workspace.get_element("4"))
+        self.assertIsNone(self.workspace.get_relationship("1"))
+
+    def test_get_relationship(self):
+        relationship = self.workspace.get_relationship("4")
+        self.assertEqual("Module", relationship.source.name)
+        self.assertEqual("Other", relationship.destination.name)
+        self.assertEqual(InteractionStyle.ASYNCHRONOUS,
+                         relationship.interaction_style)
+        self.assertEqual("Relationship", relationship.tags)
+        self.assertTrue(self.workspace.model.contains(relationship))
+        self.assertEqual([relationship], self.workspace.get_relationships(
+            relationship.source))
+
+    def test_get_code_elements(self):
+        service = self.workspace.get_element("5")
+        code_elements = self.workspace.get_code_elements(service)
+        self.assertEqual(["app.module.Service"],
+                         [c.type for c in code_elements])
+        self.assertEqual(code_elements, service.code_elements)
+        self.assertIs(code_elements,
+                      self.workspace.get_code_elements(service))
+
+    def test_load_all(self):
+        model = self.workspace.load_all()
+        self.assertEqual(4, len(model.elements))
+        self.assertEqual(1, len(model.relationships))
+
+    def test_deployment_nodes(self):
+        model = self.workspace.load_all()
+        node = DeploymentNode("AWS", environment="Live")
+        model.add_element(node)
+        node.add_deployment_node("EC2", instances=2).add(
+            self.workspace.get_element("3"))
+        handle, path = tempfile.mkstemp(suffix=".szrb")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, "wb") as file:
+            BinaryWriter().write(model, file)
+
+        with BinaryWorkspace(path) as workspace:
+            instance = workspace.get_element_by_canonical_name(
+                "/Deployment/Live/AWS/EC2/System/Module")
+            self.assertIs(workspace.get_element("3"), instance.container)
+            self.assertEqual(2, instance.replicas)
+            self.assertEqual("Live", instance.environment)
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as file:
+            file.write(b"{}" * 100)
+        with self.assertRaises(ValueError):
+            BinaryWorkspace(self.path)
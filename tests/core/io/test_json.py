@@ -0,0 +1,252 @@
+import io
+import json
+import unittest
+from unittest import mock
+
+from structurizr_py.core.io import json_reader
+from structurizr_py.core.io.json_format import JsonFormat
+from structurizr_py.core.io.json_reader import JsonReader
+from structurizr_py.core.io.json_writer import JsonWriter
+from structurizr_py.core.model.code_element import CodeElement
+from structurizr_py.core.model.deployment_node import DeploymentNode
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.person import Person
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.software_system import SoftwareSystem
+from structurizr_py.core.model.tags import Tags
+
+
+def reverse_keys(value: object) -> object:
+    """Reverses the order of the keys of every object in a JSON value."""
+    if isinstance(value, dict):
+        return {key: reverse_keys(value[key]) for key in reversed(value)}
+    if isinstance(value, list):
+        return [reverse_keys(item) for item in value]
+
+    return value
+
+
+class TestJson(unittest.TestCase):
+
+    def setUp(self):
+        self.reader = JsonReader()
+
+    def build_model(self) -> Model:
+        model = Model()
+        system = SoftwareSystem("System", "A system")
+        system.url = "https://example.com/system"
+        system.add_property("team", "payments")
+        model.add_element(system)
+        other = SoftwareSystem("Other")
+        model.add_element(other)
+        module = system.add_container("Module")
+
+        relationship = Relationship(module, other, "Uses", "HTTPS",
+                                    InteractionStyle.ASYNCHRONOUS)
+        relationship.add_tags({Tags.RELATIONSHIP})
+        model.add_relationship(relationship)
+        return model
+
+    def write(self, model: Model, **kwargs) -> str:
+        stream = io.StringIO()
+        JsonWriter(**kwargs).write(model, stream, name="Workspace")
+        return stream.getvalue()
+
+    def test_write_produces_structurizr_json(self):
+        workspace = json.loads(self.write(self.build_model()))
+
+        self.assertEqual("Workspace", workspace["name"])
+        systems = workspace["model"]["softwareSystems"]
+        self.assertEqual(["System", "Other"], [s["name"] for s in systems])
+        self.assertEqual("Element,Software System", systems[0]["tags"])
+        self.assertEqual({"team": "payments"}, systems[0]["properties"])
+
+        module = systems[0]["containers"][0]
+        self.assertEqual("Module", module["name"])
+        self.assertEqual(
+            {"id": module["relationships"][0]["id"], "tags": "Relationship",
+             "sourceId": module["id"], "destinationId": systems[1]["id"],
+             "description": "Uses", "technology": "HTTPS",
+             "interactionStyle": "Asynchronous"},
+            module["relationships"][0])
+
+    def test_write_without_fast_backend_produces_same_document(self):
+        model = self.build_model()
+
+        self.assertEqual(json.loads(self.write(model)),
+                         json.loads(self.write(model,
+                                               use_fast_backend=False)))
+
+    def test_round_trip(self):
+        model = self.reader.read(io.StringIO(self.write(self.build_model())))
+
+        elements = {e.name: e for e in model.elements}
+        self.assertEqual({"System", "Other", "Module"}, set(elements))
+        self.assertIs(elements["System"], elements["Module"].get_parent())
+        self.assertEqual("https://example.com/system", elements["System"].url)
+        self.assertEqual({"team": "payments"}, elements["System"].properties)
+
+        relationship = elements["Module"].get_efferent_relationship_with(
+            elements["Other"])
+        self.assertEqual("HTTPS", relationship.technology)
+        self.assertEqual(InteractionStyle.ASYNCHRONOUS,
+                         relationship.interaction_style)
+        self.assertTrue(elements["Other"].has_afferent_relationships())
+
+    @unittest.skipUnless(JsonFormat.has_fast_backend(), "requires orjson")
+    def test_read_with_fast_backend_produces_same_model(self):
+        document = self.write(self.build_model())
+        reader = JsonReader(use_fast_backend=True)
+
+        model = reader.read(io.StringIO(document))
+
+        self.assertEqual(json.loads(document), json.loads(self.write(model)))
+
+    def test_round_trip_with_default_element_types(self):
+        model = Model()
+        model.add_element(Person("User"))
+        system = SoftwareSystem("Shop")
+        model.add_element(system)
+        system.add_container("Web", technology="Django") \
+            .add_component("Controller", technology="Flask")
+
+        read = JsonReader().read(io.StringIO(self.write(model)))
+
+        elements = {e.get_canonical_name(): e for e in read.elements}
+        self.assertIsInstance(elements["/User"], Person)
+        web = elements["/Shop"].get_container_with_name("Web")
+        self.assertEqual("Django", web.technology)
+        self.assertIs(elements["/Shop/Web/Controller"],
+                      web.get_component_with_name("Controller"))
+        self.assertEqual("Flask", elements["/Shop/Web/Controller"].technology)
+
+    def test_read_resolves_forward_references(self):
+        document = json.dumps({"model": {"softwareSystems": [
+            {"id": "1", "name": "A", "relationships": [
+                {"id": "3", "sourceId": "1", "destinationId": "2",
+                 "description": "Uses"}]},
+            {"id": "2", "name": "B"}]}})
+
+        model = self.reader.read(io.StringIO(document))
+
+        relationship = next(iter(model.relationships))
+        self.assertEqual("B", relationship.destination.name)
+        self.assertTrue(relationship.destination.has_afferent_relationships())
+
+    def test_read_applies_fields_after_nested_collections(self):
+        document = json.dumps({"model": {"softwareSystems": [
+            {"id": "1", "name": "A", "containers": [{"id": "2", "name": "M"}],
+             "description": "Late"}]}})
+
+        model = self.reader.read(io.StringIO(document))
+
+        self.assertEqual({"Late"}, {e.description for e in model.elements
+                                    if e.name == "A"})
+
+    def test_read_is_independent_of_key_order(self):
+        model = Model()
+        system = SoftwareSystem("Shop", "A shop")
+        model.add_element(system)
+        web = system.add_container("Web", technology="Django")
+        web.add_component("Cart").add_code_element(CodeElement("shop.Cart"))
+        database = system.add_container("Database")
+        model.add_relationship(Relationship(web, database, "Reads", None,
+                                            InteractionStyle.SYNCHRONOUS))
+        node = DeploymentNode("AWS", environment="Live")
+        model.add_element(node)
+        node.add_deployment_node("EC2").add(web)
+        document = json.loads(self.write(model))
+
+        for use_fast_backend in (False, True):
+            reader = JsonReader(use_fast_backend=use_fast_backend)
+            read = reader.read(io.StringIO(json.dumps(reverse_keys(document))))
+
+            self.assertEqual(document, json.loads(self.write(read)))
+
+    def test_read_raises_error_on_malformed_nesting(self):
+        for element in (
+                {"name": "A", "containers": [{"id": "2", "name": "M"}]},
+                {"id": "1", "name": "A", "code": [{"type": "a.B"}]},
+                {"id": "1", "name": "A",
+                 "components": [{"id": "2", "name": "M"}]}):
+            document = json.dumps({"model": {"softwareSystems": [element]}})
+
+            with self.assertRaises(ValueError):
+                self.reader.read(io.StringIO(document))
+
+    def test_read_in_small_chunks_skipping_unknown_sections(self):
+        document = json.dumps({
+            "id": 12345678, "views": {"systemLandscapeViews": [{"key": "x"}]},
+            "model": {"enterprise": {"name": "E"},
+                      "softwareSystems": [
+                          {"id": "1", "name": "A" * 100,
+                           "properties": {"n": "1.5"}}]}}, indent=2)
+        stream = io.StringIO(document)
+        stream.read = lambda size=-1, read=stream.read: read(min(size, 3))
+
+        model = self.reader.read(stream)
+
+        self.assertEqual(["A" * 100], [e.name for e in model.elements])
+
+    def test_round_trip_with_deployment_nodes(self):
+        model = Model()
+        system = SoftwareSystem("Shop")
+        model.add_element(system)
+        web = system.add_container("Web", technology="Django")
+        node = DeploymentNode("AWS", environment="Live", technology="Cloud")
+        model.add_element(node)
+        server = node.add_deployment_node("EC2", technology="Ubuntu",
+                                          instances=3)
+        server.add(web)
+
+        read = JsonReader().read(io.StringIO(self.write(model)))
+
+        elements = {e.get_canonical_name(): e for e in read.elements}
+        self.assertEqual({e.get_canonical_name() for e in model.elements},
+                         set(elements))
+        aws = elements["/Deployment/Live/AWS"]
+        self.assertEqual(("Live", "Cloud"), (aws.environment, aws.technology))
+        ec2 = aws.get_deployment_node_with_name("EC2")
+        self.assertEqual(("Live", "Ubuntu", 3),
+                         (ec2.environment, ec2.technology, ec2.instances))
+        instance = ec2.get_container_instance(elements["/Shop/Web"])
+        self.assertIs(elements["/Deployment/Live/AWS/EC2/Shop/Web"],
+                      instance)
+        self.assertEqual(3, instance.replicas)
+
+    def test_read_raises_error_on_unknown_container(self):
+        document = json.dumps({"model": {"deploymentNodes": [
+            {"id": "1", "name": "AWS", "containerInstances": [
+                {"id": "2", "containerId": "9"}]}]}})
+
+        with self.assertRaisesRegex(ValueError, "container 9"):
+            self.reader.read(io.StringIO(document))
+
+    def test_read_raises_error_on_unregistered_element_type(self):
+        document = json.dumps({"model": {"deploymentNodes": [{"id": "1"}]}})
+        with mock.patch.dict(json_reader.DEFAULT_ELEMENT_FACTORIES):
+            del json_reader.DEFAULT_ELEMENT_FACTORIES[Tags.DEPLOYMENT_NODE]
+            reader = JsonReader()
+
+        self.assertRaises(ValueError, reader.read, io.StringIO(document))
+
+    def test_read_raises_error_on_missing_destination(self):
+        document = json.dumps({"model": {"softwareSystems": [
+            {"id": "1", "name": "A", "relationships": [
+                {"id": "3", "sourceId": "1", "destinationId": "2"}]}]}})
+
+        self.assertRaises(ValueError, self.reader.read, io.StringIO(document))
+
+    def test_read_raises_error_on_duplicate_relationship(self):
+        for destination in ("1", "2"):
+            document = json.dumps({"model": {"softwareSystems": [
+                {"id": "1", "name": "A", "relationships": [
+                    {"id": "3", "destinationId": destination,
+                     "description": "Uses"},
+                    {"id": "4", "destinationId": destination,
+                     "description": "Uses"}]},
+                {"id": "2", "name": "B"}]}})
+
+            with self.assertRaisesRegex(ValueError, "4 duplicates"):
+                self.reader.read(io.StringIO(document))
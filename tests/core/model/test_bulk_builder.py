@@ -0,0 +1,90 @@
+import unittest
+
+from structurizr_py.core.model.bulk_validation_error import \
+    BulkValidationError
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from tests.fixtures import SimpleElement
+
+
+class TestBulkBuilder(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+
+    def test_add_elements_bulk_from_tuples_and_dicts(self):
+        a, b = self.model.add_elements_bulk(SimpleElement, [
+            ("A", "First", "https://example.com/a"),
+            {"name": "B", "tags": {"Database"}, "properties": {"k": "v"}}])
+
+        self.assertEqual({a, b}, self.model.elements)
+        self.assertEqual(("A", "First", "https://example.com/a"),
+                         (a.name, a.description, a.url))
+        self.assertTrue(b.has_tag("Database"))
+        self.assertEqual({"k": "v"}, b.properties)
+        self.assertEqual(["1", "2"], [a.identity, b.identity])
+        self.assertEqual("/A", a.get_canonical_name())
+
+    def test_blank_urls_are_ignored(self):
+        element, = self.model.add_elements_bulk(SimpleElement, [("A", None,
+                                                                 " ")])
+
+        self.assertIsNone(element.url)
+
+    def test_add_relationships_bulk(self):
+        a, b = self.model.add_elements_bulk(SimpleElement, [("A",), ("B",)])
+        relationship, = self.model.add_relationships_bulk([
+            (a, b, "Uses", "HTTPS", InteractionStyle.ASYNCHRONOUS)])
+
+        self.assertIs(relationship, a.get_efferent_relationship_with(b))
+        self.assertEqual("3", relationship.identity)
+
+    def test_staged_elements_can_be_related_before_commit(self):
+        builder = self.model.bulk()
+        a, b = builder.add_elements(SimpleElement, [("A",), ("B",)])
+        builder.add_relationships([{"source": a, "destination": b}])
+        builder.commit()
+
+        self.assertTrue(b.has_afferent_relationships())
+
+    def test_errors_are_aggregated_and_nothing_is_added(self):
+        outsider = SimpleElement()
+        builder = self.model.bulk()
+        a, _, _ = builder.add_elements(SimpleElement, [
+            ("A", None, "not a url"), (" ",), ("C", None, "not a url")])
+        builder.add_relationships([(a, outsider), (a, a, None, None, "Bad")])
+
+        with self.assertRaises(BulkValidationError) as context:
+            builder.commit()
+
+        self.assertEqual(
+            [("element", 0), ("element", 1), ("element", 2),
+             ("relationship", 0), ("relationship", 1)],
+            [(kind, index) for kind, index, _ in context.exception.errors])
+        self.assertEqual(set(), self.model.elements)
+        self.assertEqual(set(), self.model.relationships)
+
+    def test_duplicate_relationships_are_not_returned(self):
+        a, b = self.model.add_elements_bulk(SimpleElement, [("A",), ("B",)])
+        self.model.add_relationships_bulk([(a, b, "Uses")])
+
+        added = self.model.add_relationships_bulk([
+            (a, b, "Uses"), (b, a, "Calls"), (b, a, "Calls")])
+
+        self.assertEqual(1, len(added))
+        self.assertIs(self.model, added[0].model)
+        self.assertEqual(2, len(list(self.model.iter_relationships())))
+
+    def test_elements_added_before_a_failure_are_removed(self):
+        self.model.add_elements_bulk(SimpleElement, [("B",)])
+        builder = self.model.bulk()
+        a, _ = builder.add_elements(SimpleElement, [("A",), ("B",)])
+        builder.add_relationships([(a, a)])
+
+        with self.assertRaises(ValueError):
+            builder.commit()
+
+        self.assertIsNone(a.model)
+        self.assertEqual(["B"],
+                         [e.name for e in self.model.iter_elements()])
+        self.assertEqual([], list(self.model.iter_relationships()))
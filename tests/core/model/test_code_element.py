@@ -112,3 +112,18 @@ class TestCodeElement(unittest.TestCase):
         test_dict = {code_element: "hello"}
 
         self.assertEqual("hello", test_dict[code_element])
+
+    def test_code_elements_are_slotted(self):
+        code_element = CodeElement("structurizr.component.SomeComponent")
+        self.assertFalse(hasattr(code_element, "__dict__"))
+
+    def test_get_package(self):
+        code_element = CodeElement("structurizr.component.SomeComponent")
+        self.assertEqual("structurizr.component", code_element.get_package())
+
+        code_element.type = "other.Type"
+        self.assertEqual("other", code_element.get_package())
+
+    def test_get_package_returns_empty_string_for_default_package(self):
+        code_element = CodeElement("SomeComponent")
+        self.assertEqual("", code_element.get_package())
@@ -0,0 +1,53 @@
+import unittest
+
+from structurizr_py.core.model.code_element import CodeElement
+from structurizr_py.core.model.code_element_index import CodeElementIndex
+from structurizr_py.core.model.code_element_role import CodeElementRole
+
+
+class TestCodeElementIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = CodeElementIndex()
+        self.controller = CodeElement("app.web.Controller")
+        self.controller.role = CodeElementRole.PRIMARY
+        self.view = CodeElement("app.web.views.View")
+        self.repository = CodeElement("app.data.Repository")
+        self.main = CodeElement("Main")
+        for code_element in (self.controller, self.view, self.repository,
+                             self.main):
+            self.index.add(code_element)
+
+    def find(self, package, **kwargs):
+        return {c.type for c in self.index.find_in_package(package, **kwargs)}
+
+    def test_get_by_fully_qualified_type(self):
+        self.assertIs(self.view, self.index.get("app.web.views.View"))
+        self.assertIsNone(self.index.get("app.web.Missing"))
+        self.assertEqual(4, len(self.index))
+
+    def test_add_rejects_duplicate_types(self):
+        self.assertFalse(self.index.add(CodeElement("app.web.Controller")))
+        self.assertIs(self.controller, self.index.get("app.web.Controller"))
+
+    def test_find_in_package_includes_subpackages(self):
+        self.assertEqual({"app.web.Controller", "app.web.views.View"},
+                         self.find("app.web"))
+        self.assertEqual({"app.web.Controller"},
+                         self.find("app.web", include_subpackages=False))
+        self.assertEqual(4, len(self.find("")))
+        self.assertEqual(set(), self.find("app.missing"))
+
+    def test_find_in_package_filters_by_role(self):
+        self.assertEqual({"app.web.Controller"},
+                         self.find("app", role=CodeElementRole.PRIMARY))
+        self.assertEqual({"app.web.views.View", "app.data.Repository"},
+                         self.find("app", role=CodeElementRole.SUPPORTING))
+
+    def test_remove_prunes_empty_packages(self):
+        self.assertTrue(self.index.remove(self.view))
+        self.assertFalse(self.index.remove(self.view))
+
+        self.assertNotIn(self.view, self.index)
+        self.assertEqual(set(), self.find("app.web.views"))
+        self.assertEqual({"app.web.Controller"}, self.find("app.web"))
@@ -0,0 +1,109 @@
+import unittest
+from unittest import mock
+
+from structurizr_py.core.model import columnar_relationship_store
+from structurizr_py.core.model.columnar_relationship_store import \
+    ColumnarRelationshipStore
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from tests.fixtures import SimpleElement
+
+
+class ColumnarRelationshipStoreTests:
+    """The tests for either backend, mixed into a TestCase per backend."""
+
+    def setUp(self):
+        self.a, self.b, self.c = (SimpleElement(n) for n in "ABC")
+        self.store = ColumnarRelationshipStore()
+        self.store.add(self.a, self.b, "Uses", "HTTPS")
+        self.store.add(self.a, self.c, "Publishes to", "Kafka",
+                       InteractionStyle.ASYNCHRONOUS, tags={"Event"})
+        self.store.add(self.b, self.c, None, None, identity="3")
+
+    def test_degrees(self):
+        self.assertEqual([2, 1, 0], self.store.out_degrees())
+        self.assertEqual([0, 1, 2], self.store.in_degrees())
+
+    def test_filters(self):
+        self.assertEqual([1], self.store.filter_by_technology("Kafka"))
+        self.assertEqual([2], self.store.filter_by_technology(None))
+        self.assertEqual([], self.store.filter_by_technology("gRPC"))
+        self.assertEqual([0, 2], self.store.filter_by_interaction_style(
+            InteractionStyle.SYNCHRONOUS))
+        self.assertEqual([1], self.store.filter_by_tag("Event"))
+        self.assertEqual([], self.store.filter_by_tag("Unknown"))
+
+    def test_results_are_lists(self):
+        for result in (self.store.out_degrees(), self.store.in_degrees(),
+                       self.store.filter_by_technology("Kafka"),
+                       self.store.filter_by_interaction_style(
+                           InteractionStyle.SYNCHRONOUS),
+                       self.store.filter_by_tag("Event")):
+            self.assertIs(list, type(result))
+
+    def test_views(self):
+        view = self.store.get(1)
+
+        self.assertIs(self.a, view.source)
+        self.assertIs(self.c, view.destination)
+        self.assertEqual("Publishes to", view.description)
+        self.assertEqual(InteractionStyle.ASYNCHRONOUS,
+                         view.interaction_style)
+        self.assertEqual("Event", view.tags)
+        self.assertEqual("3", self.store.get(2).identity)
+        self.assertEqual(3, len(list(self.store)))
+        self.assertRaises(IndexError, self.store.get, 3)
+
+    def test_views_decode_their_row_once(self):
+        view = self.store.get(0)
+        with mock.patch.object(self.store, "_row",
+                               wraps=self.store._row) as row:
+            self.assertEqual("Uses", view.description)
+            self.assertEqual("HTTPS", view.technology)
+            self.assertIs(self.b, view.to_relationship().destination)
+
+        self.assertEqual(1, row.call_count)
+
+    def test_materialize(self):
+        relationship = self.store.materialize(1)
+
+        self.assertEqual(("/A", "/C", "Publishes to", "Kafka"),
+                         relationship.get_content_key())
+        self.assertTrue(relationship.has_tag("Event"))
+        self.assertIsNone(relationship.model)
+
+    def test_from_model(self):
+        model = Model()
+        for element in (self.a, self.b, self.c):
+            model.add_element(element)
+        model.add_relationship(Relationship(self.c, self.a, "Uses", None,
+                                            InteractionStyle.SYNCHRONOUS))
+
+        store = model.to_columnar_relationships()
+
+        self.assertEqual([self.a, self.b, self.c], store.elements)
+        self.assertEqual([0, 0, 1], store.out_degrees())
+
+    def test_tag_masks_beyond_64_bits(self):
+        self.store.add(self.a, self.b, tags={f"Tag {i}" for i in range(80)})
+
+        self.assertEqual([3], self.store.filter_by_tag("Tag 79"))
+        self.assertEqual([1], self.store.filter_by_tag("Event"))
+
+
+class TestColumnarRelationshipStoreWithoutNumpy(
+        ColumnarRelationshipStoreTests, unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(columnar_relationship_store, "numpy",
+                                    None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+@unittest.skipUnless(columnar_relationship_store.numpy, "requires NumPy")
+class TestColumnarRelationshipStoreWithNumpy(
+        ColumnarRelationshipStoreTests, unittest.TestCase):
+    pass
@@ -0,0 +1,57 @@
+import unittest
+
+from structurizr_py.core.model.code_element import CodeElement
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.software_system import SoftwareSystem
+from structurizr_py.core.model.tags import Tags
+
+
+class TestContainer(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        system = SoftwareSystem("Shop")
+        self.model.add_element(system)
+        self.container = system.add_container("Web")
+
+    def test_add_component(self):
+        component = self.container.add_component("Controller",
+                                                 technology="Flask")
+
+        self.assertIs(self.container, component.get_parent())
+        self.assertIs(self.model, component.model)
+        self.assertEqual("Flask", component.technology)
+        self.assertEqual({Tags.ELEMENT, Tags.COMPONENT},
+                         component.get_tags_as_set())
+        self.assertEqual("/Shop/Web/Controller",
+                         component.get_canonical_name())
+        self.assertIs(component,
+                      self.container.get_component_with_name("Controller"))
+
+    def test_component_names_are_unique(self):
+        component = self.container.add_component("Controller")
+        self.container.add_component("Repository")
+
+        with self.assertRaises(ValueError):
+            self.container.add_component("Controller")
+        with self.assertRaises(ValueError):
+            component.name = "Repository"
+
+        component.name = "View"
+        self.assertIs(component,
+                      self.container.get_component_with_name("View"))
+        self.assertIsNone(
+            self.container.get_component_with_name("Controller"))
+
+    def test_code_elements_are_indexed_in_the_model(self):
+        component = self.container.add_component("Controller")
+        component.add_code_element(CodeElement("shop.web.Controller"))
+
+        self.assertEqual(["Controller"], [
+            code_element.name for code_element in component.code_elements])
+        self.assertEqual([component], list(
+            self.model.get_elements_with_code_in_package("shop.web")))
+
+        component.model = None
+        self.assertEqual([], list(
+            self.model.get_elements_with_code_in_package("shop.web")))
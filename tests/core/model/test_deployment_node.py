@@ -0,0 +1,125 @@
+import unittest
+
+from structurizr_py.core.model.deployment_node import DeploymentNode
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.tags import Tags
+from tests.fixtures import SimpleElement
+
+
+class ContainerElement(SimpleElement):
+
+    def get_required_tags(self):
+        return {Tags.CONTAINER}
+
+
+class TestDeploymentNode(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.web = ContainerElement("Web")
+        self.database = ContainerElement("Database")
+        for container in (self.web, self.database):
+            container.model = self.model
+        self.web.add_relationship(Relationship(
+            self.web, self.database, "Reads from", "JDBC",
+            InteractionStyle.SYNCHRONOUS))
+
+        self.live = DeploymentNode("AWS", environment="Live")
+        self.live.model = self.model
+        self.servers = self.live.add_deployment_node("Web Servers",
+                                                     instances=4)
+        self.pods = self.servers.add_deployment_node("Pod", instances=3)
+        self.database_server = self.live.add_deployment_node("RDS")
+
+    def test_instances_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            DeploymentNode("Node", instances=0)
+        with self.assertRaises(ValueError):
+            self.servers.instances = -1
+
+    def test_total_instances_multiply_along_the_hierarchy(self):
+        self.assertEqual(4, self.servers.get_total_instances())
+        self.assertEqual(12, self.pods.get_total_instances())
+
+        self.live.instances = 2
+        self.assertEqual(24, self.pods.get_total_instances())
+
+    def test_children_are_keyed_by_name(self):
+        self.assertIs(self.servers,
+                      self.live.get_deployment_node_with_name("Web Servers"))
+        self.assertIsNone(self.live.get_deployment_node_with_name("Other"))
+        with self.assertRaises(ValueError):
+            self.live.add_deployment_node("RDS")
+
+        self.servers.name = "Servers"
+        self.assertIs(self.servers,
+                      self.live.get_deployment_node_with_name("Servers"))
+        self.assertIsNone(
+            self.live.get_deployment_node_with_name("Web Servers"))
+        with self.assertRaises(ValueError):
+            self.servers.name = "RDS"
+        self.assertEqual("Servers", self.servers.name)
+
+    def test_canonical_names(self):
+        instance = self.pods.add(self.web)
+
+        self.assertEqual("/Deployment/Live/AWS/Web Servers/Pod",
+                         self.pods.get_canonical_name())
+        self.assertEqual("/Deployment/Live/AWS/Web Servers/Pod/Web",
+                         instance.get_canonical_name())
+        self.assertEqual("Live", self.pods.environment)
+
+    def test_children_follow_the_node_into_models(self):
+        instance = self.pods.add(self.web)
+        self.assertIs(self.model, self.pods.model)
+        self.assertIs(self.model, instance.model)
+
+        other = Model()
+        self.live.model = other
+        self.assertIs(other, self.pods.model)
+        self.assertIs(other, instance.model)
+        self.assertNotIn(instance, self.model.elements)
+
+    def test_container_instance_represents_all_replicas(self):
+        instance = self.pods.add(self.web)
+
+        self.assertEqual(12, instance.replicas)
+        self.assertEqual("Web", instance.name)
+        self.assertIs(instance, self.pods.get_container_instance(self.web))
+        self.assertEqual([instance], self.pods.container_instances)
+        with self.assertRaises(ValueError):
+            self.pods.add(self.web)
+
+    def test_relationships_are_derived_from_containers(self):
+        web = self.pods.add(self.web)
+        database = self.database_server.add(self.database)
+        other = DeploymentNode("Staging", environment="Staging")
+        other.model = self.model
+        other.add(self.database)
+
+        derived = web.get_derived_relationships()
+        self.assertEqual(1, len(derived))
+        self.assertIs(web, derived[0].source)
+        self.assertIs(database, derived[0].destination)
+        self.assertEqual("JDBC", derived[0].technology)
+        self.assertNotIn(derived[0], self.model.relationships)
+        self.assertEqual([], database.get_derived_relationships())
+
+    def test_derived_relationships_follow_model_changes(self):
+        web = self.pods.add(self.web)
+        self.assertEqual([], web.get_derived_relationships())
+
+        self.database_server.add(self.database)
+        self.assertEqual(1, len(web.get_derived_relationships()))
+
+    def test_count_replica_connections(self):
+        self.pods.add(self.web)
+        self.database_server.add(self.database)
+        relationships = self.model.get_instance_relationships()
+
+        self.assertEqual(12, relationships.count_replica_connections())
+        self.database_server.instances = 2
+        self.assertEqual(24, relationships.count_replica_connections())
+        self.assertEqual(1, len(list(relationships)))
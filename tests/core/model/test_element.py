@@ -0,0 +1,110 @@
+import unittest
+
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.model import Model
+
+
+class NestedElement(Element):
+
+    def __init__(self, name: str, parent: Element = None):
+        super().__init__()
+        self.__parent = parent
+        self.computations = 0
+        self.name = name
+
+    def compute_canonical_name(self) -> str:
+        self.computations += 1
+        return super().compute_canonical_name()
+
+    def get_parent(self):
+        return self.__parent
+
+    def set_parent(self, parent: Element):
+        self.__parent = parent
+        self._hierarchy_changed()
+
+    def get_required_tags(self):
+        return set()
+
+
+class TestElement(unittest.TestCase):
+
+    def setUp(self):
+        self.system = NestedElement("System")
+        self.container = NestedElement("Container", self.system)
+        self.component = NestedElement("Comp/onent", self.container)
+
+    def test_get_canonical_name(self):
+        self.assertEqual("/System", self.system.get_canonical_name())
+        self.assertEqual("/System/Container/Component",
+                         self.component.get_canonical_name())
+
+    def test_get_canonical_name_is_cached(self):
+        self.component.get_canonical_name()
+        self.component.get_canonical_name()
+
+        self.assertEqual(1, self.component.computations)
+        self.assertEqual(1, self.system.computations)
+
+    def test_renaming_an_ancestor_invalidates_canonical_name(self):
+        self.component.get_canonical_name()
+        self.system.name = "Renamed"
+
+        self.assertEqual("/Renamed/Container/Component",
+                         self.component.get_canonical_name())
+
+    def test_changing_the_parent_invalidates_canonical_name(self):
+        other = NestedElement("Other")
+        self.component.get_canonical_name()
+        self.container.set_parent(other)
+
+        self.assertEqual("/Other/Container/Component",
+                         self.component.get_canonical_name())
+
+    def test_naming_a_new_element_keeps_other_caches(self):
+        self.component.get_canonical_name()
+        NestedElement("New", self.container)
+        self.component.get_canonical_name()
+
+        self.assertEqual(1, self.component.computations)
+
+    def test_renaming_in_one_model_keeps_the_caches_of_others(self):
+        first, second = Model(), Model()
+        for element in (self.system, self.container, self.component):
+            first.add_element(element)
+        other = NestedElement("Other")
+        second.add_element(other)
+        self.component.get_canonical_name()
+        other.get_canonical_name()
+        version = second.hierarchy_version
+
+        self.system.name = "Renamed"
+        other.get_canonical_name()
+        self.assertEqual(1, other.computations)
+        self.assertEqual(version, second.hierarchy_version)
+        self.assertEqual("/Renamed/Container/Component",
+                         self.component.get_canonical_name())
+
+    def test_moving_elements_between_models_invalidates_canonical_names(
+            self):
+        first, second = Model(), Model()
+        for element in (self.system, self.container, self.component):
+            first.add_element(element)
+        self.component.get_canonical_name()
+
+        for element in (self.system, self.container, self.component):
+            element.model = second
+        self.system.name = "Renamed"
+        for element in (self.system, self.container, self.component):
+            element.model = first
+
+        self.assertEqual("/Renamed/Container/Component",
+                         self.component.get_canonical_name())
+
+    def test_hash_is_consistent_with_equals(self):
+        same = NestedElement("Container", NestedElement("System"))
+
+        self.assertEqual(self.container, same)
+        self.assertEqual(hash(self.container), hash(same))
+        self.assertEqual(1, len({self.container, same}))
+        self.assertNotEqual(self.system, self.container)
@@ -0,0 +1,66 @@
+import unittest
+
+from structurizr_py.core.model.identity_strategy import \
+    ContentHashIdentityStrategy, SequentialIdentityStrategy
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.person import Person
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.software_system import SoftwareSystem
+
+
+class TestIdentityStrategy(unittest.TestCase):
+
+    @staticmethod
+    def build_model(names) -> Model:
+        model = Model(identity_strategy=ContentHashIdentityStrategy())
+        for name in names:
+            model.add_element(SoftwareSystem(name))
+        return model
+
+    def test_sequential_identities_skip_found_ones(self):
+        strategy = SequentialIdentityStrategy()
+        strategy.found("5")
+        strategy.found("abc")
+
+        self.assertEqual("6", strategy.generate_identity(Person("User")))
+        self.assertEqual("7", strategy.generate_identity(Person("User")))
+
+    def test_content_hash_identities_are_independent_of_order(self):
+        first = self.build_model(["A", "B"])
+        second = self.build_model(["B", "A"])
+
+        self.assertEqual(
+            {e.name: e.identity for e in first.elements},
+            {e.name: e.identity for e in second.elements})
+        self.assertEqual(16, len(next(iter(first.elements)).identity))
+
+    def test_content_hash_identities_of_relationships(self):
+        model = self.build_model(["A", "B"])
+        a, b = sorted(model.elements, key=lambda e: e.name)
+        uses = Relationship(a, b, "Uses", None, InteractionStyle.SYNCHRONOUS)
+        calls = Relationship(a, b, "Calls", None,
+                             InteractionStyle.SYNCHRONOUS)
+        model.add_relationship(uses)
+        model.add_relationship(calls)
+
+        self.assertNotEqual(uses.identity, calls.identity)
+        self.assertIs(uses, model.get_relationship(uses.identity))
+
+    def test_same_content_gets_a_suffix(self):
+        model = self.build_model(["A"])
+        first = next(model.iter_elements())
+        first.model = None
+        second = SoftwareSystem("A")
+        model.add_element(second)
+
+        self.assertEqual(first.identity + "-2", second.identity)
+
+    def test_changing_the_strategy_keeps_identities_unique(self):
+        model = Model()
+        model.add_element(Person("User"))
+        model.identity_strategy = SequentialIdentityStrategy()
+
+        system = SoftwareSystem("Shop")
+        model.add_element(system)
+        self.assertEqual("2", system.identity)
@@ -0,0 +1,131 @@
+import unittest
+
+from structurizr_py.core.model.default_implied_relationships_strategy import \
+    DefaultImpliedRelationshipsStrategy
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+
+
+class NestedElement(Element):
+
+    def __init__(self, name: str, parent=None):
+        super().__init__()
+        self.name = name
+        self.parent = parent
+
+    def get_parent(self):
+        return self.parent
+
+    def get_required_tags(self):
+        return set()
+
+
+class TestImpliedRelationships(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.model.implied_relationships_strategy = \
+            DefaultImpliedRelationshipsStrategy()
+        self.a = NestedElement("A")
+        self.a1 = NestedElement("A1", self.a)
+        self.a1x = NestedElement("A1x", self.a1)
+        self.b = NestedElement("B")
+        self.b1 = NestedElement("B1", self.b)
+        for element in (self.a, self.a1, self.a1x, self.b, self.b1):
+            self.model.add_element(element)
+
+    def relate(self, source, destination, description="Uses"):
+        relationship = Relationship(source, destination, description, "HTTPS",
+                                    InteractionStyle.SYNCHRONOUS)
+        self.model.add_relationship(relationship)
+        return relationship
+
+    def implied(self):
+        return sorted((r.source.name, r.destination.name, r.description)
+                      for r in self.model.iter_implied_relationships())
+
+    def test_disabled_by_default(self):
+        model = Model()
+        self.assertIsNone(model.implied_relationships_strategy)
+        self.assertEqual([], list(model.iter_implied_relationships()))
+
+    def test_relationship_implies_ancestor_pairs(self):
+        self.relate(self.a1x, self.b1)
+        self.assertEqual([("A", "B", "Uses"), ("A", "B1", "Uses"),
+                          ("A1", "B", "Uses"), ("A1", "B1", "Uses"),
+                          ("A1x", "B", "Uses")], self.implied())
+
+        implied, = self.model.get_implied_relationships_between(self.a,
+                                                                self.b)
+        self.assertEqual("HTTPS", implied.technology)
+        self.assertIsNone(implied.model)
+
+    def test_nothing_is_implied_between_nested_elements(self):
+        self.relate(self.a1x, self.a)
+        self.relate(self.a1x, self.a1)
+        self.assertEqual([], self.implied())
+
+    def test_sibling_relationship_implies_nothing_beyond_parent(self):
+        a2 = NestedElement("A2", self.a)
+        self.model.add_element(a2)
+        self.relate(self.a1x, a2)
+        self.assertEqual([("A1", "A2", "Uses")], self.implied())
+
+    def test_removing_a_relationship_keeps_pairs_implied_by_others(self):
+        first = self.relate(self.a1x, self.b1)
+        second = self.relate(self.a1, self.b1)
+        self.model.remove_relationship(first)
+        self.assertEqual([("A", "B", "Uses"), ("A", "B1", "Uses"),
+                          ("A1", "B", "Uses")], self.implied())
+
+        self.model.remove_relationship(second)
+        self.assertEqual([], self.implied())
+
+    def test_removing_the_last_relationship_removes_implied_ones(self):
+        relationship = self.relate(self.a1x, self.b1)
+        self.model.remove_relationship(relationship)
+        self.assertEqual([], self.implied())
+
+    def test_changing_a_relationship_updates_implied_ones(self):
+        relationship = self.relate(self.a1, self.b1)
+        relationship.description = "Calls"
+        self.assertEqual([("A", "B", "Calls"), ("A", "B1", "Calls"),
+                          ("A1", "B", "Calls")], self.implied())
+
+        relationship.source = self.b1
+        relationship.destination = self.a1
+        self.assertEqual([("B", "A", "Calls"), ("B", "A1", "Calls"),
+                          ("B1", "A", "Calls")], self.implied())
+
+    def test_changing_the_interaction_style_updates_implied_ones(self):
+        relationship = self.relate(self.a1, self.b1)
+        self.model.get_implied_relationships_between(self.a, self.b)
+        relationship.interaction_style = InteractionStyle.ASYNCHRONOUS
+
+        implied, = self.model.get_implied_relationships_between(self.a,
+                                                                self.b)
+        self.assertEqual(InteractionStyle.ASYNCHRONOUS,
+                         implied.interaction_style)
+
+    def test_implied_relationships_follow_a_moved_element(self):
+        c = NestedElement("C")
+        self.model.add_element(c)
+        self.relate(self.a1, self.b1)
+
+        self.a1.parent = c
+        self.a1._hierarchy_changed()
+        self.assertIn(("C", "B", "Uses"), self.implied())
+        self.assertNotIn(("A", "B", "Uses"), self.implied())
+
+    def test_setting_the_strategy_covers_existing_relationships(self):
+        model = Model()
+        for element in (self.a, self.a1, self.b, self.b1):
+            model.add_element(element)
+        model.add_relationship(Relationship(
+            self.a1, self.b1, "Uses", None, InteractionStyle.SYNCHRONOUS))
+
+        model.implied_relationships_strategy = \
+            DefaultImpliedRelationshipsStrategy()
+        self.assertEqual(3, len(list(model.iter_implied_relationships())))
@@ -0,0 +1,315 @@
+import threading
+import unittest
+
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from tests.fixtures import SimpleElement
+
+
+class TestModel(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.a = SimpleElement("A")
+        self.b = SimpleElement("B")
+        self.c = SimpleElement("C")
+        for element in (self.a, self.b, self.c):
+            element.model = self.model
+
+    def relate(self, source, destination, description="Uses"):
+        relationship = Relationship(source, destination, description, None,
+                                    InteractionStyle.SYNCHRONOUS)
+        source.add_relationship(relationship)
+        return relationship
+
+    def test_add_relationship_indexes_source_and_destination(self):
+        relationship = self.relate(self.a, self.b)
+
+        self.assertTrue(self.model.contains(relationship))
+        self.assertIs(self.model, relationship.model)
+        self.assertEqual({relationship}, self.a.relationships)
+        self.assertTrue(self.b.has_afferent_relationships())
+        self.assertFalse(self.a.has_afferent_relationships())
+        self.assertIs(relationship,
+                      self.a.get_efferent_relationship_with(self.b))
+        self.assertTrue(self.a.has_efferent_relationship_with(self.b))
+        self.assertFalse(self.b.has_efferent_relationship_with(self.a))
+
+    def test_add_relationship_returns_false_when_already_added(self):
+        relationship = self.relate(self.a, self.b)
+
+        self.assertFalse(self.model.add_relationship(relationship))
+        self.assertEqual(1, len(self.model.relationships))
+
+    def test_reassigning_destination_updates_indexes(self):
+        relationship = self.relate(self.a, self.b)
+        relationship.destination = self.c
+
+        self.assertFalse(self.b.has_afferent_relationships())
+        self.assertTrue(self.c.has_afferent_relationships())
+        self.assertIsNone(self.a.get_efferent_relationship_with(self.b))
+        self.assertIs(relationship,
+                      self.a.get_efferent_relationship_with(self.c))
+
+    def test_reassigning_source_updates_indexes(self):
+        relationship = self.relate(self.a, self.b)
+        relationship.source = self.c
+
+        self.assertEqual(set(), self.a.relationships)
+        self.assertEqual({relationship}, self.c.relationships)
+        self.assertIs(relationship,
+                      self.c.get_efferent_relationship_with(self.b))
+
+    def test_remove_relationship(self):
+        relationship = self.relate(self.a, self.b)
+
+        self.assertTrue(self.model.remove_relationship(relationship))
+        self.assertFalse(self.model.remove_relationship(relationship))
+        self.assertIsNone(relationship.model)
+        self.assertFalse(self.b.has_afferent_relationships())
+        self.assertEqual(set(), self.a.relationships)
+
+    def test_relationships_added_before_model_is_set_are_moved_to_model(self):
+        d = SimpleElement("D")
+        relationship = Relationship(d, self.a, "Uses", None,
+                                    InteractionStyle.SYNCHRONOUS)
+        d.add_relationship(relationship)
+        d.model = self.model
+
+        self.assertTrue(self.model.contains(relationship))
+        self.assertTrue(self.a.has_afferent_relationships())
+
+    def test_get_items_with_tag(self):
+        relationship = self.relate(self.a, self.b)
+        relationship.add_tags({"Async"})
+        self.b.add_tags({"Async"})
+
+        self.assertEqual([self.b, relationship],
+                         list(self.model.get_items_with_tag("Async")))
+        self.assertEqual([], list(self.model.get_items_with_tag("Unknown")))
+
+    def test_elements(self):
+        self.assertEqual({self.a, self.b, self.c}, self.model.elements)
+
+        self.c.model = Model()
+        self.assertEqual({self.a, self.b}, self.model.elements)
+
+    def test_moving_an_element_moves_its_relationships(self):
+        efferent = self.relate(self.a, self.b)
+        afferent = self.relate(self.c, self.a)
+        other = Model()
+        self.a.model = other
+
+        self.assertEqual(set(), self.model.relationships)
+        self.assertFalse(self.b.has_afferent_relationships())
+        self.assertEqual(set(), self.c.relationships)
+        self.assertIsNone(afferent.model)
+        self.assertTrue(other.contains(efferent))
+        self.assertEqual({efferent}, self.a.relationships)
+
+        self.a.model = None
+        self.assertIsNone(efferent.model)
+        self.assertEqual({efferent}, self.a.relationships)
+
+    def test_moving_a_parent_moves_the_relationships_of_its_children(self):
+        child = SimpleElement("Child", self.a)
+        child.model = self.model
+        relationship = self.relate(child, self.a)
+        other = Model()
+
+        self.a.model = other
+        child.model = other
+
+        self.assertEqual({relationship}, other.relationships)
+        self.assertEqual(set(), self.model.relationships)
+
+    def test_failed_move_leaves_the_element_in_its_model(self):
+        efferent = self.relate(self.a, self.b)
+        afferent = self.relate(self.c, self.a)
+        other = Model()
+        other.add_element(SimpleElement("A"))
+
+        with self.assertRaises(ValueError):
+            self.a.model = other
+
+        self.assertIs(self.model, self.a.model)
+        self.assertIn(self.a, self.model.elements)
+        self.assertEqual({efferent}, self.a.relationships)
+        self.assertEqual([afferent],
+                         self.model.get_afferent_relationships(self.a))
+        self.assertEqual(2, len(self.model.relationships))
+
+    def test_add_relationship_rejects_duplicate_content(self):
+        relationship = self.relate(self.a, self.b)
+        duplicate = Relationship(self.a, self.b, "Uses", None,
+                                 InteractionStyle.ASYNCHRONOUS)
+
+        self.assertFalse(self.model.add_relationship(duplicate))
+        self.assertIs(relationship,
+                      self.model.get_equivalent_relationship(duplicate))
+        self.assertEqual({relationship}, self.model.relationships)
+
+    def test_relationships_differing_in_technology_are_distinct(self):
+        http = Relationship(self.a, self.b, "Uses", "HTTP",
+                            InteractionStyle.SYNCHRONOUS)
+        grpc = Relationship(self.a, self.b, "Uses", "gRPC",
+                            InteractionStyle.SYNCHRONOUS)
+
+        self.assertTrue(self.model.add_relationship(http))
+        self.assertTrue(self.model.add_relationship(grpc))
+        self.assertEqual(2, len(list(self.model.iter_relationships())))
+        self.assertEqual({http, grpc}, self.model.relationships)
+        self.assertNotEqual(http, grpc)
+
+    def test_content_index_follows_relationship_changes(self):
+        relationship = self.relate(self.a, self.b)
+        relationship.description = "Calls"
+
+        self.assertTrue(self.model.add_relationship(
+            Relationship(self.a, self.b, "Uses", None,
+                         InteractionStyle.SYNCHRONOUS)))
+        self.assertFalse(self.model.add_relationship(
+            Relationship(self.a, self.b, "Calls", None,
+                         InteractionStyle.SYNCHRONOUS)))
+
+    def test_changing_a_relationship_into_a_duplicate_is_rejected(self):
+        uses = self.relate(self.a, self.b)
+        calls = self.relate(self.a, self.b, "Calls")
+
+        with self.assertRaises(ValueError):
+            calls.description = "Uses"
+        self.assertEqual("Calls", calls.description)
+        self.assertIs(calls, self.model.get_equivalent_relationship(calls))
+        self.assertIs(uses, self.model.get_equivalent_relationship(uses))
+
+        calls.destination = self.c
+        calls.description = "Uses"
+        with self.assertRaises(ValueError):
+            uses.destination = self.c
+        self.assertIs(self.b, uses.destination)
+        self.assertEqual([uses], self.model.get_afferent_relationships(self.b))
+
+    def test_rejected_change_releases_the_lock(self):
+        model = Model(thread_safe=True)
+        for element in (self.a, self.b):
+            element.model = model
+        self.relate(self.a, self.b)
+        calls = self.relate(self.a, self.b, "Calls")
+
+        with self.assertRaises(ValueError):
+            calls.description = "Uses"
+
+        thread = threading.Thread(target=lambda: self.relate(
+            self.b, self.a))
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(3, len(list(model.iter_relationships())))
+
+    def test_content_index_follows_renamed_elements(self):
+        self.relate(self.a, self.b)
+        self.b.name = "Renamed"
+
+        self.assertFalse(self.model.add_relationship(
+            Relationship(self.a, self.b, "Uses", None,
+                         InteractionStyle.SYNCHRONOUS)))
+        self.assertTrue(self.model.add_relationship(
+            Relationship(self.a, self.c, "Uses", None,
+                         InteractionStyle.SYNCHRONOUS)))
+
+    def test_renaming_a_leaf_element_keeps_the_hierarchy_version(self):
+        relationship = self.relate(self.a, self.b)
+        version = self.model.hierarchy_version
+        self.b.name = "Renamed"
+
+        self.assertEqual(version, self.model.hierarchy_version)
+        self.assertEqual(("/A", "/Renamed", "Uses", None),
+                         relationship.get_content_key())
+        self.assertIs(relationship, self.model.get_equivalent_relationship(
+            Relationship(self.a, self.b, "Uses", None,
+                         InteractionStyle.SYNCHRONOUS)))
+        self.assertEqual(
+            [self.b],
+            self.model.get_elements_with_canonical_name_prefix("/Renamed"))
+
+    def test_removing_and_adding_leaf_elements_keeps_the_hierarchy_version(
+            self):
+        self.relate(self.a, self.b)
+        version = self.model.hierarchy_version
+        for _ in range(3):
+            self.c.model = None
+            self.c.model = self.model
+            self.relate(self.a, self.c)
+
+        self.assertEqual(version, self.model.hierarchy_version)
+        self.assertEqual(2, len(self.model.relationships))
+
+    def test_changing_a_parent_invalidates_the_names_of_its_children(self):
+        child = SimpleElement("Child", self.a)
+        child.model = self.model
+        relationship = self.relate(child, self.b)
+
+        self.a.model = None
+        self.a.name = "Renamed"
+        self.a.model = self.model
+        self.assertEqual(("/Renamed/Child", "/B", "Uses", None),
+                         relationship.get_content_key())
+
+        self.a.name = "Again"
+        self.assertEqual("/Again/Child", child.get_canonical_name())
+
+        # a child which is out of the model while its parent is renamed
+        child.model = None
+        self.a.name = "Last"
+        child.model = self.model
+        self.assertEqual("/Last/Child", child.get_canonical_name())
+
+    def test_items_are_given_identities_and_indexed(self):
+        relationship = self.relate(self.a, self.b)
+
+        self.assertEqual(["1", "2", "3", "4"],
+                         [self.a.identity, self.b.identity,
+                          self.c.identity, relationship.identity])
+        self.assertIs(self.b, self.model.get_element("2"))
+        self.assertIs(relationship, self.model.get_relationship("4"))
+        self.assertIsNone(self.model.get_element("4"))
+        self.assertIsNone(self.model.get_relationship("1"))
+
+        self.model.remove_relationship(relationship)
+        self.assertIsNone(self.model.get_relationship("4"))
+
+    def test_identities_must_be_unique(self):
+        element = SimpleElement("D")
+        element.identity = "1"
+
+        with self.assertRaises(ValueError):
+            element.model = self.model
+        self.assertIsNone(element.model)
+        with self.assertRaises(ValueError):
+            self.b.identity = "1"
+        self.assertEqual("2", self.b.identity)
+
+    def test_changing_an_identity_reindexes_the_item(self):
+        self.a.identity = "100"
+
+        self.assertIsNone(self.model.get_element("1"))
+        self.assertIs(self.a, self.model.get_element("100"))
+        self.assertEqual("101", self.relate(self.a, self.b).identity)
+
+    def test_resolve_relationships(self):
+        relationship = Relationship(None, None, "Uses", None,
+                                    InteractionStyle.SYNCHRONOUS)
+        relationship.source_identity = "1"
+        relationship.destination_identity = "3"
+        missing = Relationship(self.a, None, "Calls", None,
+                               InteractionStyle.SYNCHRONOUS)
+        missing.destination_identity = "9"
+
+        with self.assertRaises(ValueError):
+            self.model.resolve_relationships([relationship, missing])
+        self.assertFalse(self.model.contains(relationship))
+
+        self.model.resolve_relationships([relationship])
+        self.assertIs(relationship,
+                      self.a.get_efferent_relationship_with(self.c))
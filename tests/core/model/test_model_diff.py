@@ -0,0 +1,129 @@
+import io
+import json
+import unittest
+
+from structurizr_py.core.io.json_writer import JsonWriter
+from structurizr_py.core.model.deployment_node import DeploymentNode
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.software_system import SoftwareSystem
+from structurizr_py.core.model.tags import Tags
+from tests.fixtures import SimpleElement
+
+SYSTEM_TAGS = frozenset({Tags.ELEMENT, Tags.SOFTWARE_SYSTEM})
+
+
+def build_model(names, relationships) -> Model:
+    model = Model()
+    elements = {}
+    for name in names:
+        elements[name] = SoftwareSystem(name)
+        model.add_element(elements[name])
+    for source, destination, description in relationships:
+        model.add_relationship(Relationship(
+            elements[source], elements[destination], description, None,
+            InteractionStyle.SYNCHRONOUS))
+
+    return model
+
+
+class TestModelDiff(unittest.TestCase):
+
+    def setUp(self):
+        self.old = build_model(["A", "B", "C"], [("A", "B", "Uses"),
+                                                 ("B", "C", "Calls")])
+        self.new = build_model(["A", "B", "D"], [("A", "B", "Uses"),
+                                                 ("B", "D", "Calls")])
+        self.elements = {e.name: e for e in self.new.elements}
+        self.elements["A"].description = "Changed"
+        self.elements["B"].add_tags({"Database"})
+        self.elements["B"].add_property("team", "payments")
+        self.elements["A"].relationships.pop().add_property("port", "443")
+
+    def assert_diff(self, diff):
+        self.assertEqual(["/D"], [c.key for c in diff.added_elements])
+        self.assertEqual(["/C"], [c.key for c in diff.removed_elements])
+        self.assertEqual(
+            {"/A": {"description": (None, "Changed")},
+             "/B": {"tags": (SYSTEM_TAGS, SYSTEM_TAGS | {"Database"}),
+                    "properties.team": (None, "payments")}},
+            {c.key: c.changes for c in diff.modified_elements})
+        self.assertEqual([("/B", "/D", "Calls")],
+                         [c.key[:3] for c in diff.added_relationships])
+        self.assertEqual([("/B", "/C", "Calls")],
+                         [c.key[:3] for c in diff.removed_relationships])
+        self.assertEqual([{"properties.port": (None, "443")}],
+                         [c.changes for c in diff.modified_relationships])
+
+    def test_diff(self):
+        diff = self.old.diff(self.new)
+
+        self.assert_diff(diff)
+        self.assertIs(self.elements["D"], diff.added_elements[0].new)
+        self.assertFalse(diff.is_empty())
+
+    def test_diff_snapshot(self):
+        stream = io.StringIO()
+        JsonWriter().write(self.old, stream)
+        stream.seek(0)
+
+        self.assert_diff(self.new.diff_snapshot(stream))
+
+    def test_diff_of_equal_models_is_empty(self):
+        self.assertTrue(self.old.diff(
+            build_model(["A", "B", "C"], [("A", "B", "Uses"),
+                                          ("B", "C", "Calls")])).is_empty())
+
+    def test_changing_the_technology_replaces_a_relationship(self):
+        new = build_model(["A", "B", "C"], [("A", "B", "Uses"),
+                                            ("B", "C", "Calls")])
+        next(iter(new.iter_relationships())).technology = "HTTPS"
+
+        diff = self.old.diff(new)
+        self.assertEqual([("/A", "/B", "Uses", "HTTPS")],
+                         [c.key for c in diff.added_relationships])
+        self.assertEqual([("/A", "/B", "Uses", None)],
+                         [c.key for c in diff.removed_relationships])
+        self.assertEqual([], diff.modified_relationships)
+
+    def test_relationships_differing_in_technology_are_matched(self):
+        model = build_model(["A", "B"], [])
+        a, b = model.iter_elements()
+        for technology in ("HTTP", "gRPC"):
+            model.add_relationship(Relationship(
+                a, b, "Uses", technology, InteractionStyle.SYNCHRONOUS))
+        stream = io.StringIO()
+        JsonWriter().write(model, stream)
+        stream.seek(0)
+
+        self.assertTrue(model.diff(model).is_empty())
+        self.assertTrue(model.diff_snapshot(stream).is_empty())
+
+    def test_deployment_nodes_are_matched_with_their_snapshot(self):
+        web = self.elements["A"].add_container("Web")
+        node = DeploymentNode("AWS", environment="Live")
+        self.new.add_element(node)
+        node.add_deployment_node("EC2").add(web)
+        stream = io.StringIO()
+        JsonWriter().write(self.new, stream)
+        stream.seek(0)
+
+        self.assertTrue(self.new.diff_snapshot(stream).is_empty())
+
+    def test_diff_snapshot_rejects_dangling_references(self):
+        document = json.dumps({"model": {"softwareSystems": [
+            {"id": "1", "name": "A", "relationships": [
+                {"id": "2", "sourceId": "1", "destinationId": "9"}]}]}})
+
+        with self.assertRaisesRegex(ValueError, "9"):
+            self.new.diff_snapshot(io.StringIO(document))
+
+    def test_elements_sharing_a_canonical_name_are_matched(self):
+        parent = self.elements["A"]
+        for description in ("First", "Second"):
+            module = SimpleElement("Module", parent)
+            module.description = description
+            self.new.add_element(module)
+
+        self.assertTrue(self.new.diff(self.new).is_empty())
@@ -0,0 +1,59 @@
+import unittest
+
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.relationship import Relationship
+
+
+class TestModelItem(unittest.TestCase):
+
+    def setUp(self):
+        self.item = Relationship(None, None, "Uses", None,
+                                 InteractionStyle.SYNCHRONOUS)
+
+    def test_items_are_slotted(self):
+        self.assertFalse(hasattr(self.item, "__dict__"))
+
+    def test_tags_are_empty_by_default(self):
+        self.assertEqual("", self.item.tags)
+        self.assertEqual(set(), self.item.get_tags_as_set())
+        self.assertFalse(self.item.has_tag("Tag"))
+
+    def test_add_tags(self):
+        self.item.add_tags({"A", "B"})
+
+        self.assertTrue(self.item.has_tag("A"))
+        self.assertEqual({"A", "B"}, self.item.get_tags_as_set())
+
+    def test_tags_are_listed_in_registration_order(self):
+        self.item.add_tags({"Custom", "Relationship"})
+
+        self.assertEqual("Relationship,Custom", self.item.tags)
+
+    def test_tags_setter_replaces_tags(self):
+        self.item.add_tags({"A"})
+        self.item.tags = {"B"}
+
+        self.assertFalse(self.item.has_tag("A"))
+        self.assertEqual("B", self.item.tags)
+
+    def test_interaction_style_replaces_tag(self):
+        self.item.interaction_style = InteractionStyle.ASYNCHRONOUS
+        self.assertEqual("Asynchronous", self.item.tags)
+
+        self.item.interaction_style = InteractionStyle.SYNCHRONOUS
+        self.assertEqual("Synchronous", self.item.tags)
+
+    def test_remove_tag_does_nothing_when_tag_is_missing(self):
+        self.item.remove_tag("A")
+        self.item.add_tags({"A"})
+        self.item.remove_tag("A")
+
+        self.assertFalse(self.item.has_tag("A"))
+
+    def test_properties_are_not_shared_between_items(self):
+        other = Relationship(None, None, "Uses", None,
+                             InteractionStyle.SYNCHRONOUS)
+        self.item.add_property("name", "value")
+
+        self.assertEqual({"name": "value"}, self.item.properties)
+        self.assertEqual({}, other.properties)
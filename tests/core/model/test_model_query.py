@@ -0,0 +1,167 @@
+import unittest
+
+from structurizr_py.core.model.code_element import CodeElement
+from structurizr_py.core.model.element import Element
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.tags import Tags
+from tests.fixtures import SimpleElement
+
+
+class CodeOwningElement(SimpleElement):
+
+    def __init__(self, name: str, parent: Element = None):
+        self.__code_elements = []
+        super().__init__(name, parent)
+
+    @property
+    def code_elements(self):
+        return self.__code_elements
+
+    def add_code_element(self, code_element: CodeElement):
+        self.__code_elements.append(code_element)
+        if self.model is not None:
+            self.model._code_element_added(self, code_element)
+
+
+class TestModelQuery(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.system = self.add(CodeOwningElement("System"))
+        self.ledger = self.add(CodeOwningElement("Ledger"))
+        self.web = self.add(CodeOwningElement("Web", self.system))
+        self.api = self.add(CodeOwningElement("API", self.system))
+        self.jobs = self.add(CodeOwningElement("Jobs", self.system))
+        for element in (self.web, self.api, self.jobs):
+            element.add_tags({Tags.COMPONENT})
+        self.api.add_property("team", "payments")
+        self.jobs.add_property("team", "payments")
+        self.api.add_code_element(CodeElement("payments.api.Controller"))
+        self.jobs.add_code_element(CodeElement("payments.Job"))
+        self.web.add_code_element(CodeElement("web.View"))
+        self.relate(self.api, self.ledger, InteractionStyle.SYNCHRONOUS)
+        self.relate(self.jobs, self.ledger, InteractionStyle.ASYNCHRONOUS)
+
+    def add(self, element):
+        element.model = self.model
+        return element
+
+    def relate(self, source, destination, interaction_style):
+        relationship = Relationship(source, destination, "Uses", None,
+                                    interaction_style)
+        source.add_relationship(relationship)
+        return relationship
+
+    def test_query_without_criteria_returns_everything(self):
+        self.assertEqual(self.model.elements,
+                         set(self.model.query_elements()))
+        self.assertEqual("scan", self.model.query_elements().explain())
+
+    def test_combined_criteria(self):
+        query = self.model.query_elements() \
+            .tagged(Tags.COMPONENT) \
+            .with_code_in_package("payments") \
+            .with_relationship_to(self.ledger, InteractionStyle.ASYNCHRONOUS)
+
+        self.assertEqual([self.jobs], list(query))
+
+    def test_planner_starts_from_most_selective_index(self):
+        query = self.model.query_elements() \
+            .tagged(Tags.COMPONENT) \
+            .with_canonical_name_prefix("/System/") \
+            .with_property("team", "payments") \
+            .with_relationship_to(self.ledger, InteractionStyle.ASYNCHRONOUS)
+
+        self.assertTrue(query.explain().startswith(
+            "index relationship to Ledger"), query.explain())
+        self.assertEqual([self.jobs], list(query))
+
+    def test_tags_use_the_tag_index(self):
+        query = self.model.query_elements().tagged(Tags.COMPONENT)
+
+        self.assertEqual("index tags Component (~3 items)", query.explain())
+        self.assertEqual({self.web, self.api, self.jobs}, set(query))
+        self.assertEqual(
+            0, self.model.query_elements().tagged("Never Used").count())
+
+        self.api.add_tag("Payments Only")
+        query = query.tagged("Payments Only")
+        self.assertEqual("index tags Payments Only (~1 items), "
+                         "filter tags Component", query.explain())
+        self.assertEqual([self.api], list(query))
+
+    def test_tags_are_resolved_when_the_query_runs(self):
+        query = self.model.query_elements().tagged("Added Later")
+        filtered = self.model.query_elements() \
+            .with_canonical_name_prefix("/System/API").tagged("Added Later")
+        relationships = self.model.query_relationships().tagged("Added Later")
+        self.assertEqual([], list(query))
+
+        self.api.add_tag("Added Later")
+        relationship = self.model.get_relationship_between(self.api,
+                                                           self.ledger)
+        relationship.add_tag("Added Later")
+        self.assertEqual([self.api], list(query))
+        self.assertEqual([self.api], list(filtered))
+        self.assertTrue(filtered.explain().startswith(
+            "index canonical name prefix"), filtered.explain())
+        self.assertEqual([relationship], list(relationships))
+
+    def test_property_index_skips_relationships(self):
+        relationship = self.model.get_relationship_between(self.api,
+                                                           self.ledger)
+        relationship.add_property("team", "payments")
+
+        query = self.model.query_elements().with_property("team", "payments")
+        self.assertEqual({self.api, self.jobs}, set(query))
+        self.assertEqual(
+            [relationship],
+            list(self.model.query_relationships()
+                 .with_property("team", "payments")))
+
+    def test_code_in_package(self):
+        query = self.model.query_elements()
+
+        self.assertEqual({self.api, self.jobs},
+                         set(query.with_code_in_package("payments")))
+        self.assertEqual([self.jobs], list(query.with_code_in_package(
+            "payments", include_subpackages=False)))
+        self.assertEqual([], list(query.with_code_in_package("unknown")))
+
+        self.jobs.model = None
+        self.assertEqual([self.api],
+                         list(query.with_code_in_package("payments")))
+
+    def test_canonical_name_prefix_follows_renames(self):
+        query = self.model.query_elements() \
+            .with_canonical_name_prefix("/System/")
+        self.assertEqual([self.api, self.jobs, self.web], list(query))
+
+        self.system.name = "Platform"
+        self.assertEqual([], list(query))
+        self.assertEqual(3, self.model.query_elements()
+                         .with_canonical_name_prefix("/Platform/").count())
+
+    def test_queries_are_lazy_and_reusable(self):
+        calls = []
+        query = self.model.query_elements().tagged(Tags.COMPONENT) \
+            .where(lambda element: calls.append(element) or True)
+
+        results = iter(query)
+        self.assertEqual([], calls)
+        next(results)
+        self.assertEqual(1, len(calls))
+        self.assertEqual(3, query.count())
+
+    def test_relationship_query(self):
+        query = self.model.query_relationships().with_destination(self.ledger)
+
+        self.assertEqual(2, query.count())
+        self.assertEqual(
+            self.jobs,
+            query.with_interaction_style(InteractionStyle.ASYNCHRONOUS)
+            .first().source)
+        self.assertIsNone(query.with_source(self.web).first())
+        self.assertEqual(0, query.with_technology("HTTPS").count())
@@ -0,0 +1,130 @@
+import threading
+import unittest
+
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from tests.fixtures import SimpleElement
+
+
+def relate(model, source, destination):
+    relationship = Relationship(source, destination, "Uses", None,
+                                InteractionStyle.SYNCHRONOUS)
+    model.add_relationship(relationship)
+    return relationship
+
+
+class TestModelSnapshot(unittest.TestCase):
+
+    def test_snapshot_is_unaffected_by_later_changes(self):
+        model = Model()
+        a = SimpleElement("A")
+        b = SimpleElement("B")
+        model.add_element(a)
+        model.add_element(b)
+        relationship = relate(model, a, b)
+
+        snapshot = model.snapshot()
+        c = SimpleElement("C")
+        model.add_element(c)
+        relate(model, b, c)
+        model.remove_relationship(relationship)
+
+        self.assertEqual({a, b}, snapshot.elements)
+        self.assertEqual([relationship], list(snapshot.iter_relationships()))
+        self.assertEqual([relationship],
+                         snapshot.get_efferent_relationships(a))
+        self.assertEqual([relationship],
+                         snapshot.get_afferent_relationships(b))
+        self.assertTrue(snapshot.contains(relationship))
+        self.assertFalse(snapshot.contains(c))
+        self.assertEqual(3, len(model.snapshot().elements))
+
+    def test_thread_safe_snapshot_survives_removals_and_compaction(self):
+        model = Model(thread_safe=True)
+        model.LOG_COMPACTION_THRESHOLD = 2
+        elements = [SimpleElement(str(i)) for i in range(10)]
+        for element in elements:
+            model.add_element(element)
+        relationships = [relate(model, a, b)
+                         for a, b in zip(elements, elements[1:])]
+
+        snapshot = model.snapshot()
+        for relationship in relationships[:6]:
+            model.remove_relationship(relationship)
+        elements[0].model = None
+        model.add_element(SimpleElement("new"))
+
+        self.assertEqual(relationships, list(snapshot.iter_relationships()))
+        self.assertEqual(elements, list(snapshot.iter_elements()))
+        self.assertEqual(relationships[6:], list(model.iter_relationships()))
+        self.assertEqual(elements[1:],
+                         list(model.iter_elements())[:-1])
+        self.assertEqual("new", list(model.iter_elements())[-1].name)
+
+    def test_snapshot_is_reused_until_the_model_changes(self):
+        model = Model()
+        snapshot = model.snapshot()
+        self.assertIs(snapshot, model.snapshot())
+
+        model.add_element(SimpleElement("A"))
+        self.assertIsNot(snapshot, model.snapshot())
+        self.assertEqual(0, len(snapshot))
+
+    def test_locked_is_a_no_op_for_models_which_are_not_thread_safe(self):
+        model = Model()
+        self.assertFalse(model.thread_safe)
+        with model.locked():
+            model.add_element(SimpleElement("A"))
+
+        self.assertTrue(Model(thread_safe=True).thread_safe)
+
+    def test_concurrent_writers_and_readers(self):
+        model = Model(thread_safe=True)
+        threads = 8
+        count = 300
+        errors = []
+        done = threading.Event()
+
+        def write(thread: int):
+            try:
+                previous = None
+                for i in range(count):
+                    element = SimpleElement(f"{thread}.{i}")
+                    element.add_tags({"Worker", f"Worker {thread}"})
+                    element.add_property("index", str(i))
+                    model.add_element(element)
+                    if previous is not None:
+                        relate(model, previous, element)
+                    previous = element
+            except Exception as error:  # pragma: no cover - reported below
+                errors.append(error)
+
+        def read():
+            try:
+                while not done.is_set():
+                    snapshot = model.snapshot()
+                    elements = list(snapshot.iter_elements())
+                    self.assertEqual(len(elements), len(snapshot.elements))
+                    for relationship in model.iter_relationships():
+                        self.assertIsNotNone(relationship.source)
+            except Exception as error:  # pragma: no cover - reported below
+                errors.append(error)
+
+        readers = [threading.Thread(target=read) for _ in range(2)]
+        writers = [threading.Thread(target=write, args=(thread,))
+                   for thread in range(threads)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual(threads * count, len(model.elements))
+        self.assertEqual(threads * (count - 1), len(model.relationships))
+        tags = {frozenset(element.get_tags_as_set())
+                for element in model.iter_elements()}
+        self.assertEqual(threads, len(tags))
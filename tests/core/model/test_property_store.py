@@ -0,0 +1,109 @@
+import threading
+import unittest
+
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from tests.fixtures import SimpleElement
+
+
+class TestPropertyStore(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.store = self.model.property_store
+        self.a = SimpleElement("A")
+        self.b = SimpleElement("B")
+        for element in (self.a, self.b):
+            element.model = self.model
+
+    def test_find_items_with_property_value(self):
+        self.a.add_property("team", "payments")
+        self.b.add_property("team", "search")
+        relationship = Relationship(self.a, self.b, "Uses", None,
+                                    InteractionStyle.SYNCHRONOUS)
+        relationship.add_property("team", "payments")
+        self.a.add_relationship(relationship)
+
+        self.assertEqual(
+            {self.a, relationship},
+            set(self.model.get_items_with_property("team", "payments")))
+        self.assertEqual([self.b], list(self.store.find("team", "search")))
+        self.assertEqual([], list(self.store.find("team", "unknown")))
+        self.assertEqual([], list(self.store.find("owner", "payments")))
+
+    def test_changing_a_value_reindexes_the_item(self):
+        self.a.add_property("team", "payments")
+        self.a.add_property("team", "search")
+
+        self.assertEqual([], list(self.store.find("team", "payments")))
+        self.assertEqual([self.a], list(self.store.find("team", "search")))
+        self.assertEqual({"search": 1}, self.store.values("team"))
+
+    def test_remove_property(self):
+        self.a.add_property("team", "payments")
+        self.a.remove_property("team")
+        self.a.remove_property("unknown")
+
+        self.assertEqual({}, dict(self.a.properties))
+        self.assertEqual([], self.store.names())
+        self.assertEqual(0, self.store.count("team"))
+
+    def test_replacing_properties_reindexes_the_item(self):
+        self.a.add_property("team", "payments")
+        self.a.properties = {"owner": "alice"}
+
+        self.assertEqual(["owner"], self.store.names())
+        self.assertEqual([self.a], list(self.store.find("owner", "alice")))
+
+    def test_property_changes_take_the_lock_of_a_thread_safe_model(self):
+        model = Model(thread_safe=True)
+        self.a.model = model
+
+        with model.locked():
+            thread = threading.Thread(target=self.a.add_property,
+                                      args=("team", "payments"))
+            thread.start()
+            thread.join(0.1)
+            self.assertTrue(thread.is_alive())
+            self.assertEqual(0, model.property_store.count("team"))
+
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(1, model.property_store.count("team", "payments"))
+
+    def test_items_are_indexed_when_added_and_removed(self):
+        c = SimpleElement("C")
+        c.add_property("team", "payments")
+        self.assertEqual(0, self.store.count("team", "payments"))
+
+        c.model = self.model
+        self.assertEqual(1, self.store.count("team", "payments"))
+
+        c.model = Model()
+        self.assertEqual(0, self.store.count("team", "payments"))
+        self.assertEqual(1, c.model.property_store.count("team"))
+
+    def test_iter_property(self):
+        self.a.add_property("team", "payments")
+        self.b.add_property("team", "search")
+        self.b.add_property("owner", "bob")
+
+        self.assertEqual({(self.a, "payments"), (self.b, "search")},
+                         set(self.store.iter_property("team")))
+        self.assertEqual(2, self.store.count("team"))
+        self.assertEqual([], list(self.store.iter_property("unknown")))
+
+    def test_property_names_are_interned(self):
+        self.a.add_property("".join(["te", "am"]), "payments")
+        self.b.add_property("".join(["te", "am"]), "search")
+
+        name_a, = self.a.properties
+        name_b, = self.b.properties
+        self.assertIs(name_a, name_b)
+
+    def test_properties_are_read_only(self):
+        self.a.add_property("team", "payments")
+
+        with self.assertRaises(TypeError):
+            self.a.properties["team"] = "search"
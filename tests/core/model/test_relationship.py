@@ -0,0 +1,49 @@
+import unittest
+
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.relationship import Relationship
+from tests.fixtures import SimpleElement
+
+
+class TestRelationship(unittest.TestCase):
+
+    def setUp(self):
+        self.a = SimpleElement("A")
+        self.b = SimpleElement("B")
+        self.relationship = Relationship(self.a, self.b, "Uses", "HTTPS",
+                                         InteractionStyle.SYNCHRONOUS)
+
+    def test_get_content_key(self):
+        self.assertEqual(("/A", "/B", "Uses", "HTTPS"),
+                         self.relationship.get_content_key())
+        self.assertIs(self.relationship.get_content_key(),
+                      self.relationship.get_content_key())
+
+    def test_content_key_follows_changes(self):
+        self.relationship.get_content_key()
+        self.relationship.technology = "gRPC"
+        self.relationship.destination = self.a
+        self.assertEqual(("/A", "/A", "Uses", "gRPC"),
+                         self.relationship.get_content_key())
+
+        self.a.name = "Renamed"
+        self.assertEqual(("/Renamed", "/Renamed", "Uses", "gRPC"),
+                         self.relationship.get_content_key())
+
+    def test_equals_and_hash_use_the_content_key(self):
+        same = Relationship(SimpleElement("A"), SimpleElement("B"), "Uses",
+                            "HTTPS", InteractionStyle.ASYNCHRONOUS)
+        other = Relationship(SimpleElement("A"), SimpleElement("B"), "Uses",
+                             "gRPC", InteractionStyle.SYNCHRONOUS)
+
+        self.assertEqual(self.relationship, same)
+        self.assertEqual(hash(self.relationship), hash(same))
+        self.assertNotEqual(self.relationship, other)
+        self.assertEqual(2, len({self.relationship, same, other}))
+
+    def test_equals_returns_false_for_other_description(self):
+        other = Relationship(self.a, self.b, "Calls", "HTTPS",
+                             InteractionStyle.SYNCHRONOUS)
+
+        self.assertNotEqual(self.relationship, other)
+        self.assertNotEqual(self.relationship, None)
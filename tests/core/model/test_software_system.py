@@ -0,0 +1,80 @@
+import unittest
+
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.person import Person
+from structurizr_py.core.model.software_system import SoftwareSystem
+from structurizr_py.core.model.tags import Tags
+
+
+class TestSoftwareSystem(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.system = SoftwareSystem("Shop", "Sells things")
+        self.model.add_element(self.system)
+
+    def test_required_tags_are_added(self):
+        self.assertEqual({Tags.ELEMENT, Tags.SOFTWARE_SYSTEM},
+                         self.system.get_tags_as_set())
+        self.assertEqual({Tags.ELEMENT, Tags.PERSON},
+                         Person("User").get_tags_as_set())
+        self.assertIsNone(Person("User").get_parent())
+
+    def test_add_container(self):
+        container = self.system.add_container("Web", "Serves pages",
+                                              "Django")
+
+        self.assertIs(self.system, container.get_parent())
+        self.assertIs(self.model, container.model)
+        self.assertEqual("Django", container.technology)
+        self.assertEqual("/Shop/Web", container.get_canonical_name())
+        self.assertIs(container, self.system.get_container_with_name("Web"))
+        self.assertEqual([container], self.system.containers)
+
+    def test_top_level_names_are_unique(self):
+        user = Person("User")
+        self.model.add_element(user)
+
+        with self.assertRaises(ValueError):
+            self.model.add_element(Person("User"))
+        with self.assertRaises(ValueError):
+            self.model.add_element(SoftwareSystem("Shop"))
+        self.assertEqual(2, len(list(self.model.iter_elements())))
+
+        with self.assertRaises(ValueError):
+            user.name = "Shop"
+        self.assertEqual("User", user.name)
+        user.name = "Customer"
+        self.model.add_element(Person("User"))
+        self.assertEqual(3, len(self.model.elements))
+
+    def test_container_names_are_unique(self):
+        self.system.add_container("Web")
+
+        with self.assertRaises(ValueError):
+            self.system.add_container("Web")
+        self.assertEqual(1, len(self.system.containers))
+
+    def test_renaming_a_container_updates_the_lookup(self):
+        web = self.system.add_container("Web")
+        self.system.add_container("Database")
+
+        web.name = "Website"
+        self.assertIs(web, self.system.get_container_with_name("Website"))
+        self.assertIsNone(self.system.get_container_with_name("Web"))
+        self.assertEqual("/Shop/Website", web.get_canonical_name())
+
+        with self.assertRaises(ValueError):
+            web.name = "Database"
+        self.assertEqual("Website", web.name)
+
+    def test_containers_follow_the_software_system_into_models(self):
+        system = SoftwareSystem("Other")
+        container = system.add_container("Web")
+        component = container.add_component("Controller")
+        self.assertIsNone(component.model)
+
+        self.model.add_element(system)
+        self.assertIs(self.model, container.model)
+        self.assertIs(self.model, component.model)
+        self.assertEqual(4, len(self.model.elements))
@@ -0,0 +1,52 @@
+import unittest
+
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from tests.fixtures import SimpleElement
+
+
+class TestTagIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.index = self.model.element_tag_index
+        self.a = SimpleElement("A")
+        self.b = SimpleElement("B")
+        for element in (self.a, self.b):
+            element.model = self.model
+
+    def test_find_items_with_tag(self):
+        self.a.add_tags({"Database", "Legacy"})
+        self.b.add_tag("Database")
+        relationship = Relationship(self.a, self.b, "Uses", None,
+                                    InteractionStyle.SYNCHRONOUS)
+        self.model.add_relationship(relationship)
+        relationship.add_tag("Database")
+
+        self.assertEqual([self.a, self.b], list(self.index.find("Database")))
+        self.assertEqual(1, self.index.count("Legacy"))
+        self.assertEqual(0, self.index.count("Unknown"))
+        self.assertEqual([relationship], list(
+            self.model.relationship_tag_index.find("Database")))
+
+    def test_changing_tags_reindexes_the_item(self):
+        self.a.add_tag("Database")
+        self.a.remove_tag("Database")
+        self.b.tags = {"Database", "Legacy"}
+
+        self.assertEqual([self.b], list(self.index.find("Database")))
+        self.b.tags = set()
+        self.assertEqual(0, self.index.count("Legacy"))
+
+    def test_items_are_indexed_when_added_and_removed(self):
+        c = SimpleElement("C")
+        c.add_tag("Queue")
+        self.assertEqual(0, self.index.count("Queue"))
+
+        c.model = self.model
+        self.assertEqual(1, self.index.count("Queue"))
+
+        c.model = Model()
+        self.assertEqual(0, self.index.count("Queue"))
+        self.assertEqual(1, c.model.element_tag_index.count("Queue"))
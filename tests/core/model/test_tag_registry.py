@@ -0,0 +1,35 @@
+import unittest
+
+from structurizr_py.core.model.tag_registry import TagRegistry
+from structurizr_py.core.model.tags import Tags
+
+
+class TestTagRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = TagRegistry()
+
+    def test_default_tags_are_registered_first(self):
+        self.assertEqual(1, self.registry.find(Tags.ELEMENT))
+        self.assertEqual(2, self.registry.find(Tags.RELATIONSHIP))
+        self.assertEqual(len(TagRegistry.DEFAULT_TAGS), len(self.registry))
+
+    def test_find_returns_zero_for_unknown_tags(self):
+        self.assertEqual(0, self.registry.find("Unknown"))
+        self.assertEqual(len(TagRegistry.DEFAULT_TAGS), len(self.registry))
+
+    def test_bit_registers_new_tags_once(self):
+        bit = self.registry.bit("Database")
+
+        self.assertEqual(bit, self.registry.bit("Database"))
+        self.assertEqual(bit, self.registry.find("Database"))
+        self.assertEqual(1 << len(TagRegistry.DEFAULT_TAGS), bit)
+
+    def test_names_and_csv_are_in_registration_order(self):
+        mask = self.registry.mask({"Database", Tags.ELEMENT, Tags.CONTAINER})
+
+        self.assertEqual([Tags.ELEMENT, Tags.CONTAINER, "Database"],
+                         self.registry.names(mask))
+        self.assertEqual("Element,Container,Database", self.registry.csv(mask))
+        self.assertIs(self.registry.csv(mask), self.registry.csv(mask))
+        self.assertEqual("", self.registry.csv(0))
@@ -0,0 +1,151 @@
+import os
+import tempfile
+import textwrap
+import unittest
+
+from structurizr_py.core.scanner.python_source_scanner import \
+    PythonSourceScanner
+
+SERVICE = textwrap.dedent('''
+    class Service:
+        """A service."""
+
+        def run(self):
+            pass
+
+        def _helper(self):
+            def local():
+                pass
+
+        def __secret(self):
+            pass
+
+
+    @decorator
+    async def handler():
+        return 1
+''')
+
+
+class TestPythonSourceScanner(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        self.write("app/__init__.py", "def create():\n    pass\n")
+        self.write("app/service.py", SERVICE)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, relative_path: str, source: str, mtime: int = None):
+        path = os.path.join(self.root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            file.write(source)
+        if mtime is not None:
+            os.utime(path, ns=(mtime, mtime))
+
+    def scan(self, scanner: PythonSourceScanner):
+        return {c.type: c for c in scanner.scan(self.root)}
+
+    def test_scan_creates_code_elements(self):
+        code_elements = self.scan(PythonSourceScanner(processes=1))
+
+        self.assertEqual(
+            {"app.create", "app.service.Service", "app.service.Service.run",
+             "app.service.Service._helper", "app.service.Service.__secret",
+             "app.service.handler"}, set(code_elements))
+
+        service = code_elements["app.service.Service"]
+        self.assertEqual(("class", "public", 12),
+                         (service.category, service.visibility, service.size))
+        self.assertEqual("Service", service.name)
+        self.assertEqual("app.service", service.get_package())
+
+        helper = code_elements["app.service.Service._helper"]
+        self.assertEqual(("method", "package"),
+                         (helper.category, helper.visibility))
+        self.assertEqual(
+            "private",
+            code_elements["app.service.Service.__secret"].visibility)
+
+        handler = code_elements["app.service.handler"]
+        self.assertEqual(("function", 3), (handler.category, handler.size))
+
+    def test_rescan_only_parses_changed_files(self):
+        scanner = PythonSourceScanner(processes=1)
+        self.scan(scanner)
+        self.assertEqual(2, scanner.parsed_files)
+
+        self.scan(scanner)
+        self.assertEqual(0, scanner.parsed_files)
+
+        # touched, but same content
+        self.write("app/service.py", SERVICE, mtime=1)
+        self.scan(scanner)
+        self.assertEqual(0, scanner.parsed_files)
+
+        self.write("app/service.py", "class Other:\n    pass\n", mtime=2)
+        code_elements = self.scan(scanner)
+        self.assertEqual(1, scanner.parsed_files)
+        self.assertEqual({"app.create", "app.service.Other"},
+                         set(code_elements))
+
+    def test_cache_can_be_saved_and_loaded(self):
+        scanner = PythonSourceScanner(processes=1)
+        self.scan(scanner)
+        cache_path = os.path.join(self.root, "cache.json")
+        scanner.save_cache(cache_path)
+
+        other = PythonSourceScanner(processes=1)
+        other.load_cache(cache_path)
+
+        self.assertEqual(6, len(self.scan(other)))
+        self.assertEqual(0, other.parsed_files)
+
+    def test_syntax_errors_are_reported(self):
+        self.write("app/broken.py", "def broken(:\n")
+        scanner = PythonSourceScanner(processes=1)
+        self.scan(scanner)
+
+        broken = [os.path.join(self.root, "app", "broken.py")]
+        self.assertEqual(broken, list(scanner.errors))
+
+        # served from the cache, by modification time and by hash
+        self.scan(scanner)
+        self.assertEqual(broken, list(scanner.errors))
+        self.write("app/broken.py", "def broken(:\n", mtime=1)
+        self.scan(scanner)
+        self.assertEqual(broken, list(scanner.errors))
+        self.assertEqual(0, scanner.parsed_files)
+
+        cache_path = os.path.join(self.root, "cache.json")
+        scanner.save_cache(cache_path)
+        other = PythonSourceScanner(processes=1)
+        other.load_cache(cache_path)
+        self.scan(other)
+        self.assertEqual(broken, list(other.errors))
+
+        self.write("app/broken.py", "def fixed():\n    pass\n", mtime=2)
+        self.scan(scanner)
+        self.assertEqual({}, scanner.errors)
+
+    def test_deeply_nested_sources_are_reported(self):
+        self.write("app/nested.py", "x = 1" + "+1" * 100000)
+        scanner = PythonSourceScanner(processes=1)
+
+        self.assertEqual(6, len(self.scan(scanner)))
+        self.assertIn("RecursionError", scanner.errors[
+            os.path.join(self.root, "app", "nested.py")])
+
+    def test_scan_with_process_pool(self):
+        for i in range(PythonSourceScanner.PARALLEL_THRESHOLD):
+            self.write(f"generated/module_{i}.py",
+                       f"class Type{i}:\n    pass\n")
+
+        code_elements = self.scan(PythonSourceScanner(processes=2))
+
+        self.assertIn("generated.module_7.Type7", code_elements)
+        self.assertEqual(6 + PythonSourceScanner.PARALLEL_THRESHOLD,
+                         len(code_elements))
@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.software_system import SoftwareSystem
+from structurizr_py.core.util.instrumentation import Instrumentation, \
+    PrometheusTextFileSink
+from structurizr_py.core.util.url import Url
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.instrumentation = Instrumentation()
+
+    def tearDown(self):
+        self.instrumentation.disable()
+
+    @staticmethod
+    def build_model():
+        model = Model()
+        a = SoftwareSystem("A")
+        a.url = "https://example.com/a"
+        b = SoftwareSystem("B")
+        model.add_element(a)
+        model.add_element(b)
+        a.add_relationship(Relationship(a, b, "Uses", None,
+                                        InteractionStyle.SYNCHRONOUS))
+        b.has_afferent_relationships()
+        return model
+
+    def test_disabled_instrumentation_leaves_classes_alone(self):
+        original = vars(Url)["is_url"]
+        self.instrumentation.enable()
+        self.assertIsNot(original, vars(Url)["is_url"])
+
+        self.instrumentation.disable()
+        self.assertIs(original, vars(Url)["is_url"])
+        self.build_model()
+        self.assertEqual(0, self.instrumentation.snapshot()[
+            "url.is_url"]["calls"])
+
+    def test_operations_are_counted_and_timed(self):
+        self.instrumentation.enable()
+        model = self.build_model()
+        len(set(model.relationships))
+
+        metrics = self.instrumentation.snapshot()
+        self.assertEqual(1, metrics["url.is_url"]["calls"])
+        self.assertEqual(2, metrics["model_item.add_tags"]["calls"])
+        self.assertEqual(
+            1, metrics["element.has_afferent_relationships"]["calls"])
+        self.assertEqual(1, metrics["relationship.hash"]["calls"])
+        self.assertGreater(metrics["url.is_url"]["seconds"], 0)
+        self.assertTrue(Url.is_url("https://example.com"))
+
+        self.instrumentation.reset()
+        self.assertEqual(0, self.instrumentation.snapshot()[
+            "url.is_url"]["calls"])
+
+    def test_only_one_instrumentation_can_be_enabled(self):
+        self.instrumentation.enable()
+
+        with self.assertRaises(ValueError):
+            Instrumentation().enable()
+
+    def test_profile_reports_the_block_only(self):
+        self.instrumentation.enable()
+        self.build_model()
+
+        with self.instrumentation.profile() as metrics:
+            Url.is_url("https://example.com")
+            self.assertEqual({}, metrics)
+
+        self.assertEqual(1, metrics["url.is_url"]["calls"])
+        self.assertEqual(2, self.instrumentation.snapshot()[
+            "url.is_url"]["calls"])
+        self.assertTrue(self.instrumentation.enabled)
+
+    def test_profile_enables_for_the_block(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "model.prom")
+            with self.instrumentation.profile(PrometheusTextFileSink(path)):
+                self.build_model()
+
+            self.assertFalse(self.instrumentation.enabled)
+            with open(path, encoding="utf-8") as stream:
+                lines = stream.read().splitlines()
+            self.assertEqual(["model.prom"], os.listdir(directory))
+
+        self.assertIn("# TYPE structurizr_calls_total counter", lines)
+        self.assertIn('structurizr_calls_total{operation="url.is_url"} 1',
+                      lines)
+        self.assertTrue(any(line.startswith(
+            'structurizr_call_seconds_total{operation="json.read"} ')
+            for line in lines))
@@ -1,6 +1,7 @@
 import unittest
+from urllib.parse import urlparse
 
-from structurizr_py.core.util.url import Url
+from structurizr_py.core.util.url import Url, _parse_is_url
 
 
 class TestUrl(unittest.TestCase):
@@ -18,3 +19,25 @@ class TestUrl(unittest.TestCase):
 
     def test_is_url_returns_true_on_valid_url(self):
         self.assertTrue(Url.is_url("https://www.google.com"))
+
+    def test_is_url_agrees_with_full_parse(self):
+        for url in ["https://example.com", "http://example.com:8080/a?b#c",
+                    "https://user@host/path", "https://", "https:///path",
+                    "HTTPS://EXAMPLE.COM", "ftp://host/file",
+                    "https://exa mple.com", "mailto:someone@example.com"]:
+            parsed = urlparse(url)
+            self.assertEqual(bool(parsed.scheme and parsed.netloc),
+                             Url.is_url(url), url)
+
+    def test_is_url_caches_full_parse_results(self):
+        Url.clear_cache()
+        Url.is_url("ftp://host/file")
+        Url.is_url("ftp://host/file")
+
+        self.assertEqual(1, _parse_is_url.cache_info().hits)
+
+    def test_validate_many(self):
+        self.assertEqual([True, False, True],
+                         Url.validate_many(["https://www.google.com",
+                                            "dummy",
+                                            "https://www.google.com"]))
@@ -0,0 +1,134 @@
+import io
+import os
+import tempfile
+import unittest
+
+from structurizr_py.core.model.interaction_style import InteractionStyle
+from structurizr_py.core.model.model import Model
+from structurizr_py.core.model.relationship import Relationship
+from structurizr_py.core.model.tags import Tags
+from structurizr_py.export.dot_exporter import DotExporter
+from structurizr_py.export.export_graph import ExportGraph
+from structurizr_py.export.export_views import ExportView, export_views
+from structurizr_py.export.mermaid_exporter import MermaidExporter
+from structurizr_py.export.plant_uml_exporter import PlantUmlExporter
+from tests.fixtures import SimpleElement
+
+
+class SystemElement(SimpleElement):
+    """A software system, or a container when it has a parent."""
+
+    def get_required_tags(self):
+        if self.get_parent() is None:
+            return {Tags.ELEMENT, Tags.SOFTWARE_SYSTEM}
+        return {Tags.ELEMENT, Tags.CONTAINER}
+
+
+class TestDiagramExporters(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.user = self.add(SystemElement("User"), "1")
+        self.system = self.add(SystemElement("Shop"), "2")
+        self.web = self.add(SystemElement("Web", self.system), "3")
+        self.queue = self.add(SystemElement("Queue", self.system), "4")
+        self.web.description = 'Serves "pages"'
+        self.relate(self.user, self.web, "Browses", "HTTPS",
+                    InteractionStyle.SYNCHRONOUS)
+        self.relate(self.web, self.queue, "Publishes", None,
+                    InteractionStyle.ASYNCHRONOUS)
+        self.relate(self.user, self.system, "Uses", None,
+                    InteractionStyle.SYNCHRONOUS)
+
+    def add(self, element, identity):
+        element.identity = identity
+        element.model = self.model
+        return element
+
+    def relate(self, source, destination, description, technology, style):
+        source.add_relationship(Relationship(source, destination, description,
+                                             technology, style))
+
+    def export(self, exporter, **kwargs):
+        stream = io.StringIO()
+        exporter.export(self.model, stream, **kwargs)
+        return stream.getvalue()
+
+    def test_plant_uml(self):
+        diagram = self.export(PlantUmlExporter(), title="Shop")
+
+        self.assertTrue(diagram.startswith("@startuml\ntitle Shop\n"))
+        self.assertTrue(diagram.endswith("@enduml\n"))
+        self.assertIn('rectangle "==Shop\\n<size:10>[Software System]</size>"'
+                      ' <<Software System>> as e2 {\n', diagram)
+        self.assertIn("  rectangle \"==Web\\n<size:10>[Container]</size>"
+                      "\\n\\nServes 'pages'\" <<Container>> as e3\n", diagram)
+        self.assertIn('e1 --> e3 : "Browses\\n<size:8>[HTTPS]</size>"\n',
+                      diagram)
+        self.assertIn('e3 ..> e4 : "Publishes"\n', diagram)
+        self.assertLess(diagram.index("as e4"), diagram.index("}\n"))
+
+    def test_mermaid(self):
+        diagram = self.export(MermaidExporter(), title="Shop")
+
+        self.assertTrue(diagram.startswith(
+            "---\ntitle: Shop\n---\nflowchart TB\n"))
+        self.assertIn('  subgraph e2["Shop"]\n', diagram)
+        self.assertIn('    e3["<b>Web</b><br>[Container]<br><br>'
+                      'Serves #quot;pages#quot;"]\n', diagram)
+        self.assertIn('  e1 -->|"Browses<br>[HTTPS]"| e3\n', diagram)
+        self.assertIn('  e3 -.->|"Publishes"| e4\n', diagram)
+        self.assertIn("  end\n", diagram)
+
+    def test_dot(self):
+        diagram = self.export(DotExporter())
+
+        self.assertTrue(diagram.startswith("digraph {\n"))
+        self.assertIn("  subgraph cluster_e2 {\n", diagram)
+        self.assertIn('    e3 [label="Web\\n[Container]\\n\\n'
+                      'Serves \\"pages\\""]\n', diagram)
+        self.assertIn('  e3 -> e4 [label="Publishes", style=dashed]\n',
+                      diagram)
+        self.assertIn('  e1 -> e2 [label="Uses", lhead=cluster_e2]\n',
+                      diagram)
+
+    def test_elements_outside_the_view_are_left_out(self):
+        diagram = self.export(MermaidExporter(),
+                              elements=[self.user, self.web])
+
+        self.assertNotIn("subgraph", diagram)
+        self.assertIn('  e1 -->|"Browses<br>[HTTPS]"| e3\n', diagram)
+        self.assertNotIn("e4", diagram)
+
+    def test_fragments_are_rendered_again_after_changes(self):
+        exporter = PlantUmlExporter()
+        self.assertIn("==Web", self.export(exporter))
+
+        self.web.name = "Website"
+        diagram = self.export(exporter)
+        self.assertIn("==Website", diagram)
+        self.assertNotIn("==Web\\n", diagram)
+
+    def test_aliases_escape_identities(self):
+        element = SystemElement("Other")
+        element.identity = "a-b"
+
+        self.assertEqual("e2", ExportGraph.alias_of(self.system))
+        self.assertEqual("ea_2d_b", ExportGraph.alias_of(element))
+
+    def test_export_views(self):
+        with tempfile.TemporaryDirectory() as directory:
+            views = [ExportView(os.path.join(directory, "all.puml")),
+                     ExportView(os.path.join(directory, "context.puml"),
+                                [self.user, self.system], "Context")]
+
+            for max_workers in (1, 2):
+                paths = export_views(PlantUmlExporter(), self.model, views,
+                                     max_workers=max_workers)
+
+                self.assertEqual([view.path for view in views], paths)
+                with open(paths[1], encoding="utf-8") as stream:
+                    context = stream.read()
+                self.assertIn("title Context", context)
+                self.assertIn("as e2\n", context)
+                self.assertNotIn("e3", context)
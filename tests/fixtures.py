@@ -0,0 +1,17 @@
+from structurizr_py.core.model.element import Element
+
+
+class SimpleElement(Element):
+    """A minimal concrete element, optionally with a parent."""
+
+    def __init__(self, name: str = None, parent: Element = None):
+        self.__parent = parent
+        super().__init__()
+        if name is not None:
+            self.name = name
+
+    def get_parent(self):
+        return self.__parent
+
+    def get_required_tags(self):
+        return set()